@@ -30,30 +30,110 @@ def cmd_new(args):
 
 
 def cmd_build(args):
-    """게임 빌드"""
+    """게임 빌드 (빌드 큐에 제출)"""
+    import time
+    from core.builder.build_queue import BuildQueue, ACTIVE_STATUSES, SUCCEEDED
     from core.builder.godot_builder import GodotBuilder
     
-    print(f"🔨 빌드 시작: {args.project}")
+    print(f"🔨 빌드 제출: {args.project}")
     print(f"  플랫폼: {', '.join(args.platforms)}")
     
-    builder = GodotBuilder({"godot_path": args.godot})
+    builder = GodotBuilder({
+        "godot_path": args.godot,
+        "export_targets": args.platforms
+    })
+    queue = BuildQueue(args.queue)
+    jobs = builder.submit_build(args.project, "builds", priority=args.priority, queue=queue)
     
-    for platform in args.platforms:
-        result = builder.build(args.project, platform, f"builds/{platform}")
-        status = "✅" if result.get("success") else "❌"
-        print(f"  {status} {platform}")
+    for job in jobs:
+        print(f"  📥 {job.target}: {job.job_id} ({job.status})")
+    
+    if not args.wait:
+        return
+    
+    pending = {job.job_id for job in jobs}
+    while pending:
+        time.sleep(1)
+        for job_id in list(pending):
+            job = queue.get(job_id)
+            if job.status in ACTIVE_STATUSES:
+                continue
+            pending.discard(job_id)
+            status = "✅" if job.status == SUCCEEDED else "❌"
+            print(f"  {status} {job.target}: {job.message or job.status}")
+
+
+def cmd_workers(args):
+    """빌드 워커 실행"""
+    import time
+    from core.builder.build_queue import BuildWorkerPool
+    
+    print(f"🏭 빌드 워커 {args.workers}개 시작 (큐: {args.queue})")
+    
+    pool = BuildWorkerPool(args.queue, {"godot_path": args.godot}, workers=args.workers)
+    pool.start()
+    
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print("\n워커 종료 중...")
+    finally:
+        pool.stop()
+
+
+def cmd_jobs(args):
+    """빌드 작업 조회/취소"""
+    from core.builder.build_queue import BuildQueue
+    
+    queue = BuildQueue(args.queue)
+    
+    if args.cancel:
+        ok = queue.cancel(args.cancel)
+        print(f"{'✅ 취소 요청' if ok else '❌ 취소 불가'}: {args.cancel}")
+        return
+    
+    for job in queue.list_jobs(status=args.status, limit=args.limit):
+        print(f"  [{job.status}] {job.job_id} {job.target} p{job.priority} {job.project_path}")
 
 
 def cmd_deploy(args):
-    """게임 배포"""
-    from core.deployer.store_uploader import AppStoreUploadManager
+    """게임 배포 (멀티 스토어 동시)"""
+    import json
+    from core.deployer.deploy_orchestrator import DeployOrchestrator, ReleaseManifest
+    
+    if args.build.endswith(".json"):
+        manifest = ReleaseManifest.load(args.build)
+    else:
+        # 빌드 파일 1개 → 지정 스토어 매니페스트
+        artifact = {"path": args.build, "package_name": args.package, "bundle_id": args.package}
+        manifest = ReleaseManifest(
+            game_id=Path(args.build).stem,
+            version=args.version,
+            artifacts={store: dict(artifact) for store in (args.store or ["google_play"])}
+        )
+    
+    config = {}
+    config_path = Path("config/project_config.json")
+    if config_path.exists():
+        with open(config_path, "r", encoding="utf-8") as f:
+            config = json.load(f).get("deploy", {})
+    if args.retries is not None:
+        config["max_retries"] = args.retries
+    if args.simulate:
+        config["simulate"] = True
+    
+    stores = args.store or list(manifest.artifacts.keys())
+    print(f"🚀 배포: {manifest.game_id} v{manifest.version}")
+    print(f"  스토어: {', '.join(stores)}")
     
-    print(f"🚀 배포: {args.build}")
-    print(f"  스토어: {args.store}")
+    result = DeployOrchestrator(config).deploy(manifest, stores)
     
-    manager = AppStoreUploadManager({})
-    # 실제 배포 로직
-    print("✅ 배포 완료 (시뮬레이션)")
+    for store, outcome in result["stores"].items():
+        status = "✅" if outcome["success"] else "❌"
+        detail = outcome["error"] or f"{outcome['duration']:.1f}초"
+        print(f"  {status} {store} (시도 {outcome['attempts']}회): {detail}")
+    print(f"{'✅ 배포 완료' if result['success'] else '❌ 일부 배포 실패'} ({result['duration']:.1f}초)")
 
 
 def cmd_serve(args):
@@ -117,14 +197,36 @@ def main():
                              default=["html5"],
                              help="빌드 플랫폼")
     build_parser.add_argument("--godot", default="godot", help="Godot 경로")
+    build_parser.add_argument("--queue", default="builds/build_queue.db", help="빌드 큐 경로")
+    build_parser.add_argument("--priority", type=int, default=0, help="우선순위")
+    build_parser.add_argument("--wait", action="store_true", help="빌드 완료까지 대기")
     build_parser.set_defaults(func=cmd_build)
     
+    # workers 명령어
+    workers_parser = subparsers.add_parser("workers", help="빌드 워커 실행")
+    workers_parser.add_argument("-w", "--workers", type=int, default=2, help="워커 수")
+    workers_parser.add_argument("--godot", default="godot", help="Godot 경로")
+    workers_parser.add_argument("--queue", default="builds/build_queue.db", help="빌드 큐 경로")
+    workers_parser.set_defaults(func=cmd_workers)
+    
+    # jobs 명령어
+    jobs_parser = subparsers.add_parser("jobs", help="빌드 작업 조회/취소")
+    jobs_parser.add_argument("--status", default=None, help="상태 필터")
+    jobs_parser.add_argument("--limit", type=int, default=20, help="최대 개수")
+    jobs_parser.add_argument("--cancel", default=None, help="취소할 작업 ID")
+    jobs_parser.add_argument("--queue", default="builds/build_queue.db", help="빌드 큐 경로")
+    jobs_parser.set_defaults(func=cmd_jobs)
+    
     # deploy 명령어
     deploy_parser = subparsers.add_parser("deploy", help="게임 배포")
-    deploy_parser.add_argument("build", help="빌드 파일 경로")
-    deploy_parser.add_argument("-s", "--store", default="google_play",
+    deploy_parser.add_argument("build", help="릴리스 매니페스트(.json) 또는 빌드 파일 경로")
+    deploy_parser.add_argument("-s", "--store", nargs="+", default=None,
                               choices=["google_play", "app_store", "steam"],
-                              help="스토어")
+                              help="스토어 (기본: 매니페스트의 모든 스토어)")
+    deploy_parser.add_argument("--version", default="1.0.0", help="버전 (빌드 파일 지정 시)")
+    deploy_parser.add_argument("--package", default=None, help="패키지명/번들 ID (빌드 파일 지정 시)")
+    deploy_parser.add_argument("--retries", type=int, default=None, help="스토어별 재시도 횟수")
+    deploy_parser.add_argument("--simulate", action="store_true", help="시뮬레이션 배포")
     deploy_parser.set_defaults(func=cmd_deploy)
     
     # serve 명령어
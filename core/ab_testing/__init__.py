@@ -2,5 +2,7 @@
 A/B 테스트 모듈
 """
 from .ab_manager import ABTestManager, ABTest, Variant
+from .event_store import ABEventStore
+from .assignment import AssignmentTable
 
-__all__ = ["ABTestManager", "ABTest", "Variant"]
+__all__ = ["ABTestManager", "ABTest", "Variant", "ABEventStore", "AssignmentTable"]
@@ -3,14 +3,25 @@ A/B 테스트 시스템
 게임 변형 테스트 및 성과 비교
 """
 
+import os
 import json
 import random
-import hashlib
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict, field
 
+from .event_store import ABEventStore, IMPRESSION, CONVERSION
+from .assignment import AssignmentTable, DEFAULT_HASH_SCHEME
+from ..cache.lazy_index import LazyIndex
+
+
+# 트래픽 할당 방식 (fixed: 생성 시 가중치 고정, thompson/ucb: 밴딧 재계산)
+ALLOCATIONS = ("fixed", "thompson", "ucb")
+# 밴딧 목표 지표
+OBJECTIVES = ("conversion", "revenue")
+
 
 @dataclass
 class Variant:
@@ -20,7 +31,7 @@ class Variant:
     weight: float = 0.5  # 트래픽 비율
     config: Dict[str, Any] = field(default_factory=dict)
     
-    # 성과 지표
+    # 성과 지표 (이벤트 로그 집계의 메모리 사본)
     impressions: int = 0
     conversions: int = 0
     revenue: float = 0.0
@@ -39,6 +50,11 @@ class ABTest:
     created_at: datetime = None
     started_at: Optional[datetime] = None
     ended_at: Optional[datetime] = None
+    hash_scheme: str = DEFAULT_HASH_SCHEME  # 할당 해시 방식 (테스트 생성 후 변경 불가)
+    allocation: str = "fixed"
+    objective: str = "conversion"
+    weight_epoch: int = 0  # 가중치 재계산 횟수 (에포크 안에서는 할당 고정)
+    rebalanced_at: Optional[datetime] = None
     
     def __post_init__(self):
         if self.created_at is None:
@@ -48,57 +64,277 @@ class ABTest:
 class ABTestManager:
     """A/B 테스트 매니저"""
     
-    def __init__(self, data_dir: str = "ab_tests"):
+    def __init__(
+        self,
+        data_dir: str = "ab_tests",
+        snapshot_every: int = 10000,
+        analysis_config: Optional[dict] = None,
+        bandit_config: Optional[dict] = None,
+        cache_size: int = 1024,
+        event_synchronous: str = "FULL"
+    ):
+        """
+        Args:
+            data_dir: 데이터 디렉토리 (tests/<test_id>.json: 테스트 정의,
+                index.db: 테스트 인덱스, events.db: 이벤트 로그)
+            snapshot_every: 이벤트 N건마다 집계 스냅샷 저장
+            analysis_config: 통계 분석 설정 (ABAnalyzer 참고)
+            bandit_config: 밴딧 설정
+                - rebalance_interval: 테스트별 재계산 최소 간격 (초, 기본 300)
+                - min_impressions: 재계산 시작 전 최소 노출 수 (기본 100)
+                - min_weight: 변형별 최소 가중치 (기본 0.05)
+                - samples: Thompson 샘플 수 (기본 10000)
+                - seed: 난수 시드
+            cache_size: 메모리에 보관할 테스트 수 (나머지는 요청 시 파일에서 읽음)
+            event_synchronous: 이벤트 DB synchronous 모드 (기본 FULL: 커밋마다 fsync,
+                NORMAL은 더 빠르지만 전원 차단 시 최근 이벤트 유실 가능)
+        """
         self.data_dir = Path(data_dir)
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.tests: Dict[str, ABTest] = {}
+        self.tests_dir = self.data_dir / "tests"
+        self.tests_dir.mkdir(parents=True, exist_ok=True)
+        self.tests: LazyIndex = LazyIndex(
+            str(self.data_dir / "index.db"), self._read_test, self._describe, cache_size
+        )
+        self.snapshot_every = snapshot_every
+        self.analysis_config = analysis_config or {}
+        self.bandit_config = bandit_config or {}
+        self.rebalance_interval = self.bandit_config.get("rebalance_interval", 300)
+        self.events = ABEventStore(str(self.data_dir / "events.db"), synchronous=event_synchronous)
+        self._lock = threading.Lock()
+        self._events_since_snapshot = 0
+        # 실행 중 테스트의 할당 테이블 (첫 할당 시 생성, 통째로 교체해 갱신, 읽기는 잠금 없음)
+        self._tables: Dict[str, AssignmentTable] = {}
         self._load_tests()
     
     def _load_tests(self) -> None:
-        """저장된 테스트 로드"""
-        tests_file = self.data_dir / "tests.json"
-        if tests_file.exists():
-            with open(tests_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                for test_id, test_data in data.items():
-                    # Variant 객체 복원
-                    variants = [Variant(**v) for v in test_data.pop("variants", [])]
-                    
-                    # datetime 복원
-                    for dt_field in ["created_at", "started_at", "ended_at"]:
-                        if test_data.get(dt_field):
-                            test_data[dt_field] = datetime.fromisoformat(test_data[dt_field])
-                    
-                    self.tests[test_id] = ABTest(variants=variants, **test_data)
-    
-    def _save_tests(self) -> None:
-        """테스트 저장"""
-        data = {}
-        for test_id, test in self.tests.items():
-            test_dict = {
-                "test_id": test.test_id,
-                "name": test.name,
-                "description": test.description,
-                "game_id": test.game_id,
-                "status": test.status,
-                "variants": [asdict(v) for v in test.variants],
-                "created_at": test.created_at.isoformat() if test.created_at else None,
-                "started_at": test.started_at.isoformat() if test.started_at else None,
-                "ended_at": test.ended_at.isoformat() if test.ended_at else None,
+        """테스트 인덱스 로드 (인덱스가 없으면 테스트 파일을 한 번 훑어 생성)"""
+        if self.tests.load():
+            return
+        
+        # 기존 tests.json은 테스트별 파일로 분리 (카운터는 이벤트 로그로 이전)
+        legacy_file = self.data_dir / "tests.json"
+        if legacy_file.exists():
+            with open(legacy_file, "r", encoding="utf-8") as f:
+                legacy = [self._parse_test(test_data) for test_data in json.load(f).values()]
+            self._migrate_counters(legacy)
+            for test in legacy:
+                self._write_test(test)
+            os.replace(legacy_file, legacy_file.with_suffix(".json.migrated"))
+        
+        self.tests.rebuild([file.stem for file in self.tests_dir.glob("*.json")])
+    
+    def _parse_test(self, test_data: Dict[str, Any]) -> ABTest:
+        """저장 형식 → ABTest"""
+        test_data = dict(test_data)
+        # Variant 객체 복원
+        variants = [Variant(**v) for v in test_data.pop("variants", [])]
+        
+        # datetime 복원
+        for dt_field in ["created_at", "started_at", "ended_at", "rebalanced_at"]:
+            if test_data.get(dt_field):
+                test_data[dt_field] = datetime.fromisoformat(test_data[dt_field])
+        
+        # 해시 방식 도입 이전 테스트는 기존 MD5 할당 유지
+        test_data.setdefault("hash_scheme", "md5")
+        
+        return ABTest(variants=variants, **test_data)
+    
+    def _read_test(self, test_id: str) -> Optional[ABTest]:
+        """테스트 파일 파싱 후 이벤트 로그 카운터 반영 (없으면 None)"""
+        test_file = self.tests_dir / f"{test_id}.json"
+        if not test_file.exists():
+            return None
+        with open(test_file, "r", encoding="utf-8") as f:
+            test = self._parse_test(json.load(f))
+        
+        counters = self.events.counters([test_id])
+        for v in test.variants:
+            v.impressions, v.conversions, v.revenue = counters.get((test_id, v.variant_id), (0, 0, 0.0))
+        return test
+    
+    def _describe(self, test: ABTest) -> Dict[str, Any]:
+        """인덱스 메타데이터"""
+        return {
+            "game_id": test.game_id,
+            "name": test.name,
+            "status": test.status,
+            "allocation": test.allocation,
+            "weight_epoch": test.weight_epoch,
+            "file": f"tests/{test.test_id}.json"
+        }
+    
+    def list_tests(self, game_id: Optional[str] = None, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        테스트 목록 (인덱스만 읽음)
+        
+        Args:
+            game_id: 게임 ID (None이면 전체)
+            status: 상태 (None이면 전체)
+        
+        Returns:
+            [{"test_id", "game_id", "name", "status", "allocation", "weight_epoch", "file"}]
+        """
+        return [
+            {"test_id": test_id, **self.tests.meta(test_id)}
+            for test_id in self.tests.select(game_id=game_id, status=status)
+        ]
+    
+    def _publish_table(self, test: ABTest) -> None:
+        """테스트 할당 테이블 갱신 (실행 중이 아니면 제거)"""
+        if test.status != "running":
+            self._tables.pop(test.test_id, None)
+            return
+        self._tables[test.test_id] = AssignmentTable.build(
+            test.test_id,
+            [v.variant_id for v in test.variants],
+            [v.weight for v in test.variants],
+            hash_scheme=test.hash_scheme,
+            epoch=test.weight_epoch
+        )
+    
+    def _table(self, test_id: str) -> Optional[AssignmentTable]:
+        """할당 테이블 (실행 중인 테스트는 처음 요청 시 생성)"""
+        table = self._tables.get(test_id)
+        if table is not None:
+            return table
+        meta = self.tests.meta(test_id)
+        if meta is None or meta.get("status") != "running":
+            return None
+        self._publish_table(self.tests[test_id])
+        return self._tables.get(test_id)
+    
+    def _migrate_counters(self, tests: List[ABTest]) -> None:
+        """이벤트 로그 도입 이전 tests.json 카운터를 스냅샷 기준값으로 이전"""
+        known = self.events.known_variants()
+        for test in tests:
+            baseline = {
+                v.variant_id: (v.impressions, v.conversions, v.revenue)
+                for v in test.variants
+                if (test.test_id, v.variant_id) not in known
             }
-            data[test_id] = test_dict
+            if baseline:
+                self.events.register_variants(test.test_id, baseline)
+    
+    def refresh(self) -> None:
+        """메모리에 올린 테스트의 집계 카운터 다시 읽기 (다른 프로세스 기록/가중치 반영)"""
+        self._reload_weights()
+        loaded = self.tests.cached()
+        counters = self.events.counters([test.test_id for test in loaded])
+        with self._lock:
+            for test in loaded:
+                for v in test.variants:
+                    v.impressions, v.conversions, v.revenue = counters.get(
+                        (test.test_id, v.variant_id), (0, 0, 0.0)
+                    )
+    
+    def _reload_weights(self) -> None:
+        """
+        다른 프로세스가 배포한 밴딧 가중치/상태 반영 (인덱스가 바뀐 경우에만)
         
-        with open(self.data_dir / "tests.json", "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        메모리에 있는 테스트는 제자리 갱신하고, 캐시에서 밀려난 테스트의 할당
+        테이블은 인덱스와 상태/epoch가 다르면 버린다 (다음 할당 시 파일에서 다시 생성).
+        """
+        if not self.tests.refresh():
+            return
+        
+        for test in self.tests.cached():
+            meta = self.tests.meta(test.test_id) or {}
+            if meta.get("weight_epoch", 0) <= test.weight_epoch and meta.get("status") == test.status:
+                continue
+            fresh = self._read_test(test.test_id)
+            if fresh is None:
+                continue
+            for variant, fresh_variant in zip(test.variants, fresh.variants):
+                variant.weight = fresh_variant.weight
+            test.weight_epoch = fresh.weight_epoch
+            test.rebalanced_at = fresh.rebalanced_at
+            test.status, test.started_at, test.ended_at = fresh.status, fresh.started_at, fresh.ended_at
+            self._publish_table(test)
+        
+        for test_id, table in list(self._tables.items()):
+            meta = self.tests.meta(test_id) or {}
+            if meta.get("status") != "running" or meta.get("weight_epoch", 0) != table.epoch:
+                self._tables.pop(test_id, None)
+    
+    def snapshot(self) -> int:
+        """집계 스냅샷 저장 (재시작 시 이후 이벤트만 재생)"""
+        with self._lock:
+            self._events_since_snapshot = 0
+        return self.events.snapshot()
+    
+    def _record(
+        self,
+        test_id: str,
+        variant_id: str,
+        kind: str,
+        user_id: Optional[str] = None,
+        revenue: float = 0.0
+    ) -> None:
+        """이벤트 기록 (커밋 후 반환) 및 주기적 스냅샷"""
+        self.events.append(test_id, variant_id, kind, user_id, revenue)
+        with self._lock:
+            self._events_since_snapshot += 1
+            due = self._events_since_snapshot >= self.snapshot_every
+        if due:
+            self.snapshot()
+    
+    def _write_test(self, test: ABTest) -> None:
+        """테스트 파일 쓰기"""
+        test_dict = {
+            "test_id": test.test_id,
+            "name": test.name,
+            "description": test.description,
+            "game_id": test.game_id,
+            "status": test.status,
+            "variants": [asdict(v) for v in test.variants],
+            "created_at": test.created_at.isoformat() if test.created_at else None,
+            "started_at": test.started_at.isoformat() if test.started_at else None,
+            "ended_at": test.ended_at.isoformat() if test.ended_at else None,
+            "hash_scheme": test.hash_scheme,
+            "allocation": test.allocation,
+            "objective": test.objective,
+            "weight_epoch": test.weight_epoch,
+            "rebalanced_at": test.rebalanced_at.isoformat() if test.rebalanced_at else None,
+        }
+        
+        test_file = self.tests_dir / f"{test.test_id}.json"
+        tmp = test_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(test_dict, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, test_file)
+    
+    def _save_test(self, test: ABTest) -> None:
+        """
+        테스트 정의 저장 및 인덱스 갱신 (생성/시작/종료/가중치 재계산 시에만)
+        
+        카운터는 이벤트 로그가 원본이며 여기 기록되는 값은 참고용이다.
+        """
+        self._write_test(test)
+        self.tests.put(test.test_id, test)
     
     def create_test(
         self,
         name: str,
         description: str,
         game_id: str,
-        variants: List[Dict[str, Any]]
+        variants: List[Dict[str, Any]],
+        allocation: str = "fixed",
+        objective: str = "conversion"
     ) -> ABTest:
-        """새 A/B 테스트 생성"""
+        """
+        새 A/B 테스트 생성
+        
+        Args:
+            allocation: 트래픽 할당 방식 (fixed, thompson, ucb)
+            objective: 밴딧 목표 지표 (conversion, revenue)
+        """
+        if allocation not in ALLOCATIONS:
+            print(f"[경고] 지원하지 않는 할당 방식 '{allocation}' → fixed 사용")
+            allocation = "fixed"
+        if objective not in OBJECTIVES:
+            print(f"[경고] 지원하지 않는 목표 지표 '{objective}' → conversion 사용")
+            objective = "conversion"
+        
         test_id = f"test_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
         variant_objs = [
@@ -116,11 +352,13 @@ class ABTestManager:
             name=name,
             description=description,
             game_id=game_id,
-            variants=variant_objs
+            variants=variant_objs,
+            allocation=allocation,
+            objective=objective
         )
         
-        self.tests[test_id] = test
-        self._save_tests()
+        self.events.register_variants(test_id, {v.variant_id: (0, 0, 0.0) for v in variant_objs})
+        self._save_test(test)
         return test
     
     def start_test(self, test_id: str) -> bool:
@@ -131,7 +369,8 @@ class ABTestManager:
         test = self.tests[test_id]
         test.status = "running"
         test.started_at = datetime.now()
-        self._save_tests()
+        self._publish_table(test)
+        self._save_test(test)
         return True
     
     def stop_test(self, test_id: str) -> bool:
@@ -142,47 +381,170 @@ class ABTestManager:
         test = self.tests[test_id]
         test.status = "completed"
         test.ended_at = datetime.now()
-        self._save_tests()
+        self._publish_table(test)
+        self._save_test(test)
         return True
     
-    def assign_variant(self, test_id: str, user_id: str) -> Optional[Variant]:
+    def rebalance(self, test_ids: Optional[List[str]] = None, force: bool = False) -> Dict[str, List[float]]:
         """
-        유저에게 변형 할당 (결정적 해싱 사용)
+        밴딧 테스트 가중치 일괄 재계산 및 배포
+        
+        집계 카운터로 새 가중치를 계산해 에포크를 올리고 할당 테이블을
+        통째로 교체한다 (진행 중인 할당은 이전 테이블 또는 새 테이블 중
+        하나만 사용). 최소 노출 수에 못 미치거나 재계산 간격이 지나지 않은
+        테스트는 건너뛴다.
+        
+        Args:
+            test_ids: 대상 테스트 (None이면 실행 중인 밴딧 테스트 전체)
+            force: 재계산 간격 무시
+        
+        Returns:
+            {test_id: 새 가중치 목록}
+        """
+        try:
+            import numpy as np
+            from .bandit import thompson_weights, ucb_weights
+        except ImportError:
+            print("[경고] numpy가 설치되지 않아 밴딧 가중치를 재계산하지 않습니다")
+            return {}
+        
+        self.refresh()
+        now = datetime.now()
+        rng = np.random.default_rng(self.bandit_config.get("seed"))
+        min_impressions = self.bandit_config.get("min_impressions", 100)
+        min_weight = self.bandit_config.get("min_weight", 0.05)
+        
+        updated = {}
+        for test_id in (test_ids if test_ids is not None else self.tests.select(status="running")):
+            test = self.tests.get(test_id)
+            if test is None or test.status != "running" or test.allocation == "fixed":
+                continue
+            if (not force and test.rebalanced_at
+                    and (now - test.rebalanced_at).total_seconds() < self.rebalance_interval):
+                continue
+            
+            with self._lock:
+                impressions = [v.impressions for v in test.variants]
+                conversions = [v.conversions for v in test.variants]
+                revenue = [v.revenue for v in test.variants] if test.objective == "revenue" else None
+            if sum(impressions) < min_impressions:
+                continue
+            
+            if test.allocation == "thompson":
+                weights = thompson_weights(
+                    impressions, conversions, revenue,
+                    samples=self.bandit_config.get("samples", 10000),
+                    min_weight=min_weight,
+                    rng=rng
+                )
+            else:
+                weights = ucb_weights(impressions, conversions, revenue, min_weight=min_weight)
+            
+            for variant, weight in zip(test.variants, weights):
+                variant.weight = float(weight)
+            test.weight_epoch += 1
+            test.rebalanced_at = now
+            self._publish_table(test)
+            self._save_test(test)
+            updated[test_id] = [v.weight for v in test.variants]
+        
+        return updated
+    
+    def start_rebalancer(self, interval: Optional[float] = None) -> threading.Event:
+        """
+        주기적 가중치 재계산 스레드 시작
+        
+        Args:
+            interval: 재계산 주기 (초, 기본 rebalance_interval)
+        
+        Returns:
+            set() 하면 스레드가 종료되는 이벤트
+        """
+        stop = threading.Event()
+        interval = interval or self.rebalance_interval
+        
+        def loop() -> None:
+            while not stop.wait(interval):
+                try:
+                    self.rebalance()
+                except Exception as e:
+                    print(f"[경고] 밴딧 가중치 재계산 실패: {e}")
+        
+        threading.Thread(target=loop, name="ab-rebalancer", daemon=True).start()
+        return stop
+    
+    def assign(self, test_id: str, user_id: str) -> Optional[Variant]:
+        """
+        유저에게 변형 할당 (결정적 해싱, 기록 없음)
+        
+        상태를 바꾸지 않으므로 세션 시작마다 호출해도 된다. 노출 집계가
+        필요하면 track_impression을 따로 호출한다.
         
         Args:
             test_id: 테스트 ID
             user_id: 유저 ID
         
         Returns:
-            할당된 변형
+            할당된 변형 (실행 중인 테스트가 아니면 None)
         """
-        if test_id not in self.tests:
+        table = self._table(test_id)
+        if table is None:
             return None
+        return self.tests[test_id].variants[table.assign(user_id)]
+    
+    def assign_many(self, test_id: str, user_ids: List[str]) -> List[Optional[Variant]]:
+        """
+        여러 유저 일괄 할당 (기록 없음)
         
-        test = self.tests[test_id]
-        if test.status != "running":
-            return None
+        Returns:
+            user_ids 순서의 변형 목록 (실행 중인 테스트가 아니면 전부 None)
+        """
+        table = self._table(test_id)
+        if table is None:
+            return [None] * len(user_ids)
+        variants = self.tests[test_id].variants
+        return [variants[i] for i in table.assign_many(user_ids)]
+    
+    def track_impression(
+        self,
+        test_id: str,
+        variant_id: str,
+        user_id: Optional[str] = None
+    ) -> None:
+        """노출 추적"""
+        if test_id not in self.tests:
+            return
         
-        # 유저 ID 기반 결정적 해싱
-        hash_input = f"{test_id}:{user_id}"
-        hash_value = int(hashlib.md5(hash_input.encode()).hexdigest(), 16)
-        bucket = (hash_value % 1000) / 1000.0  # 0.0 ~ 1.0
+        for variant in self.tests[test_id].variants:
+            if variant.variant_id == variant_id:
+                self._record(test_id, variant_id, IMPRESSION, user_id)
+                with self._lock:
+                    variant.impressions += 1
+                break
+    
+    def assign_variant(self, test_id: str, user_id: str) -> Optional[Variant]:
+        """
+        유저에게 변형 할당 후 노출 기록 (assign + track_impression)
         
-        # 가중치 기반 변형 선택
-        cumulative = 0.0
-        for variant in test.variants:
-            cumulative += variant.weight
-            if bucket < cumulative:
-                variant.impressions += 1
-                self._save_tests()
-                return variant
-        
-        # 폴백: 마지막 변형
-        test.variants[-1].impressions += 1
-        self._save_tests()
-        return test.variants[-1]
-    
-    def track_conversion(self, test_id: str, variant_id: str, revenue: float = 0.0) -> None:
+        Args:
+            test_id: 테스트 ID
+            user_id: 유저 ID
+        
+        Returns:
+            할당된 변형
+        """
+        chosen = self.assign(test_id, user_id)
+        if chosen is not None:
+            self.track_impression(test_id, chosen.variant_id, user_id)
+        return chosen
+    
+    def track_conversion(
+        self,
+        test_id: str,
+        variant_id: str,
+        revenue: float = 0.0,
+        user_id: Optional[str] = None
+    ) -> None:
         """전환 추적"""
         if test_id not in self.tests:
             return
@@ -190,17 +552,58 @@ class ABTestManager:
         test = self.tests[test_id]
         for variant in test.variants:
             if variant.variant_id == variant_id:
-                variant.conversions += 1
-                variant.revenue += revenue
-                self._save_tests()
+                self._record(test_id, variant_id, CONVERSION, user_id, revenue)
+                with self._lock:
+                    variant.conversions += 1
+                    variant.revenue += revenue
                 break
     
+    def analyze(self, test_ids: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        테스트 통계 분석 (여러 테스트를 한 번에 계산)
+        
+        Args:
+            test_ids: 분석할 테스트 (None이면 전체)
+        
+        Returns:
+            {test_id: 분석 결과} (numpy가 없으면 빈 딕셔너리)
+        """
+        try:
+            from .analysis import ABAnalyzer, ExperimentData
+        except ImportError:
+            print("[경고] numpy가 설치되지 않아 통계 분석을 건너뜁니다")
+            return {}
+        
+        ids = [t for t in (test_ids if test_ids is not None else self.tests) if t in self.tests]
+        histograms = self.events.revenue_histogram(ids)
+        
+        inputs = []
+        with self._lock:
+            for test_id in ids:
+                variants = self.tests[test_id].variants
+                inputs.append(ExperimentData(
+                    test_id=test_id,
+                    variant_ids=[v.variant_id for v in variants],
+                    impressions=[v.impressions for v in variants],
+                    conversions=[v.conversions for v in variants],
+                    revenue=[v.revenue for v in variants],
+                    revenue_histograms=[histograms.get((test_id, v.variant_id), []) for v in variants]
+                ))
+        
+        return ABAnalyzer(self.analysis_config).analyze(inputs)
+    
     def get_results(self, test_id: str) -> Optional[Dict[str, Any]]:
-        """테스트 결과 조회"""
+        """
+        테스트 결과 조회
+        
+        승자는 종료된 테스트에서 P(best)가 기준을 넘고 대조군 대비 순차 검정이
+        유의할 때만 정해진다 (결론이 나지 않으면 None).
+        """
         if test_id not in self.tests:
             return None
         
         test = self.tests[test_id]
+        analysis = self.analyze([test_id]).get(test_id)
         
         results = {
             "test_id": test.test_id,
@@ -211,22 +614,35 @@ class ABTestManager:
         
         for v in test.variants:
             conv_rate = v.conversions / v.impressions if v.impressions > 0 else 0
-            arpu = v.revenue / v.conversions if v.conversions > 0 else 0
             
-            results["variants"].append({
+            entry = {
                 "variant_id": v.variant_id,
                 "name": v.name,
                 "impressions": v.impressions,
                 "conversions": v.conversions,
                 "conversion_rate": f"{conv_rate:.2%}",
                 "revenue": v.revenue,
-                "arpu": arpu
-            })
+                "arpu": v.revenue / v.impressions if v.impressions > 0 else 0,
+                "arppu": v.revenue / v.conversions if v.conversions > 0 else 0
+            }
+            if analysis:
+                stats = analysis["variants"][v.variant_id]
+                entry.update({
+                    "prob_best": stats["prob_best"],
+                    "credible_interval": stats["credible_interval"],
+                    "arpu_ci": stats["arpu_ci"],
+                })
+                if "vs_control" in stats:
+                    entry["vs_control"] = stats["vs_control"]
+            results["variants"].append(entry)
         
         # 승자 결정
         if test.status == "completed" and test.variants:
-            winner = max(test.variants, key=lambda x: x.conversions / max(x.impressions, 1))
-            results["winner"] = winner.variant_id
+            if analysis:
+                results["winner"] = analysis["winner"]
+            else:
+                winner = max(test.variants, key=lambda x: x.conversions / max(x.impressions, 1))
+                results["winner"] = winner.variant_id
         
         return results
     
@@ -257,9 +673,20 @@ class ABTestManager:
     - 수익: ${v['revenue']:,.2f}
     - ARPU: ${v['arpu']:.2f}
 """
+            if "prob_best" in v:
+                low, high = v["arpu_ci"]
+                report += f"""    - ARPU 신뢰구간: ${low:.2f} ~ ${high:.2f}
+    - 최고 확률: {v['prob_best']:.1%}
+"""
+            if "vs_control" in v:
+                vs = v["vs_control"]
+                report += f"""    - 대조군 대비: {vs['diff']:+.2%} (p={vs['p_value_sequential']:.4f}, {'유의' if vs['significant'] else '유의하지 않음'})
+"""
         
         if results.get("winner"):
             report += f"\n🏆 승자: {results['winner']}"
+        elif "winner" in results:
+            report += "\n⚖️ 유의한 승자 없음"
         
         return report
 
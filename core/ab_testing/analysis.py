@@ -0,0 +1,347 @@
+"""
+A/B 테스트 통계 분석
+전체 테스트의 변형을 배열로 묶어 한 번에 계산 (numpy 필요)
+
+- 대조군(첫 번째 변형) 대비 2-비율 z-검정과 전환율 차이 신뢰구간
+- 순차 검정 보정: mSPRT 상시 유효 p-값 (진행 중 여러 번 조회해도 유효)
+  + 변형 수에 대한 Bonferroni 보정
+- Beta-Binomial 사후분포 몬테카를로로 P(best)와 신용구간
+- 유저당 매출(ARPU) 부트스트랩 신뢰구간: 전환 매출 히스토그램에 대한
+  Poisson 리샘플링이라 비용이 노출 수가 아닌 매출 구간 수에 비례
+  (전환이 많은 변형은 합계의 정규 근사, 메모리 제한 단위로 분할)
+"""
+
+import math
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
+
+# (매출액, 건수)
+RevenueHistogram = List[Tuple[float, int]]
+
+_erfc = np.frompyfunc(math.erfc, 1, 1)
+
+
+@dataclass
+class ExperimentData:
+    """분석 입력 (테스트 1개, 변형 순서대로, 첫 변형이 대조군)"""
+    test_id: str
+    variant_ids: List[str]
+    impressions: List[int]
+    conversions: List[int]
+    revenue: List[float]
+    revenue_histograms: List[RevenueHistogram] = field(default_factory=list)
+
+
+class ABAnalyzer:
+    """A/B 테스트 일괄 분석기"""
+
+    def __init__(self, config: Optional[dict] = None):
+        """
+        Args:
+            config: 분석 설정
+                - alpha: 유의 수준 (기본 0.05)
+                - prior: Beta 사전분포 (a, b) (기본 (1, 1))
+                - posterior_samples: 사후분포 샘플 수 (기본 2000)
+                - bootstrap_samples: ARPU 부트스트랩 반복 수 (기본 1000)
+                - revenue_bins: 매출 히스토그램 최대 구간 수 (기본 64)
+                - arpu_normal_min: 이 전환 수 이상인 변형은 ARPU 부트스트랩을
+                  정규 근사로 계산 (기본 200)
+                - mixture_variance: mSPRT 혼합 분산 τ² (기본 0.02²)
+                - decision_threshold: 승자 판정 P(best) 기준 (기본 0.95)
+                - seed: 난수 시드
+        """
+        config = config or {}
+        self.alpha = config.get("alpha", 0.05)
+        self.prior = tuple(config.get("prior", (1.0, 1.0)))
+        self.posterior_samples = config.get("posterior_samples", 2000)
+        self.bootstrap_samples = config.get("bootstrap_samples", 1000)
+        self.revenue_bins = config.get("revenue_bins", 64)
+        self.arpu_normal_min = config.get("arpu_normal_min", 200)
+        self.mixture_variance = config.get("mixture_variance", 0.02 ** 2)
+        self.decision_threshold = config.get("decision_threshold", 0.95)
+        self.rng = np.random.default_rng(config.get("seed"))
+
+    def analyze(self, tests: List[ExperimentData]) -> Dict[str, Dict[str, Any]]:
+        """
+        테스트 일괄 분석
+
+        Args:
+            tests: 분석할 테스트 목록
+
+        Returns:
+            {test_id: {"winner", "variants": {variant_id: 지표}}}
+        """
+        tests = [t for t in tests if t.variant_ids]
+        if not tests:
+            return {}
+
+        sizes = np.array([len(t.variant_ids) for t in tests])
+        offsets = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        test_index = np.repeat(np.arange(len(tests)), sizes)
+        control = offsets[test_index]
+
+        n = np.array([x for t in tests for x in t.impressions], dtype=np.float64)
+        c = np.array([x for t in tests for x in t.conversions], dtype=np.float64)
+        c = np.minimum(c, n)
+
+        frequentist = self._z_tests(n, c, control, sizes[test_index])
+        prob_best, credible = self._posteriors(n, c, sizes, offsets)
+        arpu, arpu_ci, arpu_diff_ci = self._bootstrap_arpu(tests, n, c, control)
+
+        results = {}
+        for t_idx, test in enumerate(tests):
+            start = offsets[t_idx]
+            variants = {}
+            for k, variant_id in enumerate(test.variant_ids):
+                i = start + k
+                entry = {
+                    "conversion_rate": float(c[i] / n[i]) if n[i] > 0 else 0.0,
+                    "prob_best": float(prob_best[i]),
+                    "credible_interval": [float(credible[0, i]), float(credible[1, i])],
+                    "arpu": float(arpu[i]),
+                    "arpu_ci": [float(arpu_ci[0, i]), float(arpu_ci[1, i])],
+                }
+                if k > 0:
+                    entry["vs_control"] = {
+                        "diff": float(frequentist["diff"][i]),
+                        "diff_ci": [float(frequentist["ci_low"][i]), float(frequentist["ci_high"][i])],
+                        "z": float(frequentist["z"][i]),
+                        "p_value": float(frequentist["p_value"][i]),
+                        "p_value_sequential": float(frequentist["p_sequential"][i]),
+                        "significant": bool(frequentist["significant"][i]),
+                        "arpu_diff_ci": [float(arpu_diff_ci[0, i]), float(arpu_diff_ci[1, i])],
+                    }
+                variants[variant_id] = entry
+
+            results[test.test_id] = {
+                "alpha": self.alpha,
+                "winner": self._winner(test.variant_ids, variants),
+                "variants": variants,
+            }
+        return results
+
+    def _winner(self, variant_ids: List[str], variants: Dict[str, Dict[str, Any]]) -> Optional[str]:
+        """P(best) 기준을 넘고, 도전 변형이면 대조군 대비 유의한 경우에만 승자"""
+        best = max(variant_ids, key=lambda v: variants[v]["prob_best"])
+        entry = variants[best]
+        if entry["prob_best"] < self.decision_threshold:
+            return None
+        if "vs_control" in entry and not entry["vs_control"]["significant"]:
+            return None
+        return best
+
+    def _z_tests(
+        self,
+        n: np.ndarray,
+        c: np.ndarray,
+        control: np.ndarray,
+        arms: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """대조군 대비 2-비율 z-검정 + mSPRT 순차 p-값"""
+        p = np.divide(c, n, out=np.zeros_like(c), where=n > 0)
+        n0, p0 = n[control], p[control]
+        diff = p - p0
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pooled = (c + c[control]) / (n + n0)
+            se_pooled = np.sqrt(pooled * (1 - pooled) * (1 / n + 1 / n0))
+            z = np.where(se_pooled > 0, diff / se_pooled, 0.0)
+            # 차이 추정량 분산 (비합동)
+            var = p * (1 - p) / n + p0 * (1 - p0) / n0
+        z = np.nan_to_num(z)
+        var = np.nan_to_num(var)
+        p_value = _erfc(np.abs(z) / math.sqrt(2)).astype(np.float64)
+
+        # 다중 비교 보정된 유의 수준과 임계값 (변형 수별)
+        adjusted = self.alpha / np.maximum(arms - 1, 1)
+        z_crit = np.array([NormalDist().inv_cdf(1 - a / 2) for a in adjusted])
+        half_width = z_crit * np.sqrt(var)
+
+        # mSPRT: Λ = sqrt(V/(V+τ²)) · exp(τ²θ²/(2V(V+τ²))), p = min(1, 1/Λ)
+        tau2 = self.mixture_variance
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_lambda = 0.5 * np.log(var / (var + tau2)) + tau2 * diff ** 2 / (2 * var * (var + tau2))
+        log_lambda = np.where(var > 0, log_lambda, 0.0)
+        p_sequential = np.minimum(1.0, np.exp(-np.clip(log_lambda, -700, 700)))
+
+        return {
+            "diff": diff,
+            "ci_low": diff - half_width,
+            "ci_high": diff + half_width,
+            "z": z,
+            "p_value": p_value,
+            "p_sequential": p_sequential,
+            "significant": p_sequential < adjusted,
+        }
+
+    def _posteriors(
+        self,
+        n: np.ndarray,
+        c: np.ndarray,
+        sizes: np.ndarray,
+        offsets: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Beta 사후분포 P(best)와 신용구간 (테스트×변형 패딩 배열, 메모리 제한 단위로 분할)"""
+        prior_a, prior_b = self.prior
+        samples = self.posterior_samples
+        k_max = int(sizes.max())
+        prob_best = np.zeros(len(n))
+        credible = np.zeros((2, len(n)))
+        quantiles = [self.alpha / 2, 1 - self.alpha / 2]
+
+        # 한 번에 약 400만 개 샘플
+        chunk = max(1, 4_000_000 // (k_max * samples))
+        arm = np.arange(k_max)
+        for first in range(0, len(sizes), chunk):
+            chunk_sizes = sizes[first:first + chunk]
+            chunk_offsets = offsets[first:first + chunk]
+            mask = arm[None, :] < chunk_sizes[:, None]
+            index = np.where(mask, chunk_offsets[:, None] + arm[None, :], 0)
+
+            a = np.where(mask, prior_a + c[index], 1.0)
+            b = np.where(mask, prior_b + n[index] - c[index], 1.0)
+            draws = self.rng.beta(a[..., None], b[..., None], size=a.shape + (samples,))
+            draws[~mask] = -1.0
+
+            best = draws.argmax(axis=1)
+            wins = (best[:, None, :] == arm[None, :, None]).mean(axis=2)
+            bounds = np.quantile(draws, quantiles, axis=2)
+
+            flat = index[mask]
+            prob_best[flat] = wins[mask]
+            credible[:, flat] = bounds[:, mask]
+
+        return prob_best, credible
+
+    def _bootstrap_arpu(
+        self,
+        tests: List[ExperimentData],
+        n: np.ndarray,
+        c: np.ndarray,
+        control: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        ARPU와 부트스트랩 신뢰구간 (변형별, 대조군 대비 차이)
+
+        Poisson 부트스트랩: 각 매출 구간 건수와 비전환 유저(매출 0) 수를
+        Poisson(건수)로 다시 뽑아 재표본 ARPU를 계산한다. 전환이 arpu_normal_min
+        이상이면 구간별 추출 대신 합계의 정규 근사를 쓴다. 테스트 단위로 묶어
+        (반복, 변형, 구간) 배열이 메모리 제한을 넘지 않게 나눠 처리한다.
+        """
+        supports = []
+        i = 0
+        for test in tests:
+            for k in range(len(test.variant_ids)):
+                histogram = test.revenue_histograms[k] if k < len(test.revenue_histograms) else []
+                revenue = test.revenue[k] if k < len(test.revenue) else 0.0
+                supports.append(self._revenue_support(histogram, int(c[i]), revenue))
+                i += 1
+
+        total = len(n)
+        width = max(len(values) for values, _ in supports)
+        values = np.zeros((total, width))
+        counts = np.zeros((total, width))
+        for i, (v, k) in enumerate(supports):
+            values[i, :len(v)] = v
+            counts[i, :len(k)] = k
+        non_converted = np.maximum(n - counts.sum(axis=1), 0)
+
+        users = counts.sum(axis=1) + non_converted
+        arpu = np.divide((values * counts).sum(axis=1), users, out=np.zeros(total), where=users > 0)
+
+        reps = self.bootstrap_samples
+        quantiles = [self.alpha / 2, 1 - self.alpha / 2]
+        arpu_ci = np.zeros((2, total))
+        arpu_diff_ci = np.zeros((2, total))
+
+        # 한 번에 약 400만 개 샘플 (테스트 경계에서 자름)
+        sizes = np.bincount(control)[np.unique(control)]
+        per_chunk = max(1, 4_000_000 // (reps * int(sizes.max()) * max(width, 1)))
+        bounds = np.concatenate(([0], np.cumsum(sizes)))
+        for t in range(0, len(sizes), per_chunk):
+            lo, hi = bounds[t], bounds[min(t + per_chunk, len(sizes))]
+            part_values, part_counts = values[lo:hi], counts[lo:hi]
+            part_zeros = non_converted[lo:hi]
+
+            replicates = np.zeros((reps, hi - lo))
+            # 비전환 유저 수는 보통 커서 Poisson(λ) ≈ N(λ, λ) 근사 (작으면 그대로 Poisson)
+            zeros = np.where(
+                part_zeros >= 1000,
+                np.rint(self.rng.normal(part_zeros, np.sqrt(part_zeros), size=(reps, hi - lo))),
+                self.rng.poisson(np.where(part_zeros >= 1000, 0, part_zeros), size=(reps, hi - lo))
+            )
+            zeros = np.maximum(zeros, 0)
+
+            # 전환이 적은 변형: 구간별 Poisson 그대로
+            exact = part_counts.sum(axis=1) < self.arpu_normal_min
+            if exact.any():
+                draws = self.rng.poisson(part_counts[exact], size=(reps, int(exact.sum()), width))
+                drawn_users = draws.sum(axis=2) + zeros[:, exact]
+                replicates[:, exact] = np.divide(
+                    (draws * part_values[exact]).sum(axis=2), drawn_users,
+                    out=np.zeros(drawn_users.shape), where=drawn_users > 0
+                )
+
+            # 전환이 많은 변형: (Σ매출, Σ건수)를 같은 평균·공분산의 2변량 정규로 근사
+            approx = ~exact
+            if approx.any():
+                lam, v = part_counts[approx], part_values[approx]
+                mean_n, mean_v = lam.sum(axis=1), (v * lam).sum(axis=1)
+                cov_vn, var_v = (v * lam).sum(axis=1), (v * v * lam).sum(axis=1)
+                scale = np.sqrt(mean_n)
+                slope = cov_vn / scale
+                residual = np.sqrt(np.maximum(var_v - slope ** 2, 0))
+                z1 = self.rng.standard_normal((reps, int(approx.sum())))
+                z2 = self.rng.standard_normal((reps, int(approx.sum())))
+                drawn_users = np.maximum(mean_n + scale * z1, 0) + zeros[:, approx]
+                replicates[:, approx] = np.divide(
+                    mean_v + slope * z1 + residual * z2, drawn_users,
+                    out=np.zeros(drawn_users.shape), where=drawn_users > 0
+                )
+
+            arpu_ci[:, lo:hi] = np.quantile(replicates, quantiles, axis=0)
+            diff = replicates - replicates[:, control[lo:hi] - lo]
+            arpu_diff_ci[:, lo:hi] = np.quantile(diff, quantiles, axis=0)
+
+        return arpu, arpu_ci, arpu_diff_ci
+
+    def _revenue_support(
+        self,
+        histogram: RevenueHistogram,
+        conversions: int,
+        revenue: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        전환 매출 분포 (값, 건수)
+
+        이벤트 로그 도입 이전 전환처럼 개별 매출이 없는 전환은 남은 총매출을
+        균등 분배한 값으로 채우고, 구간 수가 revenue_bins를 넘으면 건수 기준
+        분위 구간의 가중 평균으로 합친다.
+        """
+        values = np.array([v for v, _ in histogram], dtype=np.float64)
+        counts = np.array([n for _, n in histogram], dtype=np.int64)
+
+        missing = conversions - int(counts.sum())
+        if missing > 0:
+            residual = max(revenue - float(values @ counts), 0.0)
+            values = np.append(values, residual / missing)
+            counts = np.append(counts, missing)
+
+        if len(values) > self.revenue_bins:
+            order = np.argsort(values)
+            values, counts = values[order], counts[order]
+            cumulative = np.cumsum(counts)
+            edges = np.searchsorted(
+                cumulative, np.linspace(0, cumulative[-1], self.revenue_bins + 1)[1:-1], side="right"
+            )
+            groups = np.split(np.arange(len(values)), np.unique(edges))
+            groups = [g for g in groups if len(g)]
+            binned = [counts[g].sum() for g in groups]
+            values = np.array([values[g] @ counts[g] / total for g, total in zip(groups, binned)])
+            counts = np.array(binned, dtype=np.int64)
+
+        return values, counts
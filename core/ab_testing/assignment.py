@@ -0,0 +1,126 @@
+"""
+A/B 테스트 변형 할당 테이블
+가중치를 정수 버킷 경계로 미리 계산하고 bisect로 O(log n) 할당
+
+할당은 상태를 바꾸지 않는 순수 함수이며, 같은 테이블(가중치 에포크)
+안에서는 같은 유저가 항상 같은 변형을 받는다.
+"""
+
+import zlib
+import hashlib
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import List, Sequence, Tuple
+
+
+# 해시 방식별 버킷 수
+HASH_BUCKETS = {
+    "crc32": 10000,
+    "md5": 1000,  # 기존 테스트 호환 (할당 결과 유지)
+}
+DEFAULT_HASH_SCHEME = "crc32"
+
+
+def _mix32(h: int) -> int:
+    """32비트 최종 혼합 (murmur3 fmix32) - 순차 ID의 CRC 편향 제거"""
+    h ^= h >> 16
+    h = (h * 0x85EBCA6B) & 0xFFFFFFFF
+    h ^= h >> 13
+    h = (h * 0xC2B2AE35) & 0xFFFFFFFF
+    h ^= h >> 16
+    return h
+
+
+def _boundaries(weights: Sequence[float], buckets: int) -> Tuple[int, ...]:
+    """
+    누적 가중치 → 정수 버킷 상한
+
+    버킷 b가 변형 i에 속하는 조건은 기존 구현과 같은 `b / buckets < 누적가중치`.
+    마지막 상한은 항상 buckets로 두어 가중치 합이 1 미만이어도
+    남는 버킷은 마지막 변형에 할당된다.
+    """
+    bounds = []
+    cumulative = 0.0
+    b = 0
+    for weight in weights:
+        cumulative += weight
+        while b < buckets and b / buckets < cumulative:
+            b += 1
+        bounds.append(b)
+    if bounds:
+        bounds[-1] = buckets
+    return tuple(bounds)
+
+
+@dataclass(frozen=True)
+class AssignmentTable:
+    """테스트 1개의 할당 테이블 (불변, 교체로 갱신)"""
+    test_id: str
+    variant_ids: Tuple[str, ...]
+    boundaries: Tuple[int, ...]
+    hash_scheme: str = DEFAULT_HASH_SCHEME
+    epoch: int = 0
+    # 테스트 ID CRC (해시 시작값, 생성 시 1회 계산)
+    salt: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "salt", zlib.crc32(f"{self.test_id}:".encode()))
+
+    @classmethod
+    def build(
+        cls,
+        test_id: str,
+        variant_ids: Sequence[str],
+        weights: Sequence[float],
+        hash_scheme: str = DEFAULT_HASH_SCHEME,
+        epoch: int = 0
+    ) -> "AssignmentTable":
+        """가중치로 테이블 생성"""
+        buckets = HASH_BUCKETS[hash_scheme]
+        return cls(
+            test_id=test_id,
+            variant_ids=tuple(variant_ids),
+            boundaries=_boundaries(weights, buckets),
+            hash_scheme=hash_scheme,
+            epoch=epoch
+        )
+
+    @property
+    def buckets(self) -> int:
+        return HASH_BUCKETS[self.hash_scheme]
+
+    def bucket(self, user_id: str) -> int:
+        """유저 버킷 번호"""
+        if self.hash_scheme == "md5":
+            digest = hashlib.md5(f"{self.test_id}:{user_id}".encode()).hexdigest()
+            return int(digest, 16) % 1000
+        # 테스트 ID CRC에 이어서 계산 (문자열 결합 없음)
+        return _mix32(zlib.crc32(user_id.encode(), self.salt)) % self.buckets
+
+    def assign(self, user_id: str) -> int:
+        """유저 → 변형 인덱스"""
+        return bisect_right(self.boundaries, self.bucket(user_id))
+
+    def assign_many(self, user_ids: Sequence[str]) -> List[int]:
+        """
+        여러 유저 일괄 할당 (numpy가 있으면 searchsorted로 벡터화)
+
+        Returns:
+            변형 인덱스 목록 (입력 순서)
+        """
+        if self.hash_scheme == "md5":
+            buckets = [self.bucket(u) for u in user_ids]
+        else:
+            salt, n, crc32, mix = self.salt, self.buckets, zlib.crc32, _mix32
+            buckets = [mix(crc32(u.encode(), salt)) % n for u in user_ids]
+
+        try:
+            import numpy as np
+        except ImportError:
+            bounds = self.boundaries
+            return [bisect_right(bounds, b) for b in buckets]
+
+        indices = np.searchsorted(
+            np.asarray(self.boundaries), np.asarray(buckets, dtype=np.int64), side="right"
+        )
+        return indices.tolist()
@@ -0,0 +1,95 @@
+"""
+A/B 테스트 밴딧 할당
+집계된 노출/전환/매출로 변형 가중치를 일괄 재계산 (numpy 필요)
+
+요청마다 계산하지 않고 주기적으로 한 번에 계산한 가중치를 할당 테이블
+에포크로 배포한다. 에포크 안에서는 할당이 결정적이다.
+"""
+
+import math
+from typing import Optional, Sequence
+
+import numpy as np
+
+
+def _with_floor(weights: np.ndarray, min_weight: float) -> np.ndarray:
+    """모든 변형에 최소 가중치 보장 (탐색 유지)"""
+    arms = len(weights)
+    if min_weight * arms >= 1.0:
+        return np.full(arms, 1.0 / arms)
+    return min_weight + (1.0 - min_weight * arms) * weights
+
+
+def _value_per_conversion(conversions: np.ndarray, revenue: np.ndarray) -> np.ndarray:
+    """전환당 매출 (전환이 없는 변형은 전체 평균 사용)"""
+    pooled = revenue.sum() / conversions.sum() if conversions.sum() > 0 else 1.0
+    values = np.divide(revenue, conversions, out=np.full(len(conversions), pooled), where=conversions > 0)
+    return np.maximum(values, 1e-9)
+
+
+def thompson_weights(
+    impressions: Sequence[int],
+    conversions: Sequence[int],
+    revenue: Optional[Sequence[float]] = None,
+    samples: int = 10000,
+    prior: Sequence[float] = (1.0, 1.0),
+    min_weight: float = 0.0,
+    rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    """
+    Thompson 샘플링 가중치 = 각 변형이 최고일 사후 확률
+
+    Args:
+        impressions: 변형별 노출
+        conversions: 변형별 전환
+        revenue: 변형별 매출 (주면 전환율 × 전환당 매출 기준, 전환당 매출은 점추정)
+        samples: 사후분포 샘플 수
+        prior: Beta 사전분포 (a, b)
+        min_weight: 변형별 최소 가중치
+        rng: 난수 생성기
+
+    Returns:
+        합이 1인 가중치 배열
+    """
+    rng = rng or np.random.default_rng()
+    n = np.asarray(impressions, dtype=np.float64)
+    c = np.minimum(np.asarray(conversions, dtype=np.float64), n)
+
+    draws = rng.beta(prior[0] + c[:, None], prior[1] + (n - c)[:, None], size=(len(n), samples))
+    if revenue is not None:
+        draws *= _value_per_conversion(c, np.asarray(revenue, dtype=np.float64))[:, None]
+
+    wins = np.bincount(draws.argmax(axis=0), minlength=len(n)) / samples
+    return _with_floor(wins, min_weight)
+
+
+def ucb_weights(
+    impressions: Sequence[int],
+    conversions: Sequence[int],
+    revenue: Optional[Sequence[float]] = None,
+    min_weight: float = 0.0
+) -> np.ndarray:
+    """
+    UCB1 가중치 (상한 신뢰 점수가 가장 높은 변형에 나머지 트래픽 할당)
+
+    노출이 없는 변형이 있으면 그 변형들이 먼저 트래픽을 나눠 받는다.
+    매출 목표는 보상을 최대 전환당 매출로 나눠 [0, 1]로 맞춘다.
+
+    Returns:
+        합이 1인 가중치 배열
+    """
+    n = np.asarray(impressions, dtype=np.float64)
+    c = np.minimum(np.asarray(conversions, dtype=np.float64), n)
+
+    untried = n == 0
+    if untried.any():
+        return _with_floor(untried / untried.sum(), min_weight)
+
+    mean = c / n
+    if revenue is not None:
+        values = _value_per_conversion(c, np.asarray(revenue, dtype=np.float64))
+        mean = mean * values / values.max()
+
+    scores = mean + np.sqrt(2.0 * math.log(n.sum()) / n)
+    best = scores == scores.max()
+    return _with_floor(best / best.sum(), min_weight)
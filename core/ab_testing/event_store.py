@@ -0,0 +1,287 @@
+"""
+A/B 테스트 이벤트 저장소
+노출/전환 이벤트를 SQLite(WAL) 테이블에 추가 기록하고 주기적으로 스냅샷
+
+집계 카운터 = 마지막 스냅샷 + 스냅샷 이후 이벤트. 이벤트는 1건씩 커밋되므로
+프로세스가 비정상 종료돼도 기록된 이벤트는 유지되고, 여러 프로세스가
+동시에 기록해도 안전하다.
+
+내구성은 synchronous 설정을 따른다:
+- FULL (기본): 커밋마다 WAL을 fsync → 전원 차단/OS 장애에도 커밋된 이벤트 유지
+- NORMAL: fsync는 체크포인트 때만 → 프로세스 종료에는 안전하지만 전원
+  차단/OS 장애 시 마지막 체크포인트 이후 커밋이 사라질 수 있음 (쓰기는 더 빠름)
+"""
+
+import time
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, Dict, List, Tuple, Iterable
+
+
+IMPRESSION = "impression"
+CONVERSION = "conversion"
+
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    test_id TEXT NOT NULL,
+    variant_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    user_id TEXT,
+    revenue REAL NOT NULL DEFAULT 0,
+    ts REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_test ON events (test_id, kind);
+CREATE TABLE IF NOT EXISTS snapshot (
+    test_id TEXT NOT NULL,
+    variant_id TEXT NOT NULL,
+    impressions INTEGER NOT NULL DEFAULT 0,
+    conversions INTEGER NOT NULL DEFAULT 0,
+    revenue REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (test_id, variant_id)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# (impressions, conversions, revenue)
+Counters = Tuple[int, int, float]
+
+
+class ABEventStore:
+    """추가 전용 이벤트 로그 + 스냅샷"""
+
+    def __init__(self, db_path: str = "ab_tests/events.db", synchronous: str = "FULL"):
+        """
+        Args:
+            db_path: 이벤트 DB 경로 (여러 프로세스가 공유 가능)
+            synchronous: SQLite synchronous 모드 (FULL/NORMAL 등, 모듈 설명 참고)
+        """
+        synchronous = synchronous.upper()
+        if synchronous not in SYNCHRONOUS_MODES:
+            print(f"[경고] 알 수 없는 synchronous 모드: {synchronous} (FULL 사용)")
+            synchronous = "FULL"
+        self.synchronous = synchronous
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path), timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={synchronous}")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------ 기록
+
+    def append(
+        self,
+        test_id: str,
+        variant_id: str,
+        kind: str,
+        user_id: Optional[str] = None,
+        revenue: float = 0.0
+    ) -> int:
+        """
+        이벤트 1건 기록 (즉시 커밋)
+
+        Returns:
+            이벤트 순번
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO events (test_id, variant_id, kind, user_id, revenue, ts) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (test_id, variant_id, kind, user_id, revenue, time.time())
+            )
+            return cursor.lastrowid
+
+    def append_many(
+        self,
+        events: Iterable[Tuple[str, str, str, Optional[str], float]]
+    ) -> int:
+        """
+        이벤트 일괄 기록 (트랜잭션 1회)
+
+        Args:
+            events: (test_id, variant_id, kind, user_id, revenue) 목록
+
+        Returns:
+            기록한 이벤트 수
+        """
+        now = time.time()
+        rows = [(t, v, k, u, r, now) for t, v, k, u, r in events]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO events (test_id, variant_id, kind, user_id, revenue, ts) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(rows)
+
+    def register_variants(
+        self,
+        test_id: str,
+        baseline: Dict[str, Counters]
+    ) -> None:
+        """
+        변형 스냅샷 행 생성 (이미 있으면 유지)
+
+        기존 tests.json 카운터를 이전할 때 baseline으로 넘긴다.
+        """
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO snapshot (test_id, variant_id, impressions, conversions, revenue) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(test_id, vid, imp, conv, rev) for vid, (imp, conv, rev) in baseline.items()]
+            )
+
+    # ------------------------------------------------------------------ 집계
+
+    def _snapshot_seq(self) -> int:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'snapshot_seq'").fetchone()
+        return int(row[0]) if row else 0
+
+    def last_seq(self) -> int:
+        """마지막 이벤트 순번"""
+        with self._lock:
+            row = self._conn.execute("SELECT MAX(seq) FROM events").fetchone()
+            return row[0] or 0
+
+    def known_variants(self) -> set:
+        """스냅샷 행이 있는 (test_id, variant_id)"""
+        with self._lock:
+            return {tuple(r) for r in self._conn.execute("SELECT test_id, variant_id FROM snapshot")}
+
+    def counters(self, test_ids: Optional[Iterable[str]] = None) -> Dict[Tuple[str, str], Counters]:
+        """
+        집계 (스냅샷 + 스냅샷 이후 이벤트)
+
+        Args:
+            test_ids: 대상 테스트 (None이면 전체)
+
+        Returns:
+            {(test_id, variant_id): (impressions, conversions, revenue)}
+        """
+        if test_ids is not None:
+            test_ids = list(test_ids)
+            if not test_ids:
+                return {}
+        with self._lock:
+            # 스냅샷과 이후 이벤트를 같은 시점 기준으로 읽음
+            self._conn.execute("BEGIN")
+            try:
+                return self._aggregate(self._conn, test_ids)
+            finally:
+                self._conn.execute("COMMIT")
+
+    def revenue_histogram(
+        self,
+        test_ids: Optional[Iterable[str]] = None,
+        precision: int = 2
+    ) -> Dict[Tuple[str, str], List[Tuple[float, int]]]:
+        """
+        전환 매출 분포 (개별 전환 이벤트 기준, 통계 분석용)
+
+        Args:
+            test_ids: 대상 테스트 (None이면 전체)
+            precision: 매출 반올림 자릿수 (같은 값끼리 묶음)
+
+        Returns:
+            {(test_id, variant_id): [(매출액, 건수), ...]}
+        """
+        query = (
+            "SELECT test_id, variant_id, ROUND(revenue, ?) AS amount, COUNT(*) "
+            "FROM events WHERE kind = ?"
+        )
+        params: list = [precision, CONVERSION]
+        if test_ids is not None:
+            test_ids = list(test_ids)
+            query += f" AND test_id IN ({','.join('?' * len(test_ids))})"
+            params.extend(test_ids)
+        query += " GROUP BY test_id, variant_id, amount"
+
+        histogram: Dict[Tuple[str, str], List[Tuple[float, int]]] = {}
+        with self._lock:
+            for test_id, variant_id, amount, count in self._conn.execute(query, params):
+                histogram.setdefault((test_id, variant_id), []).append((amount, count))
+        return histogram
+
+    def _aggregate(
+        self,
+        conn: sqlite3.Connection,
+        test_ids: Optional[List[str]] = None
+    ) -> Dict[Tuple[str, str], Counters]:
+        where, params = "", []
+        if test_ids is not None:
+            where = f" AND test_id IN ({','.join('?' * len(test_ids))})"
+            params = list(test_ids)
+
+        totals: Dict[Tuple[str, str], List] = {
+            (t, v): [imp, conv, rev]
+            for t, v, imp, conv, rev in conn.execute(
+                "SELECT test_id, variant_id, impressions, conversions, revenue FROM snapshot "
+                "WHERE 1 = 1" + where,
+                params
+            )
+        }
+
+        tail = conn.execute(
+            "SELECT test_id, variant_id, kind, COUNT(*), COALESCE(SUM(revenue), 0) "
+            "FROM events WHERE seq > ?" + where + " GROUP BY test_id, variant_id, kind",
+            [self._snapshot_seq()] + params
+        )
+        for test_id, variant_id, kind, count, revenue in tail:
+            entry = totals.setdefault((test_id, variant_id), [0, 0, 0.0])
+            if kind == IMPRESSION:
+                entry[0] += count
+            elif kind == CONVERSION:
+                entry[1] += count
+                entry[2] += revenue
+
+        return {key: (imp, conv, rev) for key, (imp, conv, rev) in totals.items()}
+
+    def snapshot(self) -> int:
+        """
+        현재 집계를 스냅샷으로 저장 (재시작 시 이후 이벤트만 재생)
+
+        집계와 스냅샷 순번 갱신을 한 트랜잭션에서 처리하므로 다른 프로세스의
+        동시 기록과 겹쳐도 이벤트가 중복/누락되지 않는다.
+
+        Returns:
+            스냅샷 순번
+        """
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                seq = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM events").fetchone()[0]
+                totals = self._aggregate(conn)
+                conn.executemany(
+                    "INSERT OR REPLACE INTO snapshot (test_id, variant_id, impressions, conversions, revenue) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(t, v, imp, conv, rev) for (t, v), (imp, conv, rev) in totals.items()]
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('snapshot_seq', ?)", (str(seq),)
+                )
+                conn.execute("COMMIT")
+                return seq
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
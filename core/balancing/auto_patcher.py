@@ -1,49 +1,183 @@
+import os
 import json
+import hashlib
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+
+# GDD keys that record patch history rather than game configuration
+METADATA_KEYS = ("last_patched", "patch_notes")
+
 
 class AutoPatcher:
     """
     Automatically modifies game configuration based on market sentiment.
     """
-    
-    def __init__(self, games_dir: str = "games"):
+
+    def __init__(self, games_dir: str = "games", max_workers: int = 8):
         self.games_dir = Path(games_dir)
-        
+        self.index_path = self.games_dir / "gdd_index.json"
+        self.max_workers = max_workers
+        self._index_lock = threading.Lock()
+
     def create_patch(self, gdd_path: str, sentiments: Dict[str, float]) -> Dict[str, Any]:
         """
         Apply patch to GDD based on sentiments.
         """
-        patch_note = []
-        changes = {}
-        
         try:
             with open(gdd_path, "r", encoding="utf-8") as f:
                 gdd = json.load(f)
         except Exception as e:
             print(f"[AutoPatcher] Failed to load GDD: {e}")
             return {"success": False, "error": str(e)}
-            
+
+        patch_note, changes = self._apply(gdd, sentiments)
+
+        # Save
+        self._write_atomic(Path(gdd_path), gdd)
+
+        print(f"[AutoPatcher] Patch Applied: {patch_note}")
+
+        return {
+            "success": True,
+            "patch_note": "\n".join(patch_note),
+            "changes": changes
+        }
+
+    def patch_many(
+        self,
+        sentiments_by_game: Dict[str, Dict[str, float]],
+        rebuild: bool = False,
+        build_queue=None,
+        platforms: Optional[List[str]] = None,
+        output_dir: str = "builds"
+    ) -> Dict[str, Any]:
+        """
+        Apply sentiment patches to many games concurrently.
+
+        Games are located through the GDD index (game_id = GDD directory
+        relative to games_dir). A game is only rewritten when its effective
+        config (everything except patch metadata) changes.
+
+        Args:
+            sentiments_by_game: {game_id: sentiments}
+            rebuild: queue builds for games whose config changed
+            build_queue: BuildQueue to submit to (default builds/build_queue.db)
+            platforms: build targets (default android, html5)
+            output_dir: build output directory
+
+        Returns:
+            {"patched": [...], "unchanged": [...], "missing": [...],
+             "failed": {game_id: error}, "changes": {game_id: changes},
+             "builds": {game_id: [job_id, ...]}}
+        """
+        paths = self.locate(list(sentiments_by_game))
+        summary = {"patched": [], "unchanged": [], "missing": [], "failed": {}, "changes": {}, "builds": {}}
+
+        tasks = []
+        for game_id, sentiments in sentiments_by_game.items():
+            if game_id in paths:
+                tasks.append((game_id, paths[game_id], sentiments))
+            else:
+                summary["missing"].append(game_id)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results = list(pool.map(lambda task: self._patch_one(*task), tasks))
+
+        for game_id, result in results:
+            if "error" in result:
+                summary["failed"][game_id] = result["error"]
+            elif result["changed"]:
+                summary["patched"].append(game_id)
+                summary["changes"][game_id] = result["changes"]
+            else:
+                summary["unchanged"].append(game_id)
+
+        if rebuild and summary["patched"]:
+            summary["builds"] = self._queue_rebuilds(
+                {game_id: paths[game_id].parent for game_id in summary["patched"]},
+                build_queue, platforms or ["android", "html5"], output_dir
+            )
+
+        print(
+            f"[AutoPatcher] {len(summary['patched'])} patched, {len(summary['unchanged'])} unchanged, "
+            f"{len(summary['missing'])} missing, {len(summary['failed'])} failed, "
+            f"{sum(len(jobs) for jobs in summary['builds'].values())} builds queued"
+        )
+        return summary
+
+    def locate(self, game_ids: List[str]) -> Dict[str, Path]:
+        """
+        Resolve GDD paths from the index, rescanning games_dir once if any
+        requested game is unknown or its GDD has moved.
+        """
+        with self._index_lock:
+            index = self._load_index()
+            stale = [g for g in game_ids if g not in index or not (self.games_dir / index[g]).exists()]
+            if stale:
+                index = self.rebuild_index()
+        return {g: self.games_dir / index[g] for g in game_ids if g in index}
+
+    def rebuild_index(self) -> Dict[str, str]:
+        """Scan games_dir for gdd.json files and rewrite the index."""
+        index = {}
+        for gdd_path in sorted(self.games_dir.rglob("gdd.json")):
+            rel = gdd_path.relative_to(self.games_dir)
+            index[rel.parent.as_posix()] = rel.as_posix()
+        if self.games_dir.exists():
+            self._write_atomic(self.index_path, index)
+        return index
+
+    def _load_index(self) -> Dict[str, str]:
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"[AutoPatcher] Failed to load GDD index: {e}")
+            return {}
+
+    def _patch_one(self, game_id: str, gdd_path: Path, sentiments: Dict[str, float]) -> Tuple[str, Dict[str, Any]]:
+        try:
+            with open(gdd_path, "r", encoding="utf-8") as f:
+                gdd = json.load(f)
+            before = self._config_hash(gdd)
+            patch_note, changes = self._apply(gdd, sentiments)
+            if not changes or self._config_hash(gdd) == before:
+                return game_id, {"changed": False}
+            self._write_atomic(gdd_path, gdd)
+            return game_id, {"changed": True, "changes": changes, "patch_note": "\n".join(patch_note)}
+        except Exception as e:
+            print(f"[AutoPatcher] Failed to patch {game_id}: {e}")
+            return game_id, {"error": str(e)}
+
+    def _apply(self, gdd: Dict[str, Any], sentiments: Dict[str, float]) -> Tuple[List[str], Dict[str, Any]]:
+        """Apply sentiment rules to a loaded GDD in place."""
+        patch_note = []
+        changes = {}
+
         # Logic: Difficulty Adjustment
         difficulty = gdd.get("difficulty", {})
         if not difficulty: difficulty = {"level": 1.0}
-        
+
         current_level = difficulty.get("level", 1.0)
-        
+
         if sentiments.get("difficulty", 0) > 0.5:
             # Too Hard -> Reduce Difficulty
             new_level = max(0.5, current_level * 0.8)
             patch_note.append(f"난이도 하향 조정 ({current_level:.1f} -> {new_level:.1f})")
             difficulty["level"] = new_level
             changes["difficulty"] = new_level
-            
+
         elif sentiments.get("boredom", 0) > 0.5:
             # Boring -> Increase Game Speed or Spawn Rate
             game_speed = gdd.get("game_config", {}).get("game_speed", 1.0)
             new_speed = game_speed * 1.2
             patch_note.append(f"게임 속도 상향 ({game_speed:.1f} -> {new_speed:.1f})")
-            
+
             if "game_config" not in gdd: gdd["game_config"] = {}
             gdd["game_config"]["game_speed"] = new_speed
             changes["game_speed"] = new_speed
@@ -52,15 +186,38 @@ class AutoPatcher:
         gdd["difficulty"] = difficulty
         gdd["last_patched"] = datetime.now().isoformat()
         gdd["patch_notes"] = gdd.get("patch_notes", []) + patch_note
-        
-        # Save
-        with open(gdd_path, "w", encoding="utf-8") as f:
-            json.dump(gdd, f, indent=2, ensure_ascii=False)
-            
-        print(f"[AutoPatcher] Patch Applied: {patch_note}")
-        
-        return {
-            "success": True,
-            "patch_note": "\n".join(patch_note),
-            "changes": changes
-        }
+
+        return patch_note, changes
+
+    def _config_hash(self, gdd: Dict[str, Any]) -> str:
+        """Hash of the effective config (GDD without patch metadata)."""
+        config = {k: v for k, v in gdd.items() if k not in METADATA_KEYS}
+        return hashlib.sha256(json.dumps(config, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def _write_atomic(self, path: Path, data: Any) -> None:
+        """Write JSON via temp file + rename so readers never see a partial file."""
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def _queue_rebuilds(
+        self,
+        projects: Dict[str, Path],
+        build_queue,
+        platforms: List[str],
+        output_dir: str
+    ) -> Dict[str, List[str]]:
+        if build_queue is None:
+            try:
+                from ..builder.build_queue import BuildQueue
+            except ImportError as e:
+                print(f"[AutoPatcher] Build queue unavailable, skipping rebuilds: {e}")
+                return {}
+            build_queue = BuildQueue()
+
+        builds = {}
+        for game_id, project_path in projects.items():
+            jobs = build_queue.submit_project(str(project_path), platforms, output_dir)
+            builds[game_id] = [job.job_id for job in jobs]
+        return builds
@@ -3,12 +3,17 @@
 게임 파라미터 원격 조정
 """
 
+import copy
 import json
+import random
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, field
 
+from .config_store import ConfigStore
+from ..cache.lazy_index import LazyIndex
+
 
 @dataclass
 class BalanceConfig:
@@ -105,25 +110,77 @@ class BalanceManager:
         }
     }
     
-    def __init__(self, data_dir: str = "balance"):
+    def __init__(self, data_dir: str = "balance", cache_size: int = 1024):
+        """
+        Args:
+            data_dir: 데이터 디렉토리 (config_<id>.json, index.db: 설정 인덱스)
+            cache_size: 메모리에 보관할 설정 수 (나머지는 요청 시 파일에서 읽음)
+        """
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.configs: Dict[str, BalanceConfig] = {}
+        self.configs: LazyIndex = LazyIndex(
+            str(self.data_dir / "index.db"), self._read_config, self._describe, cache_size
+        )
+        self.store = ConfigStore(data_dir)
         self._load_configs()
     
     def _load_configs(self) -> None:
-        """저장된 설정 로드"""
-        for file in self.data_dir.glob("*.json"):
-            if file.name.startswith("config_"):
-                with open(file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    if data.get("created_at"):
-                        data["created_at"] = datetime.fromisoformat(data["created_at"])
-                    config = BalanceConfig(**data)
-                    self.configs[config.config_id] = config
+        """설정 인덱스 로드 (인덱스가 없으면 설정 파일을 한 번 훑어 생성)"""
+        if self.configs.load():
+            return
+        config_ids = [
+            file.stem[len("config_"):]
+            for file in self.data_dir.glob("config_*.json")
+        ]
+        self.configs.rebuild(config_ids)
+    
+    def _read_config(self, config_id: str) -> Optional[BalanceConfig]:
+        """설정 파일 파싱 (없으면 None)"""
+        filepath = self.data_dir / f"config_{config_id}.json"
+        if not filepath.exists():
+            return None
+        with open(filepath, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("created_at"):
+            data["created_at"] = datetime.fromisoformat(data["created_at"])
+        return BalanceConfig(**data)
+    
+    def _describe(self, config: BalanceConfig) -> Dict[str, Any]:
+        """인덱스 메타데이터"""
+        return {
+            "game_id": config.game_id,
+            "version": config.version,
+            "published": config.published,
+            "file": f"config_{config.config_id}.json"
+        }
+    
+    def list_configs(self, game_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        설정 목록 (인덱스만 읽음)
+        
+        Args:
+            game_id: 게임 ID (None이면 전체)
+        
+        Returns:
+            [{"config_id", "game_id", "version", "published", "file"}]
+        """
+        return [
+            {"config_id": config_id, **self.configs.meta(config_id)}
+            for config_id in self.configs.select(game_id=game_id)
+        ]
+    
+    def _parameters(self, config: BalanceConfig) -> Dict[str, Any]:
+        """버전 스냅샷/퍼블리시 본문에 들어가는 파라미터"""
+        return {
+            "version": config.version,
+            "gameplay": config.gameplay,
+            "economy": config.economy,
+            "difficulty": config.difficulty,
+            "ads": config.ads
+        }
     
     def _save_config(self, config: BalanceConfig) -> None:
-        """설정 저장"""
+        """설정 저장 (버전 스냅샷도 기록)"""
         data = {
             "config_id": config.config_id,
             "game_id": config.game_id,
@@ -139,13 +196,16 @@ class BalanceManager:
         filepath = self.data_dir / f"config_{config.config_id}.json"
         with open(filepath, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
+        
+        self.configs.put(config.config_id, config)
+        self.store.save_version(config.config_id, config.version, self._parameters(config))
     
     def create_config(self, game_id: str, template_type: str = None) -> BalanceConfig:
         """새 밸런스 설정 생성"""
         config_id = f"{game_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
-        # 템플릿 적용
-        template = self.DEFAULT_TEMPLATES.get(template_type, {})
+        # 템플릿 적용 (설정마다 사본 사용, 수정이 템플릿에 번지지 않도록)
+        template = copy.deepcopy(self.DEFAULT_TEMPLATES.get(template_type, {}))
         
         config = BalanceConfig(
             config_id=config_id,
@@ -157,7 +217,6 @@ class BalanceManager:
             ads=template.get("ads", {})
         )
         
-        self.configs[config_id] = config
         self._save_config(config)
         return config
     
@@ -198,32 +257,137 @@ class BalanceManager:
         config.published = True
         self._save_config(config)
         
-        # 퍼블리시된 설정을 별도 파일로 저장 (클라이언트 다운로드용)
-        published_path = self.data_dir / f"published_{config.game_id}.json"
-        with open(published_path, "w", encoding="utf-8") as f:
-            json.dump({
-                "version": config.version,
-                "gameplay": config.gameplay,
-                "economy": config.economy,
-                "difficulty": config.difficulty,
-                "ads": config.ads,
-                "published_at": datetime.now().isoformat()
-            }, f, ensure_ascii=False, indent=2)
+        # 퍼블리시된 설정을 별도 파일로 저장 (클라이언트 다운로드용) 및 메모리 교체
+        payload = copy.deepcopy(self._parameters(config))
+        payload["published_at"] = datetime.now().isoformat()
+        self.store.publish(config.game_id, payload)
         
         return True
     
     def get_published_config(self, game_id: str) -> Optional[Dict[str, Any]]:
-        """퍼블리시된 설정 조회 (클라이언트용)"""
-        published_path = self.data_dir / f"published_{game_id}.json"
+        """퍼블리시된 설정 조회 (클라이언트용, 메모리에서 반환하므로 수정 금지)"""
+        published = self.store.get_published(game_id)
+        return published.payload if published else None
+    
+    def serve_published_config(
+        self,
+        game_id: str,
+        if_none_match: Optional[str] = None,
+        delta: bool = False
+    ) -> Dict[str, Any]:
+        """
+        퍼블리시된 설정 HTTP 응답 (ETag/304/JSON Patch 델타)
         
-        if not published_path.exists():
-            return None
+        Args:
+            game_id: 게임 ID
+            if_none_match: 클라이언트의 If-None-Match 헤더
+            delta: 클라이언트가 가진 버전 기준 JSON Patch 요청
         
-        with open(published_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        Returns:
+            {"status", "etag", "body", "content_type"}
+        """
+        return self.store.serve(game_id, if_none_match, delta)
+    
+    def list_versions(self, config_id: str) -> List[Dict[str, Any]]:
+        """설정 버전 기록 [{version, hash, saved_at}]"""
+        return self.store.list_versions(config_id)
     
-    def compare_configs(self, config_id1: str, config_id2: str) -> Dict[str, Any]:
-        """두 설정 비교"""
+    def get_config_version(self, config_id: str, version: int) -> Optional[Dict[str, Any]]:
+        """특정 버전의 파라미터"""
+        return self.store.get_version(config_id, version)
+    
+    def simulate(
+        self,
+        config_id: str,
+        runs: int = 100_000,
+        seed: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        설정 몬테카를로 시뮬레이션 (러너/매치3/클리커)
+        
+        Args:
+            config_id: 설정 ID
+            runs: 시뮬레이션 횟수
+            seed: 난수 시드
+        
+        Returns:
+            생존 곡선, 분당 재화 등 지표 (러너/매치3: 세션 길이,
+            클리커: 프레스티지 도달 시간/비율)
+        """
+        if config_id not in self.configs:
+            return {"error": "설정을 찾을 수 없습니다"}
+        
+        try:
+            from .simulator import simulate_config
+        except ImportError:
+            return {"error": "numpy가 설치되지 않아 시뮬레이션을 실행할 수 없습니다"}
+        
+        return simulate_config(self.configs[config_id], runs=runs, seed=seed)
+    
+    def tune(
+        self,
+        config_id: str,
+        space: Dict[str, Any],
+        targets: Optional[Dict[str, Any]] = None,
+        tuner_config: Optional[dict] = None
+    ) -> Dict[str, Any]:
+        """
+        시뮬레이션 기반 파라미터 자동 튜닝
+        
+        최선 후보를 설정에 한 번에 적용해 새 버전으로 저장한다 (퍼블리시는
+        별도로 해야 함).
+        
+        Args:
+            config_id: 기준 설정 ID
+            space: 탐색 공간 {"카테고리.키": (최소, 최대) 또는 [선택지]}
+            targets: 목표 지표 {"지표 경로": 목표값} (None이면 설정의 목표값 사용)
+            tuner_config: 탐색 설정 (BalanceTuner 참고)
+        
+        Returns:
+            탐색 결과 + 적용된 config_id/version
+        """
+        if config_id not in self.configs:
+            return {"error": "설정을 찾을 수 없습니다"}
+        
+        try:
+            from .tuner import BalanceTuner
+        except ImportError:
+            return {"error": "numpy가 설치되지 않아 튜닝을 실행할 수 없습니다"}
+        
+        config = self.configs[config_id]
+        result = BalanceTuner(tuner_config).tune(config, space, targets)
+        if "error" in result:
+            return result
+        
+        for key, value in result["best"]["params"].items():
+            category, name = key.split(".", 1)
+            getattr(config, category)[name] = value
+        config.version += 1
+        config.published = False
+        self._save_config(config)
+        
+        result["config_id"] = config.config_id
+        result["version"] = config.version
+        return result
+    
+    def compare_configs(
+        self,
+        config_id1: str,
+        config_id2: str,
+        simulate: bool = False,
+        runs: int = 100_000,
+        seed: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        두 설정 비교
+        
+        Args:
+            config_id1: 기준 설정 ID
+            config_id2: 비교 설정 ID
+            simulate: 시뮬레이션 지표 비교 포함 ("simulation" 키)
+            runs: 설정별 시뮬레이션 횟수
+            seed: 난수 시드 (두 설정에 같은 시드를 써서 비교 분산을 줄임)
+        """
         if config_id1 not in self.configs or config_id2 not in self.configs:
             return {"error": "설정을 찾을 수 없습니다"}
         
@@ -251,8 +415,40 @@ class BalanceManager:
                         "after": val2
                     }
         
+        if simulate:
+            if seed is None:
+                seed = random.randrange(2 ** 32)
+            before = self.simulate(config_id1, runs=runs, seed=seed)
+            after = self.simulate(config_id2, runs=runs, seed=seed)
+            differences["simulation"] = {
+                "before": before,
+                "after": after,
+                "delta": self._simulation_delta(before, after)
+            }
+        
         return differences
     
+    def _simulation_delta(self, before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, float]:
+        """시뮬레이션 주요 지표 차이 (after - before, 두 결과에 모두 있는 지표만)"""
+        if "error" in before or "error" in after:
+            return {}
+        
+        metrics = {
+            "median_session": lambda r: r.get("session_length", {}).get("median"),
+            "mean_session": lambda r: r.get("session_length", {}).get("mean"),
+            "median_time_to_prestige": lambda r: r.get("time_to_prestige", {}).get("median"),
+            "prestige_rate": lambda r: r.get("prestige_rate"),
+            "coins_per_minute": lambda r: r.get("coins_per_minute"),
+            "score_per_minute": lambda r: r.get("score_per_minute"),
+            "win_rate": lambda r: r.get("win_rate"),
+        }
+        delta = {}
+        for name, metric in metrics.items():
+            b, a = metric(before), metric(after)
+            if b is not None and a is not None:
+                delta[name] = round(a - b, 4)
+        return delta
+    
     def generate_gdscript(self, config_id: str) -> str:
         """GDScript 설정 파일 생성"""
         if config_id not in self.configs:
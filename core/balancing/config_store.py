@@ -0,0 +1,329 @@
+"""
+버전 관리 밸런스 설정 저장소
+모든 설정 버전을 내용 해시로 보관하고 퍼블리시된 설정을 메모리에서 서빙
+
+- objects/<sha256>.json: 정규화 JSON 본문 (내용 주소 저장, 중복 없음)
+- versions/<config_id>.json: 설정 버전 기록 [{version, hash, saved_at}]
+- published_<game_id>.json: 클라이언트 다운로드용 현재 퍼블리시 본문 (기존 형식 유지)
+- published_<game_id>.history.json: 퍼블리시 기록 [{etag, version, published_at}]
+
+클라이언트는 받은 ETag를 If-None-Match로 보내 304를 받거나, 델타를
+요청하면 자신이 가진 버전에서 현재 버전까지의 JSON Patch(RFC 6902)를 받는다.
+"""
+
+import os
+import json
+import hashlib
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass
+
+
+JSON_CONTENT_TYPE = "application/json"
+PATCH_CONTENT_TYPE = "application/json-patch+json"
+
+
+def canonical_json(data: Any) -> bytes:
+    """정규화 JSON (키 정렬, 공백 없음) - 같은 내용이면 같은 바이트"""
+    return json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def content_hash(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()
+
+
+def make_etag(body: bytes) -> str:
+    """강한 ETag (본문 해시)"""
+    return f'"{content_hash(body)[:32]}"'
+
+
+def _pointer(path: List[str]) -> str:
+    return "".join("/" + str(p).replace("~", "~0").replace("/", "~1") for p in path)
+
+
+def make_json_patch(old: Any, new: Any, path: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    두 JSON 문서 차이 → JSON Patch 연산 목록
+
+    객체는 키 단위로 재귀 비교하고, 배열/값이 다르면 통째로 replace 한다.
+    """
+    path = path or []
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = []
+        for key in sorted(old.keys() - new.keys()):
+            ops.append({"op": "remove", "path": _pointer(path + [key])})
+        for key in sorted(new.keys()):
+            if key not in old:
+                ops.append({"op": "add", "path": _pointer(path + [key]), "value": new[key]})
+            else:
+                ops.extend(make_json_patch(old[key], new[key], path + [key]))
+        return ops
+    if old == new and type(old) is type(new):
+        return []
+    return [{"op": "replace", "path": _pointer(path), "value": new}]
+
+
+def apply_json_patch(document: Any, ops: List[Dict[str, Any]]) -> Any:
+    """JSON Patch 적용 (add/remove/replace, 클라이언트 측 참고 구현)"""
+    document = json.loads(json.dumps(document))
+    for op in ops:
+        parts = [p.replace("~1", "/").replace("~0", "~") for p in op["path"].split("/")[1:]]
+        if not parts:
+            document = op.get("value")
+            continue
+        parent = document
+        for part in parts[:-1]:
+            parent = parent[int(part)] if isinstance(parent, list) else parent[part]
+        key = parts[-1]
+        if isinstance(parent, list):
+            key = len(parent) if key == "-" else int(key)
+            if op["op"] == "remove":
+                parent.pop(key)
+            elif op["op"] == "add":
+                parent.insert(key, op["value"])
+            else:
+                parent[key] = op["value"]
+        elif op["op"] == "remove":
+            del parent[key]
+        else:
+            parent[key] = op["value"]
+    return document
+
+
+@dataclass
+class PublishedConfig:
+    """메모리에 올린 퍼블리시 설정"""
+    game_id: str
+    payload: Dict[str, Any]
+    body: bytes
+    etag: str
+    version: int
+    file_stamp: Tuple[int, int, int] = (0, 0, 0)  # 읽은 파일의 (inode, mtime_ns, size)
+
+
+class ConfigStore:
+    """버전/퍼블리시 설정 저장소"""
+
+    def __init__(self, data_dir: str = "balance", max_deltas: int = 256):
+        """
+        Args:
+            data_dir: 저장 디렉토리 (BalanceManager와 공유)
+            max_deltas: 메모리에 보관할 델타 수
+        """
+        self.data_dir = Path(data_dir)
+        self.objects_dir = self.data_dir / "objects"
+        self.versions_dir = self.data_dir / "versions"
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.versions_dir.mkdir(parents=True, exist_ok=True)
+        self.max_deltas = max_deltas
+
+        self._lock = threading.Lock()
+        self._published: Dict[str, PublishedConfig] = {}
+        # (기준 ETag, 현재 ETag) → 패치 본문
+        self._deltas: Dict[Tuple[str, str], bytes] = {}
+
+    # ------------------------------------------------------------------ 본문/버전
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def put_object(self, data: Dict[str, Any]) -> str:
+        """본문 저장 (이미 있으면 생략)"""
+        body = canonical_json(data)
+        digest = content_hash(body)
+        path = self.objects_dir / f"{digest}.json"
+        if not path.exists():
+            self._write_atomic(path, body)
+        return digest
+
+    def get_object(self, digest: str) -> Optional[Dict[str, Any]]:
+        path = self.objects_dir / f"{digest}.json"
+        if not path.exists():
+            return None
+        with open(path, "rb") as f:
+            return json.loads(f.read())
+
+    def list_versions(self, config_id: str) -> List[Dict[str, Any]]:
+        """설정 버전 기록 [{version, hash, saved_at}]"""
+        path = self.versions_dir / f"{config_id}.json"
+        if not path.exists():
+            return []
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def save_version(self, config_id: str, version: int, data: Dict[str, Any]) -> str:
+        """
+        설정 버전 기록 (같은 버전 재저장 시 덮어씀)
+
+        Returns:
+            내용 해시
+        """
+        digest = self.put_object(data)
+        with self._lock:
+            history = [h for h in self.list_versions(config_id) if h["version"] != version]
+            history.append({"version": version, "hash": digest, "saved_at": datetime.now().isoformat()})
+            history.sort(key=lambda h: h["version"])
+            self._write_atomic(
+                self.versions_dir / f"{config_id}.json",
+                json.dumps(history, ensure_ascii=False, indent=2).encode("utf-8")
+            )
+        return digest
+
+    def get_version(self, config_id: str, version: int) -> Optional[Dict[str, Any]]:
+        """특정 버전 본문"""
+        for entry in self.list_versions(config_id):
+            if entry["version"] == version:
+                return self.get_object(entry["hash"])
+        return None
+
+    # ------------------------------------------------------------------ 퍼블리시
+
+    def _history_path(self, game_id: str) -> Path:
+        return self.data_dir / f"published_{game_id}.history.json"
+
+    def publish_history(self, game_id: str) -> List[Dict[str, Any]]:
+        """퍼블리시 기록 [{etag, hash, version, published_at}]"""
+        path = self._history_path(game_id)
+        if not path.exists():
+            return []
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def publish(self, game_id: str, payload: Dict[str, Any]) -> PublishedConfig:
+        """
+        퍼블리시 본문 저장 및 메모리 교체
+
+        Returns:
+            PublishedConfig
+        """
+        body = canonical_json(payload)
+        digest = self.put_object(payload)
+        published = PublishedConfig(
+            game_id=game_id,
+            payload=payload,
+            body=body,
+            etag=make_etag(body),
+            version=payload.get("version", 0)
+        )
+
+        with self._lock:
+            self._write_atomic(
+                self._published_path(game_id),
+                json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+            )
+            history = self.publish_history(game_id)
+            history.append({
+                "etag": published.etag,
+                "hash": digest,
+                "version": published.version,
+                "published_at": payload.get("published_at", datetime.now().isoformat())
+            })
+            self._write_atomic(
+                self._history_path(game_id),
+                json.dumps(history, ensure_ascii=False, indent=2).encode("utf-8")
+            )
+            published.file_stamp = self._file_stamp(self._published_path(game_id))
+            self._published[game_id] = published
+        return published
+
+    def _published_path(self, game_id: str) -> Path:
+        return self.data_dir / f"published_{game_id}.json"
+
+    def _file_stamp(self, path: Path) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def get_published(self, game_id: str) -> Optional[PublishedConfig]:
+        """
+        현재 퍼블리시 설정
+
+        메모리 사본은 파일 stat이 같을 때만 사용한다 (요청당 stat 1회).
+        다른 프로세스(CLI, 다른 워커)가 퍼블리시하면 파일이 교체되므로 다시 읽는다.
+        """
+        path = self._published_path(game_id)
+        stamp = self._file_stamp(path)
+        if stamp is None:
+            with self._lock:
+                self._published.pop(game_id, None)
+            return None
+
+        published = self._published.get(game_id)
+        if published is not None and published.file_stamp == stamp:
+            return published
+
+        with open(path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+        body = canonical_json(payload)
+        published = PublishedConfig(
+            game_id=game_id, payload=payload, body=body,
+            etag=make_etag(body), version=payload.get("version", 0),
+            file_stamp=stamp
+        )
+        with self._lock:
+            self._published[game_id] = published
+        return published
+
+    def _payload_for_etag(self, game_id: str, etag: str) -> Optional[Dict[str, Any]]:
+        for entry in reversed(self.publish_history(game_id)):
+            if entry["etag"] == etag:
+                return self.get_object(entry["hash"])
+        return None
+
+    def serve(
+        self,
+        game_id: str,
+        if_none_match: Optional[str] = None,
+        delta: bool = False
+    ) -> Dict[str, Any]:
+        """
+        클라이언트 요청 처리
+
+        Args:
+            game_id: 게임 ID
+            if_none_match: 클라이언트가 가진 ETag (쉼표 구분 여러 개 또는 *)
+            delta: 가진 버전에서 현재 버전까지 JSON Patch로 응답
+
+        Returns:
+            {"status": 200/304/404, "etag", "body": bytes, "content_type"}
+        """
+        published = self.get_published(game_id)
+        if published is None:
+            return {"status": 404, "etag": None, "body": b"", "content_type": JSON_CONTENT_TYPE}
+
+        tags = [t.strip() for t in (if_none_match or "").split(",") if t.strip()]
+        tags = [t[2:] if t.startswith("W/") else t for t in tags]
+        if "*" in tags or published.etag in tags:
+            return {"status": 304, "etag": published.etag, "body": b"", "content_type": JSON_CONTENT_TYPE}
+
+        if delta and tags:
+            body = self._delta(game_id, tags[0], published)
+            if body is not None:
+                return {"status": 200, "etag": published.etag, "body": body, "content_type": PATCH_CONTENT_TYPE}
+
+        return {"status": 200, "etag": published.etag, "body": published.body, "content_type": JSON_CONTENT_TYPE}
+
+    def _delta(self, game_id: str, base_etag: str, current: PublishedConfig) -> Optional[bytes]:
+        """기준 ETag → 현재 버전 패치 (알 수 없는 기준이면 None)"""
+        key = (base_etag, current.etag)
+        cached = self._deltas.get(key)
+        if cached is not None:
+            return cached
+
+        base = self._payload_for_etag(game_id, base_etag)
+        if base is None:
+            return None
+        body = canonical_json(make_json_patch(base, current.payload))
+
+        with self._lock:
+            if len(self._deltas) >= self.max_deltas:
+                self._deltas.pop(next(iter(self._deltas)))
+            self._deltas[key] = body
+        return body
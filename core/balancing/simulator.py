@@ -0,0 +1,441 @@
+"""
+밸런스 시뮬레이터
+러너/매치3/클리커 핵심 루프를 헤드리스로 수백만 회 시뮬레이션 (numpy 필요)
+
+게임을 빌드하지 않고 BalanceConfig 값이 플레이어에게 어떤 의미인지
+(생존 곡선, 기대 세션 길이, 분당 재화 수입) 몇 초 안에 추정한다.
+플레이어 실력은 런마다 분포에서 뽑는다.
+"""
+
+from typing import Dict, Any, Optional, List
+
+import numpy as np
+
+
+# 러너 기하/플레이어 모델 (템플릿 기준값)
+RUNNER_MODEL = {
+    "obstacle_width": 60.0,      # px
+    "obstacle_height": 50.0,     # px
+    "player_width": 50.0,        # px
+    "view_distance": 800.0,      # 장애물이 보이기 시작하는 거리 (px)
+    "reaction_time": 0.25,       # 반응 시간 (초)
+    "timing_error_median": 0.06, # 점프 타이밍 오차 중앙값 (초)
+    "timing_error_spread": 0.5,  # 오차 로그정규 분산 (실력 편차)
+    "score_per_second": 100.0,   # game_manager.gd: distance += delta * 100 * difficulty
+    "score_coin_rate": 0.1,      # game_manager.gd: earned_coins = int(score * 0.1)
+    "max_session": 1800.0,       # 시뮬레이션 상한 (초)
+}
+
+# 매치3 플레이어 모델
+MATCH3_MODEL = {
+    "gem_types": 6,              # template_match3 기본값
+    "think_time": 2.0,           # 이동당 고민 시간 (초)
+    "cascade_delay": 0.9,        # 연쇄 1회 연출 (board.gd: 0.3초 × 3)
+    "skill_bonus": 0.25,         # 실력 최고 플레이어의 긴 매칭 확률 가산
+    "max_cascades": 10,
+}
+
+# 클리커 플레이어 모델
+CLICKER_MODEL = {
+    "tap_rate_median": 4.0,      # 초당 탭 중앙값
+    "tap_rate_spread": 0.4,      # 탭 속도 로그정규 분산
+    "click_upgrade_cost": 10.0,  # main.gd 업그레이드 기준 비용
+    "auto_upgrade_cost": 50.0,
+    "auto_upgrade_rate": 1.0,    # 자동 클리커 1단계당 초당 클릭
+    "prestige_threshold": 1_000_000,  # template_clicker 기본값 (누적 코인)
+    "max_session": 6 * 3600.0,
+}
+
+SURVIVAL_POINTS = 20
+
+
+def detect_game_type(gameplay: Dict[str, Any]) -> Optional[str]:
+    """게임플레이 파라미터로 시뮬레이터 종류 판별"""
+    if "obstacle_gap_min" in gameplay or "jump_height" in gameplay:
+        return "runner"
+    if "grid_size" in gameplay or "min_match" in gameplay:
+        return "match3"
+    if "base_click_value" in gameplay:
+        return "clicker"
+    return None
+
+
+def _summary(values: np.ndarray) -> Dict[str, float]:
+    if len(values) == 0:
+        return {"mean": 0.0, "median": 0.0, "p10": 0.0, "p90": 0.0}
+    p10, median, p90 = np.percentile(values, [10, 50, 90])
+    return {
+        "mean": round(float(values.mean()), 3),
+        "median": round(float(median), 3),
+        "p10": round(float(p10), 3),
+        "p90": round(float(p90), 3),
+    }
+
+
+def _survival_curve(ends: np.ndarray, horizon: float, unit: str) -> List[Dict[str, float]]:
+    """종료 시점 분포 → 시점별 진행 중 비율"""
+    grid = np.linspace(0, horizon, SURVIVAL_POINTS + 1)
+    ends = np.sort(ends)
+    alive = 1.0 - np.searchsorted(ends, grid, side="right") / len(ends)
+    return [{unit: round(float(x), 3), "alive": round(float(a), 4)} for x, a in zip(grid, alive)]
+
+
+def _erf(x: np.ndarray) -> np.ndarray:
+    """오차 함수 근사 (Abramowitz-Stegun 7.1.26, 오차 < 1.5e-7)"""
+    sign = np.sign(x)
+    x = np.abs(x)
+    t = 1.0 / (1.0 + 0.3275911 * x)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    return sign * (1.0 - poly * np.exp(-x * x))
+
+
+class RunnerSimulator:
+    """
+    무한 러너 시뮬레이터
+
+    장애물마다 이륙 허용 시간 폭 안에 점프하면 통과한다. 허용 폭은 장애물
+    높이 위에 머무는 체공 시간에서 장애물을 지나는 시간을 뺀 값이고, 다음
+    장애물까지 착지할 시간이 부족하면 그만큼 줄어든다. 점프 타이밍 오차는
+    플레이어별 로그정규 분포이며 장애물이 보이는 시간이 반응 시간보다
+    짧으면 커진다.
+
+    속도가 오르는 구간은 장애물 단위로 살아 있는 런만 스텝하고, 최대 속도
+    도달 후에는 장애물당 생존 확률이 일정하므로 남은 통과 횟수를 기하분포로
+    한 번에 뽑는다 (간격 분포는 구적점 평균).
+    """
+
+    GAP_QUADRATURE = 32
+
+    def __init__(self, params: Dict[str, Any], model: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            params: gameplay/economy/difficulty 값을 합친 파라미터
+            model: RUNNER_MODEL 덮어쓰기
+        """
+        self.params = params
+        self.model = {**RUNNER_MODEL, **(model or {})}
+
+        p, m = params, self.model
+        self.base_speed = float(p.get("player_speed", 400.0))
+        gravity = float(p.get("gravity", 980.0))
+        jump = float(p.get("jump_height", 400.0))
+        self.gap_min = float(p.get("obstacle_gap_min", 300))
+        self.gap_max = float(p.get("obstacle_gap_max", 600))
+        self.initial = float(p.get("initial_speed", 1.0))
+        self.increase = float(p.get("speed_increase_rate", 0.01))
+        self.max_mult = float(p.get("max_speed_multiplier", 2.0))
+        self.coin_rate = float(p.get("coin_spawn_rate", 0.3))
+        self.coin_value = float(p.get("coin_value", 1))
+
+        # 체공 시간: 초기 수직 속도 jump_height, 중력 gravity (player.gd)
+        self.airtime = 2.0 * jump / gravity
+        # 장애물 높이 위에 머무는 시간 (점프 최고점이 장애물보다 낮으면 0)
+        margin = jump ** 2 - 2.0 * gravity * m["obstacle_height"]
+        self.time_above = 2.0 * np.sqrt(margin) / gravity if margin > 0 else 0.0
+        self.clearance = m["obstacle_width"] + m["player_width"]
+
+    def _window(self, gap: np.ndarray, speed) -> np.ndarray:
+        """이륙 허용 시간 폭"""
+        window = np.clip(self.time_above - self.clearance / speed, 0.0, None)
+        return window * np.minimum(gap / speed / self.airtime, 1.0)
+
+    def _noise(self, sigma: np.ndarray, speed) -> np.ndarray:
+        """보이는 시간이 반응 시간보다 짧으면 오차 증가"""
+        m = self.model
+        return sigma * np.maximum(1.0, m["reaction_time"] * speed / m["view_distance"])
+
+    def run(self, runs: int = 1_000_000, seed: Optional[int] = None) -> Dict[str, Any]:
+        """
+        시뮬레이션 실행
+
+        Returns:
+            {"game_type", "runs", "session_length", "survival_curve",
+             "coins_per_minute", "score", "censored"}
+        """
+        m = self.model
+        rng = np.random.default_rng(seed)
+        cap = m["max_session"]
+
+        index = np.arange(runs)
+        sigma = m["timing_error_median"] * np.exp(rng.normal(0.0, m["timing_error_spread"], runs))
+        t = np.zeros(runs)
+        score = np.zeros(runs)
+        coins = np.zeros(runs)
+
+        end_time = np.empty(runs)
+        end_score = np.empty(runs)
+        end_coins = np.empty(runs)
+        censored = np.zeros(runs, dtype=bool)
+
+        def finish(done: np.ndarray, capped: np.ndarray) -> None:
+            ids = index[done]
+            end_time[ids] = t[done]
+            end_score[ids] = score[done]
+            end_coins[ids] = coins[done]
+            censored[ids] = capped[done]
+
+        # 1단계: 속도 상승 구간 (장애물 단위)
+        ramp_end = (self.max_mult - self.initial) / self.increase if self.increase > 0 else 0.0
+        while len(index):
+            ramping = t < ramp_end
+            if not ramping.any():
+                break
+            mult = np.minimum(self.initial + self.increase * t, self.max_mult)
+            speed = self.base_speed * mult
+            gap = rng.uniform(self.gap_min, self.gap_max, len(index))
+            dt = gap / speed
+            error = np.abs(rng.normal(0.0, 1.0, len(index)) * self._noise(sigma, speed))
+            # 이미 최대 속도에 도달한 런은 이번 스텝을 건너뜀
+            survived = ~ramping | (error < self._window(gap, speed) / 2)
+            step = ramping.astype(np.float64)
+
+            t = t + dt * step
+            score = score + m["score_per_second"] * mult * dt * step
+            coins = coins + rng.poisson(self.coin_rate, len(index)) * self.coin_value * (survived & ramping)
+
+            capped = survived & (t >= cap)
+            done = ~survived | capped
+            if done.any():
+                t = np.where(capped, cap, t)
+                finish(done, capped)
+                keep = ~done
+                index, sigma, t, score, coins = index[keep], sigma[keep], t[keep], score[keep], coins[keep]
+
+        # 2단계: 최대 속도 구간 (기하분포로 한 번에)
+        if len(index):
+            mult = self.max_mult if self.increase > 0 else min(self.initial, self.max_mult)
+            speed = self.base_speed * mult
+            gaps = self.gap_min + (np.arange(self.GAP_QUADRATURE) + 0.5) / self.GAP_QUADRATURE * (self.gap_max - self.gap_min)
+            windows = self._window(gaps, speed)
+            noise = self._noise(sigma, speed)
+            survive = _erf(windows[None, :] / (2.0 * np.sqrt(2.0) * noise[:, None]))
+
+            q = survive.mean(axis=1)
+            # 통과한 장애물의 평균 간격 (짧은 간격에서 더 많이 실패)
+            survived_gap = np.where(q > 0, (survive * gaps).mean(axis=1) / np.maximum(q, 1e-300), gaps.mean())
+
+            passed = rng.geometric(np.clip(1.0 - q, 1e-12, 1.0)) - 1
+            limit = np.floor((cap - t) * speed / survived_gap)
+            capped = passed >= limit
+            passed = np.minimum(passed, limit)
+
+            # 실패한 장애물까지 간격 1개 추가
+            dt = np.where(capped, cap - t, (passed * survived_gap + gaps.mean()) / speed)
+            t = t + dt
+            score = score + m["score_per_second"] * mult * dt
+            coins = coins + rng.poisson(self.coin_rate * passed) * self.coin_value
+            finish(np.ones(len(index), dtype=bool), capped)
+
+        total_coins = end_coins + np.floor(end_score * m["score_coin_rate"])
+        minutes = end_time.sum() / 60.0
+
+        return {
+            "game_type": "runner",
+            "runs": runs,
+            "session_length": _summary(end_time),
+            "survival_curve": _survival_curve(end_time, float(np.percentile(end_time, 99)), "time"),
+            "coins_per_minute": round(float(total_coins.sum() / minutes), 3) if minutes > 0 else 0.0,
+            "score": _summary(end_score),
+            "censored": round(float(censored.mean()), 4),
+        }
+
+
+class Match3Simulator:
+    """매치3 레벨 시뮬레이션 (이동 단위 스텝, 연쇄 포함)"""
+
+    def __init__(self, params: Dict[str, Any], model: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            params: gameplay/economy/difficulty 값을 합친 파라미터
+            model: MATCH3_MODEL 덮어쓰기
+        """
+        self.params = params
+        self.model = {**MATCH3_MODEL, **(model or {})}
+
+    def run(self, runs: int = 1_000_000, seed: Optional[int] = None) -> Dict[str, Any]:
+        """
+        시뮬레이션 실행
+
+        목표 점수 = target_score_multiplier × initial_moves × min_match × score_per_gem
+        (연쇄 없이 최소 매칭만 하는 플레이 대비 배수)
+
+        Returns:
+            {"game_type", "runs", "target_score", "win_rate", "moves_used",
+             "session_length", "survival_curve", "score_per_minute"}
+        """
+        p, m = self.params, self.model
+        rng = np.random.default_rng(seed)
+
+        gem_types = int(p.get("gem_types", m["gem_types"]))
+        min_match = int(p.get("min_match", 3))
+        score_per_gem = float(p.get("score_per_gem", 10))
+        combo = float(p.get("combo_multiplier", 1.5))
+        moves = int(p.get("initial_moves", 30))
+        target = float(p.get("target_score_multiplier", 1.2)) * moves * min_match * score_per_gem
+        swap = float(p.get("swap_duration", 0.2))
+
+        # 실력: 한 칸 더 긴 매칭을 찾을 확률
+        extend = 1.0 / gem_types + m["skill_bonus"] * rng.beta(2.0, 2.0, runs)
+        # 새 젬 1개당 우연히 매칭이 생길 기대 횟수
+        spawn_match = 2.0 * (min_match - 1) / gem_types ** (min_match - 1)
+
+        score = np.zeros(runs)
+        elapsed = np.zeros(runs)
+        finished_at = np.full(runs, moves)
+        active = np.ones(runs, dtype=bool)
+
+        for move in range(1, moves + 1):
+            n = int(active.sum())
+            if n == 0:
+                break
+            ext = extend[active]
+            cleared = min_match + rng.geometric(1.0 - ext, n) - 1
+            gained = cleared * score_per_gem
+            cascades = np.zeros(n)
+
+            # 연쇄: 제거된 젬 수에 비례해 새 매칭 발생
+            chain = np.ones(n, dtype=bool)
+            for level in range(1, int(m["max_cascades"]) + 1):
+                chain &= rng.random(n) < 1.0 - np.exp(-cleared * spawn_match)
+                if not chain.any():
+                    break
+                cleared = np.where(chain, min_match + rng.geometric(1.0 - 1.0 / gem_types, n) - 1, 0)
+                gained += chain * cleared * score_per_gem * combo ** level
+                cascades += chain
+
+            score[active] += gained
+            elapsed[active] += m["think_time"] + swap + m["cascade_delay"] * (1 + cascades)
+
+            won = active & (score >= target)
+            finished_at[won] = move
+            active &= ~won
+
+        win = score >= target
+        minutes = elapsed.sum() / 60.0
+
+        return {
+            "game_type": "match3",
+            "runs": runs,
+            "target_score": target,
+            "win_rate": round(float(win.mean()), 4),
+            "moves_used": _summary(finished_at.astype(np.float64)),
+            "session_length": _summary(elapsed),
+            "survival_curve": _survival_curve(finished_at.astype(np.float64), float(moves), "move"),
+            "score_per_minute": round(float(score.sum() / minutes), 3) if minutes > 0 else 0.0,
+        }
+
+
+class ClickerSimulator:
+    """
+    클리커 프레스티지 도달 시간 시뮬레이션
+
+    클릭 강화(+base_click_value)와 자동 클리커 두 업그레이드 라인이 있고
+    구매할 때마다 비용이 upgrade_cost_multiplier 배로 오른다. 플레이어는
+    비용 대비 수입 증가가 큰 쪽을 모이는 대로 산다. 구매 사이에는 수입이
+    일정하므로 구매 이벤트 단위로 정확히 계산한다 (반복 = 구매 횟수).
+    """
+
+    def __init__(self, params: Dict[str, Any], model: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            params: gameplay/economy/difficulty 값을 합친 파라미터
+            model: CLICKER_MODEL 덮어쓰기
+        """
+        self.params = params
+        self.model = {**CLICKER_MODEL, **(model or {})}
+
+    def run(self, runs: int = 100_000, seed: Optional[int] = None) -> Dict[str, Any]:
+        """
+        시뮬레이션 실행
+
+        Returns:
+            {"game_type", "runs", "time_to_prestige", "prestige_rate",
+             "survival_curve", "coins_per_minute"}
+        """
+        p, m = self.params, self.model
+        rng = np.random.default_rng(seed)
+
+        click_value = float(p.get("base_click_value", 1))
+        cost_mult = float(p.get("upgrade_cost_multiplier", 1.5))
+        threshold = float(p.get("prestige_threshold", m["prestige_threshold"]))
+        auto_rate = m["auto_upgrade_rate"]
+        cap = m["max_session"]
+
+        taps = m["tap_rate_median"] * np.exp(rng.normal(0.0, m["tap_rate_spread"], runs))
+        t = np.zeros(runs)
+        coins = np.zeros(runs)
+        earned = np.zeros(runs)
+        click_level = np.zeros(runs)
+        auto_level = np.zeros(runs)
+        ends = np.full(runs, cap)
+        finished = np.zeros(runs, dtype=bool)
+
+        active = np.ones(runs, dtype=bool)
+        while active.any():
+            income = taps * click_value * (1 + click_level) + auto_rate * auto_level
+            click_cost = m["click_upgrade_cost"] * cost_mult ** click_level
+            auto_cost = m["auto_upgrade_cost"] * cost_mult ** auto_level
+            prefer_click = taps * click_value / click_cost >= auto_rate / auto_cost
+            cost = np.where(prefer_click, click_cost, auto_cost)
+
+            wait = np.maximum(cost - coins, 0.0) / income
+            to_prestige = (threshold - earned) / income
+
+            reached = active & (to_prestige <= wait) & (t + to_prestige <= cap)
+            ends[reached] = t[reached] + to_prestige[reached]
+            finished |= reached
+            # 구매 전에 상한 도달
+            active &= ~reached & (t + wait < cap)
+
+            t = np.where(active, t + wait, t)
+            coins = np.where(active, coins + income * wait - cost, coins)
+            earned = np.where(active, earned + income * wait, earned)
+            click_level += active & prefer_click
+            auto_level += active & ~prefer_click
+
+        # 상한까지 버틴 런의 누적 수입
+        income = taps * click_value * (1 + click_level) + auto_rate * auto_level
+        earned = np.where(finished, threshold, earned + income * (cap - t))
+        minutes = ends.sum() / 60.0
+
+        return {
+            "game_type": "clicker",
+            "runs": runs,
+            "time_to_prestige": _summary(ends),
+            "prestige_rate": round(float(finished.mean()), 4),
+            "survival_curve": _survival_curve(ends, float(ends.max()), "time"),
+            "coins_per_minute": round(float(earned.sum() / minutes), 3) if minutes > 0 else 0.0,
+        }
+
+
+SIMULATORS = {
+    "runner": RunnerSimulator,
+    "match3": Match3Simulator,
+    "clicker": ClickerSimulator,
+}
+
+
+def simulate_config(
+    config,
+    runs: int = 1_000_000,
+    seed: Optional[int] = None,
+    model: Optional[Dict[str, float]] = None
+) -> Dict[str, Any]:
+    """
+    BalanceConfig 시뮬레이션
+
+    Args:
+        config: BalanceConfig
+        runs: 시뮬레이션 횟수
+        seed: 난수 시드
+        model: 플레이어/기하 모델 덮어쓰기
+
+    Returns:
+        시뮬레이션 지표 (지원하지 않는 게임 유형이면 {"error": ...})
+    """
+    game_type = detect_game_type(config.gameplay)
+    if game_type not in SIMULATORS:
+        return {"error": "시뮬레이션을 지원하지 않는 게임 유형입니다"}
+
+    params = {**config.gameplay, **config.economy, **config.difficulty}
+    return SIMULATORS[game_type](params, model).run(runs, seed)
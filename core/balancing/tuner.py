@@ -0,0 +1,211 @@
+"""
+밸런스 자동 튜너
+시뮬레이터로 파라미터 후보를 병렬 평가해 목표 지표에 가장 가까운 값 탐색
+
+탐색 공간 예시:
+    {"gameplay.jump_height": (350.0, 500.0),   # 연속 범위 (양끝이 정수면 정수)
+     "economy.coin_value": [1, 2, 3]}          # 선택지
+
+목표 예시:
+    {"session_length.median": 90}              # 지표 경로: 목표값
+    {"time_to_prestige.median": (3600, 2.0)}   # (목표값, 가중치)
+"""
+
+import os
+import random
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+from .simulator import SIMULATORS, detect_game_type
+
+
+CATEGORIES = ("gameplay", "economy", "difficulty", "ads")
+
+Space = Dict[str, Union[Tuple[float, float], List[Any]]]
+Targets = Dict[str, Union[float, Tuple[float, float]]]
+
+
+def default_targets(config) -> Targets:
+    """설정에 들어 있는 목표값으로 기본 목표 구성 (클리커: target_time_to_prestige)"""
+    target = config.difficulty.get("target_time_to_prestige")
+    if target:
+        return {"time_to_prestige.median": float(target)}
+    return {}
+
+
+def _metric(result: Dict[str, Any], path: str) -> Optional[float]:
+    value: Any = result
+    for part in path.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return float(value)
+
+
+def _loss(result: Dict[str, Any], targets: Targets) -> float:
+    """목표 대비 상대 오차 제곱 가중합"""
+    total = 0.0
+    for path, spec in targets.items():
+        target, weight = spec if isinstance(spec, (tuple, list)) else (spec, 1.0)
+        value = _metric(result, path)
+        if value is None:
+            return float("inf")
+        total += weight * ((value - target) / (abs(target) or 1.0)) ** 2
+    return total
+
+
+def _evaluate(task: Tuple[str, Dict[str, Any], Dict[str, Any], Targets, int, int]) -> Dict[str, Any]:
+    """후보 1개 평가 (프로세스 풀 작업, 모듈 최상위 함수여야 함)"""
+    game_type, params, candidate, targets, runs, seed = task
+    result = SIMULATORS[game_type](params).run(runs, seed)
+    return {"params": candidate, "loss": _loss(result, targets), "metrics": result}
+
+
+class BalanceTuner:
+    """시뮬레이션 기반 파라미터 탐색기"""
+
+    def __init__(self, config: Optional[dict] = None):
+        """
+        Args:
+            config: 탐색 설정
+                - strategy: grid 또는 random (기본 random)
+                - samples: random 라운드당 후보 수 (기본 32)
+                - rounds: random 탐색 라운드 수, 라운드마다 최선 후보 주변으로
+                  범위를 좁힘 (기본 3)
+                - grid_points: grid 차원당 점 개수 (기본 5)
+                - runs: 후보당 시뮬레이션 횟수 (기본 20000)
+                - workers: 프로세스 수 (기본 CPU 수, 1이면 현재 프로세스)
+                - seed: 난수 시드 (모든 후보에 같은 시뮬레이션 시드 사용)
+        """
+        config = config or {}
+        self.strategy = config.get("strategy", "random")
+        self.samples = config.get("samples", 32)
+        self.rounds = config.get("rounds", 3)
+        self.grid_points = config.get("grid_points", 5)
+        self.runs = config.get("runs", 20000)
+        self.workers = config.get("workers") or os.cpu_count() or 1
+        self.seed = config.get("seed")
+
+    def tune(self, base, space: Space, targets: Optional[Targets] = None) -> Dict[str, Any]:
+        """
+        파라미터 탐색
+
+        Args:
+            base: 기준 BalanceConfig
+            space: 탐색 공간 {"카테고리.키": 범위 또는 선택지}
+            targets: 목표 지표 (None이면 default_targets)
+
+        Returns:
+            {"best": {"params", "loss", "metrics"}, "trials": 상위 후보, "evaluated"}
+            (실패 시 {"error": ...})
+        """
+        game_type = detect_game_type(base.gameplay)
+        if game_type not in SIMULATORS:
+            return {"error": "시뮬레이션을 지원하지 않는 게임 유형입니다"}
+
+        targets = targets or default_targets(base)
+        if not targets:
+            return {"error": "목표 지표가 없습니다"}
+
+        for key in space:
+            category = key.split(".", 1)[0]
+            if category not in CATEGORIES or "." not in key:
+                return {"error": f"잘못된 파라미터 경로: {key}"}
+
+        rng = random.Random(self.seed)
+        sim_seed = self.seed if self.seed is not None else rng.randrange(2 ** 32)
+        trials: List[Dict[str, Any]] = []
+
+        with self._executor() as pool:
+            if self.strategy == "grid":
+                trials = self._evaluate_all(pool, game_type, base, self._grid(space), targets, sim_seed)
+            else:
+                bounds = dict(space)
+                for _ in range(max(1, self.rounds)):
+                    candidates = [self._sample(bounds, rng) for _ in range(self.samples)]
+                    trials += self._evaluate_all(pool, game_type, base, candidates, targets, sim_seed)
+                    best = min(trials, key=lambda t: t["loss"])
+                    bounds = self._narrow(space, bounds, best["params"])
+
+        trials.sort(key=lambda t: t["loss"])
+        return {
+            "game_type": game_type,
+            "targets": targets,
+            "best": trials[0],
+            "trials": [{"params": t["params"], "loss": t["loss"]} for t in trials[:10]],
+            "evaluated": len(trials),
+        }
+
+    def _executor(self):
+        if self.workers <= 1:
+            return _SerialExecutor()
+        return ProcessPoolExecutor(max_workers=self.workers)
+
+    def _evaluate_all(
+        self,
+        pool,
+        game_type: str,
+        base,
+        candidates: List[Dict[str, Any]],
+        targets: Targets,
+        seed: int
+    ) -> List[Dict[str, Any]]:
+        tasks = []
+        for candidate in candidates:
+            params = {**base.gameplay, **base.economy, **base.difficulty, **base.ads}
+            params.update({key.split(".", 1)[1]: value for key, value in candidate.items()})
+            tasks.append((game_type, params, candidate, targets, self.runs, seed))
+        return list(pool.map(_evaluate, tasks))
+
+    def _grid(self, space: Space) -> List[Dict[str, Any]]:
+        axes = []
+        for key, spec in space.items():
+            if isinstance(spec, list):
+                axes.append(spec)
+            else:
+                low, high = spec
+                points = [low + (high - low) * i / max(self.grid_points - 1, 1) for i in range(self.grid_points)]
+                if isinstance(low, int) and isinstance(high, int):
+                    points = sorted({round(x) for x in points})
+                axes.append(points)
+        return [dict(zip(space, combo)) for combo in itertools.product(*axes)]
+
+    def _sample(self, bounds: Space, rng: random.Random) -> Dict[str, Any]:
+        candidate = {}
+        for key, spec in bounds.items():
+            if isinstance(spec, list):
+                candidate[key] = rng.choice(spec)
+            elif isinstance(spec[0], int) and isinstance(spec[1], int):
+                candidate[key] = rng.randint(spec[0], spec[1])
+            else:
+                candidate[key] = rng.uniform(spec[0], spec[1])
+        return candidate
+
+    def _narrow(self, space: Space, bounds: Space, best: Dict[str, Any]) -> Space:
+        """최선 후보 중심으로 연속 범위를 절반으로 축소 (원래 범위 안에서)"""
+        narrowed = {}
+        for key, spec in bounds.items():
+            if isinstance(spec, list):
+                narrowed[key] = spec
+                continue
+            low, high = space[key]
+            half = (spec[1] - spec[0]) / 4
+            new_low, new_high = max(low, best[key] - half), min(high, best[key] + half)
+            if isinstance(low, int) and isinstance(high, int):
+                new_low, new_high = int(round(new_low)), int(round(new_high))
+            narrowed[key] = (new_low, new_high)
+        return narrowed
+
+
+class _SerialExecutor:
+    """workers=1용 실행기 (ProcessPoolExecutor와 같은 map/컨텍스트 인터페이스)"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def map(self, fn, iterable):
+        return map(fn, iterable)
@@ -2,5 +2,14 @@
 Godot 빌더 모듈
 """
 from .godot_builder import GodotBuilder
+from .build_queue import BuildQueue, BuildJob, BuildWorkerPool
+from .artifact_store import ArtifactStore, BuildRecord
 
-__all__ = ["GodotBuilder"]
+__all__ = [
+    "GodotBuilder",
+    "BuildQueue",
+    "BuildJob",
+    "BuildWorkerPool",
+    "ArtifactStore",
+    "BuildRecord",
+]
@@ -0,0 +1,531 @@
+"""
+빌드 아티팩트 저장소
+게임/타겟/내용 해시로 빌드를 색인하고, 파일을 청크 단위로 중복 제거·압축 보관
+
+builds/<target>/game_<timestamp>.<ext> 를 계속 쌓아두는 대신
+동일한 .wasm, .pck 등은 청크 1벌만 저장한다.
+"""
+
+import os
+import json
+import uuid
+import zlib
+import sqlite3
+import hashlib
+from pathlib import Path
+from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any, Iterable
+from dataclasses import dataclass, field
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS builds (
+    build_id TEXT PRIMARY KEY,
+    game_id TEXT NOT NULL,
+    target TEXT NOT NULL,
+    version TEXT,
+    success INTEGER NOT NULL,
+    content_hash TEXT,
+    total_size INTEGER NOT NULL DEFAULT 0,
+    metadata TEXT,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_builds_latest ON builds (game_id, target, success, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_builds_content ON builds (content_hash);
+
+CREATE TABLE IF NOT EXISTS build_files (
+    build_id TEXT NOT NULL,
+    path TEXT NOT NULL,
+    file_hash TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (build_id, path)
+);
+CREATE INDEX IF NOT EXISTS idx_build_files_hash ON build_files (file_hash);
+
+CREATE TABLE IF NOT EXISTS file_chunks (
+    file_hash TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    chunk_hash TEXT NOT NULL,
+    PRIMARY KEY (file_hash, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_file_chunks_chunk ON file_chunks (chunk_hash);
+
+CREATE TABLE IF NOT EXISTS chunks (
+    chunk_hash TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL,
+    compressed INTEGER NOT NULL
+);
+"""
+
+
+@dataclass
+class BuildRecord:
+    """저장된 빌드"""
+    build_id: str
+    game_id: str
+    target: str
+    success: bool
+    created_at: str
+    version: Optional[str] = None
+    content_hash: Optional[str] = None
+    total_size: int = 0
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "BuildRecord":
+        data = dict(row)
+        data["success"] = bool(data["success"])
+        data["metadata"] = json.loads(data["metadata"]) if data["metadata"] else {}
+        return cls(**data)
+
+
+class ArtifactStore:
+    """청크 중복 제거 빌드 아티팩트 저장소"""
+
+    # 청크 크기 (Godot 엔진 .wasm/.pck 처럼 큰 파일의 동일 구간을 공유)
+    CHUNK_SIZE = 4 * 1024 * 1024
+
+    def __init__(self, root: str = "artifacts", chunk_size: int = None, compress_level: int = 6):
+        """
+        Args:
+            root: 저장소 루트 (index.db + chunks/)
+            chunk_size: 청크 크기 (바이트)
+            compress_level: zlib 압축 레벨 (0이면 압축 안 함)
+        """
+        self.root = Path(root)
+        self.chunks_dir = self.root / "chunks"
+        self.chunks_dir.mkdir(parents=True, exist_ok=True)
+        self.chunk_size = chunk_size or self.CHUNK_SIZE
+        self.compress_level = compress_level
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.root / "index.db"), timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _chunk_path(self, chunk_hash: str) -> Path:
+        return self.chunks_dir / chunk_hash[:2] / chunk_hash
+
+    # ===== 저장 =====
+
+    def add_build(
+        self,
+        game_id: str,
+        target: str,
+        files: Iterable[str],
+        success: bool = True,
+        version: Optional[str] = None,
+        base_dir: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> BuildRecord:
+        """
+        빌드 저장
+
+        Args:
+            game_id: 게임 ID
+            target: 타겟 플랫폼
+            files: 빌드 산출물 파일 경로 목록
+            success: 빌드 성공 여부
+            version: 버전 문자열
+            base_dir: 저장 경로 기준 디렉토리 (없으면 파일명만 사용)
+            metadata: 추가 정보 (소요 시간, 로그 경로 등)
+
+        Returns:
+            BuildRecord
+        """
+        conn = self._connect()
+        try:
+            # 청크 파일 쓰기/압축은 쓰기 잠금 밖에서 (같은 연결로 존재 여부만 조회)
+            entries = []
+            new_chunks: Dict[str, tuple] = {}
+            for file in files:
+                path = Path(file)
+                rel = path.relative_to(base_dir).as_posix() if base_dir else path.name
+                file_hash, size, chunk_hashes = self._store_file(path, conn, new_chunks)
+                entries.append((rel, file_hash, size, chunk_hashes))
+            return self._insert_build(
+                conn, entries, new_chunks, game_id, target, success, version, metadata
+            )
+        finally:
+            conn.close()
+
+    def _insert_build(
+        self,
+        conn: sqlite3.Connection,
+        entries: List[tuple],
+        new_chunks: Dict[str, tuple],
+        game_id: str,
+        target: str,
+        success: bool,
+        version: Optional[str],
+        metadata: Optional[Dict[str, Any]]
+    ) -> BuildRecord:
+        """빌드/파일/청크 행 기록 (트랜잭션 1회)"""
+        entries.sort(key=lambda e: e[0])
+        content_hash = None
+        if entries:
+            digest = hashlib.sha256()
+            for rel, file_hash, _, _ in entries:
+                digest.update(f"{rel}\0{file_hash}\n".encode("utf-8"))
+            content_hash = digest.hexdigest()
+
+        record = BuildRecord(
+            build_id=f"art_{uuid.uuid4().hex[:12]}",
+            game_id=game_id,
+            target=target,
+            success=success,
+            created_at=datetime.now().isoformat(),
+            version=version,
+            content_hash=content_hash,
+            total_size=sum(e[2] for e in entries),
+            metadata=metadata or {}
+        )
+
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "INSERT OR REPLACE INTO chunks (chunk_hash, size, stored_size, compressed) "
+                "VALUES (?, ?, ?, ?)",
+                [(chunk_hash, *row) for chunk_hash, row in new_chunks.items()]
+            )
+            for rel, file_hash, size, chunk_hashes in entries:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO file_chunks (file_hash, seq, chunk_hash) VALUES (?, ?, ?)",
+                    [(file_hash, seq, h) for seq, h in enumerate(chunk_hashes)]
+                )
+                conn.execute(
+                    "INSERT INTO build_files (build_id, path, file_hash, size) VALUES (?, ?, ?, ?)",
+                    (record.build_id, rel, file_hash, size)
+                )
+            conn.execute(
+                "INSERT INTO builds (build_id, game_id, target, version, success, content_hash, "
+                "total_size, metadata, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (record.build_id, game_id, target, version, int(success), content_hash,
+                 record.total_size, json.dumps(record.metadata, ensure_ascii=False),
+                 record.created_at)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+        return record
+
+    def add_build_output(
+        self,
+        game_id: str,
+        target: str,
+        output_path: str,
+        success: bool = True,
+        version: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        remove_originals: bool = False
+    ) -> BuildRecord:
+        """
+        GodotBuilder 출력 저장 (game_<ts>.html 과 .js/.wasm/.pck 등 같은 이름의 파일 묶음)
+
+        Args:
+            remove_originals: 저장(커밋) 후 원본 출력 파일 삭제 (로그는 유지).
+                이후에는 restore()로 꺼내 쓴다.
+        """
+        output = Path(output_path)
+        files = sorted(
+            p for p in output.parent.glob(f"{output.stem}.*")
+            if p.is_file() and p.suffix != ".log"
+        )
+        record = self.add_build(
+            game_id, target, [str(p) for p in files],
+            success=success, version=version, base_dir=str(output.parent), metadata=metadata
+        )
+        if remove_originals:
+            for path in files:
+                path.unlink(missing_ok=True)
+        return record
+
+    def _store_file(self, path: Path, conn: sqlite3.Connection, new_chunks: Dict[str, tuple]):
+        """파일을 청크로 나눠 저장 → (파일 해시, 크기, 청크 해시 목록)"""
+        file_digest = hashlib.sha256()
+        chunk_hashes = []
+        size = 0
+
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                file_digest.update(chunk)
+                size += len(chunk)
+                chunk_hashes.append(self._store_chunk(chunk, conn, new_chunks))
+
+        return file_digest.hexdigest(), size, chunk_hashes
+
+    def _store_chunk(self, data: bytes, conn: sqlite3.Connection, new_chunks: Dict[str, tuple]) -> str:
+        """
+        청크 파일 저장 (이미 있으면 건너뜀)
+
+        chunks 행은 new_chunks에 모아 두었다가 빌드 트랜잭션에서 함께 기록한다.
+        """
+        chunk_hash = hashlib.sha256(data).hexdigest()
+        if chunk_hash in new_chunks:
+            return chunk_hash
+        chunk_path = self._chunk_path(chunk_hash)
+
+        exists = conn.execute(
+            "SELECT 1 FROM chunks WHERE chunk_hash = ?", (chunk_hash,)
+        ).fetchone()
+        if exists and chunk_path.exists():
+            return chunk_hash
+
+        compressed = False
+        payload = data
+        if self.compress_level > 0:
+            candidate = zlib.compress(data, self.compress_level)
+            # APK 등 이미 압축된 데이터는 원본 그대로 저장
+            if len(candidate) < len(data) * 0.95:
+                payload, compressed = candidate, True
+
+        chunk_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = chunk_path.with_name(f"{chunk_hash}.{uuid.uuid4().hex[:8]}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, chunk_path)
+
+        new_chunks[chunk_hash] = (len(data), len(payload), int(compressed))
+        return chunk_hash
+
+    # ===== 조회 =====
+
+    def latest(
+        self,
+        game_id: str,
+        target: Optional[str] = None,
+        successful: bool = True
+    ) -> Optional[BuildRecord]:
+        """게임의 최신 빌드 (기본: 성공한 빌드만)"""
+        query = "SELECT * FROM builds WHERE game_id = ?"
+        params: list = [game_id]
+        if target:
+            query += " AND target = ?"
+            params.append(target)
+        if successful:
+            query += " AND success = 1"
+        query += " ORDER BY created_at DESC LIMIT 1"
+
+        conn = self._connect()
+        try:
+            row = conn.execute(query, params).fetchone()
+            return BuildRecord.from_row(row) if row else None
+        finally:
+            conn.close()
+
+    def get(self, build_id: str) -> Optional[BuildRecord]:
+        """빌드 조회"""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT * FROM builds WHERE build_id = ?", (build_id,)).fetchone()
+            return BuildRecord.from_row(row) if row else None
+        finally:
+            conn.close()
+
+    def find_by_content(self, content_hash: str) -> List[BuildRecord]:
+        """내용 해시가 같은 빌드 목록"""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT * FROM builds WHERE content_hash = ? ORDER BY created_at DESC",
+                (content_hash,)
+            ).fetchall()
+            return [BuildRecord.from_row(r) for r in rows]
+        finally:
+            conn.close()
+
+    def list_builds(
+        self,
+        game_id: Optional[str] = None,
+        target: Optional[str] = None,
+        limit: int = 100
+    ) -> List[BuildRecord]:
+        """빌드 목록 (최신순)"""
+        query = "SELECT * FROM builds WHERE 1 = 1"
+        params: list = []
+        if game_id:
+            query += " AND game_id = ?"
+            params.append(game_id)
+        if target:
+            query += " AND target = ?"
+            params.append(target)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+
+        conn = self._connect()
+        try:
+            return [BuildRecord.from_row(r) for r in conn.execute(query, params).fetchall()]
+        finally:
+            conn.close()
+
+    def list_files(self, build_id: str) -> List[Dict[str, Any]]:
+        """빌드에 포함된 파일 목록"""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT path, file_hash, size FROM build_files WHERE build_id = ? ORDER BY path",
+                (build_id,)
+            ).fetchall()
+            return [dict(r) for r in rows]
+        finally:
+            conn.close()
+
+    def restore(self, build_id: str, dest_dir: str) -> List[str]:
+        """
+        빌드 파일 복원 (배포 시 사용)
+
+        Returns:
+            복원된 파일 경로 목록
+        """
+        dest = Path(dest_dir)
+        restored = []
+
+        conn = self._connect()
+        try:
+            files = conn.execute(
+                "SELECT path, file_hash FROM build_files WHERE build_id = ? ORDER BY path",
+                (build_id,)
+            ).fetchall()
+
+            for file in files:
+                chunks = conn.execute(
+                    "SELECT fc.chunk_hash, c.compressed FROM file_chunks fc "
+                    "JOIN chunks c ON c.chunk_hash = fc.chunk_hash "
+                    "WHERE fc.file_hash = ? ORDER BY fc.seq",
+                    (file["file_hash"],)
+                ).fetchall()
+
+                target = dest / file["path"]
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with open(target, "wb") as out:
+                    for chunk in chunks:
+                        data = self._chunk_path(chunk["chunk_hash"]).read_bytes()
+                        out.write(zlib.decompress(data) if chunk["compressed"] else data)
+                restored.append(str(target))
+        finally:
+            conn.close()
+
+        return restored
+
+    def stats(self) -> Dict[str, Any]:
+        """저장소 통계 (논리 크기 대비 실제 저장 크기)"""
+        conn = self._connect()
+        try:
+            builds = conn.execute("SELECT COUNT(*), COALESCE(SUM(total_size), 0) FROM builds").fetchone()
+            chunks = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(stored_size), 0) FROM chunks"
+            ).fetchone()
+        finally:
+            conn.close()
+
+        logical = builds[1]
+        stored = chunks[2]
+        return {
+            "builds": builds[0],
+            "chunks": chunks[0],
+            "logical_bytes": logical,
+            "stored_bytes": stored,
+            "dedup_ratio": round(logical / stored, 2) if stored else 0.0
+        }
+
+    # ===== 보존 정책 =====
+
+    def apply_retention(
+        self,
+        keep_last: int = 5,
+        keep_days: Optional[int] = None,
+        keep_failed: int = 1
+    ) -> Dict[str, int]:
+        """
+        보존 정책 적용 (게임 × 타겟별)
+
+        최근 성공 빌드 keep_last개는 항상 보존하고, 그 외 빌드는
+        keep_days 이내면 보존한다. 실패 빌드는 최근 keep_failed개만 남긴다.
+        참조가 끊긴 청크를 지우므로 빌드 저장과 동시에 실행하지 않는다.
+
+        Returns:
+            {"builds_removed": n, "chunks_removed": m, "bytes_freed": b}
+        """
+        cutoff = (datetime.now() - timedelta(days=keep_days)).isoformat() if keep_days else None
+
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                "SELECT build_id, game_id, target, success, created_at FROM builds "
+                "ORDER BY game_id, target, created_at DESC"
+            ).fetchall()
+
+            seen: Dict[tuple, int] = {}
+            remove = []
+            for row in rows:
+                key = (row["game_id"], row["target"], row["success"])
+                rank = seen.get(key, 0)
+                seen[key] = rank + 1
+
+                limit = keep_last if row["success"] else keep_failed
+                if rank < limit:
+                    continue
+                if row["success"] and cutoff and row["created_at"] >= cutoff:
+                    continue
+                remove.append(row["build_id"])
+
+            for build_id in remove:
+                conn.execute("DELETE FROM build_files WHERE build_id = ?", (build_id,))
+                conn.execute("DELETE FROM builds WHERE build_id = ?", (build_id,))
+
+            # 더 이상 참조되지 않는 파일/청크 정리
+            conn.execute(
+                "DELETE FROM file_chunks WHERE file_hash NOT IN (SELECT file_hash FROM build_files)"
+            )
+            orphans = conn.execute(
+                "SELECT chunk_hash, stored_size FROM chunks "
+                "WHERE chunk_hash NOT IN (SELECT chunk_hash FROM file_chunks)"
+            ).fetchall()
+            conn.executemany(
+                "DELETE FROM chunks WHERE chunk_hash = ?", [(o["chunk_hash"],) for o in orphans]
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+        for orphan in orphans:
+            self._chunk_path(orphan["chunk_hash"]).unlink(missing_ok=True)
+
+        return {
+            "builds_removed": len(remove),
+            "chunks_removed": len(orphans),
+            "bytes_freed": sum(o["stored_size"] for o in orphans)
+        }
+
+
+# 사용 예시
+def main():
+    store = ArtifactStore("artifacts")
+
+    record = store.add_build_output("game_001", "html5", "builds/html5/game_20260101_000000.html")
+    print(f"저장: {record.build_id} ({record.total_size:,} bytes)")
+
+    latest = store.latest("game_001", "html5")
+    if latest:
+        print(f"최신 빌드: {latest.build_id} ({latest.created_at})")
+        store.restore(latest.build_id, "deploy/html5")
+
+    print(store.stats())
+    print(store.apply_retention(keep_last=3, keep_days=30))
+
+
+if __name__ == "__main__":
+    main()
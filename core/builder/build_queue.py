@@ -0,0 +1,601 @@
+"""
+빌드 큐 (로컬 빌드 팜)
+SQLite 기반 영구 작업 큐와 로컬 워커 프로세스
+
+파이프라인, CLI, 대시보드, 웹훅이 각자 Godot를 띄우지 않고
+작업을 큐에 제출하면 N개의 워커 프로세스가 순서대로 처리한다.
+"""
+
+import os
+import json
+import time
+import uuid
+import signal
+import sqlite3
+import hashlib
+import multiprocessing
+from pathlib import Path
+from datetime import datetime
+from typing import Optional, List, Dict, Any
+from dataclasses import dataclass, asdict
+
+
+# 작업 상태
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+ACTIVE_STATUSES = (QUEUED, RUNNING)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    project_path TEXT NOT NULL,
+    project_hash TEXT NOT NULL,
+    target TEXT NOT NULL,
+    output_dir TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    worker_pid INTEGER,
+    message TEXT,
+    report TEXT,
+    progress REAL,
+    progress_message TEXT,
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_pending ON jobs (status, priority DESC, created_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_dedup ON jobs (project_hash, target, status);
+"""
+
+# 기존 DB에 추가할 컬럼 (이름, 정의)
+_MIGRATIONS = [
+    ("progress", "REAL"),
+    ("progress_message", "TEXT"),
+]
+
+# 진행률 DB 갱신 최소 간격 (초)
+PROGRESS_INTERVAL = 1.0
+
+# 작업 취소 시 Godot에 SIGTERM 후 SIGKILL까지 유예 (_kill_job_process 대기 5초보다 짧게)
+KILL_GRACE = 3.0
+
+
+@dataclass
+class BuildJob:
+    """빌드 작업"""
+    job_id: str
+    project_path: str
+    project_hash: str
+    target: str
+    output_dir: str
+    priority: int = 0
+    status: str = QUEUED
+    cancel_requested: bool = False
+    worker_pid: Optional[int] = None
+    message: str = ""
+    report: Optional[Dict[str, Any]] = None  # 타겟별 빌드 기록 (소요 시간, 로그 경로 등)
+    progress: Optional[float] = None  # 0~100 (실행 중 진행률)
+    progress_message: str = ""
+    created_at: str = ""
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "BuildJob":
+        data = dict(row)
+        data["cancel_requested"] = bool(data["cancel_requested"])
+        data["message"] = data["message"] or ""
+        data["progress_message"] = data.get("progress_message") or ""
+        data["report"] = json.loads(data["report"]) if data["report"] else None
+        return cls(**data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def hash_project(project_path: str) -> str:
+    """
+    프로젝트 내용 해시 (경로 + 파일 내용)
+
+    .godot 임포트 캐시는 결과물에 영향을 주지 않으므로 제외한다.
+    """
+    root = Path(project_path)
+    digest = hashlib.sha256()
+
+    for file in sorted(root.rglob("*")):
+        rel = file.relative_to(root)
+        if not file.is_file() or rel.parts[0] == ".godot":
+            continue
+        digest.update(rel.as_posix().encode("utf-8"))
+        digest.update(b"\0")
+        with open(file, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+class BuildQueue:
+    """SQLite 기반 영구 빌드 큐"""
+
+    def __init__(self, db_path: str = "builds/build_queue.db"):
+        """
+        Args:
+            db_path: 큐 데이터베이스 경로 (여러 프로세스가 공유)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+            for name, definition in _MIGRATIONS:
+                if name not in columns:
+                    conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} {definition}")
+
+    def _connect(self) -> sqlite3.Connection:
+        """DB 연결 (트랜잭션은 직접 관리)"""
+        conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def submit(
+        self,
+        project_path: str,
+        target: str,
+        output_dir: str,
+        priority: int = 0,
+        project_hash: Optional[str] = None
+    ) -> BuildJob:
+        """
+        작업 제출
+
+        동일한 (프로젝트 해시, 타겟) 작업이 대기/실행 중이면 새로 만들지 않고
+        기존 작업을 반환한다.
+
+        Args:
+            project_path: Godot 프로젝트 경로
+            target: 타겟 플랫폼
+            output_dir: 출력 디렉토리
+            priority: 우선순위 (클수록 먼저 처리)
+            project_hash: 프로젝트 해시 (없으면 계산)
+
+        Returns:
+            BuildJob
+        """
+        if project_hash is None:
+            project_hash = hash_project(project_path)
+
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE project_hash = ? AND target = ? "
+                "AND status IN (?, ?) ORDER BY created_at LIMIT 1",
+                (project_hash, target, *ACTIVE_STATUSES)
+            ).fetchone()
+
+            if row is not None:
+                job = BuildJob.from_row(row)
+                # 더 높은 우선순위로 재제출되면 대기 작업의 우선순위를 올림
+                if job.status == QUEUED and priority > job.priority:
+                    conn.execute(
+                        "UPDATE jobs SET priority = ? WHERE job_id = ?",
+                        (priority, job.job_id)
+                    )
+                    job.priority = priority
+                conn.execute("COMMIT")
+                return job
+
+            job = BuildJob(
+                job_id=f"job_{uuid.uuid4().hex[:12]}",
+                project_path=str(Path(project_path).resolve()),
+                project_hash=project_hash,
+                target=target,
+                output_dir=str(Path(output_dir).resolve()),
+                priority=priority,
+                created_at=datetime.now().isoformat()
+            )
+            conn.execute(
+                "INSERT INTO jobs (job_id, project_path, project_hash, target, output_dir, "
+                "priority, status, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (job.job_id, job.project_path, job.project_hash, job.target,
+                 job.output_dir, job.priority, job.status, job.created_at)
+            )
+            conn.execute("COMMIT")
+            return job
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def submit_project(
+        self,
+        project_path: str,
+        targets: List[str],
+        output_dir: str,
+        priority: int = 0
+    ) -> List[BuildJob]:
+        """프로젝트의 여러 타겟 제출 (해시는 한 번만 계산)"""
+        project_hash = hash_project(project_path)
+        return [
+            self.submit(project_path, target, output_dir, priority, project_hash)
+            for target in targets
+        ]
+
+    def claim_next(self, worker_pid: int) -> Optional[BuildJob]:
+        """우선순위가 가장 높은 대기 작업을 원자적으로 가져오기"""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE status = ? "
+                "ORDER BY priority DESC, created_at LIMIT 1",
+                (QUEUED,)
+            ).fetchone()
+
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+
+            started_at = datetime.now().isoformat()
+            conn.execute(
+                "UPDATE jobs SET status = ?, worker_pid = ?, started_at = ?, "
+                "progress = NULL, progress_message = NULL WHERE job_id = ?",
+                (RUNNING, worker_pid, started_at, row["job_id"])
+            )
+            conn.execute("COMMIT")
+
+            job = BuildJob.from_row(row)
+            job.status = RUNNING
+            job.worker_pid = worker_pid
+            job.started_at = started_at
+            return job
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def finish(
+        self,
+        job_id: str,
+        status: str,
+        message: str = "",
+        report: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """작업 완료 기록"""
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE jobs SET status = ?, message = ?, report = ?, finished_at = ? "
+                "WHERE job_id = ? AND status = ?",
+                (status, message, json.dumps(report, ensure_ascii=False) if report else None,
+                 datetime.now().isoformat(), job_id, RUNNING)
+            )
+        finally:
+            conn.close()
+
+    def update_progress(self, job_id: str, percent: Optional[float], message: str = "") -> None:
+        """실행 중 작업 진행률 기록 (대시보드 표시용)"""
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE jobs SET progress = COALESCE(?, progress), progress_message = ? "
+                "WHERE job_id = ? AND status = ?",
+                (percent, message, job_id, RUNNING)
+            )
+        finally:
+            conn.close()
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        작업 취소
+
+        대기 중인 작업은 즉시 취소되고, 실행 중인 작업은 워커가
+        다음 확인 시점에 프로세스를 종료한다.
+
+        Returns:
+            취소 요청 성공 여부
+        """
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            updated = conn.execute(
+                "UPDATE jobs SET status = ?, cancel_requested = 1, finished_at = ? "
+                "WHERE job_id = ? AND status = ?",
+                (CANCELLED, datetime.now().isoformat(), job_id, QUEUED)
+            ).rowcount
+            if not updated:
+                updated = conn.execute(
+                    "UPDATE jobs SET cancel_requested = 1 WHERE job_id = ? AND status = ?",
+                    (job_id, RUNNING)
+                ).rowcount
+            conn.execute("COMMIT")
+            return updated > 0
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def is_cancel_requested(self, job_id: str) -> bool:
+        """취소 요청 여부"""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT cancel_requested FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            return bool(row and row["cancel_requested"])
+        finally:
+            conn.close()
+
+    def get(self, job_id: str) -> Optional[BuildJob]:
+        """작업 조회"""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            return BuildJob.from_row(row) if row else None
+        finally:
+            conn.close()
+
+    def list_jobs(self, status: Optional[str] = None, limit: int = 100) -> List[BuildJob]:
+        """작업 목록 (최신순)"""
+        conn = self._connect()
+        try:
+            if status:
+                rows = conn.execute(
+                    "SELECT * FROM jobs WHERE status = ? ORDER BY created_at DESC LIMIT ?",
+                    (status, limit)
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)
+                ).fetchall()
+            return [BuildJob.from_row(r) for r in rows]
+        finally:
+            conn.close()
+
+    def stats(self) -> Dict[str, int]:
+        """상태별 작업 수"""
+        conn = self._connect()
+        try:
+            rows = conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+            return {r["status"]: r["n"] for r in rows}
+        finally:
+            conn.close()
+
+    def requeue_orphaned(self) -> int:
+        """종료된 워커가 잡고 있던 실행 중 작업을 다시 대기열로 되돌림"""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                "SELECT job_id, worker_pid FROM jobs WHERE status = ?", (RUNNING,)
+            ).fetchall()
+            orphaned = [r["job_id"] for r in rows if not _pid_alive(r["worker_pid"])]
+            for job_id in orphaned:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, worker_pid = NULL, started_at = NULL "
+                    "WHERE job_id = ?",
+                    (QUEUED, job_id)
+                )
+            conn.execute("COMMIT")
+            return len(orphaned)
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    """프로세스 생존 여부"""
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def _run_job(db_path: str, job: BuildJob, builder_config: dict) -> None:
+    """작업 실행 (워커가 띄운 자식 프로세스에서 실행)"""
+    from .godot_builder import GodotBuilder
+    from .process_runner import terminate_active
+
+    # 취소 시 Godot 프로세스까지 함께 종료할 수 있도록 별도 프로세스 그룹 사용
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+
+    # Godot은 ProcessRunner가 별도 세션으로 띄우므로 그룹 시그널이 닿지 않음
+    # → 종료 시그널을 받으면 실행 중인 세션을 먼저 정리하고 종료
+    def on_terminate(signum, frame) -> None:
+        terminate_active(grace=KILL_GRACE)
+        os._exit(128 + signum)
+
+    signal.signal(signal.SIGTERM, on_terminate)
+
+    queue = BuildQueue(db_path)
+    builder = GodotBuilder(builder_config)
+
+    # 진행률 이벤트를 큐 DB에 반영 (최소 간격으로 제한)
+    last_update = [0.0]
+
+    def on_progress(event) -> None:
+        now = time.monotonic()
+        if now - last_update[0] < PROGRESS_INTERVAL and event.percent != 100:
+            return
+        last_update[0] = now
+        label = f"{event.step}: {event.message}" if event.step else event.message
+        queue.update_progress(job.job_id, event.percent, label[:200])
+
+    builder.on_progress = on_progress
+
+    try:
+        _, success, msg = builder.build_target(
+            job.project_path, job.output_dir, job.target, build_id=job.job_id
+        )
+        report = builder.last_build_report.get(job.target)
+        queue.finish(job.job_id, SUCCEEDED if success else FAILED, msg, report)
+    except Exception as e:
+        queue.finish(job.job_id, FAILED, f"빌드 실패: {str(e)}")
+    finally:
+        # 작업 프로세스는 atexit 없이 끝날 수 있으므로 데몬을 직접 종료
+        builder.shutdown_daemons()
+
+
+def _kill_job_process(process: multiprocessing.Process) -> None:
+    """작업 프로세스(및 Godot 자식 프로세스) 종료"""
+    if hasattr(os, "killpg"):
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+        except (ProcessLookupError, PermissionError):
+            pass
+    else:
+        process.terminate()
+    process.join(5)
+    if process.is_alive():
+        process.kill()
+        process.join()
+
+
+def _worker_loop(
+    db_path: str,
+    builder_config: dict,
+    stop_event,
+    poll_interval: float
+) -> None:
+    """워커 프로세스 메인 루프"""
+    queue = BuildQueue(db_path)
+    worker_pid = os.getpid()
+
+    while not stop_event.is_set():
+        job = queue.claim_next(worker_pid)
+        if job is None:
+            stop_event.wait(poll_interval)
+            continue
+
+        process = multiprocessing.Process(
+            target=_run_job,
+            args=(db_path, job, builder_config),
+            daemon=True
+        )
+        process.start()
+
+        while process.is_alive():
+            process.join(poll_interval)
+            if process.is_alive() and (stop_event.is_set() or queue.is_cancel_requested(job.job_id)):
+                _kill_job_process(process)
+                break
+
+        # 자식이 결과를 남기지 못했으면 (취소/비정상 종료) 여기서 기록
+        current = queue.get(job.job_id)
+        if current and current.status == RUNNING:
+            if current.cancel_requested:
+                queue.finish(job.job_id, CANCELLED, "사용자 취소")
+            elif stop_event.is_set():
+                queue.finish(job.job_id, FAILED, "워커 종료로 중단됨")
+            else:
+                queue.finish(job.job_id, FAILED, f"빌드 프로세스 비정상 종료 (code {process.exitcode})")
+
+
+class BuildWorkerPool:
+    """로컬 빌드 워커 풀"""
+
+    def __init__(
+        self,
+        db_path: str = "builds/build_queue.db",
+        builder_config: dict = None,
+        workers: int = 2,
+        poll_interval: float = 1.0
+    ):
+        """
+        Args:
+            db_path: 빌드 큐 데이터베이스 경로
+            builder_config: GodotBuilder 설정
+            workers: 워커 프로세스 수 (= 동시에 실행되는 최대 빌드 수)
+            poll_interval: 큐 확인 주기 (초)
+        """
+        self.db_path = str(db_path)
+        self.builder_config = builder_config or {}
+        self.workers = max(1, workers)
+        self.poll_interval = poll_interval
+        self._stop_event = multiprocessing.Event()
+        self._processes: List[multiprocessing.Process] = []
+
+    def start(self) -> None:
+        """워커 시작 (이전 워커가 남긴 작업은 다시 대기열로)"""
+        queue = BuildQueue(self.db_path)
+        requeued = queue.requeue_orphaned()
+        if requeued:
+            print(f"[빌드 큐] 중단된 작업 {requeued}건 재대기")
+
+        self._stop_event.clear()
+        for _ in range(self.workers):
+            process = multiprocessing.Process(
+                target=_worker_loop,
+                args=(self.db_path, self.builder_config, self._stop_event, self.poll_interval)
+            )
+            process.start()
+            self._processes.append(process)
+
+    def stop(self, timeout: float = 30.0) -> None:
+        """워커 종료 (실행 중인 빌드는 중단)"""
+        self._stop_event.set()
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        self._processes = []
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """대기/실행 중인 작업이 없어질 때까지 대기"""
+        queue = BuildQueue(self.db_path)
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            stats = queue.stats()
+            if not any(stats.get(s, 0) for s in ACTIVE_STATUSES):
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(self.poll_interval)
+
+
+# 사용 예시
+def main():
+    queue = BuildQueue("builds/build_queue.db")
+
+    jobs = queue.submit_project("./game_project", ["android", "html5"], "./builds", priority=5)
+    for job in jobs:
+        print(f"제출: {job.job_id} ({job.target}, {job.status})")
+
+    pool = BuildWorkerPool("builds/build_queue.db", {"godot_path": "godot"}, workers=2)
+    pool.start()
+    pool.wait_idle()
+    pool.stop()
+
+    for job in queue.list_jobs():
+        print(f"  [{job.status}] {job.job_id} {job.target}: {job.message}")
+
+
+if __name__ == "__main__":
+    main()
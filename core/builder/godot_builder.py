@@ -4,36 +4,115 @@ Godot 빌더 모듈
 """
 
 import os
-import subprocess
+import shutil
 import json
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict, Any, Callable
+
+from .project_materializer import ProjectMaterializer
+from .godot_daemon import GodotDaemonPool, GodotDaemonError
+from .artifact_store import ArtifactStore
+from .process_runner import ProcessRunner, GodotProgressParser, ProgressEvent
 
 
 class GodotBuilder:
     """Godot 헤드리스 빌드 자동화"""
     
+    # 타겟별 내보내기 설정
+    TARGET_SETTINGS = {
+        "android": {
+            "preset": "Android",
+            "extension": ".apk"
+        },
+        "html5": {
+            "preset": "Web",
+            "extension": ".html"
+        },
+        "windows": {
+            "preset": "Windows Desktop",
+            "extension": ".exe"
+        }
+    }
+    
+    # 내보내기 1건당 예상 메모리 (MB)
+    EXPORT_MEMORY_MB = 1536
+    
     def __init__(self, config: dict):
         """
         Args:
             config: 빌드 설정 (Godot 경로, 타겟 등)
+                - max_parallel_exports: 동시 내보내기 수 (없으면 CPU/메모리로 계산)
+                - export_memory_mb: 내보내기 1건당 예상 메모리
+                - use_editor_daemon: 상주 에디터 데몬으로 임포트 (실패 시 단발 실행)
+                - artifact_store_path: 빌드 결과를 보관할 아티팩트 저장소 경로
+                - keep_build_outputs: 아티팩트 저장 후에도 builds/ 원본 유지 (기본 False,
+                  삭제된 출력은 아티팩트 저장소에서 restore)
+                - game_id: 아티팩트 저장 시 게임 ID (없으면 프로젝트 폴더명)
+                - import_timeout / export_timeout: 임포트/내보내기 제한 시간 (초)
         """
         self.config = config
         self.godot_path = config.get("godot_path", "godot")
         self.export_targets = config.get("export_targets", ["android", "html5"])
+        self.export_memory_mb = config.get("export_memory_mb", self.EXPORT_MEMORY_MB)
+        self.import_timeout = config.get("import_timeout", 120)
+        self.export_timeout = config.get("export_timeout", 600)
+        
+        # 진행률 이벤트 수신자 (빌드 큐 워커가 대시보드용으로 연결)
+        self.on_progress: Optional[Callable[[ProgressEvent], None]] = None
+        
+        # 마지막 build_all_targets 실행의 타겟별 기록 {타겟: {duration, log_path, ...}}
+        self.last_build_report: Dict[str, Dict[str, Any]] = {}
+        
+        # 타겟별 격리 복사본 생성 (임포트 캐시/설정만 개별 복사)
+        self.materializer = ProjectMaterializer()
+        
+        # 프로젝트별 상주 에디터 (옵션)
+        self.daemons: Optional[GodotDaemonPool] = None
+        if config.get("use_editor_daemon"):
+            self.daemons = GodotDaemonPool(self.godot_path)
+        
+        # 빌드 아티팩트 저장소 (옵션)
+        self.artifact_store: Optional[ArtifactStore] = None
+        if config.get("artifact_store_path"):
+            self.artifact_store = ArtifactStore(config["artifact_store_path"])
     
-    def import_assets(self, project_path: str) -> Tuple[bool, str]:
+    def import_assets(
+        self,
+        project_path: str,
+        files: Optional[List[str]] = None,
+        use_daemon: bool = True
+    ) -> Tuple[bool, str]:
         """
         헤드리스 에셋 임포트 트리거
         새 자산 파일을 Godot 엔진이 인식하도록 강제 임포트
         
+        데몬이 켜져 있으면 상주 에디터로 처리하고, 쓸 수 없으면
+        `godot --headless --editor --quit` 단발 실행으로 대체한다.
+        
         Args:
             project_path: Godot 프로젝트 경로
+            files: 재임포트할 파일 목록 (없으면 전체 스캔)
+            use_daemon: False면 데몬 없이 단발 실행 (빌드 후 지워지는 임시
+                복사본처럼 데몬을 띄워 둘 이유가 없는 경로)
         
         Returns:
             (성공 여부, 메시지)
         """
+        if self.daemons is not None and use_daemon:
+            try:
+                daemon = self.daemons.get(project_path)
+                if files:
+                    daemon.reimport(files)
+                else:
+                    daemon.scan()
+                return True, "에셋 임포트 완료 (데몬)"
+            except GodotDaemonError as e:
+                print(f"에디터 데몬 사용 불가, 단발 실행으로 대체: {e}")
+        
         try:
             cmd = [
                 self.godot_path,
@@ -43,20 +122,15 @@ class GodotBuilder:
                 "--quit"
             ]
             
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=120  # 2분 타임아웃
-            )
+            result = self._runner(self.import_timeout).run(cmd)
             
-            if result.returncode == 0:
+            if result.timed_out:
+                return False, "임포트 타임아웃"
+            if result.success:
                 return True, "에셋 임포트 완료"
             else:
-                return False, f"임포트 오류: {result.stderr}"
+                return False, f"임포트 오류: {result.tail_text()}"
                 
-        except subprocess.TimeoutExpired:
-            return False, "임포트 타임아웃"
         except FileNotFoundError:
             return False, f"Godot 실행 파일을 찾을 수 없음: {self.godot_path}"
         except Exception as e:
@@ -66,15 +140,20 @@ class GodotBuilder:
         self, 
         project_path: str, 
         preset_name: str, 
-        output_path: str
+        output_path: str,
+        log_path: Optional[str] = None
     ) -> Tuple[bool, str]:
         """
         게임 내보내기 (빌드)
         
+        Godot 출력은 메모리에 버퍼링하지 않고 줄 단위로 로그 파일에 기록하며,
+        진행 표시(`[ 42% ] step | ...`)는 on_progress 이벤트로 전달한다.
+        
         Args:
             project_path: Godot 프로젝트 경로
             preset_name: 내보내기 프리셋 이름 (export_presets.cfg에 정의)
             output_path: 출력 파일 경로
+            log_path: 로그 파일 경로 (기본값: 출력 파일명.log)
         
         Returns:
             (성공 여부, 메시지)
@@ -84,6 +163,9 @@ class GodotBuilder:
             output_dir = Path(output_path).parent
             output_dir.mkdir(parents=True, exist_ok=True)
             
+            if log_path is None:
+                log_path = str(Path(output_path).with_suffix(".log"))
+            
             cmd = [
                 self.godot_path,
                 "--headless",
@@ -91,20 +173,15 @@ class GodotBuilder:
                 "--export-release", preset_name, output_path
             ]
             
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=600  # 10분 타임아웃
-            )
+            result = self._runner(self.export_timeout).run(cmd, log_path=log_path)
             
-            if result.returncode == 0 and Path(output_path).exists():
+            if result.timed_out:
+                return False, f"빌드 타임아웃 ({self.export_timeout}초 초과)"
+            if result.success and Path(output_path).exists():
                 return True, f"빌드 완료: {output_path}"
             else:
-                return False, f"빌드 오류: {result.stderr}"
+                return False, f"빌드 오류: {self._tail_log(log_path)}"
                 
-        except subprocess.TimeoutExpired:
-            return False, "빌드 타임아웃 (10분 초과)"
         except FileNotFoundError:
             return False, f"Godot 실행 파일을 찾을 수 없음: {self.godot_path}"
         except Exception as e:
@@ -118,6 +195,10 @@ class GodotBuilder:
         """
         모든 타겟 플랫폼 빌드
         
+        에셋 임포트는 원본 프로젝트에서 한 번만 수행하고, 타겟별로 격리된
+        프로젝트 복사본에서 동시에 내보낸다 (.godot 캐시 동시 쓰기 방지).
+        타겟별 소요 시간과 로그 경로는 last_build_report에 기록된다.
+        
         Args:
             project_path: Godot 프로젝트 경로
             output_dir: 출력 디렉토리
@@ -125,48 +206,239 @@ class GodotBuilder:
         Returns:
             [(타겟, 성공여부, 메시지), ...]
         """
-        results = []
+        self.last_build_report = {}
         
         # 우선 에셋 임포트
         import_success, import_msg = self.import_assets(project_path)
         if not import_success:
             return [("import", False, import_msg)]
         
-        # 타겟별 빌드
-        target_settings = {
-            "android": {
-                "preset": "Android",
-                "extension": ".apk"
-            },
-            "html5": {
-                "preset": "Web",
-                "extension": ".html"
-            },
-            "windows": {
-                "preset": "Windows Desktop",
-                "extension": ".exe"
-            }
-        }
+        build_id = self._new_build_id()
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        jobs = []
+        unknown = []
+        for target in self.export_targets:
+            if target not in self.TARGET_SETTINGS:
+                unknown.append(target)
+            else:
+                jobs.append(target)
+        
+        max_workers = self._max_parallel_exports(len(jobs))
+        
+        game_id = self.config.get("game_id") or Path(project_path).resolve().name
+        
+        def run_job(target: str) -> Tuple[str, bool, str]:
+            return self._export_target(
+                project_path, output_dir, target, build_id, len(jobs) > 1, game_id=game_id
+            )
+        
+        if jobs:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                finished = {target: result for target, result in zip(jobs, executor.map(run_job, jobs))}
+        else:
+            finished = {}
         
+        # 결과는 설정된 타겟 순서를 유지
+        results = []
         for target in self.export_targets:
-            if target not in target_settings:
+            if target in unknown:
                 results.append((target, False, f"알 수 없는 타겟: {target}"))
-                continue
+            else:
+                results.append(finished[target])
+        
+        return results
+    
+    def build_target(
+        self,
+        project_path: str,
+        output_dir: str,
+        target: str,
+        build_id: Optional[str] = None
+    ) -> Tuple[str, bool, str]:
+        """
+        단일 타겟 빌드 (격리된 복사본에서 임포트 후 내보내기)
+        
+        같은 프로젝트의 다른 타겟 빌드나 같은 타겟의 다른 빌드와 동시에
+        실행해도 안전하다. 빌드 큐 워커가 작업 1건을 처리할 때 사용한다.
+        
+        Args:
+            project_path: Godot 프로젝트 경로
+            output_dir: 출력 디렉토리
+            target: 타겟 플랫폼 (android/html5/windows)
+            build_id: 작업 디렉토리/출력/로그 이름 (기본: 시각 + 임의 접미사,
+                빌드 큐는 job_id 사용)
+        
+        Returns:
+            (타겟, 성공여부, 메시지)
+        """
+        if target not in self.TARGET_SETTINGS:
+            return (target, False, f"알 수 없는 타겟: {target}")
+        
+        return self._export_target(
+            project_path, output_dir, target, build_id or self._new_build_id(),
+            isolate=True, import_first=True,
+            game_id=self.config.get("game_id") or Path(project_path).resolve().name
+        )
+    
+    def submit_build(
+        self,
+        project_path: str,
+        output_dir: str,
+        priority: int = 0,
+        queue=None
+    ) -> list:
+        """
+        모든 타겟 빌드를 빌드 큐에 제출 (워커 프로세스가 처리)
+        
+        Args:
+            project_path: Godot 프로젝트 경로
+            output_dir: 출력 디렉토리
+            priority: 우선순위 (클수록 먼저 처리)
+            queue: BuildQueue (없으면 config의 build_queue_path 사용)
+        
+        Returns:
+            제출된 BuildJob 목록 (동일 작업이 이미 대기 중이면 기존 작업)
+        """
+        from .build_queue import BuildQueue
+        
+        if queue is None:
+            queue = BuildQueue(self.config.get("build_queue_path", "builds/build_queue.db"))
+        
+        return queue.submit_project(
+            project_path,
+            self.export_targets,
+            output_dir,
+            priority=priority
+        )
+    
+    def _export_target(
+        self,
+        project_path: str,
+        output_dir: str,
+        target: str,
+        build_id: str,
+        isolate: bool,
+        import_first: bool = False,
+        game_id: Optional[str] = None
+    ) -> Tuple[str, bool, str]:
+        """
+        단일 타겟 내보내기 (필요 시 격리된 복사본에서 실행)
+        
+        작업 디렉토리/출력/로그 이름은 build_id로 구분하므로 빌드마다 고유하다.
+        작업 디렉토리가 이미 있으면 다른 빌드 소유이므로 지우지 않고 실패한다.
+        """
+        settings = self.TARGET_SETTINGS[target]
+        output_file = f"game_{build_id}{settings['extension']}"
+        output_path = str(Path(output_dir).resolve() / target / output_file)
+        log_path = str(Path(output_dir).resolve() / target / f"game_{build_id}.log")
+        Path(log_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        started = time.monotonic()
+        work_path = None
+        
+        try:
+            export_path = project_path
+            if isolate:
+                candidate = Path(output_dir) / ".work" / f"{target}_{build_id}"
+                # 대상이 이미 있으면 materialize가 FileExistsError → 정리 대상에서 제외
+                self.materializer.materialize(project_path, str(candidate))
+                work_path = candidate
+                export_path = str(work_path)
             
-            settings = target_settings[target]
-            output_file = f"game_{timestamp}{settings['extension']}"
-            output_path = str(Path(output_dir) / target / output_file)
+            success, msg = True, ""
+            if import_first:
+                # 격리 복사본은 빌드 후 삭제되므로 데몬은 원본 프로젝트에만 사용
+                success, msg = self.import_assets(export_path, use_daemon=work_path is None)
             
-            success, msg = self.export_game(
-                project_path, 
-                settings["preset"], 
-                output_path
-            )
-            results.append((target, success, msg))
+            if success:
+                success, msg = self.export_game(
+                    export_path,
+                    settings["preset"],
+                    output_path,
+                    log_path=log_path
+                )
+        except Exception as e:
+            success, msg = False, f"빌드 실패: {str(e)}"
+        finally:
+            if work_path is not None:
+                shutil.rmtree(work_path, ignore_errors=True)
         
-        return results
+        duration = time.monotonic() - started
+        report = {
+            "success": success,
+            "duration": round(duration, 3),
+            "output_path": output_path,
+            "log_path": log_path
+        }
+        
+        if self.artifact_store is not None and game_id:
+            try:
+                remove = not self.config.get("keep_build_outputs", False)
+                record = self.artifact_store.add_build_output(
+                    game_id, target, output_path, success=success,
+                    metadata={"duration": report["duration"], "log_path": log_path},
+                    remove_originals=remove
+                )
+                report["artifact_id"] = record.build_id
+                report["output_removed"] = remove
+            except Exception as e:
+                print(f"아티팩트 저장 실패: {e}")
+        
+        self.last_build_report[target] = report
+        
+        return (target, success, msg)
+    
+    def _new_build_id(self) -> str:
+        """빌드 이름 (시각 + 임의 접미사, 같은 초에 시작한 빌드끼리도 겹치지 않음)"""
+        return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+    
+    def _max_parallel_exports(self, job_count: int) -> int:
+        """CPU 수와 가용 메모리로 동시 내보내기 수 결정"""
+        if job_count <= 1:
+            return 1
+        
+        configured = self.config.get("max_parallel_exports")
+        if configured:
+            return max(1, min(int(configured), job_count))
+        
+        # Godot 내보내기는 자체적으로 멀티스레드를 쓰므로 코어 2개당 1건
+        cpu_limit = max(1, (os.cpu_count() or 1) // 2)
+        
+        limit = min(cpu_limit, job_count)
+        
+        available_mb = self._available_memory_mb()
+        if available_mb is not None:
+            mem_limit = max(1, int(available_mb // self.export_memory_mb))
+            limit = min(limit, mem_limit)
+        
+        return max(1, limit)
+    
+    def _available_memory_mb(self) -> Optional[float]:
+        """가용 메모리 (MB), 확인 불가 시 None"""
+        try:
+            pages = os.sysconf("SC_AVPHYS_PAGES")
+            page_size = os.sysconf("SC_PAGE_SIZE")
+            return pages * page_size / (1024 * 1024)
+        except (ValueError, OSError, AttributeError):
+            return None
+    
+    def _runner(self, timeout: float) -> ProcessRunner:
+        """Godot 실행기 (진행률 → on_progress)"""
+        return ProcessRunner(GodotProgressParser(), timeout=timeout, on_progress=self.on_progress)
+    
+    def _tail_log(self, log_path: str, lines: int = 20) -> str:
+        """로그 파일 마지막 부분 읽기"""
+        try:
+            with open(log_path, "r", encoding="utf-8", errors="replace") as f:
+                tail = f.readlines()[-lines:]
+            return "".join(tail).strip() or f"로그 없음 ({log_path})"
+        except OSError:
+            return f"로그를 읽을 수 없음: {log_path}"
+    
+    def shutdown_daemons(self) -> None:
+        """상주 에디터 데몬 종료"""
+        if self.daemons is not None:
+            self.daemons.stop_all()
     
     def validate_project(self, project_path: str) -> Tuple[bool, List[str]]:
         """
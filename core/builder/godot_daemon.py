@@ -0,0 +1,317 @@
+"""
+Godot 에디터 데몬
+헤드리스 에디터를 상주시켜 반복 임포트 시 엔진 시작 비용 제거
+
+프로젝트에 addons/pipeline_build_daemon 에디터 플러그인을 설치하고
+`godot --headless --editor` 를 종료 없이 띄운 뒤 로컬 TCP로 명령을 보낸다.
+데몬을 쓸 수 없으면 GodotDaemonError가 발생하며, 호출 측(GodotBuilder)은
+기존 단발 실행으로 대체한다.
+"""
+
+import os
+import re
+import json
+import time
+import atexit
+import shutil
+import socket
+import tempfile
+import threading
+import subprocess
+from pathlib import Path
+from typing import Optional, List, Dict, Any
+
+
+ADDON_NAME = "pipeline_build_daemon"
+PORT_ENV = "PIPELINE_DAEMON_PORT"
+
+DEFAULT_ADDON_SOURCE = (
+    Path(__file__).parent.parent.parent / "templates" / "_core" / "addons" / ADDON_NAME
+)
+
+
+class GodotDaemonError(Exception):
+    """데몬 사용 불가 또는 통신 오류"""
+    pass
+
+
+class GodotEditorDaemon:
+    """상주 헤드리스 Godot 에디터 (프로젝트 1개 담당)"""
+
+    def __init__(
+        self,
+        godot_path: str,
+        project_path: str,
+        addon_source: Optional[str] = None,
+        startup_timeout: float = 120.0,
+        request_timeout: float = 600.0
+    ):
+        """
+        Args:
+            godot_path: Godot 실행 파일 경로
+            project_path: Godot 프로젝트 경로
+            addon_source: 데몬 에디터 플러그인 경로 (기본: templates/_core/addons)
+            startup_timeout: 에디터 시작 대기 시간 (초)
+            request_timeout: 명령 1건 응답 대기 시간 (초)
+        """
+        self.godot_path = godot_path
+        self.project_path = Path(project_path)
+        self.addon_source = Path(addon_source) if addon_source else DEFAULT_ADDON_SOURCE
+        self.startup_timeout = startup_timeout
+        self.request_timeout = request_timeout
+
+        self.port: Optional[int] = None
+        self.log_path: Optional[Path] = None
+        self._process: Optional[subprocess.Popen] = None
+        self._sock: Optional[socket.socket] = None
+        self._reader = None
+        self._lock = threading.Lock()
+
+    def is_running(self) -> bool:
+        """데몬 프로세스 실행 여부"""
+        return self._process is not None and self._process.poll() is None
+
+    def start(self) -> None:
+        """데몬 시작 (플러그인 설치 → 에디터 실행 → 응답 대기)"""
+        if self.is_running():
+            return
+
+        self._install_addon()
+        self.port = self._free_port()
+        self.log_path = Path(tempfile.gettempdir()) / f"godot_daemon_{self.port}.log"
+
+        env = dict(os.environ)
+        env[PORT_ENV] = str(self.port)
+
+        cmd = [
+            self.godot_path,
+            "--headless",
+            "--editor",
+            "--path", str(self.project_path)
+        ]
+
+        try:
+            with open(self.log_path, "w", encoding="utf-8") as log_file:
+                self._process = subprocess.Popen(
+                    cmd,
+                    stdout=log_file,
+                    stderr=subprocess.STDOUT,
+                    stdin=subprocess.DEVNULL,
+                    env=env
+                )
+        except FileNotFoundError:
+            raise GodotDaemonError(f"Godot 실행 파일을 찾을 수 없음: {self.godot_path}")
+
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise GodotDaemonError(f"데몬이 시작 중 종료됨 (code {self._process.returncode})")
+            try:
+                self._connect()
+                self.request("ping")
+                return
+            except (OSError, GodotDaemonError):
+                self._disconnect()
+                time.sleep(0.2)
+
+        self.stop()
+        raise GodotDaemonError("데몬 시작 타임아웃")
+
+    def request(self, cmd: str, timeout: Optional[float] = None, **payload) -> Dict[str, Any]:
+        """
+        명령 전송 및 응답 수신
+
+        Args:
+            cmd: 명령 (ping/scan/reimport/quit)
+            timeout: 응답 대기 시간 (기본: request_timeout)
+
+        Returns:
+            응답 딕셔너리 (ok=True)
+
+        Raises:
+            GodotDaemonError: 연결 실패 또는 ok=False 응답
+        """
+        with self._lock:
+            if self._sock is None:
+                self._connect()
+
+            message = json.dumps({"cmd": cmd, **payload}, ensure_ascii=False) + "\n"
+            try:
+                self._sock.settimeout(timeout or self.request_timeout)
+                self._sock.sendall(message.encode("utf-8"))
+                line = self._reader.readline()
+            except OSError as e:
+                self._disconnect()
+                raise GodotDaemonError(f"데몬 통신 오류: {e}")
+
+            if not line:
+                self._disconnect()
+                raise GodotDaemonError("데몬 연결이 끊어짐")
+
+        response = json.loads(line.decode("utf-8"))
+        if not response.get("ok"):
+            raise GodotDaemonError(response.get("error", "알 수 없는 오류"))
+        return response
+
+    def scan(self) -> str:
+        """전체 파일시스템 스캔 (새 에셋 임포트)"""
+        return self.request("scan").get("message", "")
+
+    def reimport(self, files: List[str]) -> str:
+        """
+        지정 파일 재임포트
+
+        Args:
+            files: 프로젝트 기준 경로 또는 res:// 경로 목록
+        """
+        res_paths = [self._to_res_path(f) for f in files]
+        return self.request("reimport", files=res_paths).get("message", "")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """데몬 종료"""
+        if self.is_running():
+            try:
+                self.request("quit", timeout=timeout)
+            except (GodotDaemonError, OSError, ValueError):
+                pass
+        self._disconnect()
+
+        if self._process is not None:
+            try:
+                self._process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+            self._process = None
+
+    def _connect(self) -> None:
+        self._sock = socket.create_connection(("127.0.0.1", self.port), timeout=5)
+        self._reader = self._sock.makefile("rb")
+
+    def _disconnect(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def _free_port(self) -> int:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(("127.0.0.1", 0))
+            return s.getsockname()[1]
+
+    def _to_res_path(self, path: str) -> str:
+        if path.startswith("res://"):
+            return path
+        p = Path(path)
+        if p.is_absolute():
+            p = p.resolve().relative_to(self.project_path.resolve())
+        return "res://" + p.as_posix()
+
+    def _install_addon(self) -> None:
+        """데몬 플러그인 설치 및 project.godot에 활성화"""
+        if not self.addon_source.exists():
+            raise GodotDaemonError(f"데몬 플러그인을 찾을 수 없음: {self.addon_source}")
+
+        project_file = self.project_path / "project.godot"
+        if not project_file.exists():
+            raise GodotDaemonError("project.godot 파일이 없습니다")
+
+        addon_dest = self.project_path / "addons" / ADDON_NAME
+        if not addon_dest.exists():
+            shutil.copytree(self.addon_source, addon_dest)
+        self._exclude_addon_from_exports()
+
+        entry = f'"res://addons/{ADDON_NAME}/plugin.cfg"'
+        text = project_file.read_text(encoding="utf-8")
+        if entry in text:
+            return
+
+        enabled = re.search(r"^enabled=PackedStringArray\((.*)\)$", text, re.M)
+        if "[editor_plugins]" in text and enabled:
+            inner = enabled.group(1).strip()
+            line = f"enabled=PackedStringArray({inner + ', ' if inner else ''}{entry})"
+            text = text[:enabled.start()] + line + text[enabled.end():]
+        elif "[editor_plugins]" in text:
+            text = text.replace(
+                "[editor_plugins]",
+                f"[editor_plugins]\n\nenabled=PackedStringArray({entry})",
+                1
+            )
+        else:
+            text = text.rstrip("\n") + f"\n\n[editor_plugins]\n\nenabled=PackedStringArray({entry})\n"
+
+        # 구체화된 프로젝트에서도 project.godot은 개별 복사본이므로 템플릿에 영향 없음
+        tmp = project_file.with_name("project.godot.tmp")
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, project_file)
+
+
+    def _exclude_addon_from_exports(self) -> None:
+        """내보내기 프리셋의 exclude_filter에 데몬 플러그인 추가 (게임 패키지에 포함되지 않게)"""
+        presets_file = self.project_path / "export_presets.cfg"
+        if not presets_file.exists():
+            return
+
+        pattern = f"addons/{ADDON_NAME}/*"
+        text = presets_file.read_text(encoding="utf-8")
+
+        def add_pattern(match: re.Match) -> str:
+            filters = [f.strip() for f in match.group(1).split(",") if f.strip()]
+            if pattern not in filters:
+                filters.append(pattern)
+            return f'exclude_filter="{", ".join(filters)}"'
+
+        updated = re.sub(r'^exclude_filter="(.*)"$', add_pattern, text, flags=re.M)
+        if updated != text:
+            tmp = presets_file.with_name("export_presets.cfg.tmp")
+            tmp.write_text(updated, encoding="utf-8")
+            os.replace(tmp, presets_file)
+
+
+class GodotDaemonPool:
+    """프로젝트별 데몬 관리"""
+
+    def __init__(self, godot_path: str, **daemon_options):
+        """
+        Args:
+            godot_path: Godot 실행 파일 경로
+            daemon_options: GodotEditorDaemon 추가 옵션
+        """
+        self.godot_path = godot_path
+        self.daemon_options = daemon_options
+        self._daemons: Dict[str, GodotEditorDaemon] = {}
+        self._failed: Dict[str, str] = {}  # 시작 실패한 프로젝트 (재시도하지 않음)
+        self._lock = threading.Lock()
+        atexit.register(self.stop_all)
+
+    def _key(self, project_path: str) -> str:
+        return str(Path(project_path).resolve())
+
+    def get(self, project_path: str) -> GodotEditorDaemon:
+        """프로젝트 데몬 (없으면 시작)"""
+        key = self._key(project_path)
+        with self._lock:
+            if key in self._failed:
+                raise GodotDaemonError(self._failed[key])
+
+            daemon = self._daemons.get(key)
+            if daemon is not None and daemon.is_running():
+                return daemon
+
+            daemon = GodotEditorDaemon(self.godot_path, project_path, **self.daemon_options)
+            try:
+                daemon.start()
+            except GodotDaemonError as e:
+                self._failed[key] = str(e)
+                raise
+            self._daemons[key] = daemon
+            return daemon
+
+    def stop_all(self) -> None:
+        """모든 데몬 종료"""
+        with self._lock:
+            for daemon in self._daemons.values():
+                daemon.stop()
+            self._daemons.clear()
@@ -0,0 +1,291 @@
+"""
+스트리밍 서브프로세스 실행기
+출력을 버퍼링하지 않고 줄 단위로 읽어 로그/진행률 이벤트로 전달
+
+Godot 빌드와 steamcmd 업로드가 공통으로 사용한다. 프로세스는 별도
+프로세스 그룹(세션)으로 띄워 타임아웃 시 자식 프로세스까지 함께 종료한다.
+실행 중인 세션은 모듈에 기록해 두고, 상위 프로세스가 종료될 때
+terminate_active()로 함께 정리한다 (빌드 큐 작업 취소 등).
+"""
+
+import os
+import re
+import time
+import codecs
+import signal
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Callable, Set
+
+# 이 프로세스가 띄운 실행 중 세션 (프로세스 그룹 ID = 자식 PID)
+_active_groups: Set[int] = set()
+
+
+def _signal_group(pgid: int, sig) -> bool:
+    """프로세스 그룹에 시그널 전송 (그룹이 없으면 False)"""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(pgid, sig)
+        else:
+            os.kill(pgid, sig)
+        return True
+    except (ProcessLookupError, PermissionError):
+        return False
+
+
+def terminate_active(grace: float = 5.0) -> None:
+    """
+    실행 중인 모든 세션 종료 (SIGTERM → 유예 후 SIGKILL, 동기)
+
+    시그널 핸들러에서 호출할 수 있도록 이벤트 루프를 쓰지 않는다.
+    """
+    groups = list(_active_groups)
+    for pgid in groups:
+        _signal_group(pgid, signal.SIGTERM)
+
+    deadline = time.monotonic() + grace
+    while time.monotonic() < deadline:
+        if not any(_signal_group(pgid, 0) for pgid in groups):
+            return
+        time.sleep(0.05)
+    for pgid in groups:
+        _signal_group(pgid, getattr(signal, "SIGKILL", signal.SIGTERM))
+
+
+@dataclass
+class ProgressEvent:
+    """진행률 이벤트"""
+    source: str  # godot, steamcmd 등
+    message: str
+    percent: Optional[float] = None  # 0~100 (알 수 없으면 None)
+    step: str = ""
+    timestamp: float = field(default_factory=time.time)
+
+
+@dataclass
+class ProcessResult:
+    """실행 결과"""
+    returncode: Optional[int]
+    duration: float
+    timed_out: bool = False
+    tail: List[str] = field(default_factory=list)  # 마지막 출력 줄 (stdout/stderr 합침)
+    log_path: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.returncode == 0 and not self.timed_out
+
+    def tail_text(self, lines: int = 20) -> str:
+        return "\n".join(self.tail[-lines:])
+
+
+class ProgressParser:
+    """출력 줄 → 진행률 이벤트 (기본: 해석하지 않음)"""
+
+    source = "process"
+
+    def parse(self, line: str) -> Optional[ProgressEvent]:
+        return None
+
+
+class GodotProgressParser(ProgressParser):
+    """Godot 헤드리스 진행 표시: `[ 42% ] savepack | Storing File: res://...`"""
+
+    source = "godot"
+    _PATTERN = re.compile(r"^\[\s*(\d+)%\s*\]\s*([^|]+?)\s*\|\s*(.*)$")
+
+    def parse(self, line: str) -> Optional[ProgressEvent]:
+        match = self._PATTERN.match(line.strip())
+        if not match:
+            return None
+        return ProgressEvent(
+            source=self.source,
+            percent=float(match.group(1)),
+            step=match.group(2),
+            message=match.group(3)
+        )
+
+
+class SteamcmdProgressParser(ProgressParser):
+    """steamcmd 진행 표시 (업로드 백분율, 빌드 단계)"""
+
+    source = "steamcmd"
+    _PERCENT = re.compile(r"(\d+(?:\.\d+)?)\s*%")
+    _STEPS = ("Logging in", "Building depot", "Uploading content", "Scanning content", "Successfully finished")
+
+    def parse(self, line: str) -> Optional[ProgressEvent]:
+        text = line.strip()
+        if text.startswith("Successfully finished"):
+            return ProgressEvent(source=self.source, percent=100.0, step="finished", message=text)
+
+        match = self._PERCENT.search(text)
+        if match:
+            return ProgressEvent(source=self.source, percent=float(match.group(1)), message=text)
+
+        for step in self._STEPS:
+            if step in text:
+                return ProgressEvent(source=self.source, step=step, message=text)
+        return None
+
+
+class ProcessRunner:
+    """줄 단위 스트리밍 서브프로세스 실행기"""
+
+    def __init__(
+        self,
+        parser: Optional[ProgressParser] = None,
+        timeout: Optional[float] = None,
+        on_line: Optional[Callable[[str, str], None]] = None,
+        on_progress: Optional[Callable[[ProgressEvent], None]] = None,
+        tail_lines: int = 50,
+        kill_grace: float = 5.0
+    ):
+        """
+        Args:
+            parser: 진행률 해석기
+            timeout: 전체 실행 제한 시간 (초)
+            on_line: 줄 콜백 (스트림 이름 stdout/stderr, 줄)
+            on_progress: 진행률 이벤트 콜백
+            tail_lines: 결과에 남길 마지막 출력 줄 수
+            kill_grace: SIGTERM 후 SIGKILL까지 대기 시간 (초)
+        """
+        self.parser = parser or ProgressParser()
+        self.timeout = timeout
+        self.on_line = on_line
+        self.on_progress = on_progress
+        self.tail_lines = tail_lines
+        self.kill_grace = kill_grace
+
+    def run(
+        self,
+        cmd: List[str],
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+        log_path: Optional[str] = None
+    ) -> ProcessResult:
+        """동기 실행 (스레드/워커 프로세스용, 자체 이벤트 루프 사용)"""
+        return asyncio.run(self.run_async(cmd, cwd=cwd, env=env, log_path=log_path))
+
+    async def run_async(
+        self,
+        cmd: List[str],
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+        log_path: Optional[str] = None
+    ) -> ProcessResult:
+        """
+        비동기 실행
+
+        Args:
+            cmd: 명령어
+            cwd: 작업 디렉토리
+            env: 환경 변수
+            log_path: 전체 출력을 기록할 로그 파일
+
+        Returns:
+            ProcessResult
+
+        Raises:
+            FileNotFoundError: 실행 파일 없음
+        """
+        started = time.monotonic()
+        tail: deque = deque(maxlen=self.tail_lines)
+        log_file = open(log_path, "w", encoding="utf-8") if log_path else None
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=cwd,
+                env=env,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True
+            )
+        except BaseException:
+            if log_file:
+                log_file.close()
+            raise
+        _active_groups.add(process.pid)
+
+        def handle(stream_name: str, line: str) -> None:
+            tail.append(line)
+            if log_file:
+                log_file.write(line + "\n")
+            if self.on_line:
+                self.on_line(stream_name, line)
+            if self.on_progress:
+                event = self.parser.parse(line)
+                if event is not None:
+                    self.on_progress(event)
+
+        readers = asyncio.gather(
+            self._read_lines(process.stdout, "stdout", handle),
+            self._read_lines(process.stderr, "stderr", handle)
+        )
+
+        async def finish() -> None:
+            await asyncio.shield(readers)
+            # 파이프를 닫고 계속 실행되는 프로세스도 같은 제한 시간 적용
+            await process.wait()
+
+        timed_out = False
+        try:
+            await asyncio.wait_for(finish(), self.timeout)
+        except asyncio.TimeoutError:
+            timed_out = True
+            await self._kill_group(process)
+            readers.cancel()
+            try:
+                await readers
+            except asyncio.CancelledError:
+                pass
+        finally:
+            _active_groups.discard(process.pid)
+            if log_file:
+                log_file.close()
+
+        return ProcessResult(
+            returncode=process.returncode,
+            duration=round(time.monotonic() - started, 3),
+            timed_out=timed_out,
+            tail=list(tail),
+            log_path=log_path
+        )
+
+    async def _read_lines(
+        self,
+        stream: asyncio.StreamReader,
+        stream_name: str,
+        handle: Callable[[str, str], None]
+    ) -> None:
+        """
+        스트림을 줄 단위로 전달 (\\r로 갱신되는 진행 표시도 줄로 취급)
+        
+        청크 경계에서 잘린 멀티바이트 문자(한글 경로 등)는 증분 디코더가
+        다음 청크와 이어 붙여 디코딩한다.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        buffer = ""
+        while True:
+            chunk = await stream.read(65536)
+            buffer += decoder.decode(chunk, final=not chunk)
+            if not chunk:
+                break
+            parts = re.split(r"\r\n|\r|\n", buffer)
+            buffer = parts.pop()
+            for line in parts:
+                if line:
+                    handle(stream_name, line)
+        if buffer:
+            handle(stream_name, buffer)
+
+    async def _kill_group(self, process: asyncio.subprocess.Process) -> None:
+        """프로세스 그룹 종료 (SIGTERM → 유예 후 SIGKILL)"""
+        _signal_group(process.pid, signal.SIGTERM)
+        try:
+            await asyncio.wait_for(process.wait(), self.kill_grace)
+        except asyncio.TimeoutError:
+            _signal_group(process.pid, getattr(signal, "SIGKILL", signal.SIGTERM))
+            await process.wait()
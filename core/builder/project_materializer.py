@@ -0,0 +1,294 @@
+"""
+프로젝트 구체화 (템플릿 → 게임 프로젝트)
+불변 템플릿 파일은 reflink(CoW)로 공유하고, 파이프라인이 수정하는 파일과
+reflink를 쓸 수 없는 파일시스템에서는 실제로 복사한다.
+
+하드링크는 method="hardlink"로 명시할 때만 사용한다. 하드링크 파일을 제자리
+수정하면 템플릿과 다른 게임까지 바뀌므로 수정 전에 make_private()를 호출해야 한다.
+"""
+
+import os
+import json
+import errno
+import shutil
+import fnmatch
+from pathlib import Path
+from datetime import datetime
+from typing import Optional, List, Dict, Any
+from dataclasses import dataclass, field, asdict
+
+
+MANIFEST_NAME = ".materialize.json"
+
+# Linux FICLONE ioctl (btrfs, xfs 등 reflink 지원 파일시스템)
+_FICLONE = 0x40049409
+
+# 링크 생성 실패 시 복사로 대체할 오류
+_LINK_FALLBACK_ERRNOS = {
+    errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.EOPNOTSUPP, errno.EINVAL,
+    errno.ENOTTY, errno.EBADF
+}
+
+
+@dataclass
+class MaterializeManifest:
+    """구체화 매니페스트 (대상 프로젝트 루트에 저장)"""
+    source: str
+    method: str  # reflink, hardlink, copy
+    linked: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # {상대경로: {size, mtime_ns}}
+    copied: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    created_at: str = ""
+
+    def __post_init__(self):
+        if not self.created_at:
+            self.created_at = datetime.now().isoformat()
+
+
+class ProjectMaterializer:
+    """템플릿 기반 프로젝트 구체화"""
+
+    # 파이프라인/Godot가 덮어쓰는 파일 (항상 개별 복사)
+    DEFAULT_MUTABLE_PATTERNS = [
+        "gdd.json",
+        "project.godot",
+        "export_presets.cfg",
+        "template_config.json",
+        "*.import",
+        ".godot/*",
+        "skins/*",
+    ]
+
+    def __init__(self, mutable_patterns: Optional[List[str]] = None, method: str = "auto"):
+        """
+        Args:
+            mutable_patterns: 개별 복사할 파일 패턴 (fnmatch, 상대경로 또는 파일명)
+            method: auto/reflink(reflink → 복사), hardlink(하드링크 → 복사), copy
+        """
+        self.mutable_patterns = (
+            mutable_patterns if mutable_patterns is not None else list(self.DEFAULT_MUTABLE_PATTERNS)
+        )
+        self.method = method
+        self._reflink_supported: Optional[bool] = None if method in ("auto", "reflink") else False
+        self._hardlink_supported = method == "hardlink"
+
+    def is_mutable(self, rel_path: str) -> bool:
+        """수정 대상 파일 여부"""
+        name = rel_path.rsplit("/", 1)[-1]
+        for pattern in self.mutable_patterns:
+            if fnmatch.fnmatch(rel_path, pattern):
+                return True
+            if "/" not in pattern and fnmatch.fnmatch(name, pattern):
+                return True
+        return False
+
+    def materialize(self, source_path: str, dest_path: str) -> MaterializeManifest:
+        """
+        템플릿 디렉토리를 대상 경로에 구체화
+
+        Args:
+            source_path: 템플릿 (원본) 디렉토리
+            dest_path: 생성할 프로젝트 디렉토리 (존재하지 않아야 함)
+
+        Returns:
+            MaterializeManifest
+        """
+        source = Path(source_path)
+        dest = Path(dest_path)
+        dest.mkdir(parents=True, exist_ok=False)
+
+        manifest = MaterializeManifest(source=str(source.resolve()), method="copy")
+        methods_used = set()
+
+        for root, dirs, files in os.walk(source):
+            root_path = Path(root)
+            rel_root = root_path.relative_to(source)
+            for d in dirs:
+                (dest / rel_root / d).mkdir(exist_ok=True)
+
+            for name in files:
+                rel = (rel_root / name).as_posix()
+                if rel == MANIFEST_NAME:
+                    continue
+
+                src_file = root_path / name
+                dst_file = dest / rel
+
+                if self.is_mutable(rel):
+                    shutil.copy2(src_file, dst_file)
+                    manifest.copied[rel] = self._stat_entry(dst_file)
+                    continue
+
+                used = self._link_or_copy(src_file, dst_file)
+                if used == "copy":
+                    manifest.copied[rel] = self._stat_entry(dst_file)
+                else:
+                    manifest.linked[rel] = self._stat_entry(dst_file)
+                methods_used.add(used)
+
+        for preferred in ("reflink", "hardlink"):
+            if preferred in methods_used:
+                manifest.method = preferred
+                break
+
+        self.save_manifest(dest, manifest)
+        return manifest
+
+    def _link_or_copy(self, src: Path, dst: Path) -> str:
+        """reflink(또는 명시한 하드링크) → 복사 순으로 시도"""
+        if self._reflink_supported is not False:
+            if self._try_reflink(src, dst):
+                self._reflink_supported = True
+                return "reflink"
+            if self._reflink_supported is None:
+                self._reflink_supported = False
+
+        if self._hardlink_supported:
+            try:
+                os.link(src, dst)
+                return "hardlink"
+            except OSError as e:
+                if e.errno not in _LINK_FALLBACK_ERRNOS:
+                    raise
+                # 파일시스템이 하드링크를 지원하지 않음 (다른 장치 등)
+                self._hardlink_supported = False
+
+        shutil.copy2(src, dst)
+        return "copy"
+
+    def _try_reflink(self, src: Path, dst: Path) -> bool:
+        """FICLONE ioctl로 CoW 복제 (Linux 전용)"""
+        try:
+            import fcntl
+        except ImportError:
+            return False
+
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError as e:
+            if dst.exists():
+                dst.unlink()
+            if e.errno in _LINK_FALLBACK_ERRNOS:
+                return False
+            raise
+
+        shutil.copystat(src, dst)
+        return True
+
+    def _stat_entry(self, path: Path) -> Dict[str, Any]:
+        st = path.stat()
+        return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+    def make_private(self, dest_path: str, rel_path: str) -> bool:
+        """
+        공유(하드링크) 파일을 개별 복사본으로 전환 (덮어쓰기 전 호출)
+
+        하드링크된 파일을 제자리 수정하면 템플릿 원본까지 바뀌므로
+        수정 전에 링크를 끊는다.
+
+        Returns:
+            전환 여부 (이미 개별 파일이면 False)
+        """
+        dest = Path(dest_path)
+        manifest = self.load_manifest(dest)
+        if manifest is None or rel_path not in manifest.linked:
+            return False
+
+        target = dest / rel_path
+        tmp = target.with_name(target.name + ".tmp_private")
+        shutil.copy2(target, tmp)
+        os.replace(tmp, target)
+
+        manifest.linked.pop(rel_path)
+        manifest.copied[rel_path] = self._stat_entry(target)
+        self.save_manifest(dest, manifest)
+        return True
+
+    def diff(self, dest_path: str) -> Dict[str, List[str]]:
+        """
+        구체화 이후 변경된 파일 (stat만 비교, 내용은 읽지 않음)
+
+        공유 파일도 검사한다. reflink 파일은 제자리 수정 시 이 게임만 바뀌고,
+        하드링크 파일은 템플릿(및 같은 템플릿의 다른 게임)까지 바뀐 것이다.
+
+        Returns:
+            {"modified": [...], "missing": [...]}
+        """
+        dest = Path(dest_path)
+        manifest = self.load_manifest(dest)
+        result = {"modified": [], "missing": []}
+        if manifest is None:
+            return result
+
+        for rel, entry in {**manifest.linked, **manifest.copied}.items():
+            path = dest / rel
+            if not path.exists():
+                result["missing"].append(rel)
+            elif self._stat_entry(path) != entry:
+                result["modified"].append(rel)
+
+        return result
+
+    def reset(self, dest_path: str) -> List[str]:
+        """변경된 파일만 템플릿 상태로 복원 (복원한 파일은 개별 복사본)"""
+        dest = Path(dest_path)
+        manifest = self.load_manifest(dest)
+        if manifest is None:
+            return []
+
+        changes = self.diff(dest_path)
+        restored = []
+        for rel in changes["modified"] + changes["missing"]:
+            src = Path(manifest.source) / rel
+            if not src.exists():
+                continue  # 파이프라인이 추가한 파일
+            target = dest / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            # 하드링크에 그대로 쓰면 공유 inode를 덮어쓰므로 먼저 끊는다
+            target.unlink(missing_ok=True)
+            shutil.copy2(src, target)
+            manifest.linked.pop(rel, None)
+            manifest.copied[rel] = self._stat_entry(target)
+            restored.append(rel)
+
+        self.save_manifest(dest, manifest)
+        return restored
+
+    def track(self, dest_path: str, rel_path: str) -> None:
+        """파이프라인이 새로 만든 파일을 매니페스트에 기록 (diff 대상에 포함)"""
+        dest = Path(dest_path)
+        manifest = self.load_manifest(dest)
+        if manifest is None:
+            return
+        manifest.linked.pop(rel_path, None)
+        manifest.copied[rel_path] = self._stat_entry(dest / rel_path)
+        self.save_manifest(dest, manifest)
+
+    def load_manifest(self, dest_path) -> Optional[MaterializeManifest]:
+        """매니페스트 로드"""
+        path = Path(dest_path) / MANIFEST_NAME
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return MaterializeManifest(**json.load(f))
+
+    def save_manifest(self, dest_path, manifest: MaterializeManifest) -> None:
+        """매니페스트 저장"""
+        path = Path(dest_path) / MANIFEST_NAME
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(asdict(manifest), f, ensure_ascii=False, indent=2)
+
+
+# 사용 예시
+def main():
+    materializer = ProjectMaterializer()
+
+    manifest = materializer.materialize("templates/template_runner", "games/runner/demo")
+    print(f"방식: {manifest.method}")
+    print(f"공유 파일: {len(manifest.linked)}개, 복사 파일: {len(manifest.copied)}개")
+
+    print(f"변경 사항: {materializer.diff('games/runner/demo')}")
+
+
+if __name__ == "__main__":
+    main()
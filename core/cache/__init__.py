@@ -2,5 +2,7 @@
 캐시 모듈
 """
 from .cache_manager import CacheManager, MemoryCache, RedisCache, get_cache
+from .tiered_cache import TieredCache, DiskCache
+from .lazy_index import LazyIndex
 
-__all__ = ["CacheManager", "MemoryCache", "RedisCache", "get_cache"]
+__all__ = ["CacheManager", "MemoryCache", "RedisCache", "get_cache", "TieredCache", "DiskCache", "LazyIndex"]
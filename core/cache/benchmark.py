@@ -0,0 +1,207 @@
+"""
+캐시 벤치마크
+GDD 크기 값으로 캐시 백엔드별 연산 지연과 처리량을 측정
+
+백엔드 (외부 서비스 불필요):
+- memory: MemoryCache
+- redis-inproc: RedisCache + FakeRedis (코덱/클라이언트 비용만, 네트워크 없음)
+- redis-resp: RedisCache + 로컬 RespServer (loopback TCP 왕복 포함)
+- tiered: TieredCache (MemoryCache L1 + redis-resp L2)
+- tiered-disk: TieredCache (MemoryCache L1 + DiskCache L2)
+
+연산: set, get (히트), get_miss, get_many, set_many
+실행: python -m core.cache.benchmark [--ops N] [--payload-kb K]
+"""
+
+import time
+import random
+import argparse
+import tempfile
+import statistics
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .cache_manager import MemoryCache, RedisCache
+from .tiered_cache import TieredCache, DiskCache
+from .fake_redis import FakeRedis, RespServer
+
+
+BACKENDS = ["memory", "redis-inproc", "redis-resp", "tiered", "tiered-disk"]
+OPERATIONS = ["set", "get", "get_miss", "get_many", "set_many"]
+
+
+def make_gdd(index: int, payload_kb: int = 8) -> Dict[str, Any]:
+    """
+    벤치마크용 GDD (gdd_schema 구조, 자산 목록으로 크기 조절)
+
+    Args:
+        index: 값 구분용 번호
+        payload_kb: 대략적인 JSON 크기 (KB)
+    """
+    rng = random.Random(index)
+    templates = ["runner", "puzzle", "clicker", "match3", "arcade", "rhythm", "idle"]
+    gdd = {
+        "game_title": f"트렌드 게임 {index}",
+        "template_type": templates[index % len(templates)],
+        "trend_source": {
+            "tiktok_hashtags": [f"#trend{rng.randint(0, 9999)}" for _ in range(5)],
+            "google_trends_keywords": ["casual", "hyper", "viral"],
+            "trend_velocity": rng.random(),
+            "collected_at": "2024-05-01T12:00:00",
+        },
+        "core_loop": ["스폰", "회피", "점수 획득", "보상"],
+        "mechanics": ["탭으로 점프", "스와이프로 이동", "콤보 배율"],
+        "art_style": {
+            "style_prompt": "픽셀 아트, 밝은 파스텔 색감, 2D 횡스크롤",
+            "color_palette": ["#FFB3BA", "#FFDFBA", "#FFFFBA", "#BAFFC9", "#BAE1FF"],
+        },
+        "character_dna": {"main_character": "모자 쓴 고양이", "enemies": ["슬라임", "박쥐"]},
+        "monetization": {"ad_placements": ["interstitial", "rewarded"], "iap_items": ["remove_ads"]},
+        "difficulty": {"initial_difficulty": 1.0, "difficulty_curve": 1.15, "max_difficulty": 5.0},
+        "assets_required": [],
+    }
+    asset_types = ["player", "enemy", "background", "obstacle", "ui", "effect", "audio"]
+    # 자산 1개 ≈ 200바이트
+    for i in range(max(1, payload_kb * 5)):
+        asset_type = asset_types[i % len(asset_types)]
+        gdd["assets_required"].append({
+            "asset_id": f"{asset_type}_{i}",
+            "asset_type": asset_type,
+            "generation_prompt": f"{asset_type} {i}, 픽셀 아트, 투명 배경, 64x64, 변형 {rng.randint(0, 999)}",
+            "filename": f"{asset_type}_{i}.png",
+        })
+    return gdd
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def _measure(op: Callable[[int], Any], count: int) -> Dict[str, float]:
+    """op(i)를 count번 실행해 지연(마이크로초)과 초당 처리량 계산"""
+    samples = []
+    started = time.perf_counter()
+    for i in range(count):
+        t0 = time.perf_counter()
+        op(i)
+        samples.append((time.perf_counter() - t0) * 1e6)
+    elapsed = time.perf_counter() - started
+    return {
+        "ops": count,
+        "ops_per_sec": count / elapsed if elapsed > 0 else 0.0,
+        "mean_us": statistics.fmean(samples),
+        "p50_us": _percentile(samples, 0.50),
+        "p99_us": _percentile(samples, 0.99),
+    }
+
+
+def _bench_backend(cache, ops: int, batch: int, payloads: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    keys = [f"bench:gdd:{i}" for i in range(ops)]
+    n = len(payloads)
+    results = {
+        "set": _measure(lambda i: cache.set(keys[i], payloads[i % n], 3600), ops),
+        "get": _measure(lambda i: cache.get(keys[i]), ops),
+        "get_miss": _measure(lambda i: cache.get(f"bench:missing:{i}"), ops),
+    }
+
+    batches = max(1, ops // batch)
+    results["get_many"] = _measure(
+        lambda b: cache.get_many(keys[(b * batch) % ops:][:batch]), batches
+    )
+    results["set_many"] = _measure(
+        lambda b: cache.set_many(
+            {f"bench:many:{b}:{j}": payloads[j % n] for j in range(batch)}, 3600
+        ),
+        batches
+    )
+    return results
+
+
+def _make_backend(name: str, workdir: Path, server: Optional[RespServer]):
+    if name == "memory":
+        return MemoryCache(max_entries=1_000_000, max_bytes=1 << 34)
+    if name == "redis-inproc":
+        return RedisCache(client=FakeRedis())
+    if name == "redis-resp":
+        return RedisCache(client=server.client())
+    if name == "tiered":
+        return TieredCache(MemoryCache(max_entries=1_000_000, max_bytes=1 << 34), RedisCache(client=server.client()))
+    if name == "tiered-disk":
+        return TieredCache(
+            MemoryCache(max_entries=1_000_000, max_bytes=1 << 34),
+            DiskCache(str(workdir / "bench.db"), purge_every=1 << 30)
+        )
+    return None
+
+
+def run_benchmark(
+    backends: Optional[List[str]] = None,
+    ops: int = 2000,
+    payload_kb: int = 8,
+    batch: int = 50,
+    distinct_payloads: int = 16
+) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    백엔드별 벤치마크 실행
+
+    Args:
+        backends: 측정할 백엔드 (기본 전체, BACKENDS 참고)
+        ops: 단건 연산 횟수
+        payload_kb: GDD 값 크기 (KB)
+        batch: get_many/set_many 한 번의 키 수
+        distinct_payloads: 서로 다른 값 개수
+
+    Returns:
+        {백엔드: {연산: {"ops", "ops_per_sec", "mean_us", "p50_us", "p99_us"}}}
+        (get_many/set_many는 배치 1회 기준, 모르는 백엔드는 {"error": ...})
+    """
+    backends = backends or BACKENDS
+    payloads = [make_gdd(i, payload_kb) for i in range(max(1, distinct_payloads))]
+    results: Dict[str, Any] = {}
+
+    with tempfile.TemporaryDirectory() as tmp, RespServer() as server:
+        for name in backends:
+            cache = _make_backend(name, Path(tmp), server)
+            if cache is None:
+                print(f"[경고] 알 수 없는 백엔드: {name}")
+                results[name] = {"error": f"unknown backend: {name}"}
+                continue
+            server.store.execute("FLUSHDB")
+            results[name] = _bench_backend(cache, ops, batch, payloads)
+            if hasattr(cache, "l2") and hasattr(cache.l2, "close"):
+                cache.l2.close()
+    return results
+
+
+def format_results(results: Dict[str, Dict[str, Dict[str, float]]]) -> str:
+    """결과 표 문자열"""
+    lines = [f"{'backend':<14}{'op':<10}{'ops/s':>12}{'mean µs':>10}{'p50 µs':>10}{'p99 µs':>10}"]
+    for backend, ops in results.items():
+        if "error" in ops:
+            lines.append(f"{backend:<14}{ops['error']}")
+            continue
+        for op, r in ops.items():
+            lines.append(
+                f"{backend:<14}{op:<10}{r['ops_per_sec']:>12.0f}{r['mean_us']:>10.1f}"
+                f"{r['p50_us']:>10.1f}{r['p99_us']:>10.1f}"
+            )
+    return "\n".join(lines)
+
+
+# 사용 예시
+def main():
+    parser = argparse.ArgumentParser(description="캐시 백엔드 벤치마크")
+    parser.add_argument("--backends", nargs="+", default=BACKENDS, choices=BACKENDS)
+    parser.add_argument("--ops", type=int, default=2000)
+    parser.add_argument("--payload-kb", type=int, default=8)
+    parser.add_argument("--batch", type=int, default=50)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.backends, args.ops, args.payload_kb, args.batch)
+    print(f"GDD {args.payload_kb}KB, 단건 {args.ops}회, 배치 {args.batch}키")
+    print(format_results(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,104 +3,296 @@
 Redis 기반 캐싱 및 메모리 캐싱
 """
 
+import sys
 import json
+import time
+import heapq
+import asyncio
+import inspect
 import hashlib
-from datetime import datetime, timedelta
-from typing import Any, Optional, Dict, Callable
+import threading
+from enum import Enum
+from datetime import datetime, date
+from collections import OrderedDict
+from typing import Any, Optional, Dict, Callable, List, Tuple, Iterable, Union
 from functools import wraps
-from dataclasses import dataclass
+from itertools import islice
+from dataclasses import dataclass, is_dataclass, fields as dataclass_fields
+
+from .codec import get_codec, encode, decode, MISSING
 
 
 @dataclass
 class CacheEntry:
-    """캐시 항목"""
+    """캐시 항목 (시각은 time.monotonic 기준)"""
     key: str
     value: Any
-    created_at: datetime
-    expires_at: Optional[datetime]
+    created_at: float
+    expires_at: Optional[float]
+    size: int = 0
     hit_count: int = 0
+    tags: Tuple[str, ...] = ()
+
+
+# 컨테이너 크기 추정 시 살펴볼 최대 원소 수 (나머지는 평균으로 외삽)
+_SIZE_SAMPLE = 8
+_SCALAR_TYPES = frozenset({str, bytes, bytearray, int, float, bool, type(None)})
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """
+    값의 대략적인 메모리 크기 (바이트, 컨테이너는 3단계까지 재귀)
+    
+    원소가 많은 목록·튜플·집합은 앞쪽 _SIZE_SAMPLE개만 재고 개수만큼 외삽해
+    set 경로에서 값 전체를 순회하지 않는다.
+    """
+    size = sys.getsizeof(value)
+    if _depth >= 3 or type(value) in _SCALAR_TYPES:
+        return size
+    if isinstance(value, dict):
+        size += sum(estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        sample = sum(estimate_size(v, _depth + 1) for v in islice(value, _SIZE_SAMPLE))
+        size += sample * len(value) // _SIZE_SAMPLE if len(value) > _SIZE_SAMPLE else sample
+    elif hasattr(value, "__dict__"):
+        size += estimate_size(vars(value), _depth + 1)
+    return size
 
 
 class MemoryCache:
-    """메모리 캐시"""
+    """
+    메모리 캐시 (LRU + TTL)
+    
+    항목 수/바이트 상한을 넘으면 가장 오래 쓰지 않은 항목부터 제거하고,
+    만료 시각은 최소 힙으로 관리해 만료된 항목만 꺼내 지운다 (전체 순회 없음).
+    태그별 키 집합을 유지해 태그 무효화는 해당 항목 수만큼만 처리한다.
+    """
     
-    def __init__(self, default_ttl: int = 3600):
+    def __init__(
+        self,
+        default_ttl: int = 3600,
+        max_entries: int = 10000,
+        max_bytes: Optional[int] = 64 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic
+    ):
         """
         Args:
-            default_ttl: 기본 TTL (초)
+            default_ttl: 기본 TTL (초, 0 이하면 만료 없음)
+            max_entries: 최대 항목 수
+            max_bytes: 최대 크기 (estimate_size 합계, None이면 크기 제한과 추정 생략)
+            clock: 단조 시계 (테스트용 교체 가능)
         """
         self.default_ttl = default_ttl
-        self._cache: Dict[str, CacheEntry] = {}
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        # (만료 시각, 키) - 덮어쓰기/삭제된 항목은 꺼낼 때 건너뜀
+        self._expiry: List[Tuple[float, str]] = []
+        self._bytes = 0
+        # 태그 → 키 집합 (항목이 제거되면 함께 정리)
+        self._tags: Dict[str, set] = {}
+        self._lock = threading.Lock()
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
     
-    def _is_expired(self, entry: CacheEntry) -> bool:
-        """만료 여부 확인"""
-        if entry.expires_at is None:
-            return False
-        return datetime.now() > entry.expires_at
+    def _remove(self, key: str) -> CacheEntry:
+        entry = self._cache.pop(key)
+        self._bytes -= entry.size
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+        return entry
+    
+    def _expire(self, now: float) -> int:
+        """만료 시각이 지난 항목 제거 (힙 앞부분만 확인)"""
+        removed = 0
+        heap = self._expiry
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove(key)
+                removed += 1
+        self.expirations += removed
+        
+        # 덮어쓴 항목의 힙 잔여분이 쌓이면 정리
+        if len(heap) > 2 * len(self._cache) + 64:
+            self._expiry = [(e.expires_at, k) for k, e in self._cache.items() if e.expires_at is not None]
+            heapq.heapify(self._expiry)
+        return removed
     
     def get(self, key: str) -> Optional[Any]:
         """캐시 조회"""
-        if key not in self._cache:
-            return None
-        
-        entry = self._cache[key]
-        
-        if self._is_expired(entry):
-            del self._cache[key]
-            return None
-        
-        entry.hit_count += 1
-        return entry.value
+        with self._lock:
+            now = self._clock()
+            entry = self._cache.get(key)
+            if entry is not None and entry.expires_at is not None and entry.expires_at <= now:
+                self._expire(now)
+                entry = None
+            
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            self._cache.move_to_end(key)
+            entry.hit_count += 1
+            self.hits += 1
+            return entry.value
     
-    def set(self, key: str, value: Any, ttl: int = None) -> None:
-        """캐시 저장"""
+    def set(self, key: str, value: Any, ttl: int = None, tags: Iterable[str] = ()) -> None:
+        """
+        캐시 저장 (max_bytes보다 큰 값은 저장하지 않음)
+        
+        Args:
+            tags: invalidate_tag로 함께 지울 태그
+        """
         if ttl is None:
             ttl = self.default_ttl
+        # 크기 제한이 없으면 값을 순회하지 않음
+        size = estimate_size(value) if self.max_bytes is not None else 0
         
-        expires_at = datetime.now() + timedelta(seconds=ttl) if ttl > 0 else None
-        
-        self._cache[key] = CacheEntry(
-            key=key,
-            value=value,
-            created_at=datetime.now(),
-            expires_at=expires_at
-        )
+        with self._lock:
+            now = self._clock()
+            if key in self._cache:
+                self._remove(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            
+            expires_at = now + ttl if ttl > 0 else None
+            tags = tuple(tags)
+            self._cache[key] = CacheEntry(
+                key=key,
+                value=value,
+                created_at=now,
+                expires_at=expires_at,
+                size=size,
+                tags=tags
+            )
+            self._bytes += size
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            if expires_at is not None:
+                heapq.heappush(self._expiry, (expires_at, key))
+            
+            self._expire(now)
+            while len(self._cache) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._cache)))
+                self.evictions += 1
+    
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """여러 키 조회 (없는 키는 결과에서 제외)"""
+        found = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+    
+    def set_many(self, items: Dict[str, Any], ttl: int = None, tags: Iterable[str] = ()) -> None:
+        """여러 키 저장"""
+        tags = tuple(tags)
+        for key, value in items.items():
+            self.set(key, value, ttl, tags)
     
     def delete(self, key: str) -> bool:
         """캐시 삭제"""
-        if key in self._cache:
-            del self._cache[key]
-            return True
-        return False
+        with self._lock:
+            if key in self._cache:
+                self._remove(key)
+                return True
+            return False
+    
+    def invalidate_tag(self, tag: str) -> int:
+        """
+        태그가 붙은 항목 모두 삭제
+        
+        Returns:
+            삭제한 항목 수
+        """
+        with self._lock:
+            keys = self._tags.pop(tag, ())
+            for key in keys:
+                self._remove(key)
+            return len(keys)
     
     def clear(self) -> None:
         """전체 캐시 삭제"""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+            self._expiry.clear()
+            self._tags.clear()
+            self._bytes = 0
     
     def cleanup(self) -> int:
         """만료된 항목 정리"""
-        expired = [k for k, v in self._cache.items() if self._is_expired(v)]
-        for key in expired:
-            del self._cache[key]
-        return len(expired)
+        with self._lock:
+            return self._expire(self._clock())
+    
+    def __len__(self) -> int:
+        return len(self._cache)
     
     def stats(self) -> Dict[str, Any]:
         """캐시 통계"""
-        total_hits = sum(e.hit_count for e in self._cache.values())
+        lookups = self.hits + self.misses
         return {
             "entries": len(self._cache),
-            "total_hits": total_hits,
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "tags": len(self._tags),
+            "total_hits": self.hits,
         }
 
 
 class RedisCache:
-    """Redis 캐시"""
+    """
+    Redis 캐시 (값은 codec 모듈의 헤더 + 바이너리 형식)
+    
+    태그는 "<tag_prefix><태그>" 정렬 집합에 키를 만료 시각(점수)과 함께 모아 두고
+    무효화 시 아직 살아 있는 키만 꺼내 삭제한다. 저장할 때마다 만료된 키를
+    집합에서 지워 집합 크기가 살아 있는 항목 수를 넘지 않는다. 태그 집합 TTL은
+    추가할 때마다 max(ttl, tag_ttl)로 갱신한다.
+    """
     
-    def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0):
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        codec: str = "pickle",
+        client=None,
+        tag_prefix: str = "cache:tags:",
+        tag_ttl: int = 86400
+    ):
+        """
+        Args:
+            host, port, db: Redis 접속 정보
+            codec: 값 코덱 (pickle 또는 msgpack)
+            client: 이미 만든 Redis 클라이언트 (주면 접속 정보 무시)
+            tag_prefix: 태그 정렬 집합 키 접두사 (이전 SET 형식 키와 겹치지 않게 cache:tags:)
+            tag_ttl: 태그 집합 최소 TTL (초)
+        """
         self.host = host
         self.port = port
         self.db = db
-        self._client = None
+        self.codec = get_codec(codec)
+        self._client = client
+        self.tag_prefix = tag_prefix
+        self.tag_ttl = tag_ttl
     
     def _get_client(self):
         """Redis 클라이언트 가져오기"""
@@ -110,14 +302,17 @@ class RedisCache:
                 self._client = redis.Redis(
                     host=self.host,
                     port=self.port,
-                    db=self.db,
-                    decode_responses=True
+                    db=self.db
                 )
             except ImportError:
                 print("redis 패키지 필요: pip install redis")
                 return None
         return self._client
     
+    def _decode(self, data: Any) -> Optional[Any]:
+        value = decode(data)
+        return None if value is MISSING else value
+    
     def get(self, key: str) -> Optional[Any]:
         """캐시 조회"""
         client = self._get_client()
@@ -125,26 +320,136 @@ class RedisCache:
             return None
         
         try:
-            data = client.get(key)
-            if data:
-                return json.loads(data)
+            return self._decode(client.get(key))
         except Exception as e:
             print(f"Redis get 오류: {e}")
         
         return None
     
-    def set(self, key: str, value: Any, ttl: int = 3600) -> None:
-        """캐시 저장"""
+    def set(self, key: str, value: Any, ttl: int = 3600, tags: Iterable[str] = ()) -> None:
+        """캐시 저장 (ttl이 0 이하면 만료 없음)"""
+        if tags:
+            self.set_many({key: value}, ttl, tags)
+            return
+        
         client = self._get_client()
         if client is None:
             return
         
         try:
-            data = json.dumps(value, ensure_ascii=False, default=str)
-            client.setex(key, ttl, data)
+            data = encode(value, self.codec)
+            if ttl > 0:
+                client.setex(key, ttl, data)
+            else:
+                client.set(key, data)
         except Exception as e:
             print(f"Redis set 오류: {e}")
     
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """여러 키 조회 (MGET 1회 왕복, 없는 키는 결과에서 제외)"""
+        client = self._get_client()
+        if client is None or not keys:
+            return {}
+        
+        try:
+            values = client.mget(keys)
+        except Exception as e:
+            print(f"Redis mget 오류: {e}")
+            return {}
+        
+        found = {}
+        for key, data in zip(keys, values):
+            value = self._decode(data)
+            if value is not None:
+                found[key] = value
+        return found
+    
+    def get_many_with_ttl(self, keys: List[str]) -> Dict[str, Tuple[Any, Optional[float]]]:
+        """
+        여러 키를 남은 TTL과 함께 조회 (MGET + PTTL 트랜잭션 1회 왕복)
+        
+        Returns:
+            키 → (값, 남은 TTL 초 또는 만료 없으면 None)
+        """
+        client = self._get_client()
+        if client is None or not keys:
+            return {}
+        
+        try:
+            pipe = client.pipeline(transaction=True)
+            pipe.mget(keys)
+            for key in keys:
+                pipe.pttl(key)
+            values, *ttls = pipe.execute()
+        except Exception as e:
+            print(f"Redis mget 오류: {e}")
+            return {}
+        
+        found = {}
+        for key, data, pttl in zip(keys, values, ttls):
+            value = self._decode(data)
+            if value is not None and pttl != -2:
+                found[key] = (value, pttl / 1000 if pttl >= 0 else None)
+        return found
+    
+    def set_many(self, items: Dict[str, Any], ttl: int = 3600, tags: Iterable[str] = ()) -> None:
+        """여러 키 저장 (파이프라인 1회 왕복, 태그 등록 포함)"""
+        client = self._get_client()
+        if client is None or not items:
+            return
+        
+        try:
+            now = time.time()
+            score = now + ttl if ttl > 0 else float("inf")
+            pipe = client.pipeline(transaction=False)
+            for key, value in items.items():
+                data = encode(value, self.codec)
+                if ttl > 0:
+                    pipe.setex(key, ttl, data)
+                else:
+                    pipe.set(key, data)
+            for tag in tags:
+                tag_key = self.tag_prefix + tag
+                pipe.zadd(tag_key, {key: score for key in items})
+                pipe.zremrangebyscore(tag_key, "-inf", now)
+                if ttl > 0:
+                    pipe.expire(tag_key, max(ttl, self.tag_ttl))
+                else:
+                    pipe.persist(tag_key)
+            pipe.execute()
+        except Exception as e:
+            print(f"Redis pipeline 오류: {e}")
+    
+    def invalidate_tag(self, tag: str) -> int:
+        """
+        태그가 붙은 항목 모두 삭제
+        
+        Returns:
+            삭제한 항목 수 (만료되지 않은 키만)
+        """
+        return len(self.invalidate_tag_keys(tag))
+    
+    def invalidate_tag_keys(self, tag: str) -> List[str]:
+        """태그 무효화 후 삭제 대상 키 목록 반환 (만료된 키 제외)"""
+        client = self._get_client()
+        if client is None:
+            return []
+        
+        tag_key = self.tag_prefix + tag
+        try:
+            # 집합 조회와 삭제를 한 트랜잭션으로 (이후 추가되는 키는 새 집합에)
+            pipe = client.pipeline(transaction=True)
+            pipe.zrangebyscore(tag_key, f"({time.time()}", "+inf")
+            pipe.delete(tag_key)
+            members, _ = pipe.execute()
+            keys = [m.decode("utf-8") if isinstance(m, bytes) else m for m in members]
+            if keys:
+                client.delete(*keys)
+            return keys
+        except Exception as e:
+            print(f"Redis 태그 무효화 오류: {e}")
+            return []
+    
     def delete(self, key: str) -> bool:
         """캐시 삭제"""
         client = self._get_client()
@@ -158,42 +463,374 @@ class RedisCache:
             return False
 
 
+def namespace_tag(namespace: str) -> str:
+    """네임스페이스 무효화용 태그"""
+    return f"ns:{namespace}"
+
+
+def _canonical(value: Any) -> Any:
+    """
+    키 생성용 정규화 (JSON 호환 구조)
+    
+    str()/repr()은 객체 주소나 dict/set 순서에 따라 달라지므로 타입별로
+    내용 기반 표현을 만든다. cache_key() 메서드가 있으면 그 값을 쓴다.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if hasattr(value, "cache_key") and callable(value.cache_key):
+        return {"__key__": _canonical(value.cache_key())}
+    if isinstance(value, Enum):
+        return {"__enum__": f"{type(value).__qualname__}.{value.name}"}
+    if isinstance(value, (bytes, bytearray)):
+        return {"__bytes__": hashlib.sha256(value).hexdigest()}
+    if isinstance(value, (datetime, date)):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, dict):
+        items = [(_key_text(k), _canonical(v)) for k, v in value.items()]
+        return {"__map__": sorted(items, key=lambda kv: kv[0])}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return {"__set__": sorted(_key_text(v) for v in value)}
+    if is_dataclass(value):
+        fields_ = {f.name: getattr(value, f.name) for f in dataclass_fields(value)}
+        return {"__dataclass__": type(value).__qualname__, "fields": _canonical(fields_)}
+    if hasattr(value, "__dict__"):
+        return {"__object__": type(value).__qualname__, "fields": _canonical(vars(value))}
+    return {"__repr__": repr(value)}
+
+
+def _key_text(value: Any) -> str:
+    return json.dumps(_canonical(value), sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+
+
+def _signature(func: Callable) -> Optional[inspect.Signature]:
+    try:
+        return inspect.signature(func)
+    except (TypeError, ValueError):
+        return None
+
+
+def build_key(
+    namespace: str,
+    func: Callable,
+    args: tuple = (),
+    kwargs: Optional[dict] = None,
+    signature: Optional[inspect.Signature] = None
+) -> str:
+    """
+    안정적인 캐시 키 생성
+    
+    인자를 함수 시그니처에 바인딩해 위치/키워드 호출과 기본값 생략을 같은
+    키로 만들고, self/cls는 제외한다.
+    
+    Returns:
+        "<네임스페이스>:<모듈>.<함수>:<인자 해시>"
+    """
+    kwargs = kwargs or {}
+    signature = signature or _signature(func)
+    params: Dict[str, Any]
+    try:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        params = dict(bound.arguments)
+        first = next(iter(signature.parameters), None)
+        if first in ("self", "cls"):
+            params.pop(first, None)
+    except (AttributeError, TypeError):
+        params = {"args": list(args), "kwargs": kwargs}
+    
+    digest = hashlib.sha256(_key_text(params).encode("utf-8")).hexdigest()[:32]
+    return f"{namespace}:{func.__module__}.{func.__qualname__}:{digest}"
+
+
+class _Flight:
+    """진행 중인 계산 (같은 키의 동시 미스는 결과를 공유)"""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
 class CacheManager:
     """통합 캐시 매니저"""
     
-    def __init__(self, use_redis: bool = False, **kwargs):
-        if use_redis:
+    def __init__(self, use_redis: bool = False, tiered: bool = False, cache=None, **kwargs):
+        """
+        Args:
+            use_redis: Redis 사용 (tiered면 L2로 사용)
+            tiered: 메모리 L1 + L2 2단 캐시 (L2는 Redis 또는 로컬 디스크)
+            cache: 직접 만든 캐시 백엔드 (주면 나머지 인자 무시)
+            **kwargs: 백엔드 생성 인자 (tiered면 L2 인자)
+        """
+        if cache is not None:
+            self.cache = cache
+        elif tiered:
+            from .tiered_cache import TieredCache, DiskCache
+            l2 = RedisCache(**kwargs) if use_redis else DiskCache(**kwargs)
+            self.cache = TieredCache(MemoryCache(), l2)
+        elif use_redis:
             self.cache = RedisCache(**kwargs)
         else:
             self.cache = MemoryCache(**kwargs)
+        
+        self._flights: Dict[str, _Flight] = {}
+        # (이벤트 루프 id, 키) → 계산 작업 (끝날 때까지 참조 유지)
+        self._async_flights: Dict[Tuple[int, str], asyncio.Task] = {}
+        self._flight_lock = threading.Lock()
+    
+    def _lookup(self, key: str, ttl: int, refresh_ahead: float) -> Tuple[bool, Any, Optional[float]]:
+        """
+        캐시 조회
+        
+        값은 {"v": 값, "t": 저장 시각} 봉투에 담아 저장하므로 None 결과도
+        캐시되고, 저장 시각으로 미리 갱신할 시점을 판단한다.
+        
+        Returns:
+            (히트 여부, 값, 미리 갱신이 필요하면 그 항목의 저장 시각 아니면 None)
+        """
+        envelope = self.cache.get(key)
+        if not isinstance(envelope, dict) or "v" not in envelope:
+            return False, None, None
+        stale = refresh_ahead > 0 and ttl > 0 and time.time() - envelope["t"] >= ttl * (1 - refresh_ahead)
+        return True, envelope["v"], envelope["t"] if stale else None
+    
+    def _store(self, key: str, value: Any, ttl: int, tags: Tuple[str, ...] = ()) -> None:
+        self.cache.set(key, {"v": value, "t": time.time()}, ttl, tags)
+    
+    def _fresh(self, key: str, newer_than: float) -> Tuple[bool, Any]:
+        """newer_than 이후에 저장된 캐시 값 (방금 끝난 계산 결과를 다시 계산하지 않도록)"""
+        envelope = self.cache.get(key)
+        if isinstance(envelope, dict) and "v" in envelope and envelope.get("t", 0) > newer_than:
+            return True, envelope["v"]
+        return False, None
+    
+    def _begin_flight(self, key: str) -> Tuple[_Flight, bool]:
+        """진행 중인 계산에 합류하거나 새로 등록 → (계산, 선행 여부)"""
+        with self._flight_lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                return flight, False
+            flight = self._flights[key] = _Flight()
+            return flight, True
+    
+    def _run_flight(
+        self,
+        key: str,
+        flight: _Flight,
+        compute: Callable[[], Any],
+        ttl: int,
+        tags: Tuple[str, ...],
+        newer_than: float
+    ) -> Any:
+        """선행 호출의 계산 (캐시를 다시 확인한 뒤 필요할 때만 계산)"""
+        try:
+            found, value = self._fresh(key, newer_than)
+            if not found:
+                value = compute()
+                self._store(key, value, ttl, tags)
+            flight.value = value
+            return value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._flight_lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+    
+    def _call_once(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: int,
+        tags: Tuple[str, ...] = (),
+        newer_than: float = float("-inf")
+    ) -> Any:
+        """
+        키당 한 번만 계산 (동시에 들어온 호출은 먼저 온 계산 결과를 기다림)
+        
+        Args:
+            newer_than: 이 시각 이후에 저장된 캐시 값이 있으면 계산 없이 사용
+        """
+        flight, leader = self._begin_flight(key)
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+        return self._run_flight(key, flight, compute, ttl, tags, newer_than)
+    
+    def _async_flight(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: int,
+        tags: Tuple[str, ...],
+        newer_than: float
+    ) -> "asyncio.Task":
+        """
+        키의 비동기 계산 작업 (없으면 생성)
+        
+        계산은 호출자가 아닌 이 작업이 소유하므로, 기다리던 호출 하나가
+        취소돼도 계산과 다른 호출에는 영향이 없다.
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        task = self._async_flights.get(flight_key)
+        if task is not None:
+            return task
+        
+        async def run() -> Any:
+            found, value = self._fresh(key, newer_than)
+            if not found:
+                value = await compute()
+                self._store(key, value, ttl, tags)
+            return value
+        
+        task = loop.create_task(run())
+        self._async_flights[flight_key] = task
+        
+        def done(t: asyncio.Task) -> None:
+            if self._async_flights.get(flight_key) is t:
+                del self._async_flights[flight_key]
+            if not t.cancelled():
+                t.exception()  # 기다리는 호출이 없어도 경고가 나지 않도록 확인 처리
+        
+        task.add_done_callback(done)
+        return task
+    
+    async def _call_once_async(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: int,
+        tags: Tuple[str, ...] = (),
+        newer_than: float = float("-inf")
+    ) -> Any:
+        """_call_once의 코루틴 버전 (같은 이벤트 루프 안에서 공유, 호출 취소는 그 호출만 분리)"""
+        task = self._async_flight(key, compute, ttl, tags, newer_than)
+        return await asyncio.shield(task)
+    
+    def _refresh_in_background(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: int,
+        tags: Tuple[str, ...],
+        stored_at: float
+    ) -> None:
+        """만료 전 미리 갱신 (이미 계산 중이면 생략, 계산을 먼저 등록한 뒤 스레드 시작)"""
+        flight, leader = self._begin_flight(key)
+        if not leader:
+            return
+        
+        def run() -> None:
+            try:
+                self._run_flight(key, flight, compute, ttl, tags, stored_at)
+            except Exception as e:
+                print(f"[경고] 캐시 미리 갱신 실패: {e}")
+        
+        thread = threading.Thread(target=run, name="cache-refresh", daemon=True)
+        thread.start()
     
-    def cached(self, ttl: int = 3600, key_prefix: str = ""):
-        """캐싱 데코레이터"""
+    def _refresh_in_background_async(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: int,
+        tags: Tuple[str, ...],
+        stored_at: float
+    ) -> None:
+        task = self._async_flight(key, compute, ttl, tags, stored_at)
+        
+        def done(t: asyncio.Task) -> None:
+            if not t.cancelled() and t.exception() is not None:
+                print(f"[경고] 캐시 미리 갱신 실패: {t.exception()}")
+        
+        task.add_done_callback(done)
+    
+    def cached(
+        self,
+        ttl: int = 3600,
+        key_prefix: str = "",
+        refresh_ahead: float = 0.0,
+        tags: Union[Iterable[str], Callable[..., Iterable[str]], None] = None
+    ):
+        """
+        캐싱 데코레이터 (일반 함수와 async 함수 모두 지원)
+        
+        같은 키로 동시에 미스가 나면 한 번만 실행하고 나머지는 그 결과를
+        기다린다. None 결과도 캐시한다. 감싼 함수에는 cache_key(*args, **kwargs)와
+        invalidate(*args, **kwargs)가 붙는다.
+        
+        Args:
+            ttl: 캐시 유지 시간 (초)
+            key_prefix: 네임스페이스 (invalidate_namespace로 일괄 무효화, 기본 "default")
+            refresh_ahead: 남은 수명이 ttl의 이 비율 아래로 떨어지면 캐시 값을
+                반환하면서 백그라운드에서 미리 갱신 (0이면 사용 안 함, 예: 0.2)
+            tags: 항목 태그 목록, 또는 함수와 같은 인자를 받아 태그를 돌려주는 함수
+                (예: lambda template_type, **_: [f"template:{template_type}"])
+        """
+        namespace = key_prefix or "default"
+        
         def decorator(func: Callable):
-            @wraps(func)
-            def wrapper(*args, **kwargs):
-                # 캐시 키 생성
-                key_parts = [key_prefix, func.__name__]
-                key_parts.extend(str(a) for a in args)
-                key_parts.extend(f"{k}={v}" for k, v in sorted(kwargs.items()))
-                cache_key = hashlib.md5(":".join(key_parts).encode()).hexdigest()
+            signature = _signature(func)
+            
+            def key_and_tags(args: tuple, kwargs: dict) -> Tuple[str, Tuple[str, ...]]:
+                cache_key = build_key(namespace, func, args, kwargs, signature)
+                entry_tags = tags(*args, **kwargs) if callable(tags) else (tags or ())
+                return cache_key, (namespace_tag(namespace), *entry_tags)
+            
+            if inspect.iscoroutinefunction(func):
+                @wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    cache_key, entry_tags = key_and_tags(args, kwargs)
+                    hit, value, stale_at = self._lookup(cache_key, ttl, refresh_ahead)
+                    compute = lambda: func(*args, **kwargs)
+                    if hit:
+                        if stale_at is not None:
+                            self._refresh_in_background_async(cache_key, compute, ttl, entry_tags, stale_at)
+                        return value
+                    return await self._call_once_async(cache_key, compute, ttl, entry_tags)
                 
-                # 캐시 조회
-                cached = self.cache.get(cache_key)
-                if cached is not None:
-                    return cached
+                wrapped = async_wrapper
+            else:
+                @wraps(func)
+                def wrapper(*args, **kwargs):
+                    cache_key, entry_tags = key_and_tags(args, kwargs)
+                    hit, value, stale_at = self._lookup(cache_key, ttl, refresh_ahead)
+                    compute = lambda: func(*args, **kwargs)
+                    if hit:
+                        if stale_at is not None:
+                            self._refresh_in_background(cache_key, compute, ttl, entry_tags, stale_at)
+                        return value
+                    return self._call_once(cache_key, compute, ttl, entry_tags)
                 
-                # 함수 실행 및 캐싱
-                result = func(*args, **kwargs)
-                self.cache.set(cache_key, result, ttl)
-                return result
+                wrapped = wrapper
             
-            return wrapper
+            wrapped.cache_key = lambda *args, **kwargs: build_key(namespace, func, args, kwargs, signature)
+            wrapped.invalidate = lambda *args, **kwargs: self.invalidate(wrapped.cache_key(*args, **kwargs))
+            return wrapped
         return decorator
     
     def invalidate(self, key: str) -> bool:
-        """캐시 무효화"""
+        """캐시 무효화 (키는 build_key 또는 감싼 함수의 cache_key로 생성)"""
         return self.cache.delete(key)
+    
+    def invalidate_tag(self, tag: str) -> int:
+        """
+        태그가 붙은 항목 모두 무효화
+        
+        Returns:
+            삭제한 항목 수
+        """
+        return self.cache.invalidate_tag(tag)
+    
+    def invalidate_namespace(self, namespace: str) -> int:
+        """네임스페이스(cached의 key_prefix) 전체 무효화"""
+        return self.invalidate_tag(namespace_tag(namespace))
 
 
 # 전역 캐시 인스턴스
@@ -229,6 +866,9 @@ def main():
     # 두 번째 호출 (캐시 히트)
     result2 = expensive_gdd_generation("runner")
     
+    # 템플릿이 바뀌면 gdd 네임스페이스 전체 무효화
+    print(f"무효화: {cache.invalidate_namespace('gdd')}건")
+    
     print(f"통계: {cache.cache.stats()}")
 
 
@@ -0,0 +1,132 @@
+"""
+캐시 값 직렬화 코덱
+바이너리 값 앞에 버전 헤더를 붙여 저장하고 읽을 때 헤더로 코덱을 판별
+
+헤더: b"GC" + 포맷 버전(1바이트) + 코덱 ID(1바이트)
+
+- pickle: 기본값. datetime, bytes, 데이터클래스(GDD 등)까지 그대로 복원
+  (신뢰할 수 있는 저장소에만 사용 - 임의 pickle은 코드 실행 가능)
+- msgpack: 일반 데이터(dict/list/str/숫자/bytes/datetime)용, 더 작고 빠름
+  (msgpack 패키지 필요, 없으면 pickle 사용)
+
+헤더가 없는 값은 이전 RedisCache가 저장한 JSON으로 보고 읽는다.
+"""
+
+import json
+import pickle
+from datetime import datetime
+from typing import Any, Dict
+
+
+MAGIC = b"GC"
+FORMAT_VERSION = 1
+
+# 읽기 실패 표시 (None도 정상 값일 수 있으므로 별도 객체 사용)
+MISSING = object()
+
+_DATETIME_EXT = 1
+
+
+class PickleCodec:
+    """pickle 코덱 (프로토콜 5)"""
+
+    name = "pickle"
+    codec_id = 1
+
+    def dumps(self, value: Any) -> bytes:
+        return pickle.dumps(value, protocol=5)
+
+    def loads(self, data: bytes) -> Any:
+        return pickle.loads(data)
+
+
+class MsgpackCodec:
+    """msgpack 코덱 (datetime은 확장 타입으로 저장)"""
+
+    name = "msgpack"
+    codec_id = 2
+
+    def __init__(self):
+        import msgpack
+        self._msgpack = msgpack
+
+    def _default(self, value: Any) -> Any:
+        if isinstance(value, datetime):
+            return self._msgpack.ExtType(_DATETIME_EXT, value.isoformat().encode("utf-8"))
+        raise TypeError(f"msgpack으로 저장할 수 없는 타입: {type(value).__name__}")
+
+    def _ext_hook(self, code: int, data: bytes) -> Any:
+        if code == _DATETIME_EXT:
+            return datetime.fromisoformat(data.decode("utf-8"))
+        return self._msgpack.ExtType(code, data)
+
+    def dumps(self, value: Any) -> bytes:
+        return self._msgpack.packb(value, default=self._default, use_bin_type=True)
+
+    def loads(self, data: bytes) -> Any:
+        return self._msgpack.unpackb(data, ext_hook=self._ext_hook, raw=False, strict_map_key=False)
+
+
+_CODECS: Dict[int, Any] = {PickleCodec.codec_id: PickleCodec()}
+
+
+def get_codec(name: str = "pickle"):
+    """
+    이름으로 코덱 선택
+
+    Args:
+        name: pickle 또는 msgpack (msgpack이 없거나 모르는 이름이면 pickle)
+    """
+    if name == "msgpack":
+        try:
+            codec = MsgpackCodec()
+        except ImportError:
+            print("[경고] msgpack 패키지가 없어 pickle 코덱을 사용합니다: pip install msgpack")
+            return _CODECS[PickleCodec.codec_id]
+        _CODECS[codec.codec_id] = codec
+        return codec
+    if name != "pickle":
+        print(f"[경고] 지원하지 않는 코덱 '{name}' → pickle 사용")
+    return _CODECS[PickleCodec.codec_id]
+
+
+def encode(value: Any, codec=None) -> bytes:
+    """값 → 헤더 + 코덱 바이트"""
+    codec = codec or _CODECS[PickleCodec.codec_id]
+    return MAGIC + bytes((FORMAT_VERSION, codec.codec_id)) + codec.dumps(value)
+
+
+def decode(data: Any) -> Any:
+    """
+    헤더 + 코덱 바이트 → 값
+
+    Returns:
+        값 (포맷 버전이 다르거나 읽을 수 없으면 MISSING)
+    """
+    if data is None:
+        return MISSING
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    if not data.startswith(MAGIC):
+        # 헤더 도입 이전 JSON 값
+        try:
+            return json.loads(data)
+        except ValueError:
+            return MISSING
+
+    if len(data) < 4 or data[2] != FORMAT_VERSION:
+        return MISSING
+    codec = _CODECS.get(data[3])
+    if codec is None and data[3] == MsgpackCodec.codec_id:
+        codec = get_codec("msgpack")
+        if codec.codec_id != MsgpackCodec.codec_id:
+            return MISSING
+    if codec is None:
+        return MISSING
+
+    try:
+        return codec.loads(data[4:])
+    except Exception as e:
+        print(f"[경고] 캐시 값 디코딩 실패: {e}")
+        return MISSING
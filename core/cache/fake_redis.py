@@ -0,0 +1,727 @@
+"""
+로컬 Redis 대체 구현 (테스트/벤치마크용)
+실제 Redis 없이 RedisCache를 검증하기 위한 프로세스 내 저장소
+
+- FakeRedis: redis-py와 같은 메서드를 가진 프로세스 내 클라이언트 (네트워크 없음)
+- RespServer: 같은 저장소를 RESP2 프로토콜로 여는 TCP 서버
+  (redis-py 또는 RespClient로 접속, 실제 왕복 비용 포함)
+- RespClient: redis 패키지 없이 RespServer에 접속하는 최소 클라이언트
+
+지원 명령: PING, ECHO, GET, SET [EX], SETEX, MGET, DEL, EXISTS, EXPIRE,
+PERSIST, TTL, SADD, SREM, SMEMBERS, ZADD, ZRANGEBYSCORE, ZREMRANGEBYSCORE, ZCARD,
+DBSIZE, FLUSHDB, MULTI/EXEC/DISCARD
+(파이프라인과 트랜잭션 파이프라인 포함). 값은 redis-py(decode_responses=False)처럼
+bytes로 돌려준다.
+
+사용 예:
+    cache = RedisCache(client=FakeRedis())
+    with RespServer() as server:
+        cache = RedisCache(client=server.client())
+"""
+
+import time
+import socket
+import select
+import threading
+import socketserver
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class ResponseError(Exception):
+    """Redis 오류 응답 (redis-py의 ResponseError에 해당)"""
+
+
+class _Status(str):
+    """RESP 단순 문자열 응답 (+OK 등)"""
+
+
+OK = _Status("OK")
+_WRONGTYPE = "WRONGTYPE Operation against a key holding the wrong kind of value"
+
+
+def _to_bytes(value: Any) -> bytes:
+    """redis-py와 같은 인자 인코딩"""
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, (bytearray, memoryview)):
+        return bytes(value)
+    if isinstance(value, bool):
+        raise ResponseError("bool 값은 인자로 쓸 수 없습니다 (str 또는 int로 변환)")
+    if isinstance(value, (int, float)):
+        return repr(value).encode("ascii")
+    return str(value).encode("utf-8")
+
+
+def _to_score(value: bytes) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        raise ResponseError("ERR value is not a valid float")
+
+
+def _score_bound(value: bytes) -> Tuple[float, bool]:
+    """ZRANGEBYSCORE 범위 경계 → (값, 제외 여부) ("(1.5"는 1.5 제외)"""
+    if value.startswith(b"("):
+        return _to_score(value[1:]), True
+    return _to_score(value), False
+
+
+def _in_range(score: float, low: Tuple[float, bool], high: Tuple[float, bool]) -> bool:
+    above = score > low[0] if low[1] else score >= low[0]
+    below = score < high[0] if high[1] else score <= high[0]
+    return above and below
+
+
+def _to_int(value: bytes) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        raise ResponseError("ERR value is not an integer or out of range")
+
+
+class RedisStore:
+    """
+    문자열/집합 키 저장소 (스레드 안전, 만료는 조회 시 확인)
+
+    명령 실행은 execute(이름, 인자...)로, 트랜잭션은 execute_many로 한 번에 처리한다.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            clock: 만료 판정용 시계 (테스트에서 주입)
+        """
+        self._clock = clock
+        self._data: Dict[bytes, Any] = {}
+        self._expires: Dict[bytes, float] = {}
+        self._lock = threading.RLock()
+        self.commands_processed = 0
+
+    def execute(self, name: str, *args: Any) -> Any:
+        """명령 1건 실행 (오류는 ResponseError 객체로 반환)"""
+        with self._lock:
+            return self._dispatch(name, [_to_bytes(a) for a in args])
+
+    def execute_many(self, commands: List[Tuple[str, tuple]]) -> List[Any]:
+        """여러 명령을 다른 클라이언트 명령 없이 연속 실행 (MULTI/EXEC)"""
+        with self._lock:
+            return [self._dispatch(name, [_to_bytes(a) for a in args]) for name, args in commands]
+
+    def _dispatch(self, name: str, args: List[bytes]) -> Any:
+        handler = getattr(self, f"_cmd_{name.lower()}", None)
+        if handler is None:
+            return ResponseError(f"ERR unknown command '{name}'")
+        self.commands_processed += 1
+        try:
+            return handler(*args)
+        except TypeError:
+            return ResponseError(f"ERR wrong number of arguments for '{name.lower()}' command")
+        except ResponseError as e:
+            return e
+
+    def _alive(self, key: bytes) -> bool:
+        expires_at = self._expires.get(key)
+        if expires_at is not None and expires_at <= self._clock():
+            del self._expires[key]
+            self._data.pop(key, None)
+        return key in self._data
+
+    def _string(self, key: bytes) -> Optional[bytes]:
+        if not self._alive(key):
+            return None
+        value = self._data[key]
+        if not isinstance(value, bytes):
+            raise ResponseError(_WRONGTYPE)
+        return value
+
+    def _set(self, key: bytes) -> Optional[set]:
+        if not self._alive(key):
+            return None
+        value = self._data[key]
+        if not isinstance(value, set):
+            raise ResponseError(_WRONGTYPE)
+        return value
+
+    def _zset(self, key: bytes) -> Optional[Dict[bytes, float]]:
+        if not self._alive(key):
+            return None
+        value = self._data[key]
+        if not isinstance(value, dict):
+            raise ResponseError(_WRONGTYPE)
+        return value
+
+    def _put(self, key: bytes, value: bytes, seconds: Optional[int]) -> _Status:
+        if seconds is not None and seconds <= 0:
+            raise ResponseError("ERR invalid expire time in 'set' command")
+        self._data[key] = value
+        if seconds is None:
+            self._expires.pop(key, None)
+        else:
+            self._expires[key] = self._clock() + seconds
+        return OK
+
+    # 연결/서버
+    def _cmd_ping(self, message: bytes = None):
+        return _Status("PONG") if message is None else message
+
+    def _cmd_echo(self, message: bytes):
+        return message
+
+    def _cmd_select(self, db: bytes):
+        return OK
+
+    def _cmd_dbsize(self):
+        return sum(1 for key in list(self._data) if self._alive(key))
+
+    def _cmd_flushdb(self, *options: bytes):
+        self._data.clear()
+        self._expires.clear()
+        return OK
+
+    # 문자열
+    def _cmd_get(self, key: bytes):
+        return self._string(key)
+
+    def _cmd_mget(self, key: bytes, *keys: bytes):
+        result = []
+        for k in (key, *keys):
+            value = self._data.get(k) if self._alive(k) else None
+            result.append(value if isinstance(value, bytes) else None)
+        return result
+
+    def _cmd_set(self, key: bytes, value: bytes, *options: bytes):
+        seconds = None
+        opts = [o.upper() for o in options]
+        if opts:
+            if len(opts) != 2 or opts[0] != b"EX":
+                raise ResponseError("ERR syntax error")
+            seconds = _to_int(options[1])
+        return self._put(key, value, seconds)
+
+    def _cmd_setex(self, key: bytes, seconds: bytes, value: bytes):
+        return self._put(key, value, _to_int(seconds))
+
+    # 키 공통
+    def _cmd_del(self, key: bytes, *keys: bytes):
+        removed = 0
+        for k in (key, *keys):
+            if self._alive(k):
+                del self._data[k]
+                self._expires.pop(k, None)
+                removed += 1
+        return removed
+
+    def _cmd_exists(self, key: bytes, *keys: bytes):
+        return sum(1 for k in (key, *keys) if self._alive(k))
+
+    def _cmd_expire(self, key: bytes, seconds: bytes):
+        seconds = _to_int(seconds)
+        if not self._alive(key):
+            return 0
+        if seconds <= 0:
+            self._cmd_del(key)
+        else:
+            self._expires[key] = self._clock() + seconds
+        return 1
+
+    def _cmd_persist(self, key: bytes):
+        if not self._alive(key):
+            return 0
+        return 1 if self._expires.pop(key, None) is not None else 0
+
+    def _cmd_ttl(self, key: bytes):
+        if not self._alive(key):
+            return -2
+        expires_at = self._expires.get(key)
+        if expires_at is None:
+            return -1
+        return max(0, round(expires_at - self._clock()))
+
+    def _cmd_pttl(self, key: bytes):
+        if not self._alive(key):
+            return -2
+        expires_at = self._expires.get(key)
+        if expires_at is None:
+            return -1
+        return max(0, round((expires_at - self._clock()) * 1000))
+
+    # 집합
+    def _cmd_sadd(self, key: bytes, member: bytes, *members: bytes):
+        members_ = self._set(key)
+        if members_ is None:
+            members_ = self._data[key] = set()
+        before = len(members_)
+        members_.update((member, *members))
+        return len(members_) - before
+
+    def _cmd_srem(self, key: bytes, member: bytes, *members: bytes):
+        members_ = self._set(key)
+        if members_ is None:
+            return 0
+        before = len(members_)
+        members_.difference_update((member, *members))
+        if not members_:
+            self._cmd_del(key)
+        return before - len(members_)
+
+    def _cmd_smembers(self, key: bytes):
+        members = self._set(key)
+        return set(members) if members is not None else set()
+
+    # 정렬 집합
+    def _cmd_zadd(self, key: bytes, score: bytes, member: bytes, *pairs: bytes):
+        if len(pairs) % 2:
+            raise ResponseError("ERR syntax error")
+        items = [(score, member), *zip(pairs[::2], pairs[1::2])]
+        scores = [(_to_score(s), m) for s, m in items]
+        zset = self._zset(key)
+        if zset is None:
+            zset = self._data[key] = {}
+        added = sum(1 for _, m in scores if m not in zset)
+        zset.update((m, s) for s, m in scores)
+        return added
+
+    def _cmd_zrangebyscore(self, key: bytes, low: bytes, high: bytes):
+        zset = self._zset(key)
+        if zset is None:
+            return []
+        low_, high_ = _score_bound(low), _score_bound(high)
+        members = [(s, m) for m, s in zset.items() if _in_range(s, low_, high_)]
+        return [m for _, m in sorted(members)]
+
+    def _cmd_zremrangebyscore(self, key: bytes, low: bytes, high: bytes):
+        zset = self._zset(key)
+        if zset is None:
+            return 0
+        low_, high_ = _score_bound(low), _score_bound(high)
+        removed = [m for m, s in zset.items() if _in_range(s, low_, high_)]
+        for m in removed:
+            del zset[m]
+        if not zset:
+            self._cmd_del(key)
+        return len(removed)
+
+    def _cmd_zcard(self, key: bytes):
+        zset = self._zset(key)
+        return len(zset) if zset is not None else 0
+
+
+# redis-py 응답 변환과 맞춤
+def _is_ok(reply: Any) -> Any:
+    return reply == "OK" if isinstance(reply, str) else reply
+
+
+_CALLBACKS: Dict[str, Callable[[Any], Any]] = {
+    "SET": _is_ok,
+    "SETEX": _is_ok,
+    "FLUSHDB": _is_ok,
+    "EXPIRE": bool,
+    "PERSIST": bool,
+    "SMEMBERS": set,
+    "PING": lambda reply: reply == "PONG" if isinstance(reply, str) else reply,
+}
+
+
+def _convert(name: str, reply: Any) -> Any:
+    if isinstance(reply, ResponseError):
+        return reply
+    callback = _CALLBACKS.get(name.upper())
+    return callback(reply) if callback else reply
+
+
+class _Commands(ABC):
+    """redis-py 스타일 명령 메서드 (execute_command만 구현하면 됨)"""
+
+    @abstractmethod
+    def execute_command(self, name: str, *args: Any) -> Any:
+        """명령 실행 (하위 클래스 구현)"""
+        pass
+
+    def ping(self):
+        return self.execute_command("PING")
+
+    def get(self, key):
+        return self.execute_command("GET", key)
+
+    def mget(self, keys, *args):
+        if isinstance(keys, (str, bytes)):
+            keys = [keys]
+        return self.execute_command("MGET", *keys, *args)
+
+    def set(self, key, value, ex: Optional[int] = None):
+        if ex is None:
+            return self.execute_command("SET", key, value)
+        return self.execute_command("SET", key, value, "EX", ex)
+
+    def setex(self, key, time_, value):
+        return self.execute_command("SETEX", key, time_, value)
+
+    def delete(self, *keys):
+        return self.execute_command("DEL", *keys)
+
+    def exists(self, *keys):
+        return self.execute_command("EXISTS", *keys)
+
+    def expire(self, key, time_):
+        return self.execute_command("EXPIRE", key, time_)
+
+    def persist(self, key):
+        return self.execute_command("PERSIST", key)
+
+    def ttl(self, key):
+        return self.execute_command("TTL", key)
+
+    def pttl(self, key):
+        return self.execute_command("PTTL", key)
+
+    def sadd(self, key, *members):
+        return self.execute_command("SADD", key, *members)
+
+    def srem(self, key, *members):
+        return self.execute_command("SREM", key, *members)
+
+    def smembers(self, key):
+        return self.execute_command("SMEMBERS", key)
+
+    def zadd(self, name, mapping: Dict[Any, float]):
+        pairs = [part for member, score in mapping.items() for part in (score, member)]
+        return self.execute_command("ZADD", name, *pairs)
+
+    def zrangebyscore(self, name, min_, max_):
+        return self.execute_command("ZRANGEBYSCORE", name, min_, max_)
+
+    def zremrangebyscore(self, name, min_, max_):
+        return self.execute_command("ZREMRANGEBYSCORE", name, min_, max_)
+
+    def zcard(self, name):
+        return self.execute_command("ZCARD", name)
+
+    def dbsize(self):
+        return self.execute_command("DBSIZE")
+
+    def flushdb(self):
+        return self.execute_command("FLUSHDB")
+
+
+class Pipeline(_Commands):
+    """명령을 모았다가 execute()에서 한 번에 전송"""
+
+    def __init__(self, run: Callable[[List[Tuple[str, tuple]], bool], List[Any]], transaction: bool):
+        self._run = run
+        self.transaction = transaction
+        self._commands: List[Tuple[str, tuple]] = []
+
+    def execute_command(self, name: str, *args: Any) -> "Pipeline":
+        self._commands.append((name, args))
+        return self
+
+    def execute(self, raise_on_error: bool = True) -> List[Any]:
+        """
+        모은 명령 실행
+
+        Returns:
+            명령별 결과 목록 (raise_on_error면 첫 오류를 예외로)
+        """
+        commands, self._commands = self._commands, []
+        if not commands:
+            return []
+        replies = [_convert(name, reply) for (name, _), reply in zip(commands, self._run(commands, self.transaction))]
+        if raise_on_error:
+            for reply in replies:
+                if isinstance(reply, ResponseError):
+                    raise reply
+        return replies
+
+    def reset(self) -> None:
+        self._commands = []
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.reset()
+
+
+class FakeRedis(_Commands):
+    """
+    프로세스 내 Redis 클라이언트 (네트워크 왕복 없음)
+
+    같은 RedisStore를 여러 클라이언트가 공유하면 여러 노드가 한 Redis를 쓰는
+    상황을 흉내낼 수 있다.
+    """
+
+    def __init__(self, store: Optional[RedisStore] = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            store: 공유 저장소 (없으면 새로 생성)
+            clock: 새 저장소의 만료 판정용 시계
+        """
+        self.store = store if store is not None else RedisStore(clock)
+
+    def execute_command(self, name: str, *args: Any) -> Any:
+        reply = _convert(name, self.store.execute(name, *args))
+        if isinstance(reply, ResponseError):
+            raise reply
+        return reply
+
+    def pipeline(self, transaction: bool = True) -> Pipeline:
+        return Pipeline(self._run, transaction)
+
+    def _run(self, commands: List[Tuple[str, tuple]], transaction: bool) -> List[Any]:
+        if transaction:
+            return self.store.execute_many(commands)
+        return [self.store.execute(name, *args) for name, args in commands]
+
+
+# RESP2 인코딩/디코딩
+def pack_command(name: str, *args: Any) -> bytes:
+    """명령 → RESP 배열"""
+    parts = [_to_bytes(name), *(_to_bytes(a) for a in args)]
+    out = [b"*%d\r\n" % len(parts)]
+    for part in parts:
+        out.append(b"$%d\r\n%s\r\n" % (len(part), part))
+    return b"".join(out)
+
+
+def pack_reply(reply: Any) -> bytes:
+    """응답 값 → RESP"""
+    if reply is None:
+        return b"$-1\r\n"
+    if isinstance(reply, ResponseError):
+        return b"-%s\r\n" % str(reply).encode("utf-8")
+    if isinstance(reply, _Status):
+        return b"+%s\r\n" % reply.encode("utf-8")
+    if isinstance(reply, bool):
+        return b":%d\r\n" % int(reply)
+    if isinstance(reply, int):
+        return b":%d\r\n" % reply
+    if isinstance(reply, (list, tuple, set)):
+        return b"*%d\r\n" % len(reply) + b"".join(pack_reply(item) for item in reply)
+    data = _to_bytes(reply)
+    return b"$%d\r\n%s\r\n" % (len(data), data)
+
+
+def read_reply(stream) -> Any:
+    """
+    RESP 응답 1개 읽기
+
+    Returns:
+        값 (오류 응답은 ResponseError 객체, 연결이 끊기면 ConnectionError)
+    """
+    line = stream.readline()
+    if not line.endswith(b"\r\n"):
+        raise ConnectionError("연결이 끊겼습니다")
+    kind, body = line[:1], line[1:-2]
+    if kind == b"+":
+        return _Status(body.decode("utf-8"))
+    if kind == b"-":
+        return ResponseError(body.decode("utf-8"))
+    if kind == b":":
+        return int(body)
+    if kind == b"$":
+        length = int(body)
+        if length < 0:
+            return None
+        data = stream.read(length + 2)
+        if len(data) != length + 2:
+            raise ConnectionError("연결이 끊겼습니다")
+        return data[:-2]
+    if kind == b"*":
+        length = int(body)
+        if length < 0:
+            return None
+        return [read_reply(stream) for _ in range(length)]
+    raise ResponseError(f"ERR Protocol error: unexpected '{kind!r}'")
+
+
+class _RespHandler(socketserver.StreamRequestHandler):
+    """연결별 명령 처리 (MULTI 중에는 명령을 모았다가 EXEC에서 실행)"""
+
+    # 응답은 버퍼에 모았다가 더 읽을 명령이 없을 때 전송 (파이프라인 응답을 한 번에)
+    wbufsize = -1
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def handle(self):
+        store: RedisStore = self.server.store
+        queued: Optional[List[Tuple[str, tuple]]] = None
+        while True:
+            if not select.select([self.connection], [], [], 0)[0]:
+                self.wfile.flush()
+            try:
+                command = read_reply(self.rfile)
+            except (ConnectionError, OSError):
+                return
+            if isinstance(command, ResponseError) or not isinstance(command, list) or not command:
+                self._reply(ResponseError("ERR Protocol error: expected array of bulk strings"))
+                continue
+
+            name = command[0].decode("utf-8", "replace").upper()
+            args = tuple(command[1:])
+            if name == "QUIT":
+                self._reply(OK)
+                return
+            if name == "MULTI":
+                if queued is not None:
+                    self._reply(ResponseError("ERR MULTI calls can not be nested"))
+                else:
+                    queued = []
+                    self._reply(OK)
+            elif name == "EXEC":
+                if queued is None:
+                    self._reply(ResponseError("ERR EXEC without MULTI"))
+                else:
+                    commands, queued = queued, None
+                    self._reply(store.execute_many(commands))
+            elif name == "DISCARD":
+                if queued is None:
+                    self._reply(ResponseError("ERR DISCARD without MULTI"))
+                else:
+                    queued = None
+                    self._reply(OK)
+            elif name in ("CLIENT", "HELLO"):
+                # redis-py 접속 시 보내는 CLIENT SETINFO 등은 무시
+                self._reply(OK if name == "CLIENT" else ResponseError("ERR unknown command 'HELLO'"))
+            elif queued is not None:
+                queued.append((name, args))
+                self._reply(_Status("QUEUED"))
+            else:
+                self._reply(store.execute(name, *args))
+
+    def _reply(self, reply: Any) -> None:
+        self.wfile.write(pack_reply(reply))
+
+
+class _ThreadingServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class RespServer:
+    """RESP2 TCP 서버 (별도 스레드에서 실행)"""
+
+    def __init__(self, store: Optional[RedisStore] = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Args:
+            store: 제공할 저장소 (없으면 새로 생성)
+            host: 바인드 주소
+            port: 포트 (0이면 빈 포트 자동 선택)
+        """
+        self.store = store if store is not None else RedisStore()
+        self.host = host
+        self.port = port
+        self._server: Optional[_ThreadingServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "RespServer":
+        """서버 시작 (이미 실행 중이면 그대로)"""
+        if self._server is None:
+            self._server = _ThreadingServer((self.host, self.port), _RespHandler)
+            self._server.store = self.store
+            self.port = self._server.server_address[1]
+            self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """서버 종료"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def client(self) -> "RespClient":
+        """이 서버에 접속한 RespClient"""
+        return RespClient(self.host, self.port)
+
+    def __enter__(self) -> "RespServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+class RespClient(_Commands):
+    """
+    최소 RESP2 클라이언트 (스레드 안전, 연결 1개)
+
+    파이프라인은 모든 명령을 한 번에 보내고 응답을 순서대로 읽는다.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 6379, timeout: float = 5.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._stream = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._sock is None:
+            self._sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._stream = self._sock.makefile("rb")
+        return self._sock
+
+    def close(self) -> None:
+        with self._lock:
+            if self._sock is not None:
+                self._stream.close()
+                self._sock.close()
+                self._sock = None
+
+    def _roundtrip(self, payload: bytes, count: int) -> List[Any]:
+        with self._lock:
+            try:
+                self._connect().sendall(payload)
+                return [read_reply(self._stream) for _ in range(count)]
+            except (ConnectionError, OSError):
+                # 끊긴 연결은 버리고 다음 호출에서 다시 접속
+                if self._sock is not None:
+                    self._sock.close()
+                    self._sock = None
+                raise
+
+    def execute_command(self, name: str, *args: Any) -> Any:
+        reply = _convert(name, self._roundtrip(pack_command(name, *args), 1)[0])
+        if isinstance(reply, ResponseError):
+            raise reply
+        return reply
+
+    def pipeline(self, transaction: bool = True) -> Pipeline:
+        return Pipeline(self._run, transaction)
+
+    def _run(self, commands: List[Tuple[str, tuple]], transaction: bool) -> List[Any]:
+        payload = b"".join(pack_command(name, *args) for name, args in commands)
+        if not transaction:
+            return self._roundtrip(payload, len(commands))
+
+        replies = self._roundtrip(pack_command("MULTI") + payload + pack_command("EXEC"), len(commands) + 2)
+        result = replies[-1]
+        if isinstance(result, ResponseError):
+            return [result] * len(commands)
+        return result
+
+
+# 사용 예시
+def main():
+    from .cache_manager import RedisCache
+
+    cache = RedisCache(client=FakeRedis())
+    cache.set("gdd:runner", {"game_title": "러너"}, ttl=60, tags=["template:runner"])
+    print(f"프로세스 내: {cache.get('gdd:runner')}")
+
+    with RespServer() as server:
+        cache = RedisCache(client=server.client())
+        cache.set_many({"a": 1, "b": 2}, ttl=60)
+        print(f"RESP 서버(포트 {server.port}): {cache.get_many(['a', 'b', 'c'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""
+지연 로딩 인덱스
+디스크 인덱스(키 → 메타데이터)만 먼저 읽고 객체는 요청 시 파싱, 파싱한 객체는 LRU로 보관
+
+BalanceManager.configs, ABTestManager.tests 처럼 딕셔너리로 쓰던 저장소를
+그대로 대체한다 (in, [], get, 순회 지원). 전체 순회는 모든 객체를 읽으므로
+목록이 필요하면 select()로 인덱스 메타데이터만 조회한다.
+
+인덱스는 SQLite에 항목별 행으로 저장한다. 저장 1건은 해당 행만 쓰고,
+여러 프로세스가 동시에 저장해도 서로의 항목을 잃지 않는다.
+"""
+
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# seq: 저장할 때마다 증가하는 전역 순번 (refresh는 마지막으로 읽은 순번 이후만 읽음)
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    meta TEXT NOT NULL,
+    seq INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_seq ON entries (seq);
+"""
+
+
+class LazyIndex(Mapping):
+    """디스크 인덱스(SQLite, 항목별 행) + 파싱 객체 LRU"""
+
+    def __init__(
+        self,
+        index_path: str,
+        loader: Callable[[str], Optional[Any]],
+        describe: Callable[[Any], Dict[str, Any]],
+        capacity: int = 1024
+    ):
+        """
+        Args:
+            index_path: 인덱스 DB 경로 (여러 프로세스 공유, 저장은 항목 1행 갱신)
+            loader: 키 → 객체 (파일이 없으면 None)
+            describe: 객체 → 인덱스 메타데이터
+            capacity: 메모리에 보관할 객체 수
+        """
+        self.index_path = Path(index_path)
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self.capacity = capacity
+        self._loader = loader
+        self._describe = describe
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._objects: "OrderedDict[str, Any]" = OrderedDict()
+        self._seq = 0
+        self._data_version: Optional[int] = None
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            str(self.index_path), timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------ 인덱스 DB
+
+    def load(self) -> bool:
+        """
+        인덱스 전체 읽기 (시작 시 1회)
+
+        Returns:
+            항목이 있으면 True (비어 있으면 rebuild 필요)
+        """
+        with self._lock:
+            self._entries = {}
+            self._seq = 0
+            self._data_version = self._version()
+            self._read_since(0)
+            return bool(self._entries)
+
+    def refresh(self) -> bool:
+        """
+        다른 프로세스가 저장한 항목만 읽어 반영
+
+        Returns:
+            새로 반영한 항목이 있으면 True
+        """
+        with self._lock:
+            version = self._version()
+            if version == self._data_version:
+                return False
+            self._data_version = version
+            return self._read_since(self._seq) > 0
+
+    def _version(self) -> int:
+        # 다른 연결이 커밋하면 바뀌는 값 (자기 연결의 쓰기로는 바뀌지 않음)
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _read_since(self, seq: int) -> int:
+        rows = self._conn.execute(
+            "SELECT key, meta, seq FROM entries WHERE seq > ? ORDER BY seq", (seq,)
+        ).fetchall()
+        for key, meta, row_seq in rows:
+            self._entries[key] = json.loads(meta)
+            self._seq = max(self._seq, row_seq)
+        return len(rows)
+
+    def rebuild(self, keys: List[str]) -> None:
+        """키 목록의 객체를 모두 읽어 인덱스 재생성 (인덱스가 없을 때 한 번)"""
+        with self._lock:
+            items = []
+            for key in keys:
+                obj = self._loader(key)
+                if obj is not None:
+                    items.append((key, self._describe(obj)))
+                    self._remember(key, obj)
+            self._upsert(items)
+
+    def _upsert(self, items: List[tuple]) -> None:
+        """항목 저장 (트랜잭션 1회, 바뀐 행만 기록)"""
+        if not items:
+            return
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            seq = self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM entries").fetchone()[0]
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entries (key, meta, seq) VALUES (?, ?, ?)",
+                [
+                    (key, json.dumps(meta, ensure_ascii=False), seq + i)
+                    for i, (key, meta) in enumerate(items, start=1)
+                ]
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        # 자기 쓰기는 순번을 올리지 않음 (그 사이 다른 프로세스가 쓴 항목을 건너뛰지 않도록)
+        for key, meta in items:
+            self._entries[key] = meta
+        self.writes += len(items)
+
+    # ------------------------------------------------------------------ 조회/갱신
+
+    def meta(self, key: str) -> Optional[Dict[str, Any]]:
+        """인덱스 메타데이터 (객체를 읽지 않음)"""
+        return self._entries.get(key)
+
+    def select(self, **filters: Any) -> List[str]:
+        """메타데이터가 조건과 일치하는 키 (None 조건은 무시)"""
+        filters = {k: v for k, v in filters.items() if v is not None}
+        return [
+            key for key, entry in list(self._entries.items())
+            if all(entry.get(k) == v for k, v in filters.items())
+        ]
+
+    def put(self, key: str, obj: Any) -> None:
+        """객체 저장 후 인덱스의 해당 항목만 갱신"""
+        with self._lock:
+            self._upsert([(key, self._describe(obj))])
+            self._remember(key, obj)
+
+    def evict(self, key: str) -> None:
+        """메모리 객체만 제거 (다음 조회 시 다시 읽음)"""
+        with self._lock:
+            self._objects.pop(key, None)
+
+    def cached(self) -> List[Any]:
+        """메모리에 있는 객체"""
+        with self._lock:
+            return list(self._objects.values())
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "cached": len(self._objects),
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+        }
+
+    def _remember(self, key: str, obj: Any) -> None:
+        self._objects[key] = obj
+        self._objects.move_to_end(key)
+        while len(self._objects) > self.capacity:
+            self._objects.popitem(last=False)
+
+    # ------------------------------------------------------------------ Mapping
+
+    def __getitem__(self, key: str) -> Any:
+        with self._lock:
+            obj = self._objects.get(key)
+            if obj is not None:
+                self._objects.move_to_end(key)
+                self.hits += 1
+                return obj
+
+            self.misses += 1
+            obj = self._loader(key)
+            if obj is None:
+                raise KeyError(key)
+            self._remember(key, obj)
+            if key not in self._entries:
+                # 인덱스 갱신 전에 다른 프로세스가 만든 객체
+                self._upsert([(key, self._describe(obj))])
+            return obj
+
+    def __setitem__(self, key: str, obj: Any) -> None:
+        self.put(key, obj)
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._entries or key in self._objects:
+            return True
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,314 @@
+"""
+2단 캐시
+프로세스 내 L1(MemoryCache) + 공유 L2(로컬 디스크 SQLite 또는 Redis)
+
+- 조회: L1 → L2 순서, L2에서 찾은 값은 L1에 채움 (L2 항목의 남은 TTL을 넘지 않게)
+- 저장/삭제: 두 계층 모두 반영
+- L1 TTL은 l1_ttl로 제한해 다른 노드가 바꾼 L2 값이 늦게 보이는 시간을 줄임
+
+Redis가 없는 단일 노드 배포에서는 DiskCache를 L2로 쓴다.
+"""
+
+import time
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Iterable, Tuple
+
+from .codec import get_codec, encode, decode, MISSING
+from .cache_manager import MemoryCache
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache (expires_at);
+CREATE TABLE IF NOT EXISTS cache_tags (
+    tag TEXT NOT NULL,
+    key TEXT NOT NULL,
+    PRIMARY KEY (tag, key)
+);
+CREATE INDEX IF NOT EXISTS idx_cache_tags_key ON cache_tags (key);
+"""
+
+
+class DiskCache:
+    """로컬 디스크 캐시 (SQLite WAL, 여러 프로세스 공유 가능)"""
+
+    def __init__(
+        self,
+        path: str = "cache/cache.db",
+        default_ttl: int = 3600,
+        codec: str = "pickle",
+        purge_every: int = 1000
+    ):
+        """
+        Args:
+            path: DB 경로
+            default_ttl: 기본 TTL (초, 0 이하면 만료 없음)
+            codec: 값 코덱 (pickle 또는 msgpack)
+            purge_every: 저장 N건마다 만료 항목 정리
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.default_ttl = default_ttl
+        self.codec = get_codec(codec)
+        self.purge_every = purge_every
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _expires_at(self, ttl: Optional[int]) -> Optional[float]:
+        if ttl is None:
+            ttl = self.default_ttl
+        # 디스크 값은 프로세스를 넘어 유지되므로 벽시계 기준
+        return time.time() + ttl if ttl > 0 else None
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회"""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """여러 키 조회 (쿼리 1회, 없는 키는 결과에서 제외)"""
+        return {key: value for key, (value, _) in self.get_many_with_ttl(keys).items()}
+
+    def get_many_with_ttl(self, keys: List[str]) -> Dict[str, Tuple[Any, Optional[float]]]:
+        """
+        여러 키를 남은 TTL과 함께 조회 (없는 키는 결과에서 제외)
+
+        Returns:
+            키 → (값, 남은 TTL 초 또는 만료 없으면 None)
+        """
+        if not keys:
+            return {}
+        found = {}
+        now = time.time()
+        with self._lock:
+            # SQLite 변수 개수 제한 안에서 나눠 조회
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, value, expires_at FROM cache WHERE key IN ({','.join('?' * len(chunk))}) "
+                    "AND (expires_at IS NULL OR expires_at > ?)",
+                    [*chunk, now]
+                ).fetchall()
+                for key, data, expires_at in rows:
+                    value = decode(data)
+                    if value is not MISSING:
+                        found[key] = (value, expires_at - now if expires_at is not None else None)
+        return found
+
+    def set(self, key: str, value: Any, ttl: int = None, tags: Iterable[str] = ()) -> None:
+        """캐시 저장"""
+        self.set_many({key: value}, ttl, tags)
+
+    def set_many(self, items: Dict[str, Any], ttl: int = None, tags: Iterable[str] = ()) -> None:
+        """여러 키 저장 (트랜잭션 1회, 덮어쓴 키의 이전 태그는 제거)"""
+        if not items:
+            return
+        expires_at = self._expires_at(ttl)
+        rows = [(key, encode(value, self.codec), expires_at) for key, value in items.items()]
+        tag_rows = [(tag, key) for tag in tags for key in items]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)", rows
+                )
+                self._conn.executemany("DELETE FROM cache_tags WHERE key = ?", [(key,) for key in items])
+                self._conn.executemany("INSERT OR IGNORE INTO cache_tags (tag, key) VALUES (?, ?)", tag_rows)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._writes += len(rows)
+            due = self._writes >= self.purge_every
+        if due:
+            self.cleanup()
+
+    def delete(self, key: str) -> bool:
+        """캐시 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_tags WHERE key = ?", (key,))
+            return self._conn.execute("DELETE FROM cache WHERE key = ?", (key,)).rowcount > 0
+
+    def invalidate_tag(self, tag: str) -> int:
+        """
+        태그가 붙은 항목 모두 삭제 (태그 인덱스로 해당 항목만 조회)
+
+        Returns:
+            삭제한 항목 수
+        """
+        return len(self.invalidate_tag_keys(tag))
+
+    def invalidate_tag_keys(self, tag: str) -> List[str]:
+        """태그 무효화 후 삭제한 키 목록 반환"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                keys = [(row[0],) for row in self._conn.execute(
+                    "SELECT key FROM cache_tags WHERE tag = ?", (tag,)
+                )]
+                removed = [
+                    key for (key,) in keys
+                    if self._conn.execute("DELETE FROM cache WHERE key = ?", (key,)).rowcount
+                ]
+                self._conn.executemany("DELETE FROM cache_tags WHERE key = ?", keys)
+                self._conn.execute("COMMIT")
+                return removed
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def clear(self) -> None:
+        """전체 캐시 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+            self._conn.execute("DELETE FROM cache_tags")
+
+    def cleanup(self) -> int:
+        """만료된 항목 정리 (태그 인덱스 포함)"""
+        with self._lock:
+            self._writes = 0
+            removed = self._conn.execute(
+                "DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)
+            ).rowcount
+            if removed:
+                self._conn.execute("DELETE FROM cache_tags WHERE key NOT IN (SELECT key FROM cache)")
+            return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(value)), 0) FROM cache"
+            ).fetchone()
+        return {"entries": entries, "bytes": size}
+
+
+class TieredCache:
+    """L1 메모리 + L2 공유 캐시"""
+
+    def __init__(self, l1: Optional[MemoryCache] = None, l2=None, l1_ttl: int = 60):
+        """
+        Args:
+            l1: 프로세스 내 캐시 (기본 MemoryCache)
+            l2: 공유 캐시 (DiskCache 또는 RedisCache, 기본 DiskCache)
+            l1_ttl: L1 최대 TTL (초)
+        """
+        self.l1 = l1 if l1 is not None else MemoryCache()
+        self.l2 = l2 if l2 is not None else DiskCache()
+        self.l1_ttl = l1_ttl
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+
+    def _l1_ttl(self, ttl: Optional[int]) -> int:
+        if ttl is None or ttl <= 0:
+            return self.l1_ttl
+        return min(ttl, self.l1_ttl)
+
+    def _from_l2(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        L2에서 조회해 L1에 채움
+
+        L2 항목의 남은 수명을 알 수 있으면 L1 TTL을 그 안으로 줄여 L2에서
+        만료된 값이 L1에 최대 l1_ttl만큼 더 남지 않게 한다.
+        """
+        if not hasattr(self.l2, "get_many_with_ttl"):
+            found = self.l2.get_many(keys)
+            self.l1.set_many(found, self.l1_ttl)
+            return found
+
+        found = {}
+        for key, (value, remaining) in self.l2.get_many_with_ttl(keys).items():
+            found[key] = value
+            ttl = self.l1_ttl if remaining is None else min(self.l1_ttl, remaining)
+            # MemoryCache는 TTL 0 이하를 만료 없음으로 보므로 곧 만료될 값은 채우지 않음
+            if ttl > 0:
+                self.l1.set(key, value, ttl)
+        return found
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (L1 → L2)"""
+        value = self.l1.get(key)
+        if value is not None:
+            self.l1_hits += 1
+            return value
+
+        value = self._from_l2([key]).get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.l2_hits += 1
+        return value
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """여러 키 조회 (L1에 없는 키만 L2에 한 번에 요청)"""
+        found = self.l1.get_many(keys)
+        self.l1_hits += len(found)
+        missing = [key for key in keys if key not in found]
+        if missing:
+            from_l2 = self._from_l2(missing)
+            self.l2_hits += len(from_l2)
+            self.misses += len(missing) - len(from_l2)
+            found.update(from_l2)
+        return found
+
+    def set(self, key: str, value: Any, ttl: int = 3600, tags: Iterable[str] = ()) -> None:
+        """캐시 저장 (두 계층 모두)"""
+        self.l2.set(key, value, ttl, tags)
+        self.l1.set(key, value, self._l1_ttl(ttl), tags)
+
+    def set_many(self, items: Dict[str, Any], ttl: int = 3600, tags: Iterable[str] = ()) -> None:
+        """여러 키 저장 (L2는 한 번에)"""
+        tags = tuple(tags)
+        self.l2.set_many(items, ttl, tags)
+        self.l1.set_many(items, self._l1_ttl(ttl), tags)
+
+    def delete(self, key: str) -> bool:
+        """캐시 삭제 (두 계층 모두)"""
+        removed_l1 = self.l1.delete(key)
+        removed_l2 = self.l2.delete(key)
+        return removed_l1 or removed_l2
+
+    def invalidate_tag(self, tag: str) -> int:
+        """
+        태그 무효화 (두 계층 모두)
+
+        L2에서 L1으로 채운 사본은 태그 없이 들어가므로 L2에서 지운 키를
+        L1에서도 지운다. 다른 프로세스의 L1에 남은 사본은 l1_ttl 안에 만료된다.
+        """
+        keys = self.l2.invalidate_tag_keys(tag)
+        self.l1.invalidate_tag(tag)
+        for key in keys:
+            self.l1.delete(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        """L1 전체 삭제 (L2는 지원할 때만)"""
+        self.l1.clear()
+        if hasattr(self.l2, "clear"):
+            self.l2.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        l2_stats = self.l2.stats() if hasattr(self.l2, "stats") else {}
+        return {
+            "l1_hits": self.l1_hits,
+            "l2_hits": self.l2_hits,
+            "misses": self.misses,
+            "l1": self.l1.stats(),
+            "l2": l2_stats,
+        }
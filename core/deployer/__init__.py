@@ -2,5 +2,9 @@
 배포 모듈
 """
 from .store_uploader import GooglePlayUploader, AppStoreUploadManager, ReleaseInfo
+from .deploy_orchestrator import DeployOrchestrator, ReleaseManifest, StoreDeployResult
 
-__all__ = ["GooglePlayUploader", "AppStoreUploadManager", "ReleaseInfo"]
+__all__ = [
+    "GooglePlayUploader", "AppStoreUploadManager", "ReleaseInfo",
+    "DeployOrchestrator", "ReleaseManifest", "StoreDeployResult"
+]
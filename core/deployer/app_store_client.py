@@ -0,0 +1,264 @@
+"""
+App Store Connect API 클라이언트
+개인 키 1회 파싱, JWT 캐시, keep-alive 연결 풀, 페이지네이션
+"""
+
+import json
+import time
+import queue
+import select
+import threading
+import http.client
+from urllib.parse import urlsplit, urlencode
+from typing import Optional, Dict, Any, List, Callable, Iterator, Tuple
+from concurrent.futures import ThreadPoolExecutor
+
+
+# 서버가 처리했는지 모를 때도 다시 보내도 되는 메서드
+IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}
+
+
+class AppStoreConnectError(Exception):
+    """API 오류 응답 (status, errors)"""
+
+    def __init__(self, status: int, errors: Optional[List[Dict[str, Any]]] = None):
+        self.status = status
+        self.errors = errors or []
+        detail = "; ".join(e.get("detail") or e.get("title", "") for e in self.errors)
+        super().__init__(f"HTTP {status}: {detail}" if detail else f"HTTP {status}")
+
+
+class AppStoreConnectClient:
+    """재사용 가능한 App Store Connect API 클라이언트 (스레드 안전)"""
+
+    def __init__(
+        self,
+        issuer_id: str,
+        key_id: str,
+        private_key_path: str,
+        base_url: str = "https://api.appstoreconnect.apple.com/v1",
+        pool_size: int = 8,
+        token_lifetime: int = 20 * 60,
+        refresh_margin: int = 60,
+        timeout: float = 30.0
+    ):
+        """
+        Args:
+            issuer_id: Issuer ID
+            key_id: Key ID
+            private_key_path: .p8 파일 경로
+            base_url: API 기본 URL
+            pool_size: 유지할 최대 연결 수
+            token_lifetime: JWT 유효 시간 (초, 최대 20분)
+            refresh_margin: 만료 몇 초 전에 재발급할지
+            timeout: 요청 타임아웃 (초)
+        """
+        self.issuer_id = issuer_id
+        self.key_id = key_id
+        self.private_key_path = private_key_path
+        self.pool_size = pool_size
+        self.token_lifetime = min(token_lifetime, 20 * 60)
+        self.refresh_margin = refresh_margin
+        self.timeout = timeout
+
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme
+        self.host = parts.netloc
+        self.base_path = parts.path.rstrip("/")
+
+        self._signing_key = None
+        self._token: Optional[str] = None
+        self._token_expiry = 0
+        self._token_lock = threading.Lock()
+        self._pool: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue(maxsize=pool_size)
+
+    # ------------------------------------------------------------------ 인증
+
+    def _load_signing_key(self):
+        """개인 키 파싱 (최초 1회)"""
+        if self._signing_key is None:
+            from cryptography.hazmat.primitives.serialization import load_pem_private_key
+
+            with open(self.private_key_path, "rb") as f:
+                self._signing_key = load_pem_private_key(f.read(), password=None)
+        return self._signing_key
+
+    def token(self) -> str:
+        """
+        서명된 JWT (만료 refresh_margin초 전까지 캐시)
+
+        Raises:
+            ImportError: PyJWT/cryptography 미설치
+            OSError: 키 파일 읽기 실패
+        """
+        with self._token_lock:
+            now = int(time.time())
+            if self._token and now < self._token_expiry - self.refresh_margin:
+                return self._token
+
+            import jwt
+
+            expiry = now + self.token_lifetime
+            self._token = jwt.encode(
+                {"iss": self.issuer_id, "iat": now, "exp": expiry, "aud": "appstoreconnect-v1"},
+                self._load_signing_key(),
+                algorithm="ES256",
+                headers={"kid": self.key_id}
+            )
+            self._token_expiry = expiry
+            return self._token
+
+    @property
+    def token_expiry(self) -> int:
+        return self._token_expiry
+
+    # ------------------------------------------------------------------ 연결 풀
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        if self.scheme == "http":
+            return http.client.HTTPConnection(self.host, timeout=self.timeout)
+        return http.client.HTTPSConnection(self.host, timeout=self.timeout)
+
+    def _acquire(self) -> http.client.HTTPConnection:
+        """풀의 연결 (서버가 이미 닫은 연결은 버리고 새로 생성)"""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                return self._new_connection()
+            if conn.sock is not None and not select.select([conn.sock], [], [], 0)[0]:
+                return conn
+            # 유휴 연결이 읽기 가능 = 서버 쪽 종료 (EOF)
+            conn.close()
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close(self) -> None:
+        """풀의 모든 연결 종료"""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+    # ------------------------------------------------------------------ 요청
+
+    def _path(self, path: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """상대 경로/절대 URL → 요청 경로"""
+        if path.startswith(("http://", "https://")):
+            parts = urlsplit(path)
+            full = parts.path + (f"?{parts.query}" if parts.query else "")
+        else:
+            full = self.base_path + path
+        if params:
+            full += ("&" if "?" in full else "?") + urlencode(params)
+        return full
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Dict[str, Any]]:
+        """
+        API 요청
+
+        Args:
+            method: HTTP 메서드
+            path: base_url 기준 경로 (예: /apps) 또는 links.next 절대 URL
+            body: JSON 본문
+            params: 쿼리 파라미터
+
+        Returns:
+            (HTTP 상태, JSON 응답)
+
+        Raises:
+            AppStoreConnectError: 4xx/5xx 응답
+        """
+        data = json.dumps(body).encode("utf-8") if body is not None else None
+        headers = {
+            "Authorization": f"Bearer {self.token()}",
+            "Content-Type": "application/json",
+            "Connection": "keep-alive"
+        }
+        target = self._path(path, params)
+
+        # 풀에 있던 연결이 서버 쪽에서 끊겼으면 새 연결로 1회 재시도
+        # (요청을 다 보낸 뒤 끊긴 경우 서버가 처리했을 수 있어 멱등 메서드만)
+        for attempt in range(2):
+            conn = self._acquire()
+            sent = False
+            try:
+                conn.request(method, target, body=data, headers=headers)
+                sent = True
+                response = conn.getresponse()
+                raw = response.read()
+            except (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                    ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if attempt == 1 or (sent and method.upper() not in IDEMPOTENT_METHODS):
+                    raise
+                continue
+            except Exception:
+                conn.close()
+                raise
+
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+            break
+
+        payload = json.loads(raw.decode("utf-8")) if raw else {}
+        if response.status >= 400:
+            raise AppStoreConnectError(response.status, payload.get("errors"))
+        return response.status, payload
+
+    def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return self.request("GET", path, params=params)[1]
+
+    def post(self, path: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        return self.request("POST", path, body)[1]
+
+    def patch(self, path: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        return self.request("PATCH", path, body)[1]
+
+    def paginate(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        limit: int = 200
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        목록 API의 모든 항목 (links.next 따라가기)
+
+        Args:
+            path: 목록 경로
+            params: 쿼리 파라미터
+            limit: 페이지 크기 (API 최대 200)
+        """
+        page = self.get(path, {**(params or {}), "limit": limit})
+        while True:
+            yield from page.get("data", [])
+            next_url = page.get("links", {}).get("next")
+            if not next_url:
+                return
+            page = self.get(next_url)
+
+    def map_concurrent(
+        self,
+        fn: Callable[[Any], Any],
+        items: List[Any],
+        max_workers: Optional[int] = None
+    ) -> List[Any]:
+        """항목별 요청을 풀 크기만큼 동시에 실행 (입력 순서대로 결과 반환)"""
+        if not items:
+            return []
+        workers = max(1, min(max_workers or self.pool_size, len(items)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fn, items))
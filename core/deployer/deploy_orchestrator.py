@@ -0,0 +1,310 @@
+"""
+멀티 스토어 배포 오케스트레이터
+릴리스 매니페스트 1개로 설정된 모든 스토어에 동시 배포
+"""
+
+import json
+import time
+import threading
+from functools import partial
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Callable
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+
+# 스토어별 필수 아티팩트 옵션
+REQUIRED_OPTIONS = {
+    "google_play": ["package_name"],
+    "app_store": [],
+    "steam": ["path", "app_id", "depot_id"],
+}
+
+
+@dataclass
+class ReleaseManifest:
+    """릴리스 매니페스트"""
+    game_id: str
+    version: str
+    # {스토어: {"path": 아티팩트 경로, ...스토어별 옵션}}
+    #   google_play: package_name, track
+    #   app_store: bundle_id, app_id, submit_for_review
+    #   steam: app_id, depot_id, branch
+    artifacts: Dict[str, Dict[str, Any]]
+    release_notes: Dict[str, str] = field(default_factory=dict)  # {locale: notes}
+    listings: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    build_number: str = ""
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ReleaseManifest":
+        """딕셔너리에서 생성 (알 수 없는 키 무시)"""
+        known = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+        return cls(**known)
+
+    @classmethod
+    def load(cls, path: str) -> "ReleaseManifest":
+        """JSON 파일에서 로드"""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+@dataclass
+class StoreDeployResult:
+    """스토어별 배포 결과"""
+    store: str
+    success: bool = False
+    attempts: int = 0
+    duration: float = 0.0
+    details: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    # 완료된 단계 {단계: 결과} (재시도 시 건너뜀)
+    completed_steps: Dict[str, Any] = field(default_factory=dict)
+
+
+# 스토어 백엔드: (매니페스트, 아티팩트 설정) → {"success", "error", ...}
+# 아티팩트 설정의 "completed_steps"는 시도 간 공유되는 딕셔너리로, 멱등이 아닌
+# 단계는 끝나는 즉시 기록하고 재시도 때 기록된 단계를 건너뛴다.
+StoreBackend = Callable[[ReleaseManifest, Dict[str, Any]], Dict[str, Any]]
+
+
+class DeployOrchestrator:
+    """멀티 스토어 동시 배포"""
+
+    def __init__(self, config: dict):
+        """
+        Args:
+            config: 배포 설정
+                - google_play / app_store / steam: 스토어별 업로더 설정
+                - max_retries: 스토어별 재시도 횟수 (기본 2)
+                - retry_delay: 첫 재시도 대기 시간 (초, 이후 2배씩 증가)
+                - simulate: True면 모든 스토어를 시뮬레이션 백엔드로 실행
+                - simulate_delay: 시뮬레이션 업로드 시간 {스토어: 초}
+        """
+        self.config = config
+        self.max_retries = config.get("max_retries", 2)
+        self.retry_delay = config.get("retry_delay", 5.0)
+        self.simulate = config.get("simulate", False)
+        self.simulate_delay = config.get("simulate_delay", {})
+
+        self._uploaders: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self.backends: Dict[str, StoreBackend] = {
+            "google_play": self._deploy_google_play,
+            "app_store": self._deploy_app_store,
+            "steam": self._deploy_steam,
+        }
+
+    def register_backend(self, store: str, backend: StoreBackend) -> None:
+        """스토어 백엔드 등록/교체"""
+        self.backends[store] = backend
+
+    def deploy(
+        self,
+        manifest: ReleaseManifest,
+        stores: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        매니페스트의 스토어에 동시 배포
+
+        스토어마다 별도 스레드에서 재시도까지 독립적으로 처리하므로
+        전체 소요 시간은 가장 느린 스토어 기준이다. 재시도는 이전 시도에서
+        완료된 단계(completed_steps)부터 이어서 진행한다.
+
+        Args:
+            manifest: 릴리스 매니페스트
+            stores: 배포할 스토어 (기본: 매니페스트의 모든 스토어)
+
+        Returns:
+            {"game_id", "version", "success", "duration", "stores": {스토어: 결과}}
+        """
+        targets = stores or list(manifest.artifacts.keys())
+        started = time.monotonic()
+        result = {
+            "game_id": manifest.game_id,
+            "version": manifest.version,
+            "timestamp": datetime.now().isoformat(),
+            "success": False,
+            "duration": 0.0,
+            "stores": {}
+        }
+
+        if not targets:
+            result["error"] = "배포할 스토어가 없습니다"
+            return result
+
+        with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+            futures = {
+                store: executor.submit(self._deploy_store, manifest, store)
+                for store in targets
+            }
+            for store, future in futures.items():
+                result["stores"][store] = asdict(future.result())
+
+        result["success"] = all(r["success"] for r in result["stores"].values())
+        result["duration"] = round(time.monotonic() - started, 3)
+        return result
+
+    def _deploy_store(self, manifest: ReleaseManifest, store: str) -> StoreDeployResult:
+        """스토어 1곳 배포 (재시도 포함)"""
+        outcome = StoreDeployResult(store=store)
+        started = time.monotonic()
+
+        artifact = manifest.artifacts.get(store)
+        backend = partial(self._simulate_store, store) if self.simulate else self.backends.get(store)
+
+        if artifact is None:
+            outcome.error = "매니페스트에 아티팩트가 없습니다"
+        elif backend is None:
+            outcome.error = f"지원하지 않는 스토어: {store}"
+        elif not self.simulate and self._missing_options(store, artifact):
+            # 재시도해도 해결되지 않는 오류
+            outcome.error = f"필수 옵션 누락: {', '.join(self._missing_options(store, artifact))}"
+        elif not self.simulate and artifact.get("path") and not Path(artifact["path"]).exists():
+            outcome.error = f"아티팩트 파일 없음: {artifact['path']}"
+        else:
+            for attempt in range(self.max_retries + 1):
+                outcome.attempts = attempt + 1
+                try:
+                    details = backend(manifest, {**artifact, "completed_steps": outcome.completed_steps}) or {}
+                except Exception as e:
+                    details = {"success": False, "error": str(e)}
+
+                outcome.details = details
+                outcome.success = bool(details.get("success"))
+                outcome.error = None if outcome.success else details.get("error", "배포 실패")
+                if outcome.success:
+                    break
+
+                if attempt < self.max_retries:
+                    delay = self.retry_delay * (2 ** attempt)
+                    print(f"[{store}] 배포 실패 ({outcome.error}), {delay:.1f}초 후 재시도")
+                    time.sleep(delay)
+
+        outcome.duration = round(time.monotonic() - started, 3)
+        return outcome
+
+    def _missing_options(self, store: str, artifact: Dict[str, Any]) -> List[str]:
+        return [key for key in REQUIRED_OPTIONS.get(store, []) if not artifact.get(key)]
+
+    def _uploader(self, store: str):
+        """스토어 업로더 (최초 사용 시 생성, 재시도 간 재사용)"""
+        with self._lock:
+            if store not in self._uploaders:
+                store_config = self.config.get(store, {})
+                if store == "google_play":
+                    from .store_uploader import GooglePlayUploader
+                    self._uploaders[store] = GooglePlayUploader(store_config)
+                elif store == "app_store":
+                    from .ios_uploader import AppStoreConnectUploader
+                    self._uploaders[store] = AppStoreConnectUploader(store_config)
+                elif store == "steam":
+                    from .steam_uploader import SteamUploader
+                    self._uploaders[store] = SteamUploader(store_config)
+            return self._uploaders[store]
+
+    def _deploy_google_play(self, manifest: ReleaseManifest, artifact: Dict[str, Any]) -> Dict[str, Any]:
+        """Google Play 배포 (편집 1회)"""
+        release = self._uploader("google_play").publish_release(
+            artifact["package_name"],
+            artifact.get("path"),
+            artifact.get("track", "internal"),
+            release_notes=manifest.release_notes,
+            listings=manifest.listings
+        )
+        return {
+            "success": release["success"],
+            "version_code": release["version_code"],
+            "track": release["track"],
+            "error": release["error"]
+        }
+
+    def _deploy_app_store(self, manifest: ReleaseManifest, artifact: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        App Store 배포 (IPA 업로드 → 버전 생성 → 심사 제출)
+
+        세 단계 모두 멱등이 아니라 (같은 빌드 재업로드, 중복 버전 생성 거부,
+        중복 심사 제출) 성공한 단계는 completed_steps에 기록하고 재시도 때
+        건너뛴다.
+        """
+        uploader = self._uploader("app_store")
+        steps = artifact.get("completed_steps", {})
+        result = {"success": False, "version_id": None, "submitted": False, "error": None}
+
+        if artifact.get("path") and "upload_ipa" not in steps:
+            build_id = uploader.upload_ipa(artifact["path"], artifact.get("bundle_id", ""))
+            if build_id is None:
+                result["error"] = "IPA 업로드 실패"
+                return result
+            steps["upload_ipa"] = build_id
+
+        if artifact.get("app_id"):
+            if "create_version" not in steps:
+                version_id = uploader.create_version(artifact["app_id"], manifest.version, manifest.release_notes)
+                if version_id is None:
+                    result["error"] = "버전 생성 실패"
+                    return result
+                steps["create_version"] = version_id
+            result["version_id"] = steps["create_version"]
+
+            if artifact.get("submit_for_review"):
+                if "submit_for_review" not in steps:
+                    if not uploader.submit_for_review(result["version_id"]):
+                        result["error"] = "심사 제출 실패"
+                        return result
+                    steps["submit_for_review"] = True
+                result["submitted"] = True
+
+        result["success"] = True
+        return result
+
+    def _deploy_steam(self, manifest: ReleaseManifest, artifact: Dict[str, Any]) -> Dict[str, Any]:
+        """Steam 배포 (steamcmd 빌드 업로드)"""
+        from .steam_uploader import SteamBuildConfig
+
+        build_config = SteamBuildConfig(
+            app_id=artifact["app_id"],
+            depot_id=artifact["depot_id"],
+            build_description=f"{manifest.game_id} v{manifest.version}",
+            content_root=artifact["path"],
+            set_live=artifact.get("branch")
+        )
+        upload = self._uploader("steam").upload_build(build_config)
+        return {
+            "success": upload["success"],
+            "message": upload["message"],
+            "error": None if upload["success"] else upload["message"]
+        }
+
+    def _simulate_store(self, store: str, manifest: ReleaseManifest, artifact: Dict[str, Any]) -> Dict[str, Any]:
+        """시뮬레이션 배포 (스토어별 지연만 재현)"""
+        delay = self.simulate_delay.get(store, 0.0)
+        print(f"[시뮬레이션] {store} 배포: {manifest.game_id} v{manifest.version}")
+        time.sleep(delay)
+        return {"success": True, "simulated": True}
+
+
+# 사용 예시
+def main():
+    manifest = ReleaseManifest(
+        game_id="game_001",
+        version="1.0.0",
+        artifacts={
+            "google_play": {"path": "builds/game.aab", "package_name": "com.example.game", "track": "internal"},
+            "app_store": {"path": "builds/game.ipa", "bundle_id": "com.example.game", "app_id": "1234567890"},
+            "steam": {"path": "builds/steam", "app_id": "1234567", "depot_id": "1234568", "branch": "beta"}
+        },
+        release_notes={"ko-KR": "첫 번째 릴리스", "en-US": "First release"}
+    )
+
+    orchestrator = DeployOrchestrator({
+        "simulate": True,
+        "simulate_delay": {"google_play": 1.0, "app_store": 2.0, "steam": 1.5}
+    })
+    result = orchestrator.deploy(manifest)
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
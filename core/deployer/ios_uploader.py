@@ -3,14 +3,22 @@ iOS App Store Connect 업로더
 App Store Connect API 연동
 """
 
-import json
-import jwt
-import time
+import hashlib
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 
+from .app_store_client import AppStoreConnectClient
+from .resumable_upload import UploadSessionStore, ProgressCallback, run_upload_operations
+
+
+# 업로드 가능한 에셋 종류 → 소속 세트 관계
+ASSET_SET_RELATIONSHIPS = {
+    "appScreenshots": ("appScreenshotSet", "appScreenshotSets"),
+    "appPreviews": ("appPreviewSet", "appPreviewSets"),
+}
+
 
 @dataclass
 class AppStoreRelease:
@@ -32,46 +40,33 @@ class AppStoreConnectUploader:
                 - issuer_id: Issuer ID
                 - key_id: Key ID
                 - private_key_path: .p8 파일 경로
+                - pool_size: API 연결 풀 크기 (로컬라이제이션 동시 패치 수)
+                - max_retries: 업로드 파트별 재시도 횟수
+                - upload_state_path: 업로드 재개 토큰 파일
         """
         self.config = config
         self.issuer_id = config.get("issuer_id", "")
         self.key_id = config.get("key_id", "")
         self.private_key_path = config.get("private_key_path", "")
-        self.base_url = "https://api.appstoreconnect.apple.com/v1"
-        self._token = None
-        self._token_expiry = 0
+        self.base_url = config.get("base_url", "https://api.appstoreconnect.apple.com/v1")
+        self.max_retries = config.get("max_retries", 3)
+        self.sessions = UploadSessionStore(config.get("upload_state_path", "deploy/upload_sessions.json"))
+        self.client = AppStoreConnectClient(
+            self.issuer_id,
+            self.key_id,
+            self.private_key_path,
+            base_url=self.base_url,
+            pool_size=config.get("pool_size", 8)
+        )
     
     def _generate_token(self) -> Optional[str]:
-        """JWT 토큰 생성"""
+        """JWT 토큰 (클라이언트 캐시 사용, 키 파일은 최초 1회만 읽음)"""
         if not self.private_key_path or not Path(self.private_key_path).exists():
             print("경고: Private key 파일이 없습니다")
             return None
         
         try:
-            with open(self.private_key_path, "r") as f:
-                private_key = f.read()
-            
-            now = int(time.time())
-            expiry = now + 20 * 60  # 20분 유효
-            
-            payload = {
-                "iss": self.issuer_id,
-                "iat": now,
-                "exp": expiry,
-                "aud": "appstoreconnect-v1"
-            }
-            
-            token = jwt.encode(
-                payload,
-                private_key,
-                algorithm="ES256",
-                headers={"kid": self.key_id}
-            )
-            
-            self._token = token
-            self._token_expiry = expiry
-            return token
-            
+            return self.client.token()
         except ImportError:
             print("경고: PyJWT가 설치되지 않았습니다")
             print("pip install PyJWT cryptography")
@@ -82,12 +77,8 @@ class AppStoreConnectUploader:
     
     def _get_headers(self) -> Dict[str, str]:
         """API 요청 헤더"""
-        now = int(time.time())
-        if not self._token or now >= self._token_expiry - 60:
-            self._generate_token()
-        
         return {
-            "Authorization": f"Bearer {self._token}",
+            "Authorization": f"Bearer {self._generate_token()}",
             "Content-Type": "application/json"
         }
     
@@ -100,6 +91,7 @@ class AppStoreConnectUploader:
         IPA 업로드 (altool 또는 Transporter 사용)
         
         Note: API로 직접 업로드는 불가, altool CLI 필요
+            (분할 전송/재시도는 altool이 자체 처리)
         """
         if not Path(ipa_path).exists():
             print(f"IPA 파일 없음: {ipa_path}")
@@ -140,13 +132,9 @@ class AppStoreConnectUploader:
         release_notes: Dict[str, str]
     ) -> Optional[str]:
         """새 앱 버전 생성"""
-        if not self._token and not self._generate_token():
+        if not self._generate_token():
             return self._simulate_version_create()
         
-        import urllib.request
-        
-        url = f"{self.base_url}/appStoreVersions"
-        
         body = {
             "data": {
                 "type": "appStoreVersions",
@@ -166,62 +154,65 @@ class AppStoreConnectUploader:
         }
         
         try:
-            data = json.dumps(body).encode("utf-8")
-            req = urllib.request.Request(
-                url,
-                data=data,
-                headers=self._get_headers(),
-                method="POST"
-            )
+            result = self.client.post("/appStoreVersions", body)
+            version_id = result["data"]["id"]
+            
+            # 릴리스 노트 업데이트 (로케일 동시 패치)
+            if release_notes:
+                self._update_localizations(version_id, release_notes)
+            
+            return version_id
             
-            with urllib.request.urlopen(req) as response:
-                result = json.loads(response.read().decode("utf-8"))
-                version_id = result["data"]["id"]
-                
-                # 릴리스 노트 업데이트
-                for locale, notes in release_notes.items():
-                    self._update_localization(version_id, locale, notes)
-                
-                return version_id
-                
         except Exception as e:
             print(f"버전 생성 오류: {e}")
             return None
     
-    def _update_localization(
+    def _update_localizations(
         self,
         version_id: str,
-        locale: str,
-        what_is_new: str
-    ) -> bool:
-        """릴리스 노트 업데이트"""
-        import urllib.request
+        release_notes: Dict[str, str]
+    ) -> Dict[str, bool]:
+        """
+        릴리스 노트 업데이트 (모든 로케일)
         
-        # 먼저 localization ID 조회 필요
-        url = f"{self.base_url}/appStoreVersions/{version_id}/appStoreVersionLocalizations"
+        로컬라이제이션 목록을 한 번 조회한 뒤 로케일별 패치를 동시에 보낸다.
         
+        Returns:
+            {locale: 성공 여부}
+        """
         try:
-            req = urllib.request.Request(url, headers=self._get_headers())
-            with urllib.request.urlopen(req) as response:
-                result = json.loads(response.read().decode("utf-8"))
-                
-                for loc in result.get("data", []):
-                    if loc["attributes"]["locale"] == locale:
-                        loc_id = loc["id"]
-                        return self._patch_localization(loc_id, what_is_new)
-            
-            return False
-            
+            loc_ids = {
+                loc["attributes"]["locale"]: loc["id"]
+                for loc in self.client.paginate(
+                    f"/appStoreVersions/{version_id}/appStoreVersionLocalizations",
+                    {"fields[appStoreVersionLocalizations]": "locale"}
+                )
+            }
         except Exception as e:
             print(f"Localization 오류: {e}")
-            return False
+            return {locale: False for locale in release_notes}
+        
+        items = [(locale, notes) for locale, notes in release_notes.items() if locale in loc_ids]
+        outcomes = self.client.map_concurrent(
+            lambda item: self._patch_localization(loc_ids[item[0]], item[1]),
+            items
+        )
+        
+        result = {locale: False for locale in release_notes}
+        result.update({locale: ok for (locale, _), ok in zip(items, outcomes)})
+        return result
+    
+    def _update_localization(
+        self,
+        version_id: str,
+        locale: str,
+        what_is_new: str
+    ) -> bool:
+        """릴리스 노트 업데이트 (단일 로케일)"""
+        return self._update_localizations(version_id, {locale: what_is_new})[locale]
     
     def _patch_localization(self, loc_id: str, what_is_new: str) -> bool:
         """Localization 패치"""
-        import urllib.request
-        
-        url = f"{self.base_url}/appStoreVersionLocalizations/{loc_id}"
-        
         body = {
             "data": {
                 "type": "appStoreVersionLocalizations",
@@ -233,30 +224,17 @@ class AppStoreConnectUploader:
         }
         
         try:
-            data = json.dumps(body).encode("utf-8")
-            req = urllib.request.Request(
-                url,
-                data=data,
-                headers=self._get_headers(),
-                method="PATCH"
-            )
-            
-            with urllib.request.urlopen(req) as response:
-                return response.status == 200
-                
+            status, _ = self.client.request("PATCH", f"/appStoreVersionLocalizations/{loc_id}", body)
+            return status == 200
         except Exception as e:
             print(f"패치 오류: {e}")
             return False
     
     def submit_for_review(self, version_id: str) -> bool:
         """심사 제출"""
-        if not self._token and not self._generate_token():
+        if not self._generate_token():
             return self._simulate_submit()
         
-        import urllib.request
-        
-        url = f"{self.base_url}/appStoreVersionSubmissions"
-        
         body = {
             "data": {
                 "type": "appStoreVersionSubmissions",
@@ -272,21 +250,111 @@ class AppStoreConnectUploader:
         }
         
         try:
-            data = json.dumps(body).encode("utf-8")
-            req = urllib.request.Request(
-                url,
-                data=data,
-                headers=self._get_headers(),
-                method="POST"
-            )
-            
-            with urllib.request.urlopen(req) as response:
-                return response.status == 201
-                
+            status, _ = self.client.request("POST", "/appStoreVersionSubmissions", body)
+            return status == 201
         except Exception as e:
             print(f"심사 제출 오류: {e}")
             return False
     
+    def upload_asset(
+        self,
+        asset_type: str,
+        set_id: str,
+        file_path: str,
+        progress: Optional[ProgressCallback] = None
+    ) -> Optional[str]:
+        """
+        스크린샷/앱 프리뷰 분할 업로드 (예약 → 파트 전송 → 커밋)
+        
+        예약 응답의 uploadOperations대로 파트를 나눠 보내고, 완료한 파트를
+        재개 토큰에 기록한다. 중단 후 같은 파일로 다시 호출하면 같은 예약에서
+        남은 파트만 전송한다.
+        
+        Args:
+            asset_type: appScreenshots 또는 appPreviews
+            set_id: 스크린샷/프리뷰 세트 ID
+            file_path: 업로드할 파일
+            progress: 진행률 콜백 (전송 바이트, 전체 바이트)
+        
+        Returns:
+            에셋 ID 또는 None
+        """
+        if asset_type not in ASSET_SET_RELATIONSHIPS:
+            print(f"지원하지 않는 에셋 종류: {asset_type}")
+            return None
+        
+        path = Path(file_path)
+        if not path.exists():
+            print(f"파일 없음: {file_path}")
+            return None
+        
+        if not self._generate_token():
+            return self._simulate_upload(file_path)
+        
+        key = self.sessions.key("app_store", asset_type, set_id, file_path=file_path)
+        token = self.sessions.get(key)
+        
+        try:
+            # 1. 예약 (재개 토큰이 있으면 기존 예약 사용)
+            if token:
+                asset_id = token["asset_id"]
+                operations = token["operations"]
+                print(f"중단된 업로드 재개: {asset_id} ({len(token.get('done', []))}/{len(operations)} 파트)")
+            else:
+                relationship, set_type = ASSET_SET_RELATIONSHIPS[asset_type]
+                reserved = self._request_json("POST", f"/{asset_type}", {
+                    "data": {
+                        "type": asset_type,
+                        "attributes": {
+                            "fileName": path.name,
+                            "fileSize": path.stat().st_size
+                        },
+                        "relationships": {
+                            relationship: {"data": {"type": set_type, "id": set_id}}
+                        }
+                    }
+                })
+                asset_id = reserved["data"]["id"]
+                operations = reserved["data"]["attributes"]["uploadOperations"]
+                self.sessions.save(key, {"asset_id": asset_id, "operations": operations, "done": []})
+            
+            # 2. 파트 전송
+            run_upload_operations(
+                operations, file_path, self.sessions, key,
+                {"asset_id": asset_id},
+                progress=progress,
+                max_retries=self.max_retries
+            )
+            
+            # 3. 커밋 (체크섬 검증)
+            self._request_json("PATCH", f"/{asset_type}/{asset_id}", {
+                "data": {
+                    "type": asset_type,
+                    "id": asset_id,
+                    "attributes": {
+                        "uploaded": True,
+                        "sourceFileChecksum": self._md5(file_path)
+                    }
+                }
+            })
+            self.sessions.discard(key)
+            return asset_id
+            
+        except Exception as e:
+            print(f"에셋 업로드 오류: {e}")
+            return None
+    
+    def _request_json(self, method: str, path: str, body: Optional[Dict] = None) -> Dict[str, Any]:
+        """API 요청 → JSON 응답"""
+        return self.client.request(method, path, body)[1]
+    
+    def _md5(self, file_path: str) -> str:
+        digest = hashlib.md5()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+    
     def _simulate_upload(self, path: str) -> str:
         """시뮬레이션 업로드"""
         print(f"[시뮬레이션] iOS 업로드: {path}")
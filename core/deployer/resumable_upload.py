@@ -0,0 +1,272 @@
+"""
+재개 가능한 분할 업로드
+대용량 APK/AAB/미디어 업로드를 청크 단위로 전송하고,
+진행 상태(재개 토큰)를 디스크에 남겨 중단된 지점부터 다시 보낸다.
+"""
+
+import os
+import json
+import time
+import socket
+import hashlib
+import threading
+import http.client
+import urllib.request
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Callable, Tuple
+
+
+# 진행률 콜백: (전송 바이트, 전체 바이트)
+ProgressCallback = Callable[[int, int], None]
+
+# Google 재개 업로드 청크는 256KB의 배수여야 함
+GOOGLE_CHUNK_UNIT = 256 * 1024
+DEFAULT_CHUNK_SIZE = 32 * GOOGLE_CHUNK_UNIT  # 8MB
+
+
+class UploadSessionStore:
+    """업로드 재개 토큰 저장소 (JSON 파일)"""
+
+    def __init__(self, path: str = "deploy/upload_sessions.json"):
+        """
+        Args:
+            path: 토큰 파일 경로
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def key(self, store: str, *parts: str, file_path: str) -> str:
+        """
+        세션 키 (스토어 + 식별자 + 파일 경로/크기/수정 시각)
+
+        파일이 바뀌면 키가 달라지므로 이전 토큰을 잘못 이어 쓰지 않는다.
+        """
+        try:
+            st = os.stat(file_path)
+            size, mtime_ns = st.st_size, st.st_mtime_ns
+        except OSError:
+            size, mtime_ns = 0, 0
+        raw = "|".join([store, *parts, str(Path(file_path).resolve()), str(size), str(mtime_ns)])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _write(self, data: Dict[str, Dict[str, Any]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.path)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """토큰 조회"""
+        with self._lock:
+            return self._read().get(key)
+
+    def save(self, key: str, token: Dict[str, Any]) -> None:
+        """토큰 저장"""
+        with self._lock:
+            data = self._read()
+            data[key] = token
+            self._write(data)
+
+    def discard(self, key: str) -> None:
+        """토큰 삭제 (업로드 완료/무효화)"""
+        with self._lock:
+            data = self._read()
+            if data.pop(key, None) is not None:
+                self._write(data)
+
+
+# 다시 보내면 성공할 수 있는 HTTP 상태 (그 외 4xx는 즉시 실패)
+RETRYABLE_STATUSES = {408, 429}
+
+
+class UploadStatusError(IOError):
+    """업로드 세션 조회 오류 응답 (googleapiclient HttpError처럼 resp.status 제공)"""
+
+    def __init__(self, resp):
+        self.resp = resp
+        super().__init__(f"업로드 세션 조회 실패 (HTTP {resp.status})")
+
+
+def _is_retryable(error: Exception) -> bool:
+    """일시적 오류 여부 (5xx/408/429 응답, 연결/타임아웃 오류)"""
+    resp = getattr(error, "resp", None)
+    status = getattr(resp, "status", None)
+    if status is not None:
+        return int(status) >= 500 or int(status) in RETRYABLE_STATUSES
+    return isinstance(error, (ConnectionError, TimeoutError, socket.timeout, http.client.HTTPException))
+
+
+def _query_google_offset(request, http, total: int) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """
+    재개 세션의 서버 수신 위치 조회 (빈 PUT + Content-Range: bytes */전체)
+
+    Returns:
+        (수신 바이트, 완료된 경우 API 응답). 세션이 만료되면 (-1, None)
+
+    Raises:
+        UploadStatusError: 그 밖의 오류 응답
+    """
+    resp, content = (http or request.http).request(
+        request.resumable_uri,
+        method="PUT",
+        headers={"Content-Length": "0", "Content-Range": f"bytes */{total}"}
+    )
+    if resp.status in (200, 201):
+        return total, json.loads(content)
+    if resp.status == 308:
+        received = resp.get("range")
+        return (int(received.rsplit("-", 1)[1]) + 1 if received else 0), None
+    if resp.status in (404, 410):
+        return -1, None
+    raise UploadStatusError(resp)
+
+
+def run_google_resumable(
+    make_request: Callable[[], Any],
+    sessions: UploadSessionStore,
+    key: str,
+    token: Dict[str, Any],
+    progress: Optional[ProgressCallback] = None,
+    http=None,
+    num_retries: int = 5,
+    backoff: float = 1.0
+) -> Dict[str, Any]:
+    """
+    googleapiclient 재개 업로드 요청 실행
+
+    청크마다 resumable_uri와 진행 위치를 저장한다. 저장된 토큰이 있거나
+    청크 전송이 일시적 오류(5xx/408/429, 연결/타임아웃)로 실패하면 요청을
+    새로 만들고, 서버에 실제 수신 위치를 조회한 뒤 그 지점부터 이어서
+    보낸다. 재시도는 backoff초부터 2배씩 늘려 기다리고, 그 밖의 오류(4xx
+    등)는 바로 올린다.
+
+    Args:
+        make_request: MediaFileUpload(resumable=True)로 HttpRequest를 만드는 함수
+        sessions: 재개 토큰 저장소
+        key: 세션 키
+        token: 토큰에 함께 저장할 정보 (edit_id 등)
+        progress: 진행률 콜백
+        http: 요청에 사용할 HTTP 객체 (스레드별 연결)
+        num_retries: 청크별 재시도 횟수
+        backoff: 첫 재시도 대기 시간 (초)
+
+    Returns:
+        API 응답
+    """
+    failures = 0
+    while True:
+        request = make_request()
+        total = request.resumable.size()
+        response = None
+
+        try:
+            saved = sessions.get(key)
+            if saved and saved.get("resumable_uri"):
+                request.resumable_uri = saved["resumable_uri"]
+                offset, response = _query_google_offset(request, http, total)
+                if offset < 0:
+                    # 세션 만료 → 처음부터 새 세션으로
+                    sessions.discard(key)
+                    request = make_request()
+                else:
+                    request.resumable_progress = offset
+
+            while response is None:
+                status, response = request.next_chunk(http=http, num_retries=num_retries)
+                if status is not None:
+                    failures = 0
+                    sessions.save(key, {
+                        **token,
+                        "resumable_uri": request.resumable_uri,
+                        "progress": status.resumable_progress
+                    })
+                    if progress:
+                        progress(status.resumable_progress, total)
+        except Exception as e:
+            if failures >= num_retries or not _is_retryable(e):
+                raise
+            time.sleep(backoff * (2 ** failures))
+            failures += 1
+            continue
+
+        sessions.discard(key)
+        if progress:
+            progress(total, total)
+        return response
+
+
+def _http_send(method: str, url: str, data: bytes, headers: Dict[str, str]) -> int:
+    """업로드 파트 전송 (urllib)"""
+    req = urllib.request.Request(url, data=data, headers=headers, method=method)
+    with urllib.request.urlopen(req) as response:
+        return response.status
+
+
+def run_upload_operations(
+    operations: List[Dict[str, Any]],
+    file_path: str,
+    sessions: UploadSessionStore,
+    key: str,
+    token: Dict[str, Any],
+    progress: Optional[ProgressCallback] = None,
+    send: Callable[[str, str, bytes, Dict[str, str]], int] = _http_send,
+    max_retries: int = 3,
+    backoff: float = 1.0
+) -> None:
+    """
+    App Store Connect uploadOperations 실행 (분할 PUT)
+
+    완료한 파트 번호를 저장해 두고, 재실행 시 남은 파트만 전송한다.
+
+    Args:
+        operations: 예약 응답의 uploadOperations
+            [{method, url, offset, length, requestHeaders: [{name, value}]}]
+        file_path: 업로드할 파일
+        sessions: 재개 토큰 저장소
+        key: 세션 키
+        token: 토큰에 함께 저장할 정보 (asset_id 등)
+        progress: 진행률 콜백
+        send: 파트 전송 함수 (method, url, data, headers) → HTTP 상태
+        max_retries: 파트별 재시도 횟수
+        backoff: 첫 재시도 대기 시간 (초, 이후 2배씩 증가)
+    """
+    saved = sessions.get(key) or {}
+    done = set(saved.get("done", []))
+    total = sum(op["length"] for op in operations)
+    sent = sum(op["length"] for i, op in enumerate(operations) if i in done)
+
+    with open(file_path, "rb") as f:
+        for i, op in enumerate(operations):
+            if i in done:
+                continue
+
+            f.seek(op["offset"])
+            data = f.read(op["length"])
+            headers = {h["name"]: h["value"] for h in op.get("requestHeaders", [])}
+
+            for attempt in range(max_retries + 1):
+                try:
+                    status = send(op["method"], op["url"], data, headers)
+                    if status >= 300:
+                        raise IOError(f"파트 {i} 업로드 실패 (HTTP {status})")
+                    break
+                except (IOError, OSError):
+                    if attempt == max_retries:
+                        raise
+                    time.sleep(backoff * (2 ** attempt))
+
+            done.add(i)
+            sent += op["length"]
+            sessions.save(key, {**token, "operations": operations, "done": sorted(done)})
+            if progress:
+                progress(sent, total)
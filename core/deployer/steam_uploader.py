@@ -3,13 +3,21 @@ Steam 업로더
 Steamworks SDK를 사용한 Steam 빌드 업로드
 """
 
+import os
 import json
-import subprocess
+import fnmatch
+import hashlib
 from pathlib import Path
-from typing import Optional, Dict, Any
-from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Callable
+from dataclasses import dataclass, field
 from datetime import datetime
 
+from ..builder.process_runner import ProcessRunner, SteamcmdProgressParser, ProgressEvent
+
+
+# 기본 제외 파일 (배포에 포함하지 않음)
+DEFAULT_EXCLUSIONS = ["*.pdb", "*.log", ".DS_Store", "Thumbs.db"]
+
 
 @dataclass
 class SteamBuildConfig:
@@ -21,6 +29,7 @@ class SteamBuildConfig:
     local_path: str = "*"
     depot_path: str = "."
     set_live: Optional[str] = None  # beta 브랜치 이름 또는 None
+    exclusions: List[str] = field(default_factory=lambda: list(DEFAULT_EXCLUSIONS))
 
 
 class SteamUploader:
@@ -33,15 +42,122 @@ class SteamUploader:
                 - steamcmd_path: steamcmd 경로
                 - username: Steam 계정
                 - config_path: 빌드 설정 파일 경로
+                - manifests_path: 디팟별 업로드 매니페스트 경로
+                - skip_unchanged: 변경 사항이 없으면 업로드 생략 (기본 True,
+                  set_live 브랜치 적용을 요청한 빌드는 생략하지 않음)
+                - upload_timeout: steamcmd 제한 시간 (초, 기본 600)
         """
         self.config = config
         self.steamcmd_path = config.get("steamcmd_path", "steamcmd")
         self.username = config.get("username", "")
         self.scripts_path = Path(config.get("scripts_path", "steam_scripts"))
         self.scripts_path.mkdir(parents=True, exist_ok=True)
+        self.manifests_path = Path(config.get("manifests_path", self.scripts_path / "manifests"))
+        self.skip_unchanged = config.get("skip_unchanged", True)
+        self.upload_timeout = config.get("upload_timeout", 600)
+    
+    def _manifest_file(self, app_id: str, depot_id: str) -> Path:
+        return self.manifests_path / f"depot_{app_id}_{depot_id}.json"
+    
+    def load_depot_manifest(self, app_id: str, depot_id: str) -> Dict[str, Dict[str, Any]]:
+        """마지막 업로드 성공 시점의 파일 목록 {상대경로: {size, mtime_ns, sha256}}"""
+        path = self._manifest_file(app_id, depot_id)
+        if not path.exists():
+            return {}
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f).get("files", {})
+    
+    def save_depot_manifest(self, app_id: str, depot_id: str, files: Dict[str, Dict[str, Any]]) -> None:
+        """업로드 성공 후 매니페스트 저장"""
+        path = self._manifest_file(app_id, depot_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"uploaded_at": datetime.now().isoformat(), "files": files}, f, indent=2)
+        os.replace(tmp, path)
+    
+    def scan_content(
+        self,
+        build_config: SteamBuildConfig,
+        previous: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        콘텐츠 파일 해시 목록
+        
+        크기와 수정 시각이 이전 매니페스트와 같으면 해시를 다시 계산하지 않는다.
+        """
+        previous = previous or {}
+        root = Path(build_config.content_root)
+        files = {}
+        
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for name in sorted(filenames):
+                path = Path(dirpath) / name
+                rel = path.relative_to(root).as_posix()
+                if self._is_excluded(rel, build_config.exclusions):
+                    continue
+                
+                st = path.stat()
+                prev = previous.get(rel)
+                if prev and prev["size"] == st.st_size and prev["mtime_ns"] == st.st_mtime_ns:
+                    sha256 = prev["sha256"]
+                else:
+                    sha256 = self._hash_file(path)
+                files[rel] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": sha256}
+        
+        return files
+    
+    def compute_delta(self, build_config: SteamBuildConfig) -> Dict[str, Any]:
+        """
+        마지막 업로드 대비 변경 사항
+        
+        Returns:
+            {"added", "modified", "removed", "unchanged", "bytes_to_upload",
+             "total_bytes", "files"}
+        """
+        previous = self.load_depot_manifest(build_config.app_id, build_config.depot_id)
+        current = self.scan_content(build_config, previous)
+        
+        added = [rel for rel in current if rel not in previous]
+        modified = [
+            rel for rel in current
+            if rel in previous and previous[rel]["sha256"] != current[rel]["sha256"]
+        ]
+        removed = [rel for rel in previous if rel not in current]
+        
+        return {
+            "added": added,
+            "modified": modified,
+            "removed": removed,
+            "unchanged": len(current) - len(added) - len(modified),
+            "bytes_to_upload": sum(current[rel]["size"] for rel in added + modified),
+            "total_bytes": sum(entry["size"] for entry in current.values()),
+            "files": current
+        }
+    
+    def _is_excluded(self, rel_path: str, patterns: List[str]) -> bool:
+        name = rel_path.rsplit("/", 1)[-1]
+        return any(fnmatch.fnmatch(rel_path, p) or fnmatch.fnmatch(name, p) for p in patterns)
+    
+    def _hash_file(self, path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
     
     def generate_app_build_script(self, build_config: SteamBuildConfig) -> str:
-        """앱 빌드 VDF 스크립트 생성"""
+        """
+        앱 빌드 VDF 스크립트 생성
+        
+        SteamPipe 디팟 빌드는 전체 파일 목록을 새 매니페스트로 삼으므로 매핑은
+        콘텐츠 루트 전체를 유지한다 (변경 파일만 매핑하면 나머지가 디팟에서 삭제됨).
+        실제 전송은 steamcmd가 이전 매니페스트와 청크 단위로 비교해 변경분만 보낸다.
+        """
+        exclusions = "".join(
+            f'\n            "FileExclusion" "{pattern}"' for pattern in build_config.exclusions
+        )
         script = f'''"AppBuild"
 {{
     "AppID" "{build_config.app_id}"
@@ -57,7 +173,7 @@ class SteamUploader:
                 "LocalPath" "{build_config.local_path}"
                 "DepotPath" "{build_config.depot_path}"
                 "Recursive" "1"
-            }}
+            }}{exclusions}
         }}
     }}
 }}'''
@@ -66,14 +182,19 @@ class SteamUploader:
     def upload_build(
         self,
         build_config: SteamBuildConfig,
-        password: str = None
+        password: str = None,
+        on_progress: Optional[Callable[[ProgressEvent], None]] = None
     ) -> Dict[str, Any]:
         """
         Steam에 빌드 업로드
         
+        steamcmd 출력은 줄 단위로 로그 파일에 기록하고 진행률은
+        on_progress 이벤트로 전달한다.
+        
         Args:
             build_config: 빌드 설정
             password: Steam 비밀번호 (또는 환경 변수 사용)
+            on_progress: 진행률 이벤트 콜백
         
         Returns:
             업로드 결과
@@ -85,6 +206,27 @@ class SteamUploader:
             "message": ""
         }
         
+        if not Path(build_config.content_root).is_dir():
+            result["message"] = f"콘텐츠 경로 없음: {build_config.content_root}"
+            return result
+        
+        # 마지막 업로드 대비 변경 사항 (업로드 전 보고)
+        delta = self.compute_delta(build_config)
+        files = delta.pop("files")
+        result["delta"] = delta
+        print(
+            f"디팟 {build_config.depot_id}: 추가 {len(delta['added'])}, 변경 {len(delta['modified'])}, "
+            f"삭제 {len(delta['removed'])}, 업로드 예정 {delta['bytes_to_upload']:,} / {delta['total_bytes']:,} bytes"
+        )
+        
+        # 브랜치 적용 요청은 변경이 없어도 업로드 후 적용까지 진행
+        unchanged = not (delta["added"] or delta["modified"] or delta["removed"])
+        if self.skip_unchanged and unchanged and not build_config.set_live:
+            result["success"] = True
+            result["skipped"] = True
+            result["message"] = "변경 사항 없음 (업로드 생략)"
+            return result
+        
         # VDF 스크립트 생성
         script_content = self.generate_app_build_script(build_config)
         script_path = self.scripts_path / f"app_build_{build_config.app_id}.vdf"
@@ -106,17 +248,19 @@ class SteamUploader:
             "+quit"
         ])
         
+        log_path = self.scripts_path / f"app_build_{build_config.app_id}.log"
+        runner = ProcessRunner(SteamcmdProgressParser(), timeout=self.upload_timeout, on_progress=on_progress)
+        
         try:
-            process = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=600  # 10분 타임아웃
-            )
+            process = runner.run(cmd, log_path=str(log_path))
+            result["log_path"] = str(log_path)
             
-            if process.returncode == 0:
+            if process.timed_out:
+                result["message"] = "업로드 타임아웃"
+            elif process.returncode == 0:
                 result["success"] = True
                 result["message"] = "빌드 업로드 성공"
+                self.save_depot_manifest(build_config.app_id, build_config.depot_id, files)
                 
                 # 브랜치 설정
                 if build_config.set_live:
@@ -125,13 +269,11 @@ class SteamUploader:
                         build_config.set_live
                     )
             else:
-                result["message"] = f"업로드 실패: {process.stderr}"
+                result["message"] = f"업로드 실패: {process.tail_text()}"
                 
         except FileNotFoundError:
             result["message"] = "steamcmd를 찾을 수 없습니다"
             return self._simulate_upload(build_config)
-        except subprocess.TimeoutExpired:
-            result["message"] = "업로드 타임아웃"
         except Exception as e:
             result["message"] = str(e)
         
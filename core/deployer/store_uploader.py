@@ -5,11 +5,18 @@ Google Play Developer API 연동
 
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
+from .resumable_upload import (
+    UploadSessionStore, ProgressCallback, run_google_resumable,
+    GOOGLE_CHUNK_UNIT, DEFAULT_CHUNK_SIZE
+)
+
 
 @dataclass
 class ReleaseInfo:
@@ -19,6 +26,28 @@ class ReleaseInfo:
     version_name: str
     release_notes: Dict[str, str]  # {language_code: notes}
     track: str = "internal"  # internal, alpha, beta, production
+    # {language_code: {title, short_description, full_description}}
+    # (MultilingualGDDGenerator.export_store_listings 형식)
+    # 비어 있으면 출시 노트로 등록 정보를 채움 (store_listings 참고)
+    listings: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def store_listings(self) -> Dict[str, Dict[str, Any]]:
+        """
+        스토어에 보낼 등록 정보
+
+        listings가 있으면 그대로, 없으면 이전 동작대로 언어별 출시 노트로
+        채운다 (제목: 버전명, 짧은 설명: 노트 앞 80자, 전체 설명: 노트).
+        """
+        if self.listings:
+            return self.listings
+        return {
+            lang: {
+                "title": self.version_name,
+                "short_description": notes[:80],
+                "full_description": notes
+            }
+            for lang, notes in self.release_notes.items()
+        }
 
 
 class GooglePlayUploader:
@@ -27,11 +56,23 @@ class GooglePlayUploader:
     def __init__(self, config: dict):
         """
         Args:
-            config: API 설정 (서비스 계정 키 경로 등)
+            config: API 설정
+                - credentials_path: 서비스 계정 키 경로
+                - max_workers: 등록 정보 동시 전송 수
+                - chunk_size: 업로드 청크 크기 (바이트, 256KB 단위로 내림)
+                - max_retries: 청크별 재시도 횟수
+                - upload_state_path: 업로드 재개 토큰 파일
         """
         self.config = config
         self.credentials_path = config.get("credentials_path", "")
+        self.max_workers = config.get("max_workers", 8)
+        chunk_size = config.get("chunk_size", DEFAULT_CHUNK_SIZE)
+        self.chunk_size = max(1, chunk_size // GOOGLE_CHUNK_UNIT) * GOOGLE_CHUNK_UNIT
+        self.max_retries = config.get("max_retries", 5)
+        self.sessions = UploadSessionStore(config.get("upload_state_path", "deploy/upload_sessions.json"))
         self.service = None
+        self._credentials = None
+        self._local = threading.local()
     
     def _init_service(self) -> bool:
         """Google Play API 서비스 초기화"""
@@ -49,6 +90,7 @@ class GooglePlayUploader:
             )
             
             self.service = build('androidpublisher', 'v3', credentials=credentials)
+            self._credentials = credentials
             return True
             
         except ImportError:
@@ -63,7 +105,8 @@ class GooglePlayUploader:
         self,
         package_name: str,
         apk_path: str,
-        track: str = "internal"
+        track: str = "internal",
+        progress: Optional[ProgressCallback] = None
     ) -> Optional[int]:
         """
         APK 업로드
@@ -72,138 +115,289 @@ class GooglePlayUploader:
             package_name: 앱 패키지명 (예: com.example.game)
             apk_path: APK 파일 경로
             track: 릴리스 트랙 (internal/alpha/beta/production)
+            progress: 업로드 진행률 콜백 (전송 바이트, 전체 바이트)
         
         Returns:
             버전 코드 또는 None
         """
-        if not self.service and not self._init_service():
-            return self._simulate_upload(apk_path)
-        
-        try:
-            edits = self.service.edits()
-            
-            # 1. 편집 세션 생성
-            edit_request = edits.insert(body={}, packageName=package_name)
-            edit = edit_request.execute()
-            edit_id = edit['id']
-            
-            # 2. APK 업로드
-            with open(apk_path, 'rb') as apk_file:
-                apk_response = edits.apks().upload(
-                    packageName=package_name,
-                    editId=edit_id,
-                    media_body=apk_path
-                ).execute()
-            
-            version_code = apk_response['versionCode']
-            
-            # 3. 트랙에 할당
-            edits.tracks().update(
-                packageName=package_name,
-                editId=edit_id,
-                track=track,
-                body={
-                    'releases': [{
-                        'versionCodes': [version_code],
-                        'status': 'completed'
-                    }]
-                }
-            ).execute()
-            
-            # 4. 편집 커밋
-            edits.commit(packageName=package_name, editId=edit_id).execute()
-            
-            return version_code
-            
-        except Exception as e:
-            print(f"업로드 오류: {e}")
-            return None
+        result = self.publish_release(package_name, apk_path, track, progress=progress)
+        return result["version_code"] if result["success"] else None
     
     def upload_aab(
         self,
         package_name: str,
         aab_path: str,
-        track: str = "internal"
+        track: str = "internal",
+        progress: Optional[ProgressCallback] = None
     ) -> Optional[int]:
         """
         AAB (Android App Bundle) 업로드
         """
+        result = self.publish_release(package_name, aab_path, track, progress=progress)
+        return result["version_code"] if result["success"] else None
+    
+    def update_listing(
+        self,
+        package_name: str,
+        language: str,
+        title: str,
+        short_desc: str,
+        full_desc: str
+    ) -> bool:
+        """스토어 등록 정보 업데이트 (단일 언어)"""
+        result = self.publish_release(
+            package_name,
+            listings={language: {
+                "title": title,
+                "short_description": short_desc,
+                "full_description": full_desc
+            }}
+        )
+        return result["success"]
+    
+    def publish_release(
+        self,
+        package_name: str,
+        bundle_path: Optional[str] = None,
+        track: str = "internal",
+        release_notes: Optional[Dict[str, str]] = None,
+        listings: Optional[Dict[str, Dict[str, Any]]] = None,
+        progress: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        릴리스 일괄 처리 (편집 세션 1개)
+        
+        편집 생성 → 번들 업로드 → 트랙 할당(출시 노트 포함) → 언어별 등록 정보
+        (동시 전송) → 커밋 1회. 하나라도 실패하면 편집을 폐기해
+        일부만 반영되는 일이 없도록 한다.
+        
+        번들은 청크 단위 재개 업로드로 보낸다. 업로드 도중 끊기면 편집과
+        재개 토큰을 남겨 두고, 같은 파일로 다시 호출하면 그 편집에서
+        이어서 업로드한다.
+        
+        Args:
+            package_name: 앱 패키지명
+            bundle_path: APK/AAB 경로 (없으면 등록 정보만 갱신)
+            track: 릴리스 트랙
+            release_notes: {language_code: 출시 노트}
+            listings: {language_code: {title, short_description, full_description}}
+            progress: 업로드 진행률 콜백 (전송 바이트, 전체 바이트)
+        
+        Returns:
+            {"success", "version_code", "listings": {언어: 성공여부}, "error"}
+        """
+        release_notes = release_notes or {}
+        listings = listings or {}
+        result = {
+            "success": False,
+            "version_code": None,
+            "track": track,
+            "listings": {},
+            "error": None
+        }
+        
+        if bundle_path and not bundle_path.endswith((".apk", ".aab")):
+            result["error"] = f"지원하지 않는 번들 형식: {bundle_path}"
+            return result
+        
         if not self.service and not self._init_service():
-            return self._simulate_upload(aab_path)
+            if bundle_path:
+                result["version_code"] = self._simulate_upload(bundle_path)
+            if listings:
+                self._simulate_listing_update()
+            result["listings"] = {lang: True for lang in listings}
+            result["success"] = True
+            return result
+        
+        edits = self.service.edits()
+        edit_id = None
+        session_key = None
+        uploading = False
         
         try:
-            edits = self.service.edits()
+            # 1. 편집 세션 생성 (중단된 업로드가 있으면 그 편집을 이어서 사용)
+            if bundle_path:
+                session_key = self.sessions.key("google_play", package_name, file_path=bundle_path)
+                edit_id = self._resume_edit(edits, package_name, session_key)
+            if edit_id is None:
+                edit = self._execute(edits.insert(body={}, packageName=package_name))
+                edit_id = edit['id']
             
-            edit_request = edits.insert(body={}, packageName=package_name)
-            edit = edit_request.execute()
-            edit_id = edit['id']
-            
-            # AAB 업로드 (bundles 엔드포인트 사용)
-            with open(aab_path, 'rb') as aab_file:
-                bundle_response = edits.bundles().upload(
+            # 2. 번들 업로드 + 트랙 할당
+            if bundle_path:
+                uploading = True
+                version_code = self._upload_bundle(
+                    edits, package_name, edit_id, bundle_path, session_key, progress
+                )
+                uploading = False
+                result["version_code"] = version_code
+                
+                release = {
+                    'versionCodes': [version_code],
+                    'status': 'completed'
+                }
+                if release_notes:
+                    release['releaseNotes'] = [
+                        {'language': lang, 'text': notes[:500]}
+                        for lang, notes in release_notes.items()
+                    ]
+                
+                self._execute(edits.tracks().update(
                     packageName=package_name,
                     editId=edit_id,
-                    media_body=aab_path
-                ).execute()
+                    track=track,
+                    body={'releases': [release]}
+                ))
             
-            version_code = bundle_response['versionCode']
+            # 3. 등록 정보 (같은 편집 안에서 동시 전송)
+            if listings:
+                result["listings"] = self._update_listings(edits, package_name, edit_id, listings)
+                failed = [lang for lang, ok in result["listings"].items() if not ok]
+                if failed:
+                    raise RuntimeError(f"등록 정보 업데이트 실패: {', '.join(failed)}")
             
-            edits.tracks().update(
-                packageName=package_name,
-                editId=edit_id,
-                track=track,
-                body={
-                    'releases': [{
-                        'versionCodes': [version_code],
-                        'status': 'completed'
-                    }]
-                }
-            ).execute()
-            
-            edits.commit(packageName=package_name, editId=edit_id).execute()
-            
-            return version_code
+            # 4. 편집 커밋 (1회)
+            self._execute(edits.commit(packageName=package_name, editId=edit_id))
+            result["success"] = True
             
         except Exception as e:
-            print(f"AAB 업로드 오류: {e}")
+            print(f"릴리스 오류: {e}")
+            result["error"] = str(e)
+            if uploading and self.sessions.get(session_key):
+                # 재개 토큰이 남아 있으면 편집을 유지해 다음 호출에서 이어서 업로드
+                print(f"업로드 중단: 다시 실행하면 이어서 업로드합니다 (편집 {edit_id})")
+                return result
+            if session_key:
+                self.sessions.discard(session_key)
+            if edit_id:
+                try:
+                    self._execute(edits.delete(packageName=package_name, editId=edit_id))
+                except Exception:
+                    pass
+        
+        return result
+    
+    def _resume_edit(self, edits, package_name: str, session_key: str) -> Optional[str]:
+        """중단된 업로드의 편집 ID (만료되었으면 토큰 폐기 후 None)"""
+        token = self.sessions.get(session_key)
+        if not token or not token.get("edit_id"):
             return None
+        
+        try:
+            self._execute(edits.get(packageName=package_name, editId=token["edit_id"]))
+        except Exception:
+            self.sessions.discard(session_key)
+            return None
+        
+        print(f"중단된 업로드 재개: 편집 {token['edit_id']} ({token.get('progress', 0)} bytes)")
+        return token["edit_id"]
     
-    def update_listing(
+    def _upload_bundle(
         self,
+        edits,
         package_name: str,
-        language: str,
-        title: str,
-        short_desc: str,
-        full_desc: str
-    ) -> bool:
-        """스토어 등록 정보 업데이트"""
-        if not self.service and not self._init_service():
-            return self._simulate_listing_update()
+        edit_id: str,
+        bundle_path: str,
+        session_key: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None
+    ) -> int:
+        """APK/AAB 청크 재개 업로드 → 버전 코드"""
+        is_aab = bundle_path.endswith(".aab")
+        endpoint = edits.bundles() if is_aab else edits.apks()
         
         try:
-            edits = self.service.edits()
-            
-            edit = edits.insert(body={}, packageName=package_name).execute()
-            edit_id = edit['id']
-            
-            edits.listings().update(
+            from googleapiclient.http import MediaFileUpload
+        except ImportError:
+            # 클라이언트 라이브러리 없이 주입된 서비스: 단일 요청 업로드
+            response = self._execute(endpoint.upload(
                 packageName=package_name,
                 editId=edit_id,
-                language=language,
-                body={
-                    'title': title,
-                    'shortDescription': short_desc,
-                    'fullDescription': full_desc
-                }
-            ).execute()
-            
-            edits.commit(packageName=package_name, editId=edit_id).execute()
-            return True
-            
-        except Exception as e:
-            print(f"등록 정보 업데이트 오류: {e}")
+                media_body=bundle_path
+            ))
+            return response['versionCode']
+        
+        def make_request():
+            media = MediaFileUpload(
+                bundle_path,
+                mimetype="application/octet-stream" if is_aab else "application/vnd.android.package-archive",
+                chunksize=self.chunk_size,
+                resumable=True
+            )
+            return endpoint.upload(packageName=package_name, editId=edit_id, media_body=media)
+        
+        response = run_google_resumable(
+            make_request,
+            self.sessions,
+            session_key or self.sessions.key("google_play", package_name, file_path=bundle_path),
+            {"edit_id": edit_id, "package_name": package_name, "bundle_path": bundle_path},
+            progress=progress,
+            http=self._http(),
+            num_retries=self.max_retries
+        )
+        return response['versionCode']
+    
+    def _update_listings(
+        self,
+        edits,
+        package_name: str,
+        edit_id: str,
+        listings: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, bool]:
+        """언어별 등록 정보 동시 업데이트"""
+        def update(item) -> bool:
+            lang, listing = item
+            try:
+                self._execute(edits.listings().update(
+                    packageName=package_name,
+                    editId=edit_id,
+                    language=lang,
+                    body={
+                        'title': listing.get("title", "")[:30],
+                        'shortDescription': listing.get("short_description", "")[:80],
+                        'fullDescription': listing.get("full_description", "")[:4000]
+                    }
+                ))
+                return True
+            except Exception as e:
+                print(f"등록 정보 업데이트 오류 ({lang}): {e}")
+                return False
+        
+        items = list(listings.items())
+        workers = min(self.max_workers, len(items)) if self._thread_http_available() else 1
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            outcomes = list(executor.map(update, items))
+        
+        return {lang: ok for (lang, _), ok in zip(items, outcomes)}
+    
+    def _thread_http_available(self) -> bool:
+        """스레드별 HTTP 연결 생성 가능 여부 (httplib2는 스레드 안전하지 않음)"""
+        try:
+            import httplib2
+            import google_auth_httplib2
+            return self._credentials is not None
+        except ImportError:
             return False
     
+    def _http(self):
+        """현재 스레드의 HTTP 연결 (사용 불가 시 None → 요청 기본 연결)"""
+        if not self._thread_http_available():
+            return None
+        
+        http = getattr(self._local, "http", None)
+        if http is None:
+            import httplib2
+            import google_auth_httplib2
+            http = google_auth_httplib2.AuthorizedHttp(self._credentials, http=httplib2.Http())
+            self._local.http = http
+        return http
+    
+    def _execute(self, request):
+        """API 요청 실행 (스레드마다 별도 HTTP 연결 사용)"""
+        http = self._http()
+        if http is None:
+            return request.execute()
+        return request.execute(http=http)
+    
     def _simulate_upload(self, file_path: str) -> int:
         """시뮬레이션 업로드 (API 없을 때)"""
         print(f"[시뮬레이션] 업로드: {file_path}")
@@ -219,9 +413,58 @@ class AppStoreUploadManager:
     """앱스토어 업로드 매니저 (Google Play + 향후 iOS)"""
     
     def __init__(self, config: dict):
+        """
+        Args:
+            config: 스토어별 설정
+                - google_play: GooglePlayUploader 설정
+                - artifact_store_path: 빌드 아티팩트 저장소 경로 (최신 빌드 조회용)
+        """
         self.config = config
         self.google_play = GooglePlayUploader(config.get("google_play", {}))
     
+    def resolve_latest_build(
+        self,
+        game_id: str,
+        target: str = "android",
+        dest_dir: str = "deploy"
+    ) -> Optional[str]:
+        """
+        아티팩트 저장소에서 게임의 최신 성공 빌드를 복원
+        
+        Returns:
+            복원된 빌드 파일 경로 (apk/aab 우선) 또는 None
+        """
+        from core.builder.artifact_store import ArtifactStore
+        
+        store = ArtifactStore(self.config.get("artifact_store_path", "artifacts"))
+        record = store.latest(game_id, target)
+        if record is None:
+            return None
+        
+        files = store.restore(record.build_id, str(Path(dest_dir) / game_id / record.build_id))
+        for ext in (".aab", ".apk"):
+            for file in files:
+                if file.endswith(ext):
+                    return file
+        return files[0] if files else None
+    
+    def upload_latest(
+        self,
+        game_id: str,
+        package_name: str,
+        release_info: ReleaseInfo
+    ) -> Dict[str, Any]:
+        """최신 성공 빌드를 찾아 업로드"""
+        build_path = self.resolve_latest_build(game_id, "android")
+        if build_path is None:
+            return {
+                "game_id": game_id,
+                "timestamp": datetime.now().isoformat(),
+                "platforms": {},
+                "error": "성공한 빌드가 없습니다"
+            }
+        return self.upload_game(game_id, build_path, package_name, release_info)
+    
     def upload_game(
         self,
         game_id: str,
@@ -247,37 +490,24 @@ class AppStoreUploadManager:
             "platforms": {}
         }
         
-        # Google Play 업로드
-        if build_path.endswith('.apk'):
-            version_code = self.google_play.upload_apk(
-                package_name,
-                build_path,
-                release_info.track
-            )
-        elif build_path.endswith('.aab'):
-            version_code = self.google_play.upload_aab(
-                package_name,
-                build_path,
-                release_info.track
-            )
-        else:
-            version_code = None
+        # Google Play: 번들 + 트랙 + 출시 노트 + 등록 정보를 편집 1회로 처리
+        bundle_path = build_path if build_path.endswith(('.apk', '.aab')) else None
+        release = self.google_play.publish_release(
+            package_name,
+            bundle_path,
+            release_info.track,
+            release_notes=release_info.release_notes,
+            listings=release_info.store_listings()
+        )
         
         result["platforms"]["google_play"] = {
-            "success": version_code is not None,
-            "version_code": version_code,
-            "track": release_info.track
+            "success": release["success"] and bundle_path is not None,
+            "version_code": release["version_code"],
+            "track": release_info.track,
+            "listings": release["listings"]
         }
-        
-        # 릴리스 노트 업데이트
-        for lang, notes in release_info.release_notes.items():
-            self.google_play.update_listing(
-                package_name,
-                lang,
-                release_info.version_name,
-                notes[:80],  # short desc 제한
-                notes
-            )
+        if release["error"]:
+            result["platforms"]["google_play"]["error"] = release["error"]
         
         return result
 
@@ -5,7 +5,6 @@
 
 import asyncio
 import json
-import shutil
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any
@@ -18,6 +17,7 @@ from crawler.tiktok_crawler import TikTokCrawler
 from crawler.google_trends_crawler import GoogleTrendsCrawler
 from gdd_generator.gdd_generator import GDDGenerator, GDD
 from builder.godot_builder import GodotBuilder
+from builder.project_materializer import ProjectMaterializer
 
 
 class Pipeline:
@@ -36,6 +36,7 @@ class Pipeline:
         self.google_crawler = GoogleTrendsCrawler(self.config.get("crawler", {}))
         self.gdd_generator = GDDGenerator(self.config.get("llm", {}))
         self.godot_builder = GodotBuilder(self.config.get("godot", {}))
+        self.materializer = ProjectMaterializer()
     
     def _load_config(self, config_path: str) -> dict:
         """설정 파일 로드"""
@@ -168,15 +169,16 @@ class Pipeline:
         # 게임 폴더 경로
         game_path = self.base_path / "games" / template_type / project_name
         
-        # 템플릿 복사
+        # 템플릿 구체화 (불변 파일은 링크, 수정 대상만 복사)
         if template_path.exists():
-            shutil.copytree(template_path, game_path)
+            self.materializer.materialize(str(template_path), str(game_path))
         else:
             game_path.mkdir(parents=True, exist_ok=True)
         
         # GDD 저장
         gdd_path = game_path / "gdd.json"
         self.gdd_generator.save_gdd(gdd, str(gdd_path))
+        self.materializer.track(str(game_path), "gdd.json")
         
         # 스킨 설정 업데이트 (향후 자산 생성 연동)
         
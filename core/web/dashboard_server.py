@@ -3,14 +3,15 @@
 FastAPI 기반 REST API 및 관리 UI
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Header, Response
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 import json
 import sys
+import asyncio
 from pathlib import Path
 
 # 코어 모듈 경로 추가
@@ -62,6 +63,33 @@ class BalanceUpdateRequest(BaseModel):
 games_db: Dict[str, Dict] = {}
 builds_db: Dict[str, Dict] = {}
 
+# 빌드는 직접 실행하지 않고 빌드 큐에 제출 (워커: `python cli.py workers`)
+BUILD_QUEUE_PATH = "builds/build_queue.db"
+_build_queue = None
+
+
+def get_build_queue():
+    """빌드 큐 (지연 생성)"""
+    global _build_queue
+    if _build_queue is None:
+        from core.builder.build_queue import BuildQueue
+        _build_queue = BuildQueue(BUILD_QUEUE_PATH)
+    return _build_queue
+
+
+# 퍼블리시된 밸런스 설정은 BalanceManager가 메모리에서 서빙
+BALANCE_DIR = "balance"
+_balance_manager = None
+
+
+def get_balance_manager():
+    """밸런스 매니저 (지연 생성)"""
+    global _balance_manager
+    if _balance_manager is None:
+        from core.balancing.balance_manager import BalanceManager
+        _balance_manager = BalanceManager(BALANCE_DIR)
+    return _balance_manager
+
 
 # ===== API 엔드포인트 =====
 
@@ -268,15 +296,24 @@ async def start_build(request: BuildRequest, background_tasks: BackgroundTasks):
         raise HTTPException(status_code=404, detail="게임을 찾을 수 없습니다")
     
     build_id = f"build_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    project_path = games_db[request.game_id].get("project_path", f"games/{request.game_id}")
+    
+    if not Path(project_path).exists():
+        raise HTTPException(status_code=400, detail="게임 프로젝트가 아직 생성되지 않았습니다")
+    
+    # 프로젝트 해시 계산은 파일 I/O라 이벤트 루프 밖에서 실행
+    queue = get_build_queue()
+    jobs = await asyncio.to_thread(queue.submit_project, project_path, request.platforms, "builds")
     
     builds_db[build_id] = {
         "game_id": request.game_id,
         "platforms": request.platforms,
-        "status": "building",
+        "job_ids": [job.job_id for job in jobs],
+        "status": "queued",
         "started_at": datetime.now().isoformat()
     }
     
-    return {"build_id": build_id, "status": "building"}
+    return {"build_id": build_id, "status": "queued", "job_ids": builds_db[build_id]["job_ids"]}
 
 
 @app.get("/api/builds/{build_id}")
@@ -285,7 +322,99 @@ async def get_build_status(build_id: str):
     if build_id not in builds_db:
         raise HTTPException(status_code=404, detail="빌드를 찾을 수 없습니다")
     
-    return builds_db[build_id]
+    build = dict(builds_db[build_id])
+    queue = get_build_queue()
+    jobs = await asyncio.to_thread(lambda: [queue.get(job_id) for job_id in build.get("job_ids", [])])
+    build["jobs"] = [job.to_dict() for job in jobs if job is not None]
+    
+    statuses = {job["status"] for job in build["jobs"]}
+    if statuses & {"queued", "running"}:
+        build["status"] = "running" if "running" in statuses else "queued"
+    elif statuses == {"succeeded"}:
+        build["status"] = "succeeded"
+    elif "failed" in statuses:
+        build["status"] = "failed"
+    elif "cancelled" in statuses:
+        build["status"] = "cancelled"
+    
+    return build
+
+
+@app.get("/api/builds/{build_id}/events")
+async def stream_build_events(build_id: str):
+    """빌드 진행률 스트림 (Server-Sent Events, 모든 작업 종료 시 닫힘)"""
+    if build_id not in builds_db:
+        raise HTTPException(status_code=404, detail="빌드를 찾을 수 없습니다")
+    
+    queue = get_build_queue()
+    job_ids = builds_db[build_id].get("job_ids", [])
+    
+    def snapshot() -> List[Dict[str, Any]]:
+        jobs = [queue.get(job_id) for job_id in job_ids]
+        return [
+            {
+                "job_id": job.job_id,
+                "target": job.target,
+                "status": job.status,
+                "progress": job.progress,
+                "progress_message": job.progress_message
+            }
+            for job in jobs if job is not None
+        ]
+    
+    async def events():
+        last = None
+        while True:
+            current = await asyncio.to_thread(snapshot)
+            if current != last:
+                yield f"data: {json.dumps(current, ensure_ascii=False)}\n\n"
+                last = current
+            if all(job["status"] not in ("queued", "running") for job in current):
+                break
+            await asyncio.sleep(1)
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+@app.delete("/api/builds/{build_id}")
+async def cancel_build(build_id: str):
+    """빌드 취소"""
+    if build_id not in builds_db:
+        raise HTTPException(status_code=404, detail="빌드를 찾을 수 없습니다")
+    
+    queue = get_build_queue()
+    job_ids = builds_db[build_id].get("job_ids", [])
+    cancelled = await asyncio.to_thread(lambda: [job_id for job_id in job_ids if queue.cancel(job_id)])
+    
+    return {"build_id": build_id, "cancelled": cancelled}
+
+
+@app.get("/api/build-queue")
+async def get_build_queue_stats():
+    """빌드 큐 상태 조회"""
+    return get_build_queue().stats()
+
+
+@app.get("/api/balance/{game_id}")
+async def get_published_balance(
+    game_id: str,
+    delta: bool = False,
+    if_none_match: Optional[str] = Header(None)
+):
+    """
+    퍼블리시된 밸런스 설정 (클라이언트용)
+    
+    If-None-Match가 현재 ETag와 같으면 304, delta=true면 가진 버전에서
+    현재 버전까지의 JSON Patch를 반환한다.
+    """
+    result = get_balance_manager().serve_published_config(game_id, if_none_match, delta)
+    if result["status"] == 404:
+        raise HTTPException(status_code=404, detail="퍼블리시된 설정이 없습니다")
+    
+    headers = {"ETag": result["etag"], "Cache-Control": "no-cache"}
+    if result["status"] == 304:
+        return Response(status_code=304, headers=headers)
+    return Response(content=result["body"], media_type=result["content_type"], headers=headers)
 
 
 @app.get("/analytics", response_class=HTMLResponse)
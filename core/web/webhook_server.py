@@ -8,6 +8,7 @@ from fastapi.responses import JSONResponse
 import hmac
 import hashlib
 import json
+import asyncio
 from datetime import datetime
 from typing import Dict, Any, Optional
 
@@ -79,16 +80,23 @@ class WebhookHandler:
         return {"status": "logged", "action": action}
     
     async def _trigger_build(self, data: dict) -> dict:
-        """빌드 트리거"""
+        """빌드 트리거 (빌드 큐에 제출, 실제 빌드는 워커가 수행)"""
         from core.builder.godot_builder import GodotBuilder
         
-        print("🔨 자동 빌드 시작...")
+        print("🔨 자동 빌드 제출...")
         
-        # 실제 빌드 로직
-        # builder = GodotBuilder({})
-        # builder.build(...)
+        project_path = self.config.get("project_path")
+        if not project_path:
+            return {"status": "build_skipped", "reason": "project_path 미설정"}
         
-        return {"status": "build_triggered"}
+        # 프로젝트 해시 계산과 큐(SQLite) 기록은 이벤트 루프 밖에서 실행
+        def submit() -> list:
+            builder = GodotBuilder(self.config.get("godot", {}))
+            return builder.submit_build(project_path, self.config.get("output_dir", "builds"))
+        
+        jobs = await asyncio.to_thread(submit)
+        
+        return {"status": "build_queued", "job_ids": [job.job_id for job in jobs]}
     
     async def _trigger_deploy(self, data: dict) -> dict:
         """배포 트리거"""
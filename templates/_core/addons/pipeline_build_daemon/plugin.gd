@@ -0,0 +1,103 @@
+@tool
+extends EditorPlugin
+
+# 파이프라인 빌드 데몬
+# 헤드리스 에디터를 띄워둔 채 로컬 TCP 포트로 명령을 받아 처리한다.
+# 엔진 시작 비용 없이 반복 임포트를 수행하기 위함 (core/builder/godot_daemon.py 참고)
+#
+# 프로토콜: 한 줄에 JSON 하나
+#   {"cmd": "ping"}
+#   {"cmd": "scan"}                                  전체 파일시스템 스캔 + 임포트
+#   {"cmd": "reimport", "files": ["res://a.png"]}    지정 파일 재임포트
+#   {"cmd": "quit"}
+# 응답: {"ok": true/false, "message": "...", "error": "..."}
+
+const PORT_ENV = "PIPELINE_DAEMON_PORT"
+
+var _server: TCPServer
+var _clients: Array = []  # [{"peer": StreamPeerTCP, "buffer": String}]
+var _pending_scan: Array = []  # 스캔 완료를 기다리는 peer
+
+func _enter_tree() -> void:
+    var port_text := OS.get_environment(PORT_ENV)
+    if port_text.is_empty():
+        return  # 일반 에디터 실행에서는 동작하지 않음
+    
+    _server = TCPServer.new()
+    var err := _server.listen(int(port_text), "127.0.0.1")
+    if err != OK:
+        push_error("빌드 데몬 포트 열기 실패: %d" % err)
+        _server = null
+        return
+    
+    print("PIPELINE_DAEMON_READY ", port_text)
+    set_process(true)
+
+func _exit_tree() -> void:
+    if _server:
+        _server.stop()
+        _server = null
+
+func _process(_delta: float) -> void:
+    if _server == null:
+        return
+    
+    while _server.is_connection_available():
+        _clients.append({"peer": _server.take_connection(), "buffer": ""})
+    
+    for client in _clients.duplicate():
+        var peer: StreamPeerTCP = client["peer"]
+        peer.poll()
+        if peer.get_status() != StreamPeerTCP.STATUS_CONNECTED:
+            _clients.erase(client)
+            continue
+        
+        var available := peer.get_available_bytes()
+        if available > 0:
+            client["buffer"] += peer.get_utf8_string(available)
+        
+        var newline: int = client["buffer"].find("\n")
+        while newline != -1:
+            var line: String = client["buffer"].substr(0, newline)
+            client["buffer"] = client["buffer"].substr(newline + 1)
+            _handle(peer, line)
+            newline = client["buffer"].find("\n")
+    
+    var fs := EditorInterface.get_resource_filesystem()
+    if not _pending_scan.is_empty() and not fs.is_scanning():
+        for peer in _pending_scan:
+            _reply(peer, {"ok": true, "message": "스캔 완료"})
+        _pending_scan.clear()
+
+func _handle(peer: StreamPeerTCP, line: String) -> void:
+    var request = JSON.parse_string(line)
+    if typeof(request) != TYPE_DICTIONARY:
+        _reply(peer, {"ok": false, "error": "잘못된 요청"})
+        return
+    
+    var fs := EditorInterface.get_resource_filesystem()
+    
+    match request.get("cmd", ""):
+        "ping":
+            _reply(peer, {"ok": true, "message": Engine.get_version_info()["string"]})
+        "scan":
+            fs.scan()
+            _pending_scan.append(peer)
+        "reimport":
+            var files := PackedStringArray(request.get("files", []))
+            for file in files:
+                # 아직 파일시스템에 없는 새 파일은 스캔으로 임포트
+                if fs.get_file_type(file).is_empty():
+                    fs.scan()
+                    _pending_scan.append(peer)
+                    return
+            fs.reimport_files(files)
+            _reply(peer, {"ok": true, "message": "재임포트 %d개" % files.size()})
+        "quit":
+            _reply(peer, {"ok": true, "message": "종료"})
+            get_tree().quit()
+        _:
+            _reply(peer, {"ok": false, "error": "알 수 없는 명령"})
+
+func _reply(peer: StreamPeerTCP, response: Dictionary) -> void:
+    peer.put_data((JSON.stringify(response) + "\n").to_utf8_buffer())
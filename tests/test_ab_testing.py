@@ -0,0 +1,457 @@
+"""
+단위 테스트 - A/B 테스트
+이벤트 로그 기반 집계와 할당을 검증
+"""
+
+import pytest
+import sys
+import json
+import math
+import hashlib
+import dataclasses
+import time
+import multiprocessing
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.ab_testing.ab_manager import ABTestManager
+from core.ab_testing.assignment import AssignmentTable
+from core.ab_testing.analysis import ABAnalyzer, ExperimentData
+
+
+def _two_variant_test(manager):
+    test = manager.create_test(
+        name="점프 높이",
+        description="테스트",
+        game_id="game_001",
+        variants=[{"name": "A", "weight": 0.5}, {"name": "B", "weight": 0.5}]
+    )
+    manager.start_test(test.test_id)
+    return test
+
+
+def _assign_in_process(data_dir, test_id, start, count):
+    manager = ABTestManager(data_dir)
+    for i in range(start, start + count):
+        manager.assign_variant(test_id, f"user_{i}")
+
+
+class TestABEventLog:
+    """이벤트 로그 백엔드 테스트"""
+
+    def test_events_survive_restart(self, tmp_path):
+        """스냅샷 + 이후 이벤트 재생으로 카운터 복원 테스트"""
+        data_dir = str(tmp_path / "ab")
+        manager = ABTestManager(data_dir, snapshot_every=50)
+        test = _two_variant_test(manager)
+
+        for i in range(120):
+            variant = manager.assign_variant(test.test_id, f"user_{i}")
+            if i % 10 == 0:
+                manager.track_conversion(test.test_id, variant.variant_id, 2.5)
+
+        before = {v.variant_id: (v.impressions, v.conversions, v.revenue) for v in test.variants}
+        assert sum(imp for imp, _, _ in before.values()) == 120
+
+        # 정상 종료 절차 없이 새 인스턴스로 다시 읽기
+        reloaded = ABTestManager(data_dir)
+        after = {
+            v.variant_id: (v.impressions, v.conversions, v.revenue)
+            for v in reloaded.tests[test.test_id].variants
+        }
+        assert after == before
+
+    def test_tests_json_not_rewritten_per_event(self, tmp_path):
+        """이벤트마다 테스트 정의/인덱스를 다시 쓰지 않는지 테스트"""
+        manager = ABTestManager(str(tmp_path / "ab"))
+        test = _two_variant_test(manager)
+        test_file = tmp_path / "ab" / "tests" / f"{test.test_id}.json"
+        mtime = test_file.stat().st_mtime_ns
+        writes = manager.tests.stats()["writes"]
+
+        for i in range(20):
+            manager.assign_variant(test.test_id, f"user_{i}")
+
+        assert test_file.stat().st_mtime_ns == mtime
+        assert manager.tests.stats()["writes"] == writes
+
+    def test_event_synchronous_mode(self, tmp_path):
+        """이벤트 DB synchronous 모드 기본값(FULL)과 설정 테스트"""
+        modes = {}
+        for name, option in [("default", None), ("normal", "normal"), ("invalid", "sometimes")]:
+            kwargs = {"event_synchronous": option} if option else {}
+            manager = ABTestManager(str(tmp_path / name), **kwargs)
+            modes[name] = manager.events._conn.execute("PRAGMA synchronous").fetchone()[0]
+            manager.events.close()
+
+        # 0=OFF, 1=NORMAL, 2=FULL
+        assert modes == {"default": 2, "normal": 1, "invalid": 2}
+
+    def test_legacy_counters_migrated(self, tmp_path):
+        """기존 tests.json 카운터 이전 테스트"""
+        data_dir = tmp_path / "ab"
+        data_dir.mkdir()
+        legacy = {
+            "test_old": {
+                "test_id": "test_old", "name": "old", "description": "", "game_id": "g",
+                "status": "running",
+                "variants": [
+                    {"variant_id": "test_old_v0", "name": "A", "weight": 0.5, "config": {},
+                     "impressions": 40, "conversions": 4, "revenue": 10.0},
+                    {"variant_id": "test_old_v1", "name": "B", "weight": 0.5, "config": {},
+                     "impressions": 60, "conversions": 3, "revenue": 6.0}
+                ],
+                "created_at": "2024-01-01T00:00:00", "started_at": None, "ended_at": None
+            }
+        }
+        (data_dir / "tests.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+        manager = ABTestManager(str(data_dir))
+        manager.track_conversion("test_old", "test_old_v0", 5.0)
+
+        reloaded = ABTestManager(str(data_dir))
+        v0 = reloaded.tests["test_old"].variants[0]
+        assert (v0.impressions, v0.conversions, v0.revenue) == (40, 5, 15.0)
+
+    def test_concurrent_writers(self, tmp_path):
+        """여러 프로세스 동시 기록 시 이벤트 누락 없음 테스트"""
+        data_dir = str(tmp_path / "ab")
+        manager = ABTestManager(data_dir)
+        test = _two_variant_test(manager)
+
+        processes = [
+            multiprocessing.Process(target=_assign_in_process, args=(data_dir, test.test_id, i * 100, 100))
+            for i in range(3)
+        ]
+        for p in processes:
+            p.start()
+        for p in processes:
+            p.join(30)
+
+        manager.refresh()
+        assert sum(v.impressions for v in test.variants) == 300
+
+    def test_assignment_throughput(self, tmp_path):
+        """초당 수천 건 할당 처리 테스트"""
+        manager = ABTestManager(str(tmp_path / "ab"))
+        test = _two_variant_test(manager)
+
+        started = time.perf_counter()
+        for i in range(2000):
+            manager.assign_variant(test.test_id, f"user_{i}")
+        elapsed = time.perf_counter() - started
+
+        assert 2000 / elapsed > 1000
+
+
+class TestAssignment:
+    """버킷 테이블 할당 테스트"""
+
+    def test_assign_does_not_write(self, tmp_path):
+        """assign은 이벤트를 기록하지 않는지 테스트"""
+        manager = ABTestManager(str(tmp_path / "ab"))
+        test = _two_variant_test(manager)
+
+        for i in range(50):
+            assert manager.assign(test.test_id, f"user_{i}") is not None
+
+        assert manager.events.last_seq() == 0
+        assert sum(v.impressions for v in test.variants) == 0
+
+    def test_assign_many_matches_assign(self, tmp_path):
+        """일괄 할당 결과가 단건 할당과 같은지 테스트"""
+        manager = ABTestManager(str(tmp_path / "ab"))
+        test = _two_variant_test(manager)
+        users = [f"user_{i}" for i in range(500)]
+
+        bulk = manager.assign_many(test.test_id, users)
+        assert bulk == [manager.assign(test.test_id, u) for u in users]
+
+    def test_weights_respected(self):
+        """가중치 비율대로 분배되는지 테스트"""
+        table = AssignmentTable.build("t", ["a", "b", "c"], [0.2, 0.3, 0.5])
+        indices = table.assign_many([f"user_{i}" for i in range(30000)])
+
+        for index, weight in enumerate([0.2, 0.3, 0.5]):
+            assert abs(indices.count(index) / len(indices) - weight) < 0.02
+
+    def test_legacy_md5_assignment_kept(self):
+        """기존 테스트는 MD5 할당 결과를 유지하는지 테스트"""
+        weights = [0.1, 0.2, 0.7]
+        table = AssignmentTable.build("test_old", ["v0", "v1", "v2"], weights, hash_scheme="md5")
+
+        for i in range(1000):
+            digest = hashlib.md5(f"test_old:user_{i}".encode()).hexdigest()
+            bucket = (int(digest, 16) % 1000) / 1000.0
+            expected, cumulative = 2, 0.0
+            for index, weight in enumerate(weights):
+                cumulative += weight
+                if bucket < cumulative:
+                    expected = index
+                    break
+            assert table.assign(f"user_{i}") == expected
+
+    def test_not_running_returns_none(self, tmp_path):
+        """실행 중이 아닌 테스트는 할당하지 않는지 테스트"""
+        manager = ABTestManager(str(tmp_path / "ab"))
+        test = _two_variant_test(manager)
+        manager.stop_test(test.test_id)
+
+        assert manager.assign(test.test_id, "user_1") is None
+        assert manager.assign_many(test.test_id, ["user_1", "user_2"]) == [None, None]
+
+
+def _fill(manager, test, counts):
+    """변형별 (노출, 전환, 전환당 매출) 이벤트 일괄 기록"""
+    events = []
+    for variant, (impressions, conversions, amount) in zip(test.variants, counts):
+        events += [(test.test_id, variant.variant_id, "impression", None, 0.0)] * impressions
+        events += [(test.test_id, variant.variant_id, "conversion", None, amount)] * conversions
+    manager.events.append_many(events)
+    manager.refresh()
+
+
+class TestAnalysis:
+    """통계 분석 테스트"""
+
+    def test_z_test_matches_formula(self):
+        """2-비율 z-검정 값 테스트"""
+        data = ExperimentData("t", ["a", "b"], [1000, 1000], [100, 130], [0.0, 0.0])
+        stats = ABAnalyzer({"seed": 1}).analyze([data])["t"]["variants"]["b"]["vs_control"]
+
+        pooled = 230 / 2000
+        z = 0.03 / math.sqrt(pooled * (1 - pooled) * (2 / 1000))
+        assert stats["z"] == pytest.approx(z)
+        assert stats["p_value"] == pytest.approx(math.erfc(z / math.sqrt(2)))
+        # 순차 검정 p-값은 고정 표본 p-값보다 보수적
+        assert stats["p_value_sequential"] >= stats["p_value"]
+
+    def test_clear_winner(self, tmp_path):
+        """확실한 차이가 있으면 종료 시 승자 결정 테스트"""
+        manager = ABTestManager(str(tmp_path / "ab"), analysis_config={"seed": 1})
+        test = _two_variant_test(manager)
+        _fill(manager, test, [(5000, 250, 1.0), (5000, 500, 1.0)])
+        manager.stop_test(test.test_id)
+
+        results = manager.get_results(test.test_id)
+        challenger = results["variants"][1]
+        assert challenger["prob_best"] > 0.99
+        assert challenger["vs_control"]["significant"]
+        assert results["winner"] == test.variants[1].variant_id
+
+    def test_no_winner_without_significance(self, tmp_path):
+        """차이가 없으면 승자 없음 테스트"""
+        manager = ABTestManager(str(tmp_path / "ab"), analysis_config={"seed": 1})
+        test = _two_variant_test(manager)
+        _fill(manager, test, [(500, 50, 1.0), (500, 52, 1.0)])
+        manager.stop_test(test.test_id)
+
+        assert manager.get_results(test.test_id)["winner"] is None
+        assert "유의한 승자 없음" in manager.generate_report(test.test_id)
+
+    def test_arpu_bootstrap_interval(self):
+        """ARPU 부트스트랩 신뢰구간 테스트 (이벤트 매출 + 개별 매출 없는 전환)"""
+        data = ExperimentData(
+            "t", ["a"], [2000], [100], [350.0],
+            revenue_histograms=[[(0.99, 40), (4.99, 20)]]
+        )
+        stats = ABAnalyzer({"seed": 1}).analyze([data])["t"]["variants"]["a"]
+
+        # 개별 매출이 없는 전환 40건은 남은 매출을 나눠 가짐
+        assert stats["arpu"] == pytest.approx(350.0 / 2000)
+        low, high = stats["arpu_ci"]
+        assert low < stats["arpu"] < high
+
+    def test_arpu_normal_approximation(self):
+        """전환이 많은 변형의 정규 근사가 구간별 Poisson과 같은 구간을 내는지 테스트"""
+        histogram = [(round(0.99 + 0.5 * j, 2), 3 + j % 7) for j in range(64)]
+        data = ExperimentData(
+            "t", ["a", "b"], [10000, 10000], [300, 300], [0.0, 0.0],
+            revenue_histograms=[histogram, histogram]
+        )
+        approx = ABAnalyzer({"seed": 1}).analyze([data])["t"]["variants"]["b"]
+        exact = ABAnalyzer({"seed": 1, "arpu_normal_min": 10 ** 9}).analyze([data])["t"]["variants"]["b"]
+
+        width = exact["arpu_ci"][1] - exact["arpu_ci"][0]
+        for a, e in zip(approx["arpu_ci"], exact["arpu_ci"]):
+            assert a == pytest.approx(e, abs=0.1 * width)
+
+    def test_portfolio_speed(self):
+        """수백 개 테스트 일괄 분석 속도 테스트"""
+        histogram = [(round(0.99 + 0.5 * j, 2), 3 + j % 7) for j in range(64)]
+        tests = [
+            ExperimentData(
+                f"t{i}", [f"t{i}_v{k}" for k in range(3)],
+                [10000, 10000, 10000], [300, 310 + i % 50, 290], [0.0, 0.0, 0.0],
+                revenue_histograms=[histogram] * 3
+            )
+            for i in range(300)
+        ]
+
+        started = time.perf_counter()
+        results = ABAnalyzer({"seed": 1}).analyze(tests)
+        elapsed = time.perf_counter() - started
+
+        assert len(results) == 300
+        assert elapsed < 1.0
+
+
+class TestBandit:
+    """밴딧 할당 테스트"""
+
+    def _bandit_test(self, manager, allocation):
+        test = manager.create_test(
+            name="보상 테스트",
+            description="밴딧",
+            game_id="game_001",
+            variants=[{"name": "A"}, {"name": "B"}, {"name": "C"}],
+            allocation=allocation
+        )
+        manager.start_test(test.test_id)
+        return test
+
+    @pytest.mark.parametrize("allocation", ["thompson", "ucb"])
+    def test_traffic_shifts_to_best(self, tmp_path, allocation):
+        """성과가 좋은 변형으로 가중치 이동 테스트"""
+        manager = ABTestManager(str(tmp_path / "ab"), bandit_config={"seed": 1, "min_weight": 0.05})
+        test = self._bandit_test(manager, allocation)
+        _fill(manager, test, [(2000, 40, 1.0), (2000, 200, 1.0), (2000, 60, 1.0)])
+
+        weights = manager.rebalance()[test.test_id]
+
+        assert sum(weights) == pytest.approx(1.0)
+        assert weights[1] == max(weights)
+        assert min(weights) >= 0.05 - 1e-9
+        assert test.weight_epoch == 1
+
+    def test_epoch_publish_is_deterministic(self, tmp_path):
+        """에포크 안에서 할당 고정, 새 에포크 테이블로 원자적 교체 테스트"""
+        data_dir = str(tmp_path / "ab")
+        manager = ABTestManager(data_dir, bandit_config={"seed": 1})
+        test = self._bandit_test(manager, "thompson")
+        users = [f"user_{i}" for i in range(1000)]
+        before = manager.assign_many(test.test_id, users)
+
+        _fill(manager, test, [(1000, 10, 1.0), (1000, 150, 1.0), (1000, 10, 1.0)])
+        assert manager.assign_many(test.test_id, users) == before
+
+        manager.rebalance()
+        table = manager._tables[test.test_id]
+        assert table.epoch == 1
+        after = manager.assign_many(test.test_id, users)
+        assert after == manager.assign_many(test.test_id, users)
+        assert sum(v is test.variants[1] for v in after) > sum(v is test.variants[1] for v in before)
+
+        # 다른 프로세스(새 인스턴스)도 같은 에포크 가중치로 할당
+        other = ABTestManager(data_dir)
+        assert [v.variant_id for v in other.assign_many(test.test_id, users)] == [v.variant_id for v in after]
+        assert other._tables[test.test_id] == table
+
+    def test_rebalance_waits_for_data_and_interval(self, tmp_path):
+        """최소 노출 수와 재계산 간격 준수 테스트"""
+        manager = ABTestManager(str(tmp_path / "ab"), bandit_config={"min_impressions": 100})
+        test = self._bandit_test(manager, "ucb")
+        _fill(manager, test, [(10, 1, 1.0), (10, 2, 1.0), (10, 1, 1.0)])
+        assert manager.rebalance() == {}
+
+        _fill(manager, test, [(100, 1, 1.0), (100, 20, 1.0), (100, 1, 1.0)])
+        assert test.test_id in manager.rebalance()
+        assert manager.rebalance() == {}
+        assert test.test_id in manager.rebalance(force=True)
+
+    def test_fixed_tests_untouched(self, tmp_path):
+        """고정 할당 테스트는 가중치 유지 테스트"""
+        manager = ABTestManager(str(tmp_path / "ab"))
+        test = _two_variant_test(manager)
+        _fill(manager, test, [(1000, 10, 1.0), (1000, 200, 1.0)])
+
+        assert manager.rebalance() == {}
+        assert [v.weight for v in test.variants] == [0.5, 0.5]
+
+
+class TestLazyLoading:
+    """인덱스 기반 지연 로딩 테스트"""
+
+    def _clone(self, manager, test, test_id, game_id):
+        """같은 정의로 ID/게임만 다른 테스트 저장 (생성 시각 ID 충돌 회피)"""
+        clone = dataclasses.replace(
+            test, test_id=test_id, game_id=game_id,
+            variants=[dataclasses.replace(v, variant_id=f"{test_id}_{v.variant_id}") for v in test.variants]
+        )
+        manager._save_test(clone)
+        return clone
+
+    def test_index_without_parsing(self, tmp_path):
+        """재시작 시 인덱스만 읽고 요청한 테스트만 파싱하는지 테스트"""
+        data_dir = str(tmp_path / "ab")
+        manager = ABTestManager(data_dir)
+        test = _two_variant_test(manager)
+        self._clone(manager, test, "test_other", "game_002")
+
+        reloaded = ABTestManager(data_dir)
+        assert reloaded.tests.stats()["cached"] == 0
+        assert [t["test_id"] for t in reloaded.list_tests(game_id="game_002")] == ["test_other"]
+        assert len(reloaded.list_tests(status="running")) == 2
+
+        assert reloaded.assign(test.test_id, "user_1") is not None
+        assert reloaded.tests.stats()["cached"] == 1
+
+    def test_lru_eviction_reloads_from_disk(self, tmp_path):
+        """용량을 넘은 테스트를 내리고 다시 요청하면 카운터와 함께 읽는지 테스트"""
+        manager = ABTestManager(str(tmp_path / "ab"), cache_size=1)
+        test = _two_variant_test(manager)
+        for i in range(30):
+            manager.assign_variant(test.test_id, f"user_{i}")
+        before = manager.assign(test.test_id, "user_0").variant_id
+
+        self._clone(manager, test, "test_other", "game_002")
+        assert manager.tests.stats()["cached"] == 1
+
+        reloaded = manager.tests[test.test_id]
+        assert reloaded is not test
+        assert sum(v.impressions for v in reloaded.variants) == 30
+        assert manager.assign(test.test_id, "user_0").variant_id == before
+
+    def test_evicted_test_table_follows_other_process(self, tmp_path):
+        """캐시에서 밀려난 테스트도 다른 프로세스의 종료/가중치 배포를 반영하는지 테스트"""
+        data_dir = str(tmp_path / "ab")
+        manager = ABTestManager(data_dir, cache_size=1)
+        test = _two_variant_test(manager)
+        other = self._clone(manager, test, "test_other", "game_002")
+        weighted = self._clone(manager, test, "test_weighted", "game_003")
+
+        assert manager.assign(test.test_id, "user_1") is not None
+        assert manager.assign(weighted.test_id, "user_1") is not None
+        manager.tests[other.test_id]  # 나머지 두 테스트를 캐시에서 밀어냄
+        assert manager.tests.stats()["cached"] == 1
+
+        worker = ABTestManager(data_dir)
+        assert worker.stop_test(test.test_id)
+        fresh = worker.tests[weighted.test_id]
+        fresh.variants[0].weight, fresh.variants[1].weight = 1.0, 0.0
+        fresh.weight_epoch += 1
+        worker._save_test(fresh)
+
+        manager.refresh()
+        assert manager.assign(test.test_id, "user_1") is None
+        assert {manager.assign(weighted.test_id, f"user_{i}").variant_id for i in range(50)} == {
+            fresh.variants[0].variant_id
+        }
+
+    def test_missing_index_rebuilt(self, tmp_path):
+        """인덱스가 지워져도 테스트 파일에서 다시 만드는지 테스트"""
+        data_dir = tmp_path / "ab"
+        manager = ABTestManager(str(data_dir))
+        test = _two_variant_test(manager)
+        manager.tests.close()
+        for path in data_dir.glob("index.db*"):
+            path.unlink()
+
+        reloaded = ABTestManager(str(data_dir))
+        assert [t["test_id"] for t in reloaded.list_tests()] == [test.test_id]
+        assert reloaded.tests.stats()["entries"] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
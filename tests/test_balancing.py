@@ -0,0 +1,357 @@
+"""
+단위 테스트 - 밸런싱
+몬테카를로 시뮬레이터, 설정 비교, 버전 저장소, 일괄 자동 패치를 검증
+"""
+
+import pytest
+import sys
+import json
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.balancing.balance_manager import BalanceManager
+from core.balancing.simulator import RunnerSimulator, Match3Simulator, ClickerSimulator
+from core.balancing.tuner import BalanceTuner
+from core.balancing.config_store import make_json_patch, apply_json_patch
+from core.balancing.auto_patcher import AutoPatcher
+from core.builder.build_queue import BuildQueue
+
+
+def _params(template_type, **overrides):
+    template = BalanceManager.DEFAULT_TEMPLATES[template_type]
+    return {**template["gameplay"], **template["economy"], **template["difficulty"], **overrides}
+
+
+class TestSimulator:
+    """러너/매치3 시뮬레이터 테스트"""
+
+    def test_runner_metrics(self):
+        """러너 지표 형식 및 생존 곡선 단조 감소 테스트"""
+        result = RunnerSimulator(_params("runner")).run(50_000, seed=1)
+
+        curve = [point["alive"] for point in result["survival_curve"]]
+        assert curve[0] == 1.0
+        assert all(a >= b for a, b in zip(curve, curve[1:]))
+        assert result["session_length"]["median"] > 0
+        assert result["coins_per_minute"] > 0
+
+    def test_runner_higher_jump_is_easier(self):
+        """점프가 높을수록 세션이 길어지는지 테스트"""
+        low = RunnerSimulator(_params("runner")).run(50_000, seed=1)
+        high = RunnerSimulator(_params("runner", jump_height=450.0)).run(50_000, seed=1)
+
+        assert high["session_length"]["median"] > low["session_length"]["median"]
+
+    def test_runner_faster_ramp_is_harder(self):
+        """속도 증가가 빠를수록 세션이 짧아지는지 테스트"""
+        slow = RunnerSimulator(_params("runner", speed_increase_rate=0.005)).run(50_000, seed=1)
+        fast = RunnerSimulator(_params("runner", speed_increase_rate=0.05, max_speed_multiplier=3.0)).run(50_000, seed=1)
+
+        assert fast["session_length"]["mean"] < slow["session_length"]["mean"]
+
+    def test_match3_target_controls_win_rate(self):
+        """목표 점수 배수가 높을수록 클리어율이 낮아지는지 테스트"""
+        easy = Match3Simulator(_params("match3")).run(50_000, seed=1)
+        hard = Match3Simulator(_params("match3", target_score_multiplier=2.0)).run(50_000, seed=1)
+
+        assert 0.0 <= hard["win_rate"] < easy["win_rate"] <= 1.0
+        assert hard["moves_used"]["mean"] > easy["moves_used"]["mean"]
+
+    def test_clicker_cost_curve(self):
+        """업그레이드 비용 배수가 클수록 프레스티지가 늦어지는지 테스트"""
+        cheap = ClickerSimulator(_params("clicker", upgrade_cost_multiplier=1.2)).run(20_000, seed=1)
+        steep = ClickerSimulator(_params("clicker", upgrade_cost_multiplier=1.8)).run(20_000, seed=1)
+
+        assert cheap["time_to_prestige"]["median"] < steep["time_to_prestige"]["median"]
+        assert cheap["prestige_rate"] == 1.0
+
+    def test_runner_throughput(self):
+        """대량 시뮬레이션 속도 테스트"""
+        started = time.perf_counter()
+        RunnerSimulator(_params("runner")).run(200_000, seed=1)
+        assert time.perf_counter() - started < 5.0
+
+
+class TestCompareConfigs:
+    """설정 비교 테스트"""
+
+    def test_compare_with_simulation(self, tmp_path):
+        """시뮬레이션 지표 비교 테스트"""
+        manager = BalanceManager(str(tmp_path / "balance"))
+        base = manager.create_config("game_a", "runner")
+        easier = manager.create_config("game_b", "runner")
+        manager.update_parameter(easier.config_id, "gameplay", "jump_height", 450.0)
+
+        result = manager.compare_configs(base.config_id, easier.config_id, simulate=True, runs=20_000, seed=3)
+
+        assert result["gameplay"]["jump_height"] == {"before": 400.0, "after": 450.0}
+        assert result["simulation"]["delta"]["median_session"] > 0
+        # 템플릿 값은 그대로 유지
+        assert BalanceManager.DEFAULT_TEMPLATES["runner"]["gameplay"]["jump_height"] == 400.0
+
+    def test_compare_clicker_with_simulation(self, tmp_path):
+        """클리커 설정 시뮬레이션 비교 테스트 (세션 길이 대신 프레스티지 지표)"""
+        manager = BalanceManager(str(tmp_path / "balance"))
+        base = manager.create_config("game_a", "clicker")
+        steeper = manager.create_config("game_b", "clicker")
+        manager.update_parameter(steeper.config_id, "economy", "upgrade_cost_multiplier", 1.8)
+
+        result = manager.compare_configs(base.config_id, steeper.config_id, simulate=True, runs=20_000, seed=3)
+
+        delta = result["simulation"]["delta"]
+        assert "median_session" not in delta
+        assert delta["median_time_to_prestige"] > 0
+        assert "prestige_rate" in delta
+
+    def test_compare_without_simulation(self, tmp_path):
+        """기본 비교는 파라미터 차이만 반환하는지 테스트"""
+        manager = BalanceManager(str(tmp_path / "balance"))
+        a = manager.create_config("game_a", "match3")
+        b = manager.create_config("game_b", "match3")
+
+        assert "simulation" not in manager.compare_configs(a.config_id, b.config_id)
+
+    def test_unsupported_game_type(self, tmp_path):
+        """시뮬레이터가 없는 게임 유형 테스트"""
+        manager = BalanceManager(str(tmp_path / "balance"))
+        config = manager.create_config("game_a")
+
+        assert "error" in manager.simulate(config.config_id, runs=1000)
+
+
+class TestTuner:
+    """자동 튜너 테스트"""
+
+    def test_tune_clicker_to_target_time(self, tmp_path):
+        """클리커 프레스티지 목표 시간에 맞춰 새 버전 생성 테스트"""
+        manager = BalanceManager(str(tmp_path / "balance"))
+        config = manager.create_config("game_a", "clicker")
+        target = config.difficulty["target_time_to_prestige"]
+
+        result = manager.tune(
+            config.config_id,
+            {"economy.upgrade_cost_multiplier": (1.05, 2.0)},
+            tuner_config={"samples": 8, "rounds": 3, "runs": 5000, "workers": 2, "seed": 7}
+        )
+
+        assert result["version"] == 2
+        assert result["evaluated"] == 24
+        best = result["best"]["metrics"]["time_to_prestige"]["median"]
+        assert abs(best - target) / target < 0.1
+
+        # 새 버전이 저장되고 다시 로드됨
+        reloaded = BalanceManager(str(tmp_path / "balance")).configs[config.config_id]
+        assert reloaded.version == 2
+        assert reloaded.economy["upgrade_cost_multiplier"] == result["best"]["params"]["economy.upgrade_cost_multiplier"]
+
+    def test_grid_search(self, tmp_path):
+        """그리드 탐색 후보 수 및 정수 파라미터 테스트"""
+        manager = BalanceManager(str(tmp_path / "balance"))
+        config = manager.create_config("game_a", "runner")
+
+        result = BalanceTuner({"strategy": "grid", "grid_points": 3, "runs": 5000, "workers": 1, "seed": 1}).tune(
+            config,
+            {"gameplay.obstacle_gap_min": (200, 400), "gameplay.jump_height": [380.0, 450.0]},
+            {"session_length.median": 60}
+        )
+
+        assert result["evaluated"] == 6
+        assert isinstance(result["best"]["params"]["gameplay.obstacle_gap_min"], int)
+        assert result["trials"] == sorted(result["trials"], key=lambda t: t["loss"])
+
+    def test_invalid_space(self, tmp_path):
+        """잘못된 파라미터 경로 테스트"""
+        manager = BalanceManager(str(tmp_path / "balance"))
+        config = manager.create_config("game_a", "runner")
+
+        result = manager.tune(config.config_id, {"jump_height": (300, 500)}, {"session_length.median": 60})
+        assert "error" in result
+        assert manager.configs[config.config_id].version == 1
+
+
+class TestConfigStore:
+    """버전 저장소/ETag 서빙 테스트"""
+
+    def test_versions_are_kept(self, tmp_path):
+        """모든 버전이 내용 해시와 함께 보관되는지 테스트"""
+        manager = BalanceManager(str(tmp_path))
+        config = manager.create_config("game_a", "runner")
+        manager.update_parameter(config.config_id, "gameplay", "jump_height", 500.0)
+
+        versions = manager.list_versions(config.config_id)
+        assert [v["version"] for v in versions] == [1, 2]
+        assert versions[0]["hash"] != versions[1]["hash"]
+        assert manager.get_config_version(config.config_id, 1)["gameplay"]["jump_height"] == 400.0
+        assert manager.get_config_version(config.config_id, 2)["gameplay"]["jump_height"] == 500.0
+
+    def test_etag_and_not_modified(self, tmp_path):
+        """같은 ETag면 304, 새 퍼블리시 후에는 200인지 테스트"""
+        manager = BalanceManager(str(tmp_path))
+        config = manager.create_config("game_a", "runner")
+        manager.publish_config(config.config_id)
+
+        first = manager.serve_published_config("game_a")
+        assert first["status"] == 200
+        assert json.loads(first["body"]) == manager.get_published_config("game_a")
+        assert manager.serve_published_config("game_a", first["etag"])["status"] == 304
+
+        manager.update_parameter(config.config_id, "economy", "coin_value", 3)
+        manager.publish_config(config.config_id)
+        second = manager.serve_published_config("game_a", first["etag"])
+        assert second["status"] == 200
+        assert second["etag"] != first["etag"]
+
+    def test_delta_from_old_version(self, tmp_path):
+        """가진 버전에서 JSON Patch를 적용하면 현재 설정이 되는지 테스트"""
+        manager = BalanceManager(str(tmp_path))
+        config = manager.create_config("game_a", "runner")
+        manager.publish_config(config.config_id)
+        old = manager.serve_published_config("game_a")
+
+        manager.update_parameter(config.config_id, "gameplay", "jump_height", 450.0)
+        manager.publish_config(config.config_id)
+        delta = manager.serve_published_config("game_a", old["etag"], delta=True)
+
+        assert delta["content_type"] == "application/json-patch+json"
+        patched = apply_json_patch(json.loads(old["body"]), json.loads(delta["body"]))
+        assert patched == manager.get_published_config("game_a")
+
+        unknown = manager.serve_published_config("game_a", '"unknown"', delta=True)
+        assert unknown["content_type"] == "application/json"
+
+    def test_publish_from_other_process_is_served(self, tmp_path):
+        """다른 프로세스가 퍼블리시한 설정을 오래 실행 중인 매니저가 바로 서빙하는지 테스트"""
+        dashboard = BalanceManager(str(tmp_path))
+        cli = BalanceManager(str(tmp_path))
+        config = cli.create_config("game_a", "runner")
+        cli.publish_config(config.config_id)
+        first = dashboard.serve_published_config("game_a")
+
+        cli.update_parameter(config.config_id, "gameplay", "player_speed", 450.0)
+        cli.publish_config(config.config_id)
+        second = dashboard.serve_published_config("game_a", first["etag"])
+
+        assert second["status"] == 200
+        assert dashboard.get_published_config("game_a")["gameplay"]["player_speed"] == 450.0
+        assert dashboard.serve_published_config("game_a", second["etag"])["status"] == 304
+
+    def test_published_survives_restart(self, tmp_path):
+        """재시작 후에도 같은 ETag로 서빙되는지 테스트"""
+        manager = BalanceManager(str(tmp_path))
+        config = manager.create_config("game_a", "match3")
+        manager.publish_config(config.config_id)
+        etag = manager.serve_published_config("game_a")["etag"]
+
+        reloaded = BalanceManager(str(tmp_path))
+        assert reloaded.serve_published_config("game_a", etag)["status"] == 304
+        assert reloaded.serve_published_config("game_b")["status"] == 404
+        assert len(reloaded.configs) == 1
+
+    def test_json_patch_escaping(self):
+        """키에 / 와 ~ 가 있어도 패치가 맞는지 테스트"""
+        old = {"a/b": 1, "c~d": {"x": [1, 2]}, "gone": True}
+        new = {"a/b": 2, "c~d": {"x": [1, 2, 3]}, "added": None}
+        assert apply_json_patch(old, make_json_patch(old, new)) == new
+
+
+class TestLazyLoading:
+    """인덱스 기반 지연 로딩 테스트"""
+
+    def test_index_and_lru(self, tmp_path):
+        """인덱스로 게임별 목록 조회, 용량 초과 설정은 다시 읽는지 테스트"""
+        manager = BalanceManager(str(tmp_path), cache_size=1)
+        runner = manager.create_config("game_a", "runner")
+        manager.update_parameter(runner.config_id, "gameplay", "jump_height", 480.0)
+
+        reloaded = BalanceManager(str(tmp_path), cache_size=1)
+        assert reloaded.configs.stats()["cached"] == 0
+        assert reloaded.list_configs("game_a") == [{
+            "config_id": runner.config_id, "game_id": "game_a", "version": 2,
+            "published": False, "file": f"config_{runner.config_id}.json"
+        }]
+        assert reloaded.list_configs("game_b") == []
+        assert reloaded.configs[runner.config_id].gameplay["jump_height"] == 480.0
+
+    def test_legacy_directory_indexed(self, tmp_path):
+        """인덱스 없는 기존 디렉토리를 한 번 훑어 인덱스를 만드는지 테스트"""
+        manager = BalanceManager(str(tmp_path))
+        config = manager.create_config("game_a", "match3")
+        manager.configs.close()
+        for path in tmp_path.glob("index.db*"):
+            path.unlink()
+
+        reloaded = BalanceManager(str(tmp_path))
+        assert config.config_id in reloaded.configs
+        assert reloaded.configs.stats()["entries"] == 1
+
+
+class TestAutoPatcher:
+    """일괄 자동 패치 테스트"""
+
+    def _games(self, tmp_path):
+        games = {
+            "runner/hard": {"game_title": "Hard", "difficulty": {"level": 1.0}},
+            "runner/floor": {"game_title": "Floor", "difficulty": {"level": 0.5}},
+            "match3/slow": {"game_title": "Slow", "game_config": {"game_speed": 1.0}},
+        }
+        for game_id, gdd in games.items():
+            path = tmp_path / "games" / game_id
+            path.mkdir(parents=True)
+            (path / "gdd.json").write_text(json.dumps(gdd), encoding="utf-8")
+        return tmp_path / "games"
+
+    def test_patch_many_summary(self, tmp_path):
+        """변경/무변경/누락 분류 및 원자적 저장 테스트"""
+        games_dir = self._games(tmp_path)
+        patcher = AutoPatcher(str(games_dir))
+
+        summary = patcher.patch_many({
+            "runner/hard": {"difficulty": 0.9},
+            "runner/floor": {"difficulty": 0.9},   # 이미 최저 난이도
+            "match3/slow": {"boredom": 0.1},       # 기준 미달
+            "ghost": {"boredom": 0.9},
+        })
+
+        assert summary["patched"] == ["runner/hard"]
+        assert sorted(summary["unchanged"]) == ["match3/slow", "runner/floor"]
+        assert summary["missing"] == ["ghost"]
+        assert summary["changes"]["runner/hard"] == {"difficulty": 0.8}
+
+        hard = json.loads((games_dir / "runner/hard/gdd.json").read_text(encoding="utf-8"))
+        assert hard["difficulty"]["level"] == 0.8
+        assert "last_patched" not in json.loads((games_dir / "runner/floor/gdd.json").read_text(encoding="utf-8"))
+        assert not list(games_dir.rglob("*.tmp"))
+        assert json.loads((games_dir / "gdd_index.json").read_text(encoding="utf-8"))["match3/slow"] == "match3/slow/gdd.json"
+
+    def test_index_picks_up_new_games(self, tmp_path):
+        """인덱스에 없는 게임은 다시 스캔해서 찾는지 테스트"""
+        games_dir = self._games(tmp_path)
+        patcher = AutoPatcher(str(games_dir))
+        patcher.rebuild_index()
+
+        (games_dir / "clicker/new").mkdir(parents=True)
+        (games_dir / "clicker/new/gdd.json").write_text(json.dumps({"game_title": "New"}), encoding="utf-8")
+
+        summary = patcher.patch_many({"clicker/new": {"boredom": 0.9}})
+        assert summary["patched"] == ["clicker/new"]
+
+    def test_rebuild_only_changed(self, tmp_path):
+        """설정이 바뀐 게임만 빌드 큐에 제출하는지 테스트"""
+        games_dir = self._games(tmp_path)
+        queue = BuildQueue(str(tmp_path / "queue.db"))
+
+        summary = AutoPatcher(str(games_dir)).patch_many(
+            {"runner/hard": {"difficulty": 0.9}, "runner/floor": {"difficulty": 0.9}},
+            rebuild=True, build_queue=queue, platforms=["html5"], output_dir=str(tmp_path / "builds")
+        )
+
+        assert list(summary["builds"]) == ["runner/hard"]
+        job = queue.get(summary["builds"]["runner/hard"][0])
+        assert job.target == "html5"
+        assert job.project_path == str((games_dir / "runner/hard").resolve())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,634 @@
+"""
+단위 테스트 - Godot 빌더
+가짜 godot 실행 파일로 헤드리스 빌드 흐름을 검증
+"""
+
+import pytest
+import os
+import sys
+import time
+import stat
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.builder.godot_builder import GodotBuilder
+from core.builder.build_queue import BuildQueue, BuildWorkerPool
+from core.builder.project_materializer import ProjectMaterializer
+from core.builder.godot_daemon import GodotEditorDaemon, GodotDaemonError
+from core.builder.artifact_store import ArtifactStore
+from core.builder.process_runner import ProcessRunner, GodotProgressParser
+
+
+FAKE_GODOT = """#!{python}
+import sys
+from pathlib import Path
+
+args = sys.argv[1:]
+print("fake godot", " ".join(args))
+if "--export-release" in args:
+    for percent, step in [(0, "savepack"), (50, "savepack"), (100, "savepack")]:
+        print("[ %3d%% ] %s | Storing File: res://main.tscn" % (percent, step), flush=True)
+    output = args[args.index("--export-release") + 2]
+    if "Broken" in args:
+        print("export failed", file=sys.stderr)
+        sys.exit(1)
+    Path(output).write_text("build", encoding="utf-8")
+"""
+
+# 데몬 플러그인 프로토콜을 흉내내는 가짜 에디터
+FAKE_DAEMON = """#!{python}
+import os, sys, json, socket
+from pathlib import Path
+
+port = int(os.environ["PIPELINE_DAEMON_PORT"])
+log = Path(sys.argv[sys.argv.index("--path") + 1]) / "daemon_requests.log"
+server = socket.socket()
+server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+server.bind(("127.0.0.1", port))
+server.listen()
+while True:
+    conn, _ = server.accept()
+    reader = conn.makefile("rb")
+    for line in reader:
+        request = json.loads(line)
+        with open(log, "a") as f:
+            f.write(request["cmd"] + "\\n")
+        response = {{"ok": True, "message": request["cmd"]}}
+        conn.sendall((json.dumps(response) + "\\n").encode())
+        if request["cmd"] == "quit":
+            sys.exit(0)
+"""
+
+
+def _write_executable(path: Path, content: str) -> str:
+    path.write_text(content.format(python=sys.executable), encoding="utf-8")
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return str(path)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="셸 스크립트 실행 파일 필요")
+class TestGodotBuilder:
+    """Godot 빌더 테스트"""
+
+    @pytest.fixture
+    def fake_godot(self, tmp_path):
+        return _write_executable(tmp_path / "fake_godot", FAKE_GODOT)
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+        (project_dir / "project.godot").write_text('run/main_scene="res://main.tscn"', encoding="utf-8")
+        return str(project_dir)
+
+    def test_build_all_targets_parallel(self, fake_godot, project, tmp_path):
+        """모든 타겟 동시 빌드 테스트"""
+        builder = GodotBuilder({
+            "godot_path": fake_godot,
+            "export_targets": ["android", "html5", "windows"],
+            "max_parallel_exports": 3
+        })
+        output_dir = tmp_path / "builds"
+
+        results = builder.build_all_targets(project, str(output_dir))
+
+        assert [r[0] for r in results] == ["android", "html5", "windows"]
+        assert all(r[1] for r in results), results
+
+        for target, report in builder.last_build_report.items():
+            assert Path(report["output_path"]).exists()
+            assert "fake godot" in Path(report["log_path"]).read_text(encoding="utf-8")
+            assert report["duration"] >= 0
+
+        # 격리된 작업 복사본은 정리되어야 함
+        assert not any((output_dir / ".work").iterdir())
+
+    def test_same_target_builds_do_not_collide(self, fake_godot, project, tmp_path):
+        """같은 타겟을 같은 초에 동시 빌드해도 작업 복사본/출력이 겹치지 않는지 테스트"""
+        builder = GodotBuilder({"godot_path": fake_godot})
+        output_dir = tmp_path / "builds"
+        blocker = output_dir / ".work" / "html5_job_b"
+        blocker.mkdir(parents=True)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(
+                lambda job_id: builder.build_target(project, str(output_dir), "html5", build_id=job_id),
+                ["job_a", None]
+            ))
+        # 다른 빌드가 쓰는 작업 디렉토리는 지우지 않고 실패
+        blocked = builder.build_target(project, str(output_dir), "html5", build_id="job_b")
+
+        assert all(r[1] for r in results), results
+        outputs = sorted(p.name for p in (output_dir / "html5").glob("*.html"))
+        assert len(outputs) == 2 and "game_job_a.html" in outputs
+        assert not blocked[1]
+        assert blocker.exists()
+
+    def test_unknown_target_reported(self, fake_godot, project, tmp_path):
+        """알 수 없는 타겟 결과 테스트"""
+        builder = GodotBuilder({
+            "godot_path": fake_godot,
+            "export_targets": ["html5", "ps5"]
+        })
+
+        results = builder.build_all_targets(project, str(tmp_path / "builds"))
+
+        assert results[0][1] is True
+        assert results[1] == ("ps5", False, "알 수 없는 타겟: ps5")
+
+    def test_export_failure_uses_log_tail(self, fake_godot, project, tmp_path):
+        """빌드 실패 시 로그 내용 반환 테스트"""
+        builder = GodotBuilder({"godot_path": fake_godot})
+        output_path = str(tmp_path / "out" / "game.html")
+
+        success, msg = builder.export_game(project, "Broken", output_path)
+
+        assert not success
+        assert "export failed" in msg
+        assert Path(output_path).with_suffix(".log").exists()
+
+    def test_max_parallel_exports(self):
+        """동시 내보내기 수 계산 테스트"""
+        builder = GodotBuilder({"max_parallel_exports": 8})
+        assert builder._max_parallel_exports(3) == 3
+        assert builder._max_parallel_exports(1) == 1
+
+        auto = GodotBuilder({})
+        assert 1 <= auto._max_parallel_exports(3) <= 3
+
+
+# 자식 프로세스를 남기고 멈추는 가짜 명령 (타임아웃 테스트)
+# 파이프를 닫고 계속 실행되는 프로세스
+DETACHED_PROCESS = """#!{python}
+import os, time
+os.close(1)
+os.close(2)
+time.sleep(60)
+"""
+
+# PID를 기록하고 끝나지 않는 가짜 godot
+SLOW_GODOT = """#!{python}
+import os, sys, time
+from pathlib import Path
+
+Path(sys.argv[0] + ".pid").write_text(str(os.getpid()))
+time.sleep(60)
+"""
+
+
+def _wait_until_gone(pid: int, timeout: float = 10) -> bool:
+    """프로세스 종료 대기 (init에 수거되기 전 고아 좀비도 종료로 취급)"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        try:
+            if Path(f"/proc/{pid}/stat").read_text().split()[2] == "Z":
+                return True
+        except OSError:
+            return True
+        time.sleep(0.1)
+    return False
+
+
+HANGING_PROCESS = """#!{python}
+import subprocess, sys, time
+child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+print(child.pid, flush=True)
+time.sleep(60)
+"""
+
+SPLIT_UTF8_PROCESS = """#!{python}
+import sys, time
+data = "경로: res://한글.tscn\\n".encode("utf-8")
+cut = data.index("한".encode("utf-8")) + 1
+sys.stdout.buffer.write(data[:cut])
+sys.stdout.buffer.flush()
+time.sleep(0.3)
+sys.stdout.buffer.write(data[cut:])
+sys.stdout.buffer.flush()
+"""
+
+
+
+@pytest.mark.skipif(os.name == "nt", reason="셸 스크립트 실행 파일 필요")
+class TestProcessRunner:
+    """스트리밍 실행기 테스트"""
+
+    def test_streams_lines_and_progress(self, tmp_path):
+        """줄 단위 전달, 진행률 해석, 로그 기록 테스트"""
+        fake_godot = _write_executable(tmp_path / "fake_godot", FAKE_GODOT)
+        output = tmp_path / "game.apk"
+        log_path = tmp_path / "export.log"
+        lines, events = [], []
+
+        runner = ProcessRunner(
+            GodotProgressParser(),
+            timeout=30,
+            on_line=lambda stream, line: lines.append((stream, line)),
+            on_progress=events.append
+        )
+        result = runner.run(
+            [fake_godot, "--headless", "--export-release", "Android", str(output)],
+            log_path=str(log_path)
+        )
+
+        assert result.success
+        assert [e.percent for e in events] == [0.0, 50.0, 100.0]
+        assert events[0].step == "savepack"
+        assert lines[0] == ("stdout", lines[0][1]) and lines[0][1].startswith("fake godot")
+        assert "Storing File" in log_path.read_text(encoding="utf-8")
+
+    def test_multibyte_split_across_chunks(self, tmp_path):
+        """청크 경계에서 잘린 한글이 깨지지 않는지 테스트"""
+        script = _write_executable(tmp_path / "split", SPLIT_UTF8_PROCESS)
+        lines = []
+
+        result = ProcessRunner(
+            timeout=30,
+            on_line=lambda stream, line: lines.append(line)
+        ).run([script])
+
+        assert result.success
+        assert lines == ["경로: res://한글.tscn"]
+
+    def test_timeout_kills_process_group(self, tmp_path):
+        """타임아웃 시 자식 프로세스까지 종료되는지 테스트"""
+        script = _write_executable(tmp_path / "hang", HANGING_PROCESS)
+
+        started = time.monotonic()
+        result = ProcessRunner(timeout=1.0, kill_grace=1.0).run([script])
+
+        assert result.timed_out
+        assert not result.success
+        assert time.monotonic() - started < 10
+
+        child_pid = int(result.tail[0])
+        assert _wait_until_gone(child_pid, timeout=5), "자식 프로세스가 종료되지 않음"
+
+    def test_timeout_covers_process_wait(self, tmp_path):
+        """출력 파이프를 닫고 계속 실행되는 프로세스도 타임아웃되는지 테스트"""
+        script = _write_executable(tmp_path / "detached", DETACHED_PROCESS)
+
+        started = time.monotonic()
+        result = ProcessRunner(timeout=1.0, kill_grace=1.0).run([script])
+
+        assert result.timed_out
+        assert time.monotonic() - started < 10
+
+
+class TestBuildQueue:
+    """빌드 큐 테스트"""
+
+    @pytest.fixture
+    def queue(self, tmp_path):
+        return BuildQueue(str(tmp_path / "queue.db"))
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+        (project_dir / "project.godot").write_text('run/main_scene="res://main.tscn"', encoding="utf-8")
+        return str(project_dir)
+
+    def test_dedup_identical_jobs(self, queue, project, tmp_path):
+        """동일 (프로젝트 해시, 타겟) 작업 중복 제거 테스트"""
+        first = queue.submit(project, "html5", str(tmp_path / "builds"))
+        second = queue.submit(project, "html5", str(tmp_path / "builds"), priority=5)
+        other = queue.submit(project, "android", str(tmp_path / "builds"))
+
+        assert first.job_id == second.job_id
+        assert second.priority == 5
+        assert other.job_id != first.job_id
+        assert queue.stats() == {"queued": 2}
+
+    def test_priority_order(self, queue, project, tmp_path):
+        """우선순위 순서 처리 테스트"""
+        low = queue.submit(project, "html5", str(tmp_path / "builds"), priority=1)
+        high = queue.submit(project, "android", str(tmp_path / "builds"), priority=9)
+
+        assert queue.claim_next(os.getpid()).job_id == high.job_id
+        assert queue.claim_next(os.getpid()).job_id == low.job_id
+        assert queue.claim_next(os.getpid()) is None
+
+    def test_cancel_queued_job(self, queue, project, tmp_path):
+        """대기 작업 취소 테스트"""
+        job = queue.submit(project, "html5", str(tmp_path / "builds"))
+
+        assert queue.cancel(job.job_id)
+        assert queue.get(job.job_id).status == "cancelled"
+        assert queue.claim_next(os.getpid()) is None
+
+        # 취소된 작업은 중복 제거 대상이 아님
+        again = queue.submit(project, "html5", str(tmp_path / "builds"))
+        assert again.job_id != job.job_id
+
+    def test_requeue_orphaned(self, queue, project, tmp_path):
+        """죽은 워커의 작업 재대기 테스트"""
+        job = queue.submit(project, "html5", str(tmp_path / "builds"))
+        queue.claim_next(worker_pid=2 ** 22 + 12345)
+
+        assert queue.requeue_orphaned() == 1
+        assert queue.get(job.job_id).status == "queued"
+
+    @pytest.mark.skipif(os.name == "nt", reason="셸 스크립트 실행 파일 필요")
+    def test_worker_pool_runs_jobs(self, queue, project, tmp_path):
+        """워커 풀 빌드 처리 테스트"""
+        fake_godot = _write_executable(tmp_path / "fake_godot", FAKE_GODOT)
+
+        jobs = queue.submit_project(project, ["android", "html5"], str(tmp_path / "builds"))
+
+        pool = BuildWorkerPool(
+            str(queue.db_path), {"godot_path": fake_godot}, workers=2, poll_interval=0.1
+        )
+        pool.start()
+        try:
+            assert pool.wait_idle(timeout=30)
+        finally:
+            pool.stop()
+
+        for job in jobs:
+            done = queue.get(job.job_id)
+            assert done.status == "succeeded", done.message
+            assert Path(done.report["output_path"]).exists()
+            assert done.progress == 100.0
+            assert done.progress_message.startswith("savepack")
+
+    @pytest.mark.skipif(os.name == "nt", reason="셸 스크립트 실행 파일 필요")
+    def test_cancel_running_job_kills_godot(self, queue, project, tmp_path):
+        """실행 중인 작업 취소 시 Godot 프로세스까지 종료되는지 테스트"""
+        slow_godot = _write_executable(tmp_path / "slow_godot", SLOW_GODOT)
+        pid_file = Path(slow_godot + ".pid")
+        job = queue.submit(project, "html5", str(tmp_path / "builds"))
+
+        pool = BuildWorkerPool(
+            str(queue.db_path), {"godot_path": slow_godot}, workers=1, poll_interval=0.1
+        )
+        pool.start()
+        try:
+            deadline = time.monotonic() + 30
+            while not pid_file.exists() and time.monotonic() < deadline:
+                time.sleep(0.1)
+            assert pid_file.exists(), "가짜 godot이 시작되지 않음"
+            godot_pid = int(pid_file.read_text())
+
+            assert queue.cancel(job.job_id)
+            assert pool.wait_idle(timeout=30)
+        finally:
+            pool.stop()
+
+        assert queue.get(job.job_id).status == "cancelled"
+        assert _wait_until_gone(godot_pid), "취소 후에도 Godot 프로세스가 남아 있음"
+
+
+class TestProjectMaterializer:
+    """프로젝트 구체화 테스트"""
+
+    @pytest.fixture
+    def template(self, tmp_path):
+        template_dir = tmp_path / "template_runner"
+        (template_dir / "scripts").mkdir(parents=True)
+        (template_dir / "skins" / "default").mkdir(parents=True)
+        (template_dir / "project.godot").write_text("[application]", encoding="utf-8")
+        (template_dir / "scripts" / "player.gd").write_text("extends Node", encoding="utf-8")
+        (template_dir / "skins" / "default" / "config.tres").write_text("skin", encoding="utf-8")
+        return template_dir
+
+    def test_immutable_files_shared(self, template, tmp_path):
+        """불변 파일 공유 / 수정 대상 파일 복사 테스트"""
+        materializer = ProjectMaterializer(method="hardlink")
+        dest = tmp_path / "game"
+
+        manifest = materializer.materialize(str(template), str(dest))
+
+        assert "scripts/player.gd" in manifest.linked
+        assert "project.godot" in manifest.copied
+        assert "skins/default/config.tres" in manifest.copied
+        if manifest.method == "hardlink":
+            assert (dest / "scripts" / "player.gd").stat().st_ino == \
+                (template / "scripts" / "player.gd").stat().st_ino
+        assert (dest / "project.godot").stat().st_ino != (template / "project.godot").stat().st_ino
+
+    def test_diff_and_reset(self, template, tmp_path):
+        """변경 파일 추적 및 복원 테스트"""
+        materializer = ProjectMaterializer()
+        dest = tmp_path / "game"
+        materializer.materialize(str(template), str(dest))
+
+        assert materializer.diff(str(dest)) == {"modified": [], "missing": []}
+
+        (dest / "project.godot").write_text("[application]\nchanged=true", encoding="utf-8")
+        assert materializer.diff(str(dest))["modified"] == ["project.godot"]
+
+        assert materializer.reset(str(dest)) == ["project.godot"]
+        assert (dest / "project.godot").read_text(encoding="utf-8") == "[application]"
+
+    def test_auto_never_hardlinks(self, template, tmp_path):
+        """기본 방식은 하드링크를 쓰지 않아 제자리 수정이 템플릿에 번지지 않는지 테스트"""
+        materializer = ProjectMaterializer()
+        dest = tmp_path / "game"
+        manifest = materializer.materialize(str(template), str(dest))
+
+        assert manifest.method in ("reflink", "copy")
+        with open(dest / "scripts" / "player.gd", "r+", encoding="utf-8") as f:
+            f.write("extends Area2D")
+
+        assert (template / "scripts" / "player.gd").read_text(encoding="utf-8") == "extends Node"
+        assert materializer.diff(str(dest))["modified"] == ["scripts/player.gd"]
+
+    def test_diff_detects_shared_file_edits(self, template, tmp_path):
+        """하드링크 파일 제자리 수정도 diff에 나타나고 reset이 링크를 끊는지 테스트"""
+        materializer = ProjectMaterializer(method="hardlink")
+        dest = tmp_path / "game"
+        manifest = materializer.materialize(str(template), str(dest))
+        if manifest.method != "hardlink":
+            pytest.skip("하드링크 미지원 파일시스템")
+
+        (template / "scripts" / "player.gd").write_text("extends Node3D", encoding="utf-8")
+        assert materializer.diff(str(dest))["modified"] == ["scripts/player.gd"]
+
+        materializer.reset(str(dest))
+        (dest / "scripts" / "player.gd").write_text("extends Node2D", encoding="utf-8")
+        assert (template / "scripts" / "player.gd").read_text(encoding="utf-8") == "extends Node3D"
+
+    def test_make_private_protects_template(self, template, tmp_path):
+        """공유 파일 수정 전 링크 분리 테스트"""
+        materializer = ProjectMaterializer(method="hardlink")
+        dest = tmp_path / "game"
+        materializer.materialize(str(template), str(dest))
+
+        assert materializer.make_private(str(dest), "scripts/player.gd")
+        (dest / "scripts" / "player.gd").write_text("extends Node2D", encoding="utf-8")
+
+        assert (template / "scripts" / "player.gd").read_text(encoding="utf-8") == "extends Node"
+        assert "scripts/player.gd" in materializer.diff(str(dest))["modified"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="셸 스크립트 실행 파일 필요")
+class TestGodotEditorDaemon:
+    """상주 에디터 데몬 테스트"""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+        (project_dir / "project.godot").write_text("config_version=5\n", encoding="utf-8")
+        return project_dir
+
+    def test_daemon_commands(self, project, tmp_path):
+        """데몬 시작/명령/종료 테스트"""
+        fake = _write_executable(tmp_path / "fake_daemon", FAKE_DAEMON)
+        daemon = GodotEditorDaemon(fake, str(project), startup_timeout=10)
+
+        daemon.start()
+        try:
+            assert daemon.is_running()
+            assert daemon.reimport([str(project / "icon.png")]) == "reimport"
+        finally:
+            daemon.stop()
+
+        assert not daemon.is_running()
+        assert "pipeline_build_daemon/plugin.cfg" in (project / "project.godot").read_text(encoding="utf-8")
+        assert (project / "addons" / "pipeline_build_daemon" / "plugin.gd").exists()
+
+    def test_addon_excluded_from_exports(self, project, tmp_path):
+        """데몬 플러그인이 내보내기 프리셋에서 제외되는지 테스트"""
+        (project / "export_presets.cfg").write_text(
+            '[preset.0]\n\nname="Web"\nexclude_filter=""\n\n'
+            '[preset.1]\n\nname="Android"\nexclude_filter="*.psd"\n',
+            encoding="utf-8"
+        )
+        fake = _write_executable(tmp_path / "fake_daemon", FAKE_DAEMON)
+        for _ in range(2):
+            daemon = GodotEditorDaemon(fake, str(project), startup_timeout=10)
+            daemon.start()
+            daemon.stop()
+
+        text = (project / "export_presets.cfg").read_text(encoding="utf-8")
+        assert 'exclude_filter="addons/pipeline_build_daemon/*"' in text
+        assert 'exclude_filter="*.psd, addons/pipeline_build_daemon/*"' in text
+
+    def test_missing_project_file(self, tmp_path):
+        """project.godot이 없으면 데몬을 시작하지 않는지 테스트"""
+        fake = _write_executable(tmp_path / "fake_daemon", FAKE_DAEMON)
+        with pytest.raises(GodotDaemonError):
+            GodotEditorDaemon(fake, str(tmp_path), startup_timeout=10).start()
+
+    def test_builder_uses_daemon(self, project, tmp_path):
+        """빌더 임포트가 데몬을 재사용하는지 테스트"""
+        fake = _write_executable(tmp_path / "fake_daemon", FAKE_DAEMON)
+        builder = GodotBuilder({"godot_path": fake, "use_editor_daemon": True})
+
+        try:
+            assert builder.import_assets(str(project)) == (True, "에셋 임포트 완료 (데몬)")
+            assert builder.import_assets(str(project))[0]
+        finally:
+            builder.shutdown_daemons()
+
+        requests = (project / "daemon_requests.log").read_text(encoding="utf-8").split()
+        assert requests.count("ping") == 1
+        assert requests.count("scan") == 2
+
+    def test_queue_build_skips_daemon_on_work_copy(self, project, tmp_path):
+        """격리 복사본 빌드는 데몬을 띄우지 않고 단발 임포트하는지 테스트"""
+        fake = _write_executable(tmp_path / "fake_godot", FAKE_GODOT)
+        builder = GodotBuilder({"godot_path": fake, "use_editor_daemon": True})
+        started = []
+        builder.daemons.get = lambda path: started.append(path)
+
+        _, success, msg = builder.build_target(str(project), str(tmp_path / "builds"), "html5")
+
+        assert success, msg
+        assert started == []
+
+    def test_builder_falls_back_to_one_shot(self, project, tmp_path):
+        """데몬 시작 실패 시 단발 실행 대체 테스트"""
+        fake = _write_executable(tmp_path / "fake_godot", FAKE_GODOT)
+        builder = GodotBuilder({"godot_path": fake, "use_editor_daemon": True})
+
+        success, msg = builder.import_assets(str(project))
+
+        assert success
+        assert msg == "에셋 임포트 완료"
+
+
+class TestArtifactStore:
+    """빌드 아티팩트 저장소 테스트"""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return ArtifactStore(str(tmp_path / "artifacts"), chunk_size=1024)
+
+    def _write_html5_build(self, directory: Path, stem: str, pck: bytes) -> str:
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"{stem}.html").write_text("<html></html>", encoding="utf-8")
+        (directory / f"{stem}.wasm").write_bytes(bytes(range(256)) * 64)  # 엔진: 빌드 간 동일
+        (directory / f"{stem}.pck").write_bytes(pck)
+        (directory / f"{stem}.log").write_text("log", encoding="utf-8")
+        return str(directory / f"{stem}.html")
+
+    def test_dedup_across_builds(self, store, tmp_path):
+        """빌드 간 동일 파일 청크 공유 테스트"""
+        out = tmp_path / "builds" / "html5"
+        first = store.add_build_output("game_001", "html5", self._write_html5_build(out, "game_1", b"a" * 4096))
+        second = store.add_build_output("game_001", "html5", self._write_html5_build(out, "game_2", b"b" * 4096))
+
+        assert [f["path"] for f in store.list_files(first.build_id)] == \
+            ["game_1.html", "game_1.pck", "game_1.wasm"]
+
+        stats = store.stats()
+        assert stats["logical_bytes"] == first.total_size + second.total_size
+        assert stats["stored_bytes"] < first.total_size
+        assert stats["dedup_ratio"] > 2
+
+    def test_latest_successful_and_restore(self, store, tmp_path):
+        """최신 성공 빌드 조회 및 복원 테스트"""
+        out = tmp_path / "builds" / "html5"
+        good = store.add_build_output("game_001", "html5", self._write_html5_build(out, "game_1", b"x" * 3000))
+        store.add_build("game_001", "html5", [], success=False)
+
+        latest = store.latest("game_001", "html5")
+        assert latest.build_id == good.build_id
+        assert store.latest("game_002") is None
+
+        restored = store.restore(latest.build_id, str(tmp_path / "deploy"))
+        for path in restored:
+            assert Path(path).read_bytes() == (out / Path(path).name).read_bytes()
+
+        assert store.find_by_content(good.content_hash)[0].build_id == good.build_id
+
+    def test_remove_originals_after_ingest(self, store, tmp_path):
+        """저장 후 원본 출력 삭제 (로그 유지) 및 복원 테스트"""
+        out = tmp_path / "builds" / "html5"
+        output = self._write_html5_build(out, "game_1", b"p" * 3000)
+        originals = {p.name: p.read_bytes() for p in out.iterdir() if p.suffix != ".log"}
+
+        record = store.add_build_output("game_001", "html5", output, remove_originals=True)
+
+        assert sorted(p.name for p in out.iterdir()) == ["game_1.log"]
+        restored = store.restore(record.build_id, str(tmp_path / "deploy"))
+        assert {Path(p).name: Path(p).read_bytes() for p in restored} == originals
+
+    def test_retention_frees_chunks(self, store, tmp_path):
+        """보존 정책 적용 후 청크 정리 테스트"""
+        out = tmp_path / "builds" / "html5"
+        for i in range(4):
+            store.add_build_output(
+                "game_001", "html5", self._write_html5_build(out, f"game_{i}", os.urandom(2048))
+            )
+        newest = store.latest("game_001", "html5")
+
+        result = store.apply_retention(keep_last=1)
+
+        assert result["builds_removed"] == 3
+        assert result["chunks_removed"] > 0
+        assert [b.build_id for b in store.list_builds("game_001")] == [newest.build_id]
+        assert store.restore(newest.build_id, str(tmp_path / "deploy"))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,670 @@
+"""
+단위 테스트 - 캐시
+메모리 캐시 LRU/TTL 동작, 통계, 캐싱 데코레이터, 키 생성과 태그 무효화, 2단 캐시와 코덱,
+로컬 Redis 대체 구현(FakeRedis/RESP 서버) 위의 RedisCache와 벤치마크를 검증
+"""
+
+import pytest
+import sys
+import time
+import asyncio
+import threading
+from datetime import datetime
+from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.cache import cache_manager
+from core.cache.cache_manager import MemoryCache, RedisCache, CacheManager, build_key, estimate_size
+from core.cache.tiered_cache import TieredCache, DiskCache
+from core.cache import codec
+from core.cache.fake_redis import FakeRedis, RespServer, ResponseError
+from core.cache.benchmark import run_benchmark, make_gdd, OPERATIONS
+from core.cache.lazy_index import LazyIndex
+
+
+@dataclass
+class SampleGDD:
+    """코덱 왕복 확인용 데이터클래스"""
+    game_title: str
+    created_at: datetime
+    thumbnail: bytes
+
+
+class FakeClock:
+    """수동으로 진행시키는 단조 시계"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class TestMemoryCache:
+    """LRU + TTL 메모리 캐시 테스트"""
+
+    def test_lru_eviction(self):
+        """항목 수 상한 초과 시 가장 오래 쓰지 않은 항목 제거 테스트"""
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_byte_limit(self):
+        """바이트 상한 초과 시 제거, 상한보다 큰 값은 저장하지 않음 테스트"""
+        cache = MemoryCache(max_bytes=10_000)
+        for i in range(10):
+            cache.set(f"k{i}", "x" * 2000)
+
+        stats = cache.stats()
+        assert stats["bytes"] <= 10_000
+        assert stats["entries"] < 10
+        assert cache.get("k9") is not None
+
+        cache.set("huge", "x" * 20_000)
+        assert cache.get("huge") is None
+
+    def test_size_estimate_samples_long_sequences(self):
+        """긴 목록은 일부만 재고 외삽해도 크기가 비슷하게 추정되는지 테스트"""
+        gdd = make_gdd(0, payload_kb=32)
+        full = sys.getsizeof(gdd["assets_required"]) + sum(
+            sys.getsizeof(asset) + sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in asset.items())
+            for asset in gdd["assets_required"]
+        )
+
+        estimated = estimate_size(gdd["assets_required"])
+        assert 0.8 * full <= estimated <= 1.2 * full
+
+    def test_unbounded_bytes_skips_estimate(self, monkeypatch):
+        """max_bytes=None이면 크기 추정 없이 저장하는지 테스트"""
+        def fail(value):
+            raise AssertionError("estimate_size가 호출됨")
+        monkeypatch.setattr(cache_manager, "estimate_size", fail)
+
+        cache = MemoryCache(max_bytes=None)
+        cache.set("gdd", make_gdd(0))
+
+        assert cache.get("gdd")["template_type"] == "runner"
+        assert cache.stats()["bytes"] == 0
+
+    def test_ttl_expiry_with_monotonic_clock(self):
+        """TTL 만료 및 cleanup이 만료된 항목만 제거하는지 테스트"""
+        clock = FakeClock()
+        cache = MemoryCache(default_ttl=60, clock=clock)
+        cache.set("short", 1, ttl=10)
+        cache.set("long", 2)
+        cache.set("forever", 3, ttl=0)
+
+        clock.advance(11)
+        assert cache.get("short") is None
+        assert cache.get("long") == 2
+
+        clock.advance(60)
+        assert cache.cleanup() == 1
+        assert cache.get("forever") == 3
+        assert cache.stats()["expirations"] == 2
+
+    def test_overwrite_resets_ttl(self):
+        """같은 키를 다시 저장하면 이전 만료 시각이 적용되지 않는지 테스트"""
+        clock = FakeClock()
+        cache = MemoryCache(clock=clock)
+        cache.set("k", 1, ttl=10)
+        clock.advance(5)
+        cache.set("k", 2, ttl=10)
+        clock.advance(6)
+
+        assert cache.get("k") == 2
+
+    def test_hit_miss_counters(self):
+        """히트/미스 카운터 및 적중률 테스트"""
+        cache = MemoryCache()
+        cache.set("k", "v")
+        cache.get("k")
+        cache.get("k")
+        cache.get("missing")
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (2, 1)
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+    def test_memory_flat_under_churn(self):
+        """장시간 덮어쓰기/만료가 반복돼도 내부 구조가 커지지 않는지 테스트"""
+        clock = FakeClock()
+        cache = MemoryCache(max_entries=100, clock=clock)
+        for i in range(50_000):
+            cache.set(f"k{i % 500}", i, ttl=5)
+            clock.advance(0.01)
+
+        assert len(cache) <= 100
+        assert len(cache._expiry) <= 2 * len(cache) + 64 + 1
+
+
+class TestCachedDecorator:
+    """캐싱 데코레이터 (single-flight, async, None 캐시) 테스트"""
+
+    def test_concurrent_misses_run_once(self):
+        """동시 미스 10건이 함수를 한 번만 실행하는지 테스트"""
+        manager = CacheManager()
+        calls = []
+
+        @manager.cached(ttl=60)
+        def generate(template):
+            calls.append(template)
+            time.sleep(0.2)
+            return {"template": template}
+
+        barrier = threading.Barrier(10)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(generate("runner"))
+
+        threads = [threading.Thread(target=worker) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert calls == ["runner"]
+        assert results == [{"template": "runner"}] * 10
+
+    def test_none_result_cached(self):
+        """None 결과도 캐시되는지 테스트"""
+        manager = CacheManager()
+        calls = []
+
+        @manager.cached(ttl=60)
+        def lookup(key):
+            calls.append(key)
+            return None
+
+        assert lookup("a") is None
+        assert lookup("a") is None
+        assert calls == ["a"]
+
+    def test_errors_shared_and_not_cached(self):
+        """예외가 호출자에게 전달되고 캐시되지 않는지 테스트"""
+        manager = CacheManager()
+        calls = []
+
+        @manager.cached(ttl=60)
+        def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("api down")
+            return "ok"
+
+        with pytest.raises(RuntimeError):
+            flaky()
+        assert flaky() == "ok"
+        assert len(calls) == 2
+
+    def test_async_single_flight(self):
+        """async 함수 동시 미스가 한 번만 실행되는지 테스트"""
+        manager = CacheManager()
+        calls = []
+
+        @manager.cached(ttl=60, key_prefix="img")
+        async def render(prompt):
+            calls.append(prompt)
+            await asyncio.sleep(0.05)
+            return f"image:{prompt}"
+
+        async def run():
+            first = await asyncio.gather(*(render("cat") for _ in range(10)))
+            second = await render("cat")
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first == ["image:cat"] * 10
+        assert second == "image:cat"
+        assert calls == ["cat"]
+
+    def test_async_leader_cancel_does_not_cancel_followers(self):
+        """먼저 호출한 코루틴이 취소돼도 같은 키를 기다리는 호출은 결과를 받는지 테스트"""
+        manager = CacheManager()
+        calls = []
+
+        @manager.cached(ttl=60)
+        async def render(prompt):
+            calls.append(prompt)
+            await asyncio.sleep(0.1)
+            return f"image:{prompt}"
+
+        async def run():
+            leader = asyncio.ensure_future(render("cat"))
+            await asyncio.sleep(0.01)
+            follower = asyncio.ensure_future(render("cat"))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            return await follower, leader
+
+        value, leader = asyncio.run(run())
+        assert value == "image:cat"
+        assert leader.cancelled()
+        assert calls == ["cat"]
+
+    def test_leader_rechecks_cache(self):
+        """계산이 끝난 직후 선행 호출이 된 경우 다시 계산하지 않는지 테스트"""
+        manager = CacheManager()
+        calls = []
+        compute = lambda: calls.append(1) or "value"
+
+        manager._store("k", "cached", 60)
+        assert manager._call_once("k", compute, 60) == "cached"
+        assert calls == []
+
+    def test_stale_hits_start_one_refresh(self):
+        """오래된 값 동시 조회가 갱신 스레드를 하나만 시작하는지 테스트"""
+        manager = CacheManager()
+        calls = []
+        release = threading.Event()
+
+        @manager.cached(ttl=10, refresh_ahead=0.99)
+        def version():
+            calls.append(1)
+            if len(calls) > 1:
+                release.wait(2)
+            return len(calls)
+
+        assert version() == 1
+        time.sleep(0.15)
+        started = threading.active_count()
+        assert [version() for _ in range(20)] == [1] * 20
+        assert threading.active_count() - started <= 1
+        release.set()
+
+        deadline = time.time() + 2
+        while version() != 2 and time.time() < deadline:
+            time.sleep(0.01)
+        assert len(calls) == 2
+
+    def test_refresh_ahead(self):
+        """만료 전에 캐시 값을 반환하면서 백그라운드 갱신하는지 테스트"""
+        manager = CacheManager()
+        calls = []
+
+        @manager.cached(ttl=10, refresh_ahead=0.99)
+        def version():
+            calls.append(1)
+            return len(calls)
+
+        assert version() == 1
+        time.sleep(0.15)
+        assert version() == 1  # 오래된 값을 바로 반환
+
+        deadline = time.time() + 2
+        while len(calls) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        assert version() == 2
+
+    def test_async_refresh_ahead(self):
+        """async 함수 미리 갱신 테스트"""
+        manager = CacheManager()
+        calls = []
+
+        @manager.cached(ttl=10, refresh_ahead=0.99)
+        async def version():
+            calls.append(1)
+            return len(calls)
+
+        async def run():
+            first = await version()
+            await asyncio.sleep(0.15)
+            stale = await version()
+            await asyncio.sleep(0.05)
+            return first, stale, await version()
+
+        assert asyncio.run(run()) == (1, 1, 2)
+
+
+class TestInvalidation:
+    """안정적인 키 생성 및 태그/네임스페이스 무효화 테스트"""
+
+    def test_key_independent_of_call_style(self):
+        """위치/키워드 호출, 기본값 생략, dict/set 순서와 무관하게 같은 키인지 테스트"""
+        def generate(template, options=None, seed=0):
+            return None
+
+        base = build_key("gdd", generate, ("runner", {"a": 1, "b": {2, 1}}))
+        assert build_key("gdd", generate, (), {"template": "runner", "options": {"b": {1, 2}, "a": 1}, "seed": 0}) == base
+        assert build_key("gdd", generate, ("runner", {"a": 1, "b": {2, 1}}, 1)) != base
+        assert base.startswith("gdd:") and "generate" in base
+
+    def test_key_stable_for_objects(self):
+        """repr에 주소가 들어가는 객체도 내용이 같으면 같은 키인지 테스트"""
+        class Request:
+            def __init__(self, prompt):
+                self.prompt = prompt
+
+        def render(request):
+            return None
+
+        assert build_key("img", render, (Request("cat"),)) == build_key("img", render, (Request("cat"),))
+        assert build_key("img", render, (Request("cat"),)) != build_key("img", render, (Request("dog"),))
+        gdd = SampleGDD("러너", datetime(2024, 5, 1), b"png")
+        assert build_key("gdd", render, (gdd,)) == build_key("gdd", render, (SampleGDD("러너", datetime(2024, 5, 1), b"png"),))
+
+    def test_memory_tag_invalidation(self):
+        """태그 무효화가 해당 항목만 지우고 태그 인덱스를 정리하는지 테스트"""
+        cache = MemoryCache(max_entries=3)
+        cache.set("a", 1, tags=["template:runner"])
+        cache.set("b", 2, tags=["template:runner", "lang:ko"])
+        cache.set("c", 3, tags=["template:puzzle"])
+
+        assert cache.invalidate_tag("template:runner") == 2
+        assert (cache.get("a"), cache.get("b"), cache.get("c")) == (None, None, 3)
+        assert "lang:ko" not in cache._tags
+
+        for i in range(5):
+            cache.set(f"k{i}", i, tags=["churn"])
+        assert len(cache._tags["churn"]) == len(cache) == 3
+
+    def test_decorator_tags_and_namespace(self):
+        """데코레이터 태그/네임스페이스 무효화와 개별 무효화 테스트"""
+        manager = CacheManager()
+        calls = []
+
+        @manager.cached(ttl=60, key_prefix="gdd", tags=lambda template, **_: [f"template:{template}"])
+        def generate(template, lang="ko"):
+            calls.append((template, lang))
+            return f"{template}/{lang}"
+
+        @manager.cached(ttl=60, key_prefix="img")
+        def render(prompt):
+            calls.append(prompt)
+            return prompt
+
+        generate("runner")
+        generate("runner", lang="en")
+        generate("puzzle")
+        render("cat")
+
+        assert manager.invalidate_tag("template:runner") == 2
+        generate(template="runner")
+        generate("puzzle")
+        assert calls.count(("runner", "ko")) == 2
+        assert calls.count(("puzzle", "ko")) == 1
+
+        assert generate.invalidate("puzzle") is True
+        assert manager.invalidate_namespace("gdd") == 1
+        render("cat")
+        assert calls.count("cat") == 1
+
+    def test_tiered_tag_invalidation(self, tmp_path):
+        """2단 캐시 태그 무효화가 L2에서 L1으로 채운 사본까지 지우는지 테스트"""
+        path = str(tmp_path / "cache.db")
+        writer = TieredCache(MemoryCache(), DiskCache(path))
+        reader = TieredCache(MemoryCache(), DiskCache(path))
+        writer.set_many({"a": 1, "b": 2}, tags=["template:runner"])
+        writer.set("c", 3, tags=["template:puzzle"])
+        assert reader.get("a") == 1
+
+        assert reader.invalidate_tag("template:runner") == 2
+        assert reader.get("a") is None
+        assert writer.l2.get("b") is None
+        assert reader.get("c") == 3
+        assert reader.l2.invalidate_tag("template:runner") == 0
+
+
+class TestCodec:
+    """바이너리 코덱 테스트"""
+
+    def test_pickle_round_trip(self):
+        """datetime/bytes/데이터클래스 왕복 테스트"""
+        value = {"gdd": SampleGDD("러너", datetime(2024, 5, 1, 12, 30), b"\x89PNG"), "tags": ("a", "b")}
+        data = codec.encode(value)
+
+        assert data[:4] == b"GC" + bytes((codec.FORMAT_VERSION, codec.PickleCodec.codec_id))
+        assert codec.decode(data) == value
+
+    def test_msgpack_round_trip(self):
+        """msgpack 코덱 datetime 확장 타입 테스트"""
+        pytest.importorskip("msgpack")
+        msgpack_codec = codec.get_codec("msgpack")
+        value = {"title": "러너", "at": datetime(2024, 5, 1), "blob": b"\x00\x01", "scores": [1, 2.5]}
+        assert codec.decode(codec.encode(value, msgpack_codec)) == value
+
+    def test_legacy_and_unknown_versions(self):
+        """헤더 없는 JSON은 읽고, 다른 포맷 버전은 미스 처리하는지 테스트"""
+        assert codec.decode('{"a": 1}') == {"a": 1}
+        assert codec.decode(b"GC\x63\x01junk") is codec.MISSING
+        assert codec.decode(None) is codec.MISSING
+
+
+class TestTieredCache:
+    """2단 캐시 테스트"""
+
+    def test_disk_bulk_and_expiry(self, tmp_path, monkeypatch):
+        """디스크 캐시 일괄 저장/조회 및 만료 테스트"""
+        disk = DiskCache(str(tmp_path / "cache.db"))
+        disk.set_many({f"k{i}": {"i": i} for i in range(1200)}, ttl=60)
+        disk.set("short", "v", ttl=5)
+
+        found = disk.get_many([f"k{i}" for i in range(1200)] + ["missing"])
+        assert len(found) == 1200 and found["k7"] == {"i": 7}
+
+        now = time.time()
+        monkeypatch.setattr("core.cache.tiered_cache.time.time", lambda: now + 10)
+        assert disk.get("short") is None
+        assert disk.cleanup() == 1
+        assert disk.get("k0") == {"i": 0}
+
+    def test_l2_shared_between_processes(self, tmp_path):
+        """다른 인스턴스(노드 내 다른 프로세스)가 L2 값을 L1으로 가져오는지 테스트"""
+        path = str(tmp_path / "cache.db")
+        first = TieredCache(MemoryCache(), DiskCache(path))
+        second = TieredCache(MemoryCache(), DiskCache(path))
+
+        gdd = SampleGDD("러너", datetime(2024, 5, 1), b"img")
+        first.set("gdd:runner", gdd)
+
+        assert second.get("gdd:runner") == gdd
+        assert second.get("gdd:runner") == gdd
+        stats = second.stats()
+        assert (stats["l2_hits"], stats["l1_hits"]) == (1, 1)
+
+        second.delete("gdd:runner")
+        assert DiskCache(path).get("gdd:runner") is None
+
+    def test_backfill_capped_by_l2_remaining_ttl(self, tmp_path):
+        """L2에서 곧 만료될 값은 L1에도 그 시간까지만 남는지 테스트"""
+        clock = FakeClock()
+        disk = DiskCache(str(tmp_path / "cache.db"))
+        disk.set("short", "v", ttl=5)
+        disk.set("long", "w", ttl=3600)
+        cache = TieredCache(MemoryCache(clock=clock), disk, l1_ttl=60)
+
+        assert cache.get("short") == "v"
+        assert cache.get_many(["long"]) == {"long": "w"}
+
+        clock.advance(6)
+        assert cache.l1.get("short") is None
+        assert cache.l1.get("long") == "w"
+
+    def test_redis_backfill_uses_pttl(self):
+        """Redis L2의 남은 TTL(PTTL)로 L1 TTL을 줄이는지 테스트"""
+        clock = FakeClock()
+        redis = RedisCache(client=FakeRedis(clock=clock))
+        redis.set("short", "v", ttl=5)
+        redis.set("forever", "w", ttl=0)
+        cache = TieredCache(MemoryCache(clock=clock), redis, l1_ttl=60)
+
+        assert cache.get_many(["short", "forever", "missing"]) == {"short": "v", "forever": "w"}
+
+        clock.advance(6)
+        assert cache.l1.get("short") is None
+        assert cache.get("short") is None
+        assert cache.l1.get("forever") == "w"
+
+    def test_get_many_only_asks_l2_for_misses(self, tmp_path):
+        """L1에 있는 키는 L2에 요청하지 않는지 테스트"""
+        cache = TieredCache(MemoryCache(), DiskCache(str(tmp_path / "cache.db")))
+        cache.set_many({"a": 1, "b": 2})
+        cache.l1.delete("b")
+
+        assert cache.get_many(["a", "b", "c"]) == {"a": 1, "b": 2}
+        stats = cache.stats()
+        assert (stats["l1_hits"], stats["l2_hits"], stats["misses"]) == (1, 1, 1)
+
+    def test_manager_with_tiered_backend(self, tmp_path):
+        """tiered CacheManager 데코레이터가 재시작 후에도 L2를 쓰는지 테스트"""
+        calls = []
+
+        def build():
+            manager = CacheManager(tiered=True, path=str(tmp_path / "cache.db"))
+
+            @manager.cached(ttl=60, key_prefix="gdd")
+            def generate(template):
+                calls.append(template)
+                return SampleGDD(template, datetime(2024, 1, 1), b"")
+
+            return generate
+
+        assert build()("runner").game_title == "runner"
+        assert build()("runner").game_title == "runner"
+        assert calls == ["runner"]
+
+class TestLazyIndex:
+    """SQLite 인덱스 테스트"""
+
+    def _index(self, path, store):
+        return LazyIndex(str(path), store.get, lambda obj: {"game_id": obj["game_id"]}, capacity=2)
+
+    def test_concurrent_writers_keep_all_entries(self, tmp_path):
+        """두 프로세스(연결)가 동시에 저장해도 항목을 잃지 않는지 테스트"""
+        store = {}
+        path = tmp_path / "index.db"
+        writers = [self._index(path, store), self._index(path, store)]
+
+        def write(index, prefix):
+            for i in range(100):
+                key = f"{prefix}{i}"
+                store[key] = {"game_id": prefix}
+                index.put(key, store[key])
+
+        threads = [threading.Thread(target=write, args=(index, p)) for index, p in zip(writers, "ab")]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        reader = self._index(path, store)
+        assert reader.load()
+        assert len(reader) == 200
+        assert len(reader.select(game_id="a")) == len(reader.select(game_id="b")) == 100
+        assert writers[0].stats()["writes"] == 100
+
+    def test_refresh_reads_only_new_entries(self, tmp_path):
+        """다른 프로세스가 저장한 항목만 refresh로 반영하는지 테스트"""
+        store = {"x": {"game_id": "g1"}}
+        path = tmp_path / "index.db"
+        first, second = self._index(path, store), self._index(path, store)
+        first.rebuild(["x"])
+        assert first.load() and second.load()
+
+        assert not second.refresh()
+        store["y"] = {"game_id": "g2"}
+        first.put("y", store["y"])
+        first.put("x", {"game_id": "g3"})
+
+        assert second.refresh()
+        assert second.meta("y") == {"game_id": "g2"}
+        assert second.select(game_id="g3") == ["x"]
+        assert not first.refresh()
+
+
+class TestRedisStandIn:
+    """FakeRedis/RESP 서버로 RedisCache 검증"""
+
+    def test_redis_cache_in_process(self):
+        """프로세스 내 클라이언트로 저장/일괄 조회/만료 테스트"""
+        clock = FakeClock()
+        cache = RedisCache(client=FakeRedis(clock=clock))
+        gdd = SampleGDD("러너", datetime(2024, 5, 1), b"png")
+        cache.set("gdd", gdd, ttl=10)
+        cache.set("forever", 1, ttl=0)
+        cache.set_many({"a": 1, "b": None}, ttl=60)
+
+        assert cache.get("gdd") == gdd
+        assert cache.get_many(["a", "b", "c"]) == {"a": 1}
+
+        clock.advance(11)
+        assert cache.get("gdd") is None
+        assert cache.get("forever") == 1
+        assert cache.delete("forever") is True
+        assert cache.delete("forever") is False
+
+    def test_redis_tags_over_resp(self):
+        """RESP 서버 왕복으로 태그 무효화와 태그 집합 TTL 테스트"""
+        with RespServer() as server:
+            cache = RedisCache(client=server.client(), tag_ttl=100)
+            other = RedisCache(client=server.client())
+            cache.set_many({"a": 1, "b": 2}, ttl=60, tags=["template:runner"])
+            cache.set("c", 3, ttl=60, tags=["template:puzzle"])
+
+            assert other.get_many(["a", "b", "c"]) == {"a": 1, "b": 2, "c": 3}
+            assert server.store.execute("TTL", "cache:tags:template:runner") == 100
+            assert sorted(other.invalidate_tag_keys("template:runner")) == ["a", "b"]
+            assert cache.get_many(["a", "b", "c"]) == {"c": 3}
+            assert server.store.execute("EXISTS", "cache:tags:template:runner") == 0
+
+    def test_redis_tag_index_bounded(self, monkeypatch):
+        """만료된 키가 태그 집합에서 정리되고 무효화 대상에서 빠지는지 테스트"""
+        now = [1_700_000_000.0]
+        monkeypatch.setattr("core.cache.cache_manager.time.time", lambda: now[0])
+        clock = FakeClock()
+        client = FakeRedis(clock=clock)
+        cache = RedisCache(client=client)
+
+        for i in range(5000):
+            cache.set(f"k{i}", i, ttl=5, tags=["ns:gdd"])
+            now[0] += 0.01
+            clock.advance(0.01)
+
+        assert client.zcard("cache:tags:ns:gdd") <= 501
+        assert 0 < len(cache.invalidate_tag_keys("ns:gdd")) <= 500
+        assert client.zcard("cache:tags:ns:gdd") == 0
+
+    def test_pipelines_and_errors(self):
+        """파이프라인 결과, 트랜잭션, 오류 응답을 두 클라이언트가 같게 처리하는지 테스트"""
+        with RespServer() as server:
+            for client in (FakeRedis(), server.client()):
+                client.set("s", "v")
+                pipe = client.pipeline(transaction=True)
+                pipe.setex("k", 60, b"x").sadd("tags", "k").smembers("tags").mget(["k", "s", "none"])
+                assert pipe.execute() == [True, 1, {b"k"}, [b"x", b"v", None]]
+
+                with pytest.raises(ResponseError, match="WRONGTYPE"):
+                    client.sadd("s", "m")
+                pipe = client.pipeline(transaction=False)
+                pipe.sadd("s", "m").get("k")
+                replies = pipe.execute(raise_on_error=False)
+                assert isinstance(replies[0], ResponseError) and replies[1] == b"x"
+                assert client.delete("k", "s", "tags") == 3
+
+    def test_benchmark_smoke(self):
+        """벤치마크가 모든 백엔드/연산 결과를 내는지 테스트 (CI용 소규모)"""
+        assert len(codec.encode(make_gdd(0, payload_kb=8))) > 4000
+        results = run_benchmark(ops=20, payload_kb=1, batch=5)
+
+        for backend, ops in results.items():
+            assert list(ops) == OPERATIONS, backend
+            assert all(r["ops_per_sec"] > 0 and r["p99_us"] >= r["p50_us"] for r in ops.values())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
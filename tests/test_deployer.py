@@ -0,0 +1,776 @@
+"""
+단위 테스트 - 배포 모듈
+가짜 스토어 API로 업로드 흐름을 검증
+"""
+
+import pytest
+import sys
+import json
+import socket
+import threading
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.deployer.store_uploader import GooglePlayUploader, AppStoreUploadManager, ReleaseInfo
+from core.deployer.ios_uploader import AppStoreConnectUploader
+from core.deployer.app_store_client import AppStoreConnectClient
+from core.deployer.steam_uploader import SteamUploader, SteamBuildConfig
+from core.deployer.deploy_orchestrator import DeployOrchestrator, ReleaseManifest
+from core.deployer.resumable_upload import (
+    UploadSessionStore, run_google_resumable, run_upload_operations
+)
+
+
+class FakeRequest:
+    """googleapiclient HttpRequest 대역"""
+
+    def __init__(self, edits, name, response=None, fail=False):
+        self.edits = edits
+        self.name = name
+        self.response = response or {}
+        self.fail = fail
+
+    def execute(self, http=None):
+        with self.edits.lock:
+            self.edits.calls.append(self.name)
+        if self.fail:
+            raise RuntimeError(f"{self.name} 실패")
+        return self.response
+
+
+class FakeEndpoint:
+    def __init__(self, edits, prefix):
+        self.edits = edits
+        self.prefix = prefix
+
+    def upload(self, **kwargs):
+        return FakeRequest(self.edits, f"{self.prefix}.upload", {"versionCode": 42})
+
+    def update(self, **kwargs):
+        self.edits.bodies.append((self.prefix, kwargs))
+        fail = kwargs.get("language") in self.edits.failing_languages
+        return FakeRequest(self.edits, f"{self.prefix}.update", fail=fail)
+
+
+class FakeEdits:
+    """androidpublisher edits() 대역"""
+
+    def __init__(self, failing_languages=()):
+        self.calls = []
+        self.bodies = []
+        self.failing_languages = set(failing_languages)
+        self.lock = threading.Lock()
+
+    def insert(self, body, packageName):
+        return FakeRequest(self, "insert", {"id": "edit_1"})
+
+    def commit(self, packageName, editId):
+        return FakeRequest(self, "commit")
+
+    def delete(self, packageName, editId):
+        return FakeRequest(self, "delete")
+
+    def apks(self):
+        return FakeEndpoint(self, "apks")
+
+    def bundles(self):
+        return FakeEndpoint(self, "bundles")
+
+    def tracks(self):
+        return FakeEndpoint(self, "tracks")
+
+    def listings(self):
+        return FakeEndpoint(self, "listings")
+
+
+class FakeService:
+    def __init__(self, edits):
+        self._edits = edits
+
+    def edits(self):
+        return self._edits
+
+
+LISTINGS = {
+    lang: {"title": f"게임 {lang}", "short_description": "짧은 설명", "full_description": "긴 설명"}
+    for lang in ["ko-KR", "en-US", "ja-JP", "zh-CN", "de-DE", "fr-FR", "es-ES", "pt-BR", "ru-RU", "vi-VN"]
+}
+
+
+class TestGooglePlayPublishRelease:
+    """Google Play 일괄 릴리스 테스트"""
+
+    def _uploader(self, edits):
+        uploader = GooglePlayUploader({})
+        uploader.service = FakeService(edits)
+        return uploader
+
+    def test_single_edit_session(self):
+        """편집 세션 1개로 번들/트랙/등록 정보 처리 테스트"""
+        edits = FakeEdits()
+        uploader = self._uploader(edits)
+
+        result = uploader.publish_release(
+            "com.example.game",
+            "builds/game.aab",
+            "beta",
+            release_notes={"ko-KR": "버그 수정", "en-US": "Bug fixes"},
+            listings=LISTINGS
+        )
+
+        assert result["success"]
+        assert result["version_code"] == 42
+        assert all(result["listings"].values())
+        assert edits.calls.count("insert") == 1
+        assert edits.calls.count("commit") == 1
+        assert edits.calls.count("listings.update") == len(LISTINGS)
+        assert edits.calls[-1] == "commit"
+
+        track_body = next(kw for prefix, kw in edits.bodies if prefix == "tracks")["body"]
+        notes = track_body["releases"][0]["releaseNotes"]
+        assert {"language": "en-US", "text": "Bug fixes"} in notes
+
+    def test_failed_listing_discards_edit(self):
+        """등록 정보 실패 시 편집 폐기 테스트"""
+        edits = FakeEdits(failing_languages={"ja-JP"})
+        uploader = self._uploader(edits)
+
+        result = uploader.publish_release("com.example.game", "builds/game.apk", listings=LISTINGS)
+
+        assert not result["success"]
+        assert result["listings"]["ja-JP"] is False
+        assert "commit" not in edits.calls
+        assert "delete" in edits.calls
+
+    def test_upload_game_uses_one_edit(self):
+        """upload_game 편집 세션 수 테스트"""
+        edits = FakeEdits()
+        manager = AppStoreUploadManager({})
+        manager.google_play.service = FakeService(edits)
+
+        release_info = ReleaseInfo(
+            package_name="com.example.game",
+            version_code=1,
+            version_name="1.0.0",
+            release_notes={"ko-KR": "첫 릴리스"},
+            listings=LISTINGS
+        )
+        result = manager.upload_game("game_001", "builds/game.apk", "com.example.game", release_info)
+
+        assert result["platforms"]["google_play"]["success"]
+        assert edits.calls.count("insert") == 1
+        assert edits.calls.count("commit") == 1
+
+    def test_upload_game_defaults_listings_to_release_notes(self):
+        """listings가 없으면 출시 노트로 등록 정보를 갱신하는지 테스트"""
+        edits = FakeEdits()
+        manager = AppStoreUploadManager({})
+        manager.google_play.service = FakeService(edits)
+
+        release_info = ReleaseInfo(
+            package_name="com.example.game",
+            version_code=1,
+            version_name="1.0.0",
+            release_notes={"ko-KR": "첫 릴리스", "en-US": "First release"}
+        )
+        result = manager.upload_game("game_001", "builds/game.apk", "com.example.game", release_info)
+
+        assert result["platforms"]["google_play"]["listings"] == {"ko-KR": True, "en-US": True}
+        assert edits.calls.count("listings.update") == 2
+        listing = next(kw for prefix, kw in edits.bodies if prefix == "listings" and kw["language"] == "en-US")
+        assert listing["body"]["title"] == "1.0.0"
+        assert listing["body"]["fullDescription"] == "First release"
+
+
+class FakeUploadStatus:
+    def __init__(self, progress):
+        self.resumable_progress = progress
+
+
+class FakeMedia:
+    def __init__(self, size):
+        self._size = size
+
+    def size(self):
+        return self._size
+
+
+class FakeUploadResponse(dict):
+    def __init__(self, status, headers=None):
+        super().__init__(headers or {})
+        self.status = status
+
+
+class FakeUploadServer:
+    """재개 업로드 세션 서버 대역 (fail_at 바이트 이후 failures번 끊김)"""
+
+    def __init__(self, size, fail_at=None, failures=1):
+        self.size = size
+        self.fail_at = fail_at
+        self.failures = failures
+        self.received = 0
+        self.queries = 0
+
+    def request(self, uri, method="GET", headers=None):
+        self.queries += 1
+        if self.received == self.size:
+            return FakeUploadResponse(200), b'{"versionCode": 7}'
+        headers = {"range": f"bytes=0-{self.received - 1}"} if self.received else {}
+        return FakeUploadResponse(308, headers), b""
+
+
+class FakeResumableRequest:
+    """재개 업로드 HttpRequest 대역"""
+
+    def __init__(self, server, chunk):
+        self.server = server
+        self.http = server
+        self.resumable = FakeMedia(server.size)
+        self.chunk = chunk
+        self.resumable_uri = None
+        self.resumable_progress = 0
+        self.sent = []
+
+    def next_chunk(self, http=None, num_retries=0):
+        if self.resumable_uri is None:
+            self.resumable_uri = "https://upload.example/session/1"
+        start = self.resumable_progress
+        if self.server.fail_at is not None and start >= self.server.fail_at and self.server.failures:
+            self.server.failures -= 1
+            raise ConnectionError("연결 끊김")
+        end = min(start + self.chunk, self.resumable.size())
+        self.sent.append((start, end))
+        self.server.received = end
+        self.resumable_progress = end
+        if end == self.resumable.size():
+            return None, {"versionCode": 7}
+        return FakeUploadStatus(end), None
+
+
+class TestResumableUpload:
+    """재개 업로드 테스트"""
+
+    def test_google_upload_resumes_from_token(self, tmp_path):
+        """중단된 Google 업로드가 서버 수신 위치부터 새 요청으로 재개되는지 테스트"""
+        sessions = UploadSessionStore(str(tmp_path / "sessions.json"))
+        server = FakeUploadServer(size=1000, fail_at=512, failures=10)
+        progress = []
+
+        with pytest.raises(ConnectionError):
+            run_google_resumable(lambda: FakeResumableRequest(server, 256), sessions, "k", {"edit_id": "edit_1"},
+                                 progress=lambda s, t: progress.append(s), num_retries=2, backoff=0)
+
+        token = sessions.get("k")
+        assert token["edit_id"] == "edit_1"
+        assert token["progress"] == 512
+        assert token["resumable_uri"] == "https://upload.example/session/1"
+
+        server.failures = 0
+        requests = []
+
+        def make_request():
+            requests.append(FakeResumableRequest(server, 256))
+            return requests[-1]
+
+        response = run_google_resumable(make_request, sessions, "k", {"edit_id": "edit_1"},
+                                        progress=lambda s, t: progress.append(s))
+
+        assert response["versionCode"] == 7
+        assert len(requests) == 1
+        assert requests[0].sent[0][0] == 512
+        assert progress[-1] == 1000
+        assert sessions.get("k") is None
+
+    def test_google_chunk_failure_retries_with_new_request(self, tmp_path, monkeypatch):
+        """청크 실패 시 지수 백오프 후 새 요청으로 이어서 보내는지 테스트"""
+        delays = []
+        monkeypatch.setattr("core.deployer.resumable_upload.time.sleep", delays.append)
+        sessions = UploadSessionStore(str(tmp_path / "sessions.json"))
+        server = FakeUploadServer(size=1000, fail_at=512, failures=2)
+        requests = []
+
+        def make_request():
+            requests.append(FakeResumableRequest(server, 256))
+            return requests[-1]
+
+        response = run_google_resumable(make_request, sessions, "k", {}, backoff=0.5)
+
+        assert response["versionCode"] == 7
+        assert delays == [0.5, 1.0]
+        assert len(requests) == 3
+        assert requests[-1].sent == [(512, 768), (768, 1000)]
+        assert server.queries == 2
+
+    def test_google_permanent_error_not_retried(self, tmp_path, monkeypatch):
+        """4xx 오류는 재시도 없이 바로 실패하는지 테스트"""
+        delays = []
+        monkeypatch.setattr("core.deployer.resumable_upload.time.sleep", delays.append)
+        sessions = UploadSessionStore(str(tmp_path / "sessions.json"))
+        requests = []
+
+        class Forbidden(Exception):
+            resp = FakeUploadResponse(403)
+
+        class ForbiddenRequest(FakeResumableRequest):
+            def next_chunk(self, http=None, num_retries=0):
+                raise Forbidden("권한 없음")
+
+        def make_request():
+            requests.append(ForbiddenRequest(FakeUploadServer(size=1000), 256))
+            return requests[-1]
+
+        with pytest.raises(Forbidden):
+            run_google_resumable(make_request, sessions, "k", {})
+        assert len(requests) == 1
+        assert delays == []
+
+    def test_google_offset_probe_retried(self, tmp_path, monkeypatch):
+        """저장된 세션 위치 조회가 일시 오류(503)면 재시도하는지 테스트"""
+        delays = []
+        monkeypatch.setattr("core.deployer.resumable_upload.time.sleep", delays.append)
+        sessions = UploadSessionStore(str(tmp_path / "sessions.json"))
+        sessions.save("k", {"resumable_uri": "https://upload.example/session/1", "progress": 512})
+        server = FakeUploadServer(size=1000)
+        server.received = 512
+        original = server.request
+        outages = [FakeUploadResponse(503)]
+
+        def flaky_request(uri, method="GET", headers=None):
+            if outages:
+                return outages.pop(), b""
+            return original(uri, method, headers)
+
+        server.request = flaky_request
+        requests = []
+
+        def make_request():
+            requests.append(FakeResumableRequest(server, 256))
+            return requests[-1]
+
+        response = run_google_resumable(make_request, sessions, "k", {}, backoff=0.5)
+
+        assert response["versionCode"] == 7
+        assert delays == [0.5]
+        assert requests[-1].sent[0][0] == 512
+
+    def test_upload_operations_skip_done_parts(self, tmp_path):
+        """완료된 파트는 다시 보내지 않는지 테스트"""
+        data = bytes(range(256)) * 12
+        file_path = tmp_path / "preview.mp4"
+        file_path.write_bytes(data)
+        operations = [
+            {"method": "PUT", "url": f"https://upload.example/{i}", "offset": i * 1024,
+             "length": 1024, "requestHeaders": [{"name": "Content-Type", "value": "video/mp4"}]}
+            for i in range(3)
+        ]
+        sessions = UploadSessionStore(str(tmp_path / "sessions.json"))
+        key = sessions.key("app_store", "appPreviews", "set_1", file_path=str(file_path))
+
+        received = {}
+
+        def flaky_send(method, url, body, headers):
+            if url.endswith("/2"):
+                raise IOError("연결 끊김")
+            received[url] = body
+            return 200
+
+        with pytest.raises(IOError):
+            run_upload_operations(operations, str(file_path), sessions, key, {"asset_id": "a1"},
+                                  send=flaky_send, max_retries=1, backoff=0)
+        assert sessions.get(key)["done"] == [0, 1]
+
+        resent = []
+
+        def send(method, url, body, headers):
+            resent.append(url)
+            received[url] = body
+            return 200
+
+        run_upload_operations(operations, str(file_path), sessions, key, {"asset_id": "a1"}, send=send)
+
+        assert resent == ["https://upload.example/2"]
+        assert b"".join(received[op["url"]] for op in operations) == data
+
+
+class TestDeployOrchestrator:
+    """멀티 스토어 배포 테스트"""
+
+    def _manifest(self):
+        return ReleaseManifest(
+            game_id="game_001",
+            version="1.0.0",
+            artifacts={
+                "google_play": {"package_name": "com.example.game"},
+                "app_store": {"bundle_id": "com.example.game"},
+                "steam": {"path": ".", "app_id": "1", "depot_id": "2"}
+            },
+            release_notes={"ko-KR": "첫 릴리스"}
+        )
+
+    def test_stores_deploy_concurrently(self):
+        """전체 시간이 가장 느린 스토어 기준인지 테스트"""
+        orchestrator = DeployOrchestrator({
+            "simulate": True,
+            "simulate_delay": {"google_play": 0.3, "app_store": 0.4, "steam": 0.3}
+        })
+
+        result = orchestrator.deploy(self._manifest())
+
+        assert result["success"]
+        assert set(result["stores"]) == {"google_play", "app_store", "steam"}
+        assert result["duration"] < 0.9
+
+    def test_retry_and_aggregate(self):
+        """스토어별 재시도 및 결과 집계 테스트"""
+        orchestrator = DeployOrchestrator({"max_retries": 2, "retry_delay": 0.01})
+        calls = {"google_play": 0, "app_store": 0, "steam": 0}
+
+        def flaky(manifest, artifact):
+            calls["google_play"] += 1
+            if calls["google_play"] < 2:
+                raise ConnectionError("일시 오류")
+            return {"success": True, "version_code": 3}
+
+        def ok(manifest, artifact):
+            calls["app_store"] += 1
+            return {"success": True}
+
+        def broken(manifest, artifact):
+            calls["steam"] += 1
+            return {"success": False, "error": "steamcmd 로그인 실패"}
+
+        orchestrator.register_backend("google_play", flaky)
+        orchestrator.register_backend("app_store", ok)
+        orchestrator.register_backend("steam", broken)
+
+        result = orchestrator.deploy(self._manifest())
+
+        assert not result["success"]
+        stores = result["stores"]
+        assert stores["google_play"]["success"] and stores["google_play"]["attempts"] == 2
+        assert stores["app_store"]["attempts"] == 1
+        assert stores["steam"]["attempts"] == 3
+        assert stores["steam"]["error"] == "steamcmd 로그인 실패"
+
+    def test_app_store_retry_skips_completed_steps(self, tmp_path):
+        """App Store 재시도 시 완료된 단계를 다시 실행하지 않는지 테스트"""
+        ipa = tmp_path / "game.ipa"
+        ipa.write_bytes(b"ipa")
+        calls = []
+
+        class FlakyUploader:
+            def upload_ipa(self, path, bundle_id):
+                calls.append("upload_ipa")
+                return "build_1"
+
+            def create_version(self, app_id, version, notes):
+                calls.append("create_version")
+                return "version_1"
+
+            def submit_for_review(self, version_id):
+                calls.append("submit_for_review")
+                if calls.count("submit_for_review") < 2:
+                    raise ConnectionError("일시 오류")
+                return True
+
+        orchestrator = DeployOrchestrator({"max_retries": 2, "retry_delay": 0.01})
+        orchestrator._uploaders["app_store"] = FlakyUploader()
+        manifest = ReleaseManifest(
+            game_id="g", version="1.0.0",
+            artifacts={"app_store": {"path": str(ipa), "app_id": "123", "submit_for_review": True}}
+        )
+
+        store = orchestrator.deploy(manifest)["stores"]["app_store"]
+
+        assert store["success"] and store["attempts"] == 2
+        assert calls == ["upload_ipa", "create_version", "submit_for_review", "submit_for_review"]
+        assert store["completed_steps"] == {
+            "upload_ipa": "build_1", "create_version": "version_1", "submit_for_review": True
+        }
+        assert store["details"]["version_id"] == "version_1"
+
+    def test_missing_options_not_retried(self):
+        """필수 옵션 누락 시 재시도하지 않는지 테스트"""
+        orchestrator = DeployOrchestrator({"max_retries": 3, "retry_delay": 0.01})
+        manifest = ReleaseManifest(game_id="g", version="1.0.0", artifacts={"google_play": {}})
+
+        result = orchestrator.deploy(manifest)
+
+        assert result["stores"]["google_play"]["attempts"] == 0
+        assert "package_name" in result["stores"]["google_play"]["error"]
+
+
+class FakeAppStoreHandler(BaseHTTPRequestHandler):
+    """App Store Connect API 대역 (keep-alive, 페이지당 2개)"""
+
+    protocol_version = "HTTP/1.1"
+    locales = ["ko", "en-US", "ja", "zh-Hans", "de-DE"]
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _record(self):
+        server = self.server
+        with server.lock:
+            server.peers.add(self.client_address)
+            server.tokens.add(self.headers["Authorization"])
+            server.requests.append((self.command, self.path))
+
+    def do_POST(self):
+        self._record()
+        self.rfile.read(int(self.headers["Content-Length"]))
+        if self.path.endswith("/appStoreVersions"):
+            self._reply(201, {"data": {"id": "ver_1"}})
+        else:
+            self._reply(201, {"data": {"id": "sub_1"}})
+
+    def do_GET(self):
+        self._record()
+        offset = int(self.path.split("cursor=")[1]) if "cursor=" in self.path else 0
+        page = [
+            {"id": f"loc_{locale}", "attributes": {"locale": locale}}
+            for locale in self.locales[offset:offset + 2]
+        ]
+        links = {}
+        if offset + 2 < len(self.locales):
+            host, port = self.server.server_address
+            links["next"] = f"http://{host}:{port}/v1/appStoreVersions/ver_1/appStoreVersionLocalizations?cursor={offset + 2}"
+        self._reply(200, {"data": page, "links": links})
+
+    def do_PATCH(self):
+        self._record()
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.server.lock:
+            self.server.patched[body["data"]["id"]] = body["data"]["attributes"]["whatsNew"]
+        self._reply(200, {"data": body["data"]})
+
+
+@pytest.fixture
+def app_store_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeAppStoreHandler)
+    server.lock = threading.Lock()
+    server.peers = set()
+    server.tokens = set()
+    server.requests = []
+    server.patched = {}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def p8_key(tmp_path):
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    path = tmp_path / "AuthKey_TEST.p8"
+    path.write_bytes(key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption()
+    ))
+    return path
+
+
+class TestAppStoreConnectClient:
+    """App Store Connect 클라이언트 테스트"""
+
+    def _uploader(self, server, key_path, pool_size=4):
+        host, port = server.server_address
+        return AppStoreConnectUploader({
+            "issuer_id": "issuer",
+            "key_id": "KEY123",
+            "private_key_path": str(key_path),
+            "base_url": f"http://{host}:{port}/v1",
+            "pool_size": pool_size
+        })
+
+    def test_create_version_reuses_connections_and_token(self, app_store_server, p8_key):
+        """연결 재사용, 토큰 캐시, 페이지네이션, 로케일 동시 패치 테스트"""
+        pytest.importorskip("jwt")
+        uploader = self._uploader(app_store_server, p8_key)
+        notes = {locale: f"notes {locale}" for locale in FakeAppStoreHandler.locales}
+
+        version_id = uploader.create_version("app_1", "1.2.0", notes)
+        assert version_id == "ver_1"
+        assert uploader.submit_for_review(version_id)
+
+        # 로케일 5개 모두 패치 (3페이지 조회 후)
+        assert app_store_server.patched == {f"loc_{l}": f"notes {l}" for l in FakeAppStoreHandler.locales}
+        gets = [path for method, path in app_store_server.requests if method == "GET"]
+        assert len(gets) == 3
+        # 같은 토큰으로 모든 요청 서명, 연결 수는 풀 크기 이하
+        assert len(app_store_server.tokens) == 1
+        assert len(app_store_server.peers) <= 4
+        assert len(app_store_server.requests) == 10
+
+    def test_private_key_parsed_once(self, app_store_server, p8_key):
+        """토큰 재발급 시 키 파일을 다시 읽지 않는지 테스트"""
+        pytest.importorskip("jwt")
+        uploader = self._uploader(app_store_server, p8_key)
+        first = uploader.client.token()
+        assert uploader.client.token() is first
+
+        p8_key.unlink()
+        uploader.client._token_expiry = 0  # 만료 강제
+        assert uploader.client.token() != first
+
+
+class DroppingServer:
+    """연결마다 요청 1개를 읽고, drops가 남아 있으면 응답 없이 끊는 HTTP 서버"""
+
+    def __init__(self, drops):
+        self.drops = drops
+        self.requests = []
+        self.sock = socket.socket()
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen()
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            with conn, conn.makefile("rb") as reader:
+                request_line = reader.readline().decode()
+                length = 0
+                for line in iter(reader.readline, b"\r\n"):
+                    name, _, value = line.decode().partition(":")
+                    if name.lower() == "content-length":
+                        length = int(value)
+                reader.read(length)
+                self.requests.append(request_line.split()[0])
+                if self.drops:
+                    self.drops -= 1
+                    continue
+                conn.sendall(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: close\r\n\r\n{}")
+
+    def client(self):
+        host, port = self.sock.getsockname()
+        client = AppStoreConnectClient("issuer", "KEY123", "unused.p8", base_url=f"http://{host}:{port}/v1")
+        client.token = lambda: "token"
+        return client
+
+
+class TestAppStoreRequestRetry:
+    """끊긴 연결 재시도 범위 테스트"""
+
+    def test_post_not_resent_after_disconnect(self):
+        """전송 후 끊긴 POST는 다시 보내지 않는지 테스트"""
+        server = DroppingServer(drops=1)
+        with pytest.raises(ConnectionError):
+            server.client().post("/appStoreVersionSubmissions", {"data": {}})
+        assert server.requests == ["POST"]
+        server.sock.close()
+
+    def test_get_retried_after_disconnect(self):
+        """전송 후 끊긴 GET은 새 연결로 재시도하는지 테스트"""
+        server = DroppingServer(drops=1)
+        assert server.client().get("/apps") == {}
+        assert server.requests == ["GET", "GET"]
+        server.sock.close()
+
+
+FAKE_STEAMCMD = """#!/bin/sh
+# steamcmd 대역: 호출 인자를 기록하고 종료 코드 반환
+echo "$@" >> "{calls}"
+exit {exit_code}
+"""
+
+
+class TestSteamDeltaUpload:
+    """Steam 디팟 변경분 테스트"""
+
+    def _setup(self, tmp_path, exit_code=0):
+        content = tmp_path / "content"
+        (content / "data").mkdir(parents=True)
+        (content / "game.exe").write_bytes(b"x" * 1000)
+        (content / "data" / "level1.pck").write_bytes(b"y" * 500)
+        (content / "debug.pdb").write_bytes(b"z" * 300)
+
+        calls = tmp_path / "calls.txt"
+        steamcmd = tmp_path / "steamcmd"
+        steamcmd.write_text(FAKE_STEAMCMD.format(calls=calls, exit_code=exit_code))
+        steamcmd.chmod(0o755)
+
+        uploader = SteamUploader({
+            "steamcmd_path": str(steamcmd),
+            "username": "builder",
+            "scripts_path": str(tmp_path / "scripts")
+        })
+        build_config = SteamBuildConfig(
+            app_id="100", depot_id="101", build_description="test", content_root=str(content)
+        )
+        return uploader, build_config, content, calls
+
+    def _call_count(self, calls):
+        return len(calls.read_text().splitlines()) if calls.exists() else 0
+
+    def test_delta_and_skip_unchanged(self, tmp_path):
+        """변경분 계산, 변경 없을 때 생략 테스트"""
+        uploader, build_config, content, calls = self._setup(tmp_path)
+
+        first = uploader.upload_build(build_config)
+        assert first["success"]
+        assert first["delta"]["bytes_to_upload"] == 1500  # .pdb 제외
+        assert sorted(first["delta"]["added"]) == ["data/level1.pck", "game.exe"]
+        assert self._call_count(calls) == 1
+
+        second = uploader.upload_build(build_config)
+        assert second["skipped"]
+        assert self._call_count(calls) == 1
+
+        (content / "data" / "level1.pck").write_bytes(b"w" * 700)
+        (content / "game.exe").unlink()
+        third = uploader.upload_build(build_config)
+        assert third["delta"]["modified"] == ["data/level1.pck"]
+        assert third["delta"]["removed"] == ["game.exe"]
+        assert third["delta"]["bytes_to_upload"] == 700
+        assert self._call_count(calls) == 2
+
+        script = (tmp_path / "scripts" / "app_build_100.vdf").read_text()
+        assert '"FileExclusion" "*.pdb"' in script
+        assert '"Recursive" "1"' in script
+
+    def test_unchanged_build_still_set_live(self, tmp_path, monkeypatch):
+        """변경 없는 빌드도 set_live 요청이면 생략하지 않고 브랜치를 적용하는지 테스트"""
+        uploader, build_config, content, calls = self._setup(tmp_path)
+        promoted = []
+        monkeypatch.setattr(uploader, "_set_build_live", lambda app_id, branch: promoted.append(branch) or True)
+
+        assert uploader.upload_build(build_config)["success"]
+        build_config.set_live = "beta"
+        result = uploader.upload_build(build_config)
+
+        assert result["success"] and not result.get("skipped")
+        assert self._call_count(calls) == 2
+        assert promoted == ["beta"]
+
+    def test_failed_upload_keeps_previous_manifest(self, tmp_path):
+        """업로드 실패 시 매니페스트를 갱신하지 않는지 테스트"""
+        uploader, build_config, content, calls = self._setup(tmp_path, exit_code=1)
+
+        result = uploader.upload_build(build_config)
+
+        assert not result["success"]
+        assert uploader.load_depot_manifest("100", "101") == {}
+        assert uploader.compute_delta(build_config)["bytes_to_upload"] == 1500
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])